@@ -5,8 +5,12 @@ from __future__ import annotations
 import typing
 
 import httpx
+from .core.circuit_breaker import CircuitBreaker
 from .core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from .core.json_codec import JsonCodec, JsonCodecName
 from .core.logging import LogConfig, Logger
+from .core.rate_limit import RateLimit
+from .core.retry_budget import RetryBudget
 from .environment import HumeClientEnvironment
 
 if typing.TYPE_CHECKING:
@@ -46,6 +50,17 @@ class BaseHumeClient:
     logging : typing.Optional[typing.Union[LogConfig, Logger]]
         Configure logging for the SDK. Accepts a LogConfig dict with 'level' (debug/info/warn/error), 'logger' (custom logger implementation), and 'silent' (boolean, defaults to True) fields. You can also pass a pre-configured Logger instance.
 
+    json_codec : typing.Optional[typing.Union[JsonCodecName, JsonCodec]]
+        The JSON codec used to encode and decode websocket messages. One of "json" (the standard library, default), "orjson", "msgspec", or "auto" to use orjson or msgspec when installed. You can also pass a JsonCodec instance.
+
+    rate_limit : typing.Optional[typing.Union[float, typing.Mapping[str, float], RateLimiter]]
+        Client-side rate limit for HTTP requests, in requests per second. Pass one rate for each of the "tts", "evi", "batch" and "default" endpoint groups, a mapping of group to rate, or a RateLimiter to share its limits with other clients. Requests also slow down when the API's x-ratelimit-* headers say few are left, and hold off after a 429.
+
+    retry_budget : typing.Optional[RetryBudget]
+        Caps retries of failed requests at a fraction of the requests that recently succeeded, so that retries don't multiply the load during an outage. Share one RetryBudget between clients to pool it. Its state() reports recent successes, retries and the retries left.
+    circuit_breaker : typing.Optional[CircuitBreaker]
+        Fails requests to a host straight away with CircuitOpenError after repeated 5xx responses or connection errors, probing it again after a timeout. Its states() reports the circuit of each host.
+
     Examples
     --------
     from hume import HumeClient
@@ -65,6 +80,10 @@ class BaseHumeClient:
         follow_redirects: typing.Optional[bool] = True,
         httpx_client: typing.Optional[httpx.Client] = None,
         logging: typing.Optional[typing.Union[LogConfig, Logger]] = None,
+        json_codec: typing.Optional[typing.Union[JsonCodecName, JsonCodec]] = None,
+        rate_limit: typing.Optional[RateLimit] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
     ):
         _defaulted_timeout = (
             timeout if timeout is not None else 60 if httpx_client is None else httpx_client.timeout.read
@@ -80,6 +99,10 @@ class BaseHumeClient:
             else httpx.Client(timeout=_defaulted_timeout),
             timeout=_defaulted_timeout,
             logging=logging,
+            json_codec=json_codec,
+            rate_limit=rate_limit,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
         )
         self._empathic_voice: typing.Optional[EmpathicVoiceClient] = None
         self._tts: typing.Optional[TtsClient] = None
@@ -141,6 +164,17 @@ class AsyncBaseHumeClient:
     logging : typing.Optional[typing.Union[LogConfig, Logger]]
         Configure logging for the SDK. Accepts a LogConfig dict with 'level' (debug/info/warn/error), 'logger' (custom logger implementation), and 'silent' (boolean, defaults to True) fields. You can also pass a pre-configured Logger instance.
 
+    json_codec : typing.Optional[typing.Union[JsonCodecName, JsonCodec]]
+        The JSON codec used to encode and decode websocket messages. One of "json" (the standard library, default), "orjson", "msgspec", or "auto" to use orjson or msgspec when installed. You can also pass a JsonCodec instance.
+
+    rate_limit : typing.Optional[typing.Union[float, typing.Mapping[str, float], RateLimiter]]
+        Client-side rate limit for HTTP requests, in requests per second. Pass one rate for each of the "tts", "evi", "batch" and "default" endpoint groups, a mapping of group to rate, or a RateLimiter to share its limits with other clients. Requests also slow down when the API's x-ratelimit-* headers say few are left, and hold off after a 429.
+
+    retry_budget : typing.Optional[RetryBudget]
+        Caps retries of failed requests at a fraction of the requests that recently succeeded, so that retries don't multiply the load during an outage. Share one RetryBudget between clients to pool it. Its state() reports recent successes, retries and the retries left.
+    circuit_breaker : typing.Optional[CircuitBreaker]
+        Fails requests to a host straight away with CircuitOpenError after repeated 5xx responses or connection errors, probing it again after a timeout. Its states() reports the circuit of each host.
+
     Examples
     --------
     from hume import AsyncHumeClient
@@ -160,6 +194,10 @@ class AsyncBaseHumeClient:
         follow_redirects: typing.Optional[bool] = True,
         httpx_client: typing.Optional[httpx.AsyncClient] = None,
         logging: typing.Optional[typing.Union[LogConfig, Logger]] = None,
+        json_codec: typing.Optional[typing.Union[JsonCodecName, JsonCodec]] = None,
+        rate_limit: typing.Optional[RateLimit] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
     ):
         _defaulted_timeout = (
             timeout if timeout is not None else 60 if httpx_client is None else httpx_client.timeout.read
@@ -175,6 +213,10 @@ class AsyncBaseHumeClient:
             else httpx.AsyncClient(timeout=_defaulted_timeout),
             timeout=_defaulted_timeout,
             logging=logging,
+            json_codec=json_codec,
+            rate_limit=rate_limit,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
         )
         self._empathic_voice: typing.Optional[AsyncEmpathicVoiceClient] = None
         self._tts: typing.Optional[AsyncTtsClient] = None
@@ -5,6 +5,10 @@ import typing
 import httpx
 
 from .base_client import AsyncBaseHumeClient, BaseHumeClient
+from .core.circuit_breaker import CircuitBreaker
+from .core.json_codec import JsonCodec, JsonCodecName
+from .core.rate_limit import RateLimit
+from .core.retry_budget import RetryBudget
 
 from .environment import HumeClientEnvironment
 
@@ -57,6 +61,17 @@ class HumeClient(BaseHumeClient):
     httpx_client : typing.Optional[httpx.Client]
         The httpx client to use for making requests, a preconfigured client is used by default, however this is useful should you want to pass in any custom httpx configuration.
 
+    json_codec : typing.Optional[typing.Union[JsonCodecName, JsonCodec]]
+        The JSON codec used to encode and decode websocket messages. One of "json" (the standard library, default), "orjson", "msgspec", or "auto" to use orjson or msgspec when installed.
+
+    rate_limit : typing.Optional[typing.Union[float, typing.Mapping[str, float], RateLimiter]]
+        Client-side rate limit for HTTP requests, in requests per second. Pass one rate for each of the "tts", "evi", "batch" and "default" endpoint groups, a mapping of group to rate, or a RateLimiter to share its limits with other clients. Requests also slow down when the API's x-ratelimit-* headers say few are left, and hold off after a 429.
+
+    retry_budget : typing.Optional[RetryBudget]
+        Caps retries of failed requests at a fraction of the requests that recently succeeded, so that retries don't multiply the load during an outage. Share one RetryBudget between clients to pool it. Its state() reports recent successes, retries and the retries left.
+    circuit_breaker : typing.Optional[CircuitBreaker]
+        Fails requests to a host straight away with CircuitOpenError after repeated 5xx responses or connection errors, probing it again after a timeout. Its states() reports the circuit of each host.
+
     Examples
     --------
     from hume.client import HumeClient
@@ -75,7 +90,11 @@ class HumeClient(BaseHumeClient):
         headers: typing.Optional[typing.Dict[str, str]] = None,
         timeout: typing.Optional[float] = None,
         follow_redirects: typing.Optional[bool] = True,
-        httpx_client: typing.Optional[httpx.Client] = None
+        httpx_client: typing.Optional[httpx.Client] = None,
+        json_codec: typing.Optional[typing.Union[JsonCodecName, JsonCodec]] = None,
+        rate_limit: typing.Optional[RateLimit] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
     ):
         # Error if both base_url and environment are specified
         if base_url is not None and environment is not None:
@@ -96,6 +115,10 @@ class HumeClient(BaseHumeClient):
             timeout=timeout,
             follow_redirects=follow_redirects,
             httpx_client=httpx_client,
+            json_codec=json_codec,
+            rate_limit=rate_limit,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
         )
 
 
@@ -118,6 +141,14 @@ class AsyncHumeClient(AsyncBaseHumeClient):
         Whether the default httpx client follows redirects or not, this is irrelevant if a custom httpx client is passed in.
     httpx_client : typing.Optional[httpx.AsyncClient]
         The httpx client to use for making requests, a preconfigured client is used by default, however this is useful should you want to pass in any custom httpx configuration.
+    json_codec : typing.Optional[typing.Union[JsonCodecName, JsonCodec]]
+        The JSON codec used to encode and decode websocket messages. One of "json" (the standard library, default), "orjson", "msgspec", or "auto" to use orjson or msgspec when installed.
+    rate_limit : typing.Optional[typing.Union[float, typing.Mapping[str, float], RateLimiter]]
+        Client-side rate limit for HTTP requests, in requests per second. Pass one rate for each of the "tts", "evi", "batch" and "default" endpoint groups, a mapping of group to rate, or a RateLimiter to share its limits with other clients. Requests also slow down when the API's x-ratelimit-* headers say few are left, and hold off after a 429.
+    retry_budget : typing.Optional[RetryBudget]
+        Caps retries of failed requests at a fraction of the requests that recently succeeded, so that retries don't multiply the load during an outage. Share one RetryBudget between clients to pool it. Its state() reports recent successes, retries and the retries left.
+    circuit_breaker : typing.Optional[CircuitBreaker]
+        Fails requests to a host straight away with CircuitOpenError after repeated 5xx responses or connection errors, probing it again after a timeout. Its states() reports the circuit of each host.
     Examples
     --------
     from hume.client import AsyncHumeClient
@@ -135,7 +166,11 @@ class AsyncHumeClient(AsyncBaseHumeClient):
         api_key: typing.Optional[str] = None,
         timeout: typing.Optional[float] = None,
         follow_redirects: typing.Optional[bool] = True,
-        httpx_client: typing.Optional[httpx.AsyncClient] = None
+        httpx_client: typing.Optional[httpx.AsyncClient] = None,
+        json_codec: typing.Optional[typing.Union[JsonCodecName, JsonCodec]] = None,
+        rate_limit: typing.Optional[RateLimit] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
     ):
         # Error if both base_url and environment are specified
         if base_url is not None and environment is not None:
@@ -156,4 +191,8 @@ class AsyncHumeClient(AsyncBaseHumeClient):
             timeout=timeout,
             follow_redirects=follow_redirects,
             httpx_client=httpx_client,
+            json_codec=json_codec,
+            rate_limit=rate_limit,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
         )
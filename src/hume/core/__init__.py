@@ -7,27 +7,35 @@ from importlib import import_module
 
 if typing.TYPE_CHECKING:
     from .api_error import ApiError
+    from .circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
     from .client_wrapper import AsyncClientWrapper, BaseClientWrapper, SyncClientWrapper
     from .datetime_utils import Rfc2822DateTime, parse_rfc2822_datetime, serialize_datetime
     from .events import EventEmitterMixin, EventType
     from .file import File, convert_file_dict_to_httpx_tuples, with_content_type
+    from .hedging import HedgePolicy, LatencyHistogram, LatencyHistograms
     from .http_client import AsyncHttpClient, HttpClient
     from .http_response import AsyncHttpResponse, HttpResponse
+    from .json_codec import JsonCodec, JsonCodecName, MsgspecCodec, OrjsonCodec, create_json_codec
+    from .json_stream import JsonArrayParser, aiter_json_array, iter_json_array
     from .jsonable_encoder import jsonable_encoder
     from .logging import ConsoleLogger, ILogger, LogConfig, LogLevel, Logger, create_logger
+    from .multipart import AsyncMultipartStream, MultipartEncoder
     from .pagination import AsyncPager, SyncPager
     from .pydantic_utilities import (
         IS_PYDANTIC_V2,
         UniversalBaseModel,
         UniversalRootModel,
         parse_obj_as,
+        parse_union_obj_as,
         universal_field_validator,
         universal_root_validator,
         update_forward_refs,
     )
     from .query_encoder import encode_query
+    from .rate_limit import RateLimit, RateLimiter, create_rate_limiter
     from .remove_none_from_dict import remove_none_from_dict
     from .request_options import RequestOptions
+    from .retry_budget import RetryBudget, RetryBudgetState
     from .serialization import FieldMetadata, convert_and_respect_annotation_metadata
     from .websocket_compat import InvalidWebSocketStatus, get_status_code
 _dynamic_imports: typing.Dict[str, str] = {
@@ -35,35 +43,57 @@ _dynamic_imports: typing.Dict[str, str] = {
     "AsyncClientWrapper": ".client_wrapper",
     "AsyncHttpClient": ".http_client",
     "AsyncHttpResponse": ".http_response",
+    "AsyncMultipartStream": ".multipart",
     "AsyncPager": ".pagination",
     "BaseClientWrapper": ".client_wrapper",
+    "CircuitBreaker": ".circuit_breaker",
+    "CircuitOpenError": ".circuit_breaker",
+    "CircuitState": ".circuit_breaker",
     "ConsoleLogger": ".logging",
     "EventEmitterMixin": ".events",
     "EventType": ".events",
     "FieldMetadata": ".serialization",
     "File": ".file",
+    "HedgePolicy": ".hedging",
     "HttpClient": ".http_client",
     "HttpResponse": ".http_response",
     "ILogger": ".logging",
     "IS_PYDANTIC_V2": ".pydantic_utilities",
     "InvalidWebSocketStatus": ".websocket_compat",
+    "JsonArrayParser": ".json_stream",
+    "JsonCodec": ".json_codec",
+    "JsonCodecName": ".json_codec",
+    "LatencyHistogram": ".hedging",
+    "LatencyHistograms": ".hedging",
     "LogConfig": ".logging",
     "LogLevel": ".logging",
     "Logger": ".logging",
+    "MsgspecCodec": ".json_codec",
+    "MultipartEncoder": ".multipart",
+    "OrjsonCodec": ".json_codec",
+    "RateLimit": ".rate_limit",
+    "RateLimiter": ".rate_limit",
     "RequestOptions": ".request_options",
+    "RetryBudget": ".retry_budget",
+    "RetryBudgetState": ".retry_budget",
     "Rfc2822DateTime": ".datetime_utils",
     "SyncClientWrapper": ".client_wrapper",
     "SyncPager": ".pagination",
     "UniversalBaseModel": ".pydantic_utilities",
     "UniversalRootModel": ".pydantic_utilities",
+    "aiter_json_array": ".json_stream",
     "convert_and_respect_annotation_metadata": ".serialization",
     "convert_file_dict_to_httpx_tuples": ".file",
+    "create_json_codec": ".json_codec",
     "create_logger": ".logging",
+    "create_rate_limiter": ".rate_limit",
     "encode_query": ".query_encoder",
     "get_status_code": ".websocket_compat",
+    "iter_json_array": ".json_stream",
     "jsonable_encoder": ".jsonable_encoder",
     "parse_obj_as": ".pydantic_utilities",
     "parse_rfc2822_datetime": ".datetime_utils",
+    "parse_union_obj_as": ".pydantic_utilities",
     "remove_none_from_dict": ".remove_none_from_dict",
     "serialize_datetime": ".datetime_utils",
     "universal_field_validator": ".pydantic_utilities",
@@ -99,35 +129,57 @@ __all__ = [
     "AsyncClientWrapper",
     "AsyncHttpClient",
     "AsyncHttpResponse",
+    "AsyncMultipartStream",
     "AsyncPager",
     "BaseClientWrapper",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
     "ConsoleLogger",
     "EventEmitterMixin",
     "EventType",
     "FieldMetadata",
     "File",
+    "HedgePolicy",
     "HttpClient",
     "HttpResponse",
     "ILogger",
     "IS_PYDANTIC_V2",
     "InvalidWebSocketStatus",
+    "JsonArrayParser",
+    "JsonCodec",
+    "JsonCodecName",
+    "LatencyHistogram",
+    "LatencyHistograms",
     "LogConfig",
     "LogLevel",
     "Logger",
+    "MsgspecCodec",
+    "MultipartEncoder",
+    "OrjsonCodec",
+    "RateLimit",
+    "RateLimiter",
     "RequestOptions",
+    "RetryBudget",
+    "RetryBudgetState",
     "Rfc2822DateTime",
     "SyncClientWrapper",
     "SyncPager",
     "UniversalBaseModel",
     "UniversalRootModel",
+    "aiter_json_array",
     "convert_and_respect_annotation_metadata",
     "convert_file_dict_to_httpx_tuples",
+    "create_json_codec",
     "create_logger",
+    "create_rate_limiter",
     "encode_query",
     "get_status_code",
+    "iter_json_array",
     "jsonable_encoder",
     "parse_obj_as",
     "parse_rfc2822_datetime",
+    "parse_union_obj_as",
     "remove_none_from_dict",
     "serialize_datetime",
     "universal_field_validator",
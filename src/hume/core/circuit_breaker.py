@@ -0,0 +1,132 @@
+# THIS FILE IS MANUALLY MAINTAINED: see .fernignore
+"""
+Per-host circuit breaking of HTTP requests.
+
+After `failure_threshold` consecutive failures (5xx responses, 408s and connection errors) to a host, its circuit
+opens and requests to it fail straight away with `CircuitOpenError` instead of adding to the load. After
+`reset_timeout` seconds the circuit is half-open: up to `half_open_probes` requests go through, and the first of them
+to finish closes the circuit again if it succeeded, or reopens it if it failed.
+"""
+
+import dataclasses
+import threading
+import time
+import typing
+
+import httpx
+
+from .api_error import ApiError
+
+CircuitStatus = typing.Literal["closed", "open", "half_open"]
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0
+DEFAULT_HALF_OPEN_PROBES = 1
+
+
+class CircuitOpenError(ApiError):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+    def __init__(self, host: str, retry_after: float) -> None:
+        super().__init__(body=f"Circuit open for {host} after repeated failures, retry in {retry_after:.1f}s")
+        self.host = host
+        self.retry_after = retry_after
+
+
+@dataclasses.dataclass(frozen=True)
+class CircuitState:
+    status: CircuitStatus
+    failures: int
+    """Consecutive failures."""
+    retry_after: float
+    """Seconds until an open circuit lets probes through."""
+
+
+@dataclasses.dataclass
+class _Circuit:
+    status: CircuitStatus = "closed"
+    failures: int = 0
+    opened_at: float = 0.0
+    probes: int = 0
+
+
+def is_failure(response: httpx.Response) -> bool:
+    """Whether a response counts against its host's circuit. A 429 means the host is up, just busy."""
+    return response.status_code >= 500 or response.status_code == 408
+
+
+class CircuitBreaker:
+    """Circuits for each host requests are sent to. Safe to share between threads, event loops and clients."""
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        *,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        half_open_probes: int = DEFAULT_HALF_OPEN_PROBES,
+    ) -> None:
+        if failure_threshold < 1 or half_open_probes < 1:
+            raise ValueError("failure_threshold and half_open_probes must be positive")
+        self._lock = threading.Lock()
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._half_open_probes = half_open_probes
+        self._circuits: typing.Dict[str, _Circuit] = {}
+
+    def _retry_after(self, circuit: _Circuit, now: float) -> float:
+        return max(0.0, circuit.opened_at + self._reset_timeout - now)
+
+    def allow(self, host: str) -> bool:
+        """Whether a request to `host` may be sent now. In a half-open circuit, this takes one of the probes."""
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit.status == "closed":
+                return True
+            now = time.monotonic()
+            if self._retry_after(circuit, now) > 0:
+                return False
+            if circuit.status == "open":
+                circuit.status = "half_open"
+                circuit.probes = 0
+            if circuit.probes >= self._half_open_probes:
+                # Probes that never reported back, e.g. because they were cancelled, are given up on after
+                # another reset_timeout
+                if now - circuit.opened_at < 2 * self._reset_timeout:
+                    return False
+                circuit.opened_at = now - self._reset_timeout
+                circuit.probes = 0
+            circuit.probes += 1
+            return True
+
+    def check(self, host: str) -> None:
+        """As `allow`, raising `CircuitOpenError` when the request may not be sent."""
+        if not self.allow(host):
+            raise CircuitOpenError(host, self.state(host).retry_after)
+
+    def record(self, host: str, success: bool) -> None:
+        """Record the outcome of a request to `host`."""
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if success:
+                if circuit is not None:
+                    circuit.status, circuit.failures, circuit.probes = "closed", 0, 0
+                return
+            if circuit is None:
+                circuit = self._circuits[host] = _Circuit()
+            circuit.failures += 1
+            if circuit.status == "half_open" or circuit.failures >= self._failure_threshold:
+                circuit.status = "open"
+                circuit.opened_at = time.monotonic()
+                circuit.probes = 0
+
+    def state(self, host: str) -> CircuitState:
+        with self._lock:
+            circuit = self._circuits.get(host, _Circuit())
+            retry_after = self._retry_after(circuit, time.monotonic()) if circuit.status != "closed" else 0.0
+            return CircuitState(status=circuit.status, failures=circuit.failures, retry_after=retry_after)
+
+    def states(self) -> typing.Dict[str, CircuitState]:
+        """The state of every host a request failed on."""
+        with self._lock:
+            hosts = list(self._circuits)
+        return {host: self.state(host) for host in hosts}
@@ -1,11 +1,31 @@
 # This file was auto-generated by Fern from our API Definition.
 
+import functools
+import types
 import typing
 
 import httpx
 from ..environment import HumeClientEnvironment
+from .circuit_breaker import CircuitBreaker
 from .http_client import AsyncHttpClient, HttpClient
+from .json_codec import JsonCodec, JsonCodecName, create_json_codec
 from .logging import LogConfig, Logger
+from .rate_limit import RateLimit, RateLimiter, create_rate_limiter
+from .retry_budget import RetryBudget
+
+
+@functools.lru_cache(maxsize=None)
+def _sdk_headers() -> typing.Dict[str, str]:
+    import platform
+
+    return {
+        "User-Agent": "hume/0.13.11",
+        "X-Fern-Language": "Python",
+        "X-Fern-Runtime": f"python/{platform.python_version()}",
+        "X-Fern-Platform": f"{platform.system().lower()}/{platform.release()}",
+        "X-Fern-SDK-Name": "hume",
+        "X-Fern-SDK-Version": "0.13.11",
+    }
 
 
 class BaseClientWrapper:
@@ -17,38 +37,85 @@ class BaseClientWrapper:
         environment: HumeClientEnvironment,
         timeout: typing.Optional[float] = None,
         logging: typing.Optional[typing.Union[LogConfig, Logger]] = None,
+        json_codec: typing.Optional[typing.Union[JsonCodecName, JsonCodec]] = None,
+        rate_limit: typing.Optional[RateLimit] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
     ):
+        self._base_headers: typing.Optional[typing.Mapping[str, str]] = None
         self.api_key = api_key
         self._headers = headers
         self._environment = environment
         self._timeout = timeout
         self._logging = logging
+        self._json_codec = create_json_codec(json_codec)
+        self._rate_limiter = create_rate_limiter(rate_limit)
+        self._retry_budget = retry_budget
+        self._circuit_breaker = circuit_breaker
+
+    # The base headers are built once, and again only when the API key or the custom headers are replaced
+
+    @property
+    def api_key(self) -> typing.Optional[str]:
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, api_key: typing.Optional[str]) -> None:
+        self._api_key = api_key
+        self._base_headers = None
+
+    @property
+    def _headers(self) -> typing.Optional[typing.Dict[str, str]]:
+        return self._custom_headers
+
+    @_headers.setter
+    def _headers(self, headers: typing.Optional[typing.Dict[str, str]]) -> None:
+        self._custom_headers = headers
+        self._base_headers = None
+
+    def get_base_headers(self) -> typing.Mapping[str, str]:
+        """The headers sent with every request, as a read-only mapping that is shared between requests."""
+        if self._base_headers is None:
+            headers: typing.Dict[str, str] = {
+                **_sdk_headers(),
+                **(self.get_custom_headers() or {}),
+            }
+            if self.api_key is not None:
+                headers["X-Hume-Api-Key"] = self.api_key
+            self._base_headers = types.MappingProxyType(headers)
+        return self._base_headers
 
     def get_headers(self) -> typing.Dict[str, str]:
-        import platform
-
-        headers: typing.Dict[str, str] = {
-            "User-Agent": "hume/0.13.11",
-            "X-Fern-Language": "Python",
-            "X-Fern-Runtime": f"python/{platform.python_version()}",
-            "X-Fern-Platform": f"{platform.system().lower()}/{platform.release()}",
-            "X-Fern-SDK-Name": "hume",
-            "X-Fern-SDK-Version": "0.13.11",
-            **(self.get_custom_headers() or {}),
-        }
-        if self.api_key is not None:
-            headers["X-Hume-Api-Key"] = self.api_key
-        return headers
+        return dict(self.get_base_headers())
 
     def get_custom_headers(self) -> typing.Optional[typing.Dict[str, str]]:
         return self._headers
 
+    def set_custom_headers(self, headers: typing.Optional[typing.Dict[str, str]]) -> None:
+        """
+        Replace the custom headers. Changes made to the dict passed to the client aren't seen after its first
+        request, as the base headers are cached.
+        """
+        self._headers = headers
+
     def get_environment(self) -> HumeClientEnvironment:
         return self._environment
 
     def get_timeout(self) -> typing.Optional[float]:
         return self._timeout
 
+    def get_json_codec(self) -> JsonCodec:
+        return self._json_codec
+
+    def get_rate_limiter(self) -> typing.Optional[RateLimiter]:
+        return self._rate_limiter
+
+    def get_retry_budget(self) -> typing.Optional[RetryBudget]:
+        return self._retry_budget
+
+    def get_circuit_breaker(self) -> typing.Optional[CircuitBreaker]:
+        return self._circuit_breaker
+
 
 class SyncClientWrapper(BaseClientWrapper):
     def __init__(
@@ -59,14 +126,31 @@ class SyncClientWrapper(BaseClientWrapper):
         environment: HumeClientEnvironment,
         timeout: typing.Optional[float] = None,
         logging: typing.Optional[typing.Union[LogConfig, Logger]] = None,
+        json_codec: typing.Optional[typing.Union[JsonCodecName, JsonCodec]] = None,
+        rate_limit: typing.Optional[RateLimit] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
         httpx_client: httpx.Client,
     ):
-        super().__init__(api_key=api_key, headers=headers, environment=environment, timeout=timeout, logging=logging)
+        super().__init__(
+            api_key=api_key,
+            headers=headers,
+            environment=environment,
+            timeout=timeout,
+            logging=logging,
+            json_codec=json_codec,
+            rate_limit=rate_limit,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
+        )
         self.httpx_client = HttpClient(
             httpx_client=httpx_client,
-            base_headers=self.get_headers,
+            base_headers=self.get_base_headers,
             base_timeout=self.get_timeout,
             logging_config=self._logging,
+            rate_limiter=self._rate_limiter,
+            retry_budget=self._retry_budget,
+            circuit_breaker=self._circuit_breaker,
         )
 
 
@@ -79,22 +163,40 @@ class AsyncClientWrapper(BaseClientWrapper):
         environment: HumeClientEnvironment,
         timeout: typing.Optional[float] = None,
         logging: typing.Optional[typing.Union[LogConfig, Logger]] = None,
+        json_codec: typing.Optional[typing.Union[JsonCodecName, JsonCodec]] = None,
+        rate_limit: typing.Optional[RateLimit] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
         async_token: typing.Optional[typing.Callable[[], typing.Awaitable[str]]] = None,
         httpx_client: httpx.AsyncClient,
     ):
-        super().__init__(api_key=api_key, headers=headers, environment=environment, timeout=timeout, logging=logging)
+        super().__init__(
+            api_key=api_key,
+            headers=headers,
+            environment=environment,
+            timeout=timeout,
+            logging=logging,
+            json_codec=json_codec,
+            rate_limit=rate_limit,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
+        )
         self._async_token = async_token
         self.httpx_client = AsyncHttpClient(
             httpx_client=httpx_client,
-            base_headers=self.get_headers,
+            base_headers=self.get_base_headers,
             base_timeout=self.get_timeout,
             async_base_headers=self.async_get_headers,
             logging_config=self._logging,
+            rate_limiter=self._rate_limiter,
+            retry_budget=self._retry_budget,
+            circuit_breaker=self._circuit_breaker,
         )
 
-    async def async_get_headers(self) -> typing.Dict[str, str]:
+    async def async_get_headers(self) -> typing.Mapping[str, str]:
+        if self._async_token is None:
+            return self.get_base_headers()
         headers = self.get_headers()
-        if self._async_token is not None:
-            token = await self._async_token()
-            headers["Authorization"] = f"Bearer {token}"
+        token = await self._async_token()
+        headers["Authorization"] = f"Bearer {token}"
         return headers
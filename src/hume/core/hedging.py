@@ -0,0 +1,206 @@
+# THIS FILE IS MANUALLY MAINTAINED: see .fernignore
+"""
+Hedged requests: a duplicate of a slow request is sent, and whichever response starts first is used.
+
+The duplicate is sent once the first attempt has gone without response headers for a percentile of the endpoint's
+recent times to headers, so only the slowest few requests are duplicated. Times are kept in a `LatencyHistogram`
+per endpoint. Only POST endpoints that are safe to repeat are hedged.
+"""
+
+import asyncio
+import bisect
+import math
+import threading
+import time
+import typing
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+import httpx
+
+try:
+    from typing import NotRequired  # type: ignore
+except ImportError:
+    from typing_extensions import NotRequired
+
+DEFAULT_HEDGE_PERCENTILE = 95.0
+DEFAULT_MIN_HEDGE_DELAY = 0.05
+DEFAULT_MAX_HEDGE_DELAY = 5.0
+DEFAULT_MIN_HEDGE_SAMPLES = 20
+
+# Upper bounds of the latency histogram's buckets, in seconds
+_BUCKET_BOUNDS = [0.001 * 1.05**i for i in range(math.ceil(math.log(600 / 0.001, 1.05)) + 1)]
+
+# Synthesizing speech has no side effects, so sending a request twice is harmless
+IDEMPOTENT_POST_PATHS = frozenset({"v0/tts", "v0/tts/file"})
+
+
+class HedgePolicy(typing.TypedDict, total=False):
+    """
+    The `hedge` request option.
+
+    Attributes:
+        - percentile: float. Send the duplicate after this percentile of the endpoint's recent times to headers.
+
+        - min_delay_in_seconds: float. Never send the duplicate sooner than this.
+
+        - max_delay_in_seconds: float. Never wait longer than this, and wait this long until the endpoint has
+          `min_samples` times recorded.
+
+        - min_samples: int. Times to record before the percentile is trusted.
+    """
+
+    percentile: NotRequired[float]
+    min_delay_in_seconds: NotRequired[float]
+    max_delay_in_seconds: NotRequired[float]
+    min_samples: NotRequired[int]
+
+
+def is_hedgeable(method: str, path: typing.Optional[str]) -> bool:
+    return method.upper() == "POST" and (path or "").strip("/") in IDEMPOTENT_POST_PATHS
+
+
+class LatencyHistogram:
+    """
+    Counts of latencies in buckets of roughly 5% width, between 1 ms and 10 minutes.
+
+    Only the last `window` samples are kept, so percentiles follow the endpoint as it speeds up or slows down.
+    """
+
+    def __init__(self, window: int = 1000) -> None:
+        self._lock = threading.Lock()
+        self._counts = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self._recent: typing.List[int] = []
+        self._window = window
+        self._next = 0
+
+    def record(self, seconds: float) -> None:
+        bucket = bisect.bisect_left(_BUCKET_BOUNDS, seconds)
+        with self._lock:
+            if len(self._recent) < self._window:
+                self._recent.append(bucket)
+            else:
+                self._counts[self._recent[self._next]] -= 1
+                self._recent[self._next] = bucket
+                self._next = (self._next + 1) % self._window
+            self._counts[bucket] += 1
+
+    @property
+    def count(self) -> int:
+        return len(self._recent)
+
+    def percentile(self, percentile: float) -> typing.Optional[float]:
+        """The upper bound of the bucket that the `percentile`th sample falls in, or `None` without samples."""
+        with self._lock:
+            total = len(self._recent)
+            if total == 0:
+                return None
+            rank = max(1, math.ceil(total * percentile / 100))
+            seen = 0
+            for bucket, count in enumerate(self._counts):
+                seen += count
+                if seen >= rank:
+                    break
+        return _BUCKET_BOUNDS[min(bucket, len(_BUCKET_BOUNDS) - 1)]
+
+
+class LatencyHistograms:
+    """A `LatencyHistogram` per endpoint, created as endpoints are first used."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: typing.Dict[str, LatencyHistogram] = {}
+
+    def __getitem__(self, endpoint: str) -> LatencyHistogram:
+        with self._lock:
+            histogram = self._histograms.get(endpoint)
+            if histogram is None:
+                histogram = self._histograms[endpoint] = LatencyHistogram()
+            return histogram
+
+    def endpoints(self) -> typing.List[str]:
+        with self._lock:
+            return list(self._histograms)
+
+
+def hedge_delay(histogram: LatencyHistogram, policy: HedgePolicy) -> float:
+    """Seconds to wait for the first attempt's headers before sending the duplicate."""
+    min_delay = policy.get("min_delay_in_seconds", DEFAULT_MIN_HEDGE_DELAY)
+    max_delay = policy.get("max_delay_in_seconds", DEFAULT_MAX_HEDGE_DELAY)
+    if histogram.count < policy.get("min_samples", DEFAULT_MIN_HEDGE_SAMPLES):
+        return max_delay
+    delay = histogram.percentile(policy.get("percentile", DEFAULT_HEDGE_PERCENTILE))
+    return min(max(delay if delay is not None else max_delay, min_delay), max_delay)
+
+
+def _close_response(future: "Future[httpx.Response]") -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def send_hedged(
+    client: httpx.Client,
+    request: httpx.Request,
+    delay: float,
+    histogram: LatencyHistogram,
+    may_hedge: typing.Optional[typing.Callable[[], bool]] = None,
+) -> httpx.Response:
+    """
+    Send `request`, and a duplicate if no headers arrived within `delay` seconds and `may_hedge` allows it, e.g.
+    by taking a rate limit token. Returns the first response to arrive, with its body unread. The other attempt
+    can't be interrupted, so it is closed as soon as its headers arrive. If every attempt sent fails, the first
+    one's error is raised.
+    """
+    start = time.monotonic()
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hume-hedge")
+    attempts = [executor.submit(client.send, request, stream=True)]
+    winner: typing.Optional["Future[httpx.Response]"] = None
+    try:
+        done, _ = wait(attempts, timeout=delay)
+        if not done and (may_hedge is None or may_hedge()):
+            attempts.append(executor.submit(client.send, request, stream=True))
+        pending = set(attempts)
+        while winner is None and pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((attempt for attempt in attempts if attempt in done and attempt.exception() is None), None)
+        if winner is None:
+            return attempts[0].result()
+        histogram.record(time.monotonic() - start)
+        return winner.result()
+    finally:
+        for attempt in attempts:
+            if attempt is not winner:
+                attempt.add_done_callback(_close_response)
+        executor.shutdown(wait=False)
+
+
+async def asend_hedged(
+    client: httpx.AsyncClient,
+    request: httpx.Request,
+    delay: float,
+    histogram: LatencyHistogram,
+    may_hedge: typing.Optional[typing.Callable[[], bool]] = None,
+) -> httpx.Response:
+    """As `send_hedged`, cancelling the other attempt outright."""
+    start = time.monotonic()
+    attempts = [asyncio.ensure_future(client.send(request, stream=True))]
+    winner: typing.Optional["asyncio.Future[httpx.Response]"] = None
+    try:
+        done, _ = await asyncio.wait(attempts, timeout=delay)
+        if not done and (may_hedge is None or may_hedge()):
+            attempts.append(asyncio.ensure_future(client.send(request, stream=True)))
+        pending = set(attempts)
+        while winner is None and pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            winner = next((attempt for attempt in attempts if attempt in done and attempt.exception() is None), None)
+        if winner is None:
+            return attempts[0].result()
+        histogram.record(time.monotonic() - start)
+        return winner.result()
+    finally:
+        for attempt in attempts:
+            if attempt is winner:
+                continue
+            if not attempt.done():
+                attempt.cancel()
+            elif not attempt.cancelled() and attempt.exception() is None:
+                await attempt.result().aclose()
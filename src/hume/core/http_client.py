@@ -5,19 +5,26 @@ import email.utils
 import re
 import time
 import typing
+import urllib.parse
 from contextlib import asynccontextmanager, contextmanager
 from random import random
 
 import httpx
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, is_failure
 from .file import File, convert_file_dict_to_httpx_tuples
 from .force_multipart import FORCE_MULTIPART
+from .hedging import HedgePolicy, LatencyHistograms, asend_hedged, hedge_delay, is_hedgeable, send_hedged
 from .jsonable_encoder import jsonable_encoder
 from .logging import LogConfig, Logger, create_logger
 from .query_encoder import encode_query
 from .remove_none_from_dict import remove_none_from_dict as remove_none_from_dict
 from .request_options import RequestOptions
+from .retry_budget import RetryBudget
 from httpx._types import RequestFiles
 
+if typing.TYPE_CHECKING:
+    from .rate_limit import RateLimiter
+
 INITIAL_RETRY_DELAY_SECONDS = 1.0
 MAX_RETRY_DELAY_SECONDS = 60.0
 JITTER_FACTOR = 0.2  # 20% random jitter
@@ -123,6 +130,74 @@ def _should_retry(response: httpx.Response) -> bool:
     return response.status_code >= 500 or response.status_code in retryable_400s
 
 
+def _hedge_policy(
+    method: str, path: typing.Optional[str], request_options: typing.Optional[RequestOptions]
+) -> typing.Optional[HedgePolicy]:
+    """The `hedge` request option, for the endpoints that are safe to send twice."""
+    policy = request_options.get("hedge") if request_options is not None else None
+    return policy if policy is not None and is_hedgeable(method, path) else None
+
+
+def _hedge_permit(
+    client: typing.Union["HttpClient", "AsyncHttpClient"], path: typing.Optional[str]
+) -> typing.Optional[typing.Callable[[], bool]]:
+    """A hedge is a request of its own, so it is only sent when the rate limiter has a token for it right away."""
+    rate_limiter = client.rate_limiter
+    if rate_limiter is None:
+        return None
+    return lambda: rate_limiter.try_reserve(path)
+
+
+def _request_host(url: str) -> str:
+    return urllib.parse.urlsplit(url).netloc
+
+
+def _allow_request(client: typing.Union["HttpClient", "AsyncHttpClient"], host: str, *, retrying: bool) -> bool:
+    """
+    Whether the circuit breaker lets a request to `host` through. A first attempt that isn't let through raises
+    `CircuitOpenError`; a retry returns `False`, so the response being retried is returned instead.
+    """
+    if client.circuit_breaker is None or client.circuit_breaker.allow(host):
+        return True
+    if retrying:
+        return False
+    raise CircuitOpenError(host, client.circuit_breaker.state(host).retry_after)
+
+
+def _observe_response(
+    client: typing.Union["HttpClient", "AsyncHttpClient"],
+    path: typing.Optional[str],
+    host: str,
+    response: httpx.Response,
+) -> None:
+    if client.rate_limiter is not None:
+        client.rate_limiter.observe(path, response)
+    if client.circuit_breaker is not None:
+        client.circuit_breaker.record(host, success=not is_failure(response))
+    if client.retry_budget is not None and not _should_retry(response):
+        client.retry_budget.record_success()
+
+
+def _observe_error(client: typing.Union["HttpClient", "AsyncHttpClient"], host: str) -> None:
+    if client.circuit_breaker is not None:
+        client.circuit_breaker.record(host, success=False)
+
+
+def _may_retry(
+    client: typing.Union["HttpClient", "AsyncHttpClient"],
+    response: httpx.Response,
+    retries: int,
+    max_retries: int,
+) -> bool:
+    if not _should_retry(response) or retries >= max_retries:
+        return False
+    if client.retry_budget is not None and not client.retry_budget.try_retry():
+        if client.logger.is_debug():
+            client.logger.debug("Retry budget exhausted, not retrying", status_code=response.status_code)
+        return False
+    return True
+
+
 _SENSITIVE_HEADERS = frozenset(
     {
         "authorization",
@@ -188,6 +263,27 @@ def _maybe_filter_none_from_multipart_data(
     return data
 
 
+def _merge_headers(
+    base_headers: typing.Mapping[str, str],
+    *overrides: typing.Optional[typing.Mapping[str, typing.Any]],
+) -> typing.Dict[str, typing.Any]:
+    """
+    Merge request headers over the base headers, dropping `None` values.
+
+    The base headers are already strings. Only header values that aren't strings go through `jsonable_encoder`.
+    """
+    merged: typing.Dict[str, typing.Any] = dict(base_headers)
+    for override in overrides:
+        if not override:
+            continue
+        for key, value in override.items():
+            if value is None:
+                merged.pop(key, None)
+            else:
+                merged[key] = value if isinstance(value, str) else jsonable_encoder(value)
+    return merged
+
+
 def remove_omit_from_dict(
     original: typing.Dict[str, typing.Optional[typing.Any]],
     omit: typing.Optional[typing.Any],
@@ -263,15 +359,22 @@ class HttpClient:
         *,
         httpx_client: httpx.Client,
         base_timeout: typing.Callable[[], typing.Optional[float]],
-        base_headers: typing.Callable[[], typing.Dict[str, str]],
+        base_headers: typing.Callable[[], typing.Mapping[str, str]],
         base_url: typing.Optional[typing.Callable[[], str]] = None,
         logging_config: typing.Optional[typing.Union[LogConfig, Logger]] = None,
+        rate_limiter: typing.Optional["RateLimiter"] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
     ):
         self.base_url = base_url
         self.base_timeout = base_timeout
         self.base_headers = base_headers
         self.httpx_client = httpx_client
         self.logger = create_logger(logging_config)
+        self.rate_limiter = rate_limiter
+        self.retry_budget = retry_budget
+        self.circuit_breaker = circuit_breaker
+        self.latency_histograms = LatencyHistograms()
 
     def get_base_url(self, maybe_base_url: typing.Optional[str]) -> str:
         base_url = maybe_base_url
@@ -282,6 +385,12 @@ class HttpClient:
             raise ValueError("A base_url is required to make this request, please provide one and try again.")
         return base_url
 
+    def _send_hedged(self, path: typing.Optional[str], policy: HedgePolicy, request: httpx.Request) -> httpx.Response:
+        histogram = self.latency_histograms[f"{request.method} {path}"]
+        return send_hedged(
+            self.httpx_client, request, hedge_delay(histogram, policy), histogram, _hedge_permit(self, path)
+        )
+
     def request(
         self,
         path: typing.Optional[str] = None,
@@ -345,14 +454,10 @@ class HttpClient:
         )
 
         _request_url = _build_url(base_url, path)
-        _request_headers = jsonable_encoder(
-            remove_none_from_dict(
-                {
-                    **self.base_headers(),
-                    **(headers if headers is not None else {}),
-                    **(request_options.get("additional_headers", {}) or {} if request_options is not None else {}),
-                }
-            )
+        _request_headers = _merge_headers(
+            self.base_headers(),
+            headers,
+            request_options.get("additional_headers") if request_options is not None else None,
         )
 
         if self.logger.is_debug():
@@ -364,7 +469,9 @@ class HttpClient:
                 has_body=json_body is not None or data_body is not None,
             )
 
-        response = self.httpx_client.request(
+        max_retries: int = request_options.get("max_retries", 2) if request_options is not None else 2
+        _host = _request_host(_request_url)
+        _send_kwargs: typing.Dict[str, typing.Any] = dict(
             method=method,
             url=_request_url,
             headers=_request_headers,
@@ -375,24 +482,30 @@ class HttpClient:
             files=request_files,
             timeout=timeout,
         )
-
-        max_retries: int = request_options.get("max_retries", 2) if request_options is not None else 2
-        if _should_retry(response=response):
-            if retries < max_retries:
-                time.sleep(_retry_timeout(response=response, retries=retries))
-                return self.request(
-                    path=path,
-                    method=method,
-                    base_url=base_url,
-                    params=params,
-                    json=json,
-                    content=content,
-                    files=files,
-                    headers=headers,
-                    request_options=request_options,
-                    retries=retries + 1,
-                    omit=omit,
-                )
+        _hedge = _hedge_policy(method, path, request_options)
+        response: typing.Optional[httpx.Response] = None
+        while True:
+            if not _allow_request(self, _host, retrying=response is not None):
+                break
+            if self.rate_limiter is not None:
+                _delay = self.rate_limiter.reserve(path)
+                if _delay > 0:
+                    time.sleep(_delay)
+            try:
+                if _hedge is not None:
+                    response = self._send_hedged(path, _hedge, self.httpx_client.build_request(**_send_kwargs))
+                    response.read()
+                else:
+                    response = self.httpx_client.request(**_send_kwargs)
+            except httpx.TransportError:
+                _observe_error(self, _host)
+                raise
+            _observe_response(self, path, _host, response)
+            if not _may_retry(self, response, retries, max_retries):
+                break
+            time.sleep(_retry_timeout(response=response, retries=retries))
+            retries += 1
+        assert response is not None
 
         if self.logger.is_debug():
             if 200 <= response.status_code < 400:
@@ -478,14 +591,10 @@ class HttpClient:
         )
 
         _request_url = _build_url(base_url, path)
-        _request_headers = jsonable_encoder(
-            remove_none_from_dict(
-                {
-                    **self.base_headers(),
-                    **(headers if headers is not None else {}),
-                    **(request_options.get("additional_headers", {}) if request_options is not None else {}),
-                }
-            )
+        _request_headers = _merge_headers(
+            self.base_headers(),
+            headers,
+            request_options.get("additional_headers") if request_options is not None else None,
         )
 
         if self.logger.is_debug():
@@ -496,7 +605,8 @@ class HttpClient:
                 headers=_redact_headers(_request_headers),
             )
 
-        with self.httpx_client.stream(
+        _host = _request_host(_request_url)
+        _send_kwargs: typing.Dict[str, typing.Any] = dict(
             method=method,
             url=_request_url,
             headers=_request_headers,
@@ -506,8 +616,29 @@ class HttpClient:
             content=content,
             files=request_files,
             timeout=timeout,
-        ) as stream:
-            yield stream
+        )
+        _hedge = _hedge_policy(method, path, request_options)
+        _allow_request(self, _host, retrying=False)
+        if self.rate_limiter is not None:
+            _delay = self.rate_limiter.reserve(path)
+            if _delay > 0:
+                time.sleep(_delay)
+
+        try:
+            if _hedge is not None:
+                response = self._send_hedged(path, _hedge, self.httpx_client.build_request(**_send_kwargs))
+                try:
+                    _observe_response(self, path, _host, response)
+                    yield response
+                finally:
+                    response.close()
+            else:
+                with self.httpx_client.stream(**_send_kwargs) as stream:
+                    _observe_response(self, path, _host, stream)
+                    yield stream
+        except httpx.TransportError:
+            _observe_error(self, _host)
+            raise
 
 
 class AsyncHttpClient:
@@ -516,10 +647,13 @@ class AsyncHttpClient:
         *,
         httpx_client: httpx.AsyncClient,
         base_timeout: typing.Callable[[], typing.Optional[float]],
-        base_headers: typing.Callable[[], typing.Dict[str, str]],
+        base_headers: typing.Callable[[], typing.Mapping[str, str]],
         base_url: typing.Optional[typing.Callable[[], str]] = None,
-        async_base_headers: typing.Optional[typing.Callable[[], typing.Awaitable[typing.Dict[str, str]]]] = None,
+        async_base_headers: typing.Optional[typing.Callable[[], typing.Awaitable[typing.Mapping[str, str]]]] = None,
         logging_config: typing.Optional[typing.Union[LogConfig, Logger]] = None,
+        rate_limiter: typing.Optional["RateLimiter"] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
     ):
         self.base_url = base_url
         self.base_timeout = base_timeout
@@ -527,8 +661,12 @@ class AsyncHttpClient:
         self.async_base_headers = async_base_headers
         self.httpx_client = httpx_client
         self.logger = create_logger(logging_config)
+        self.rate_limiter = rate_limiter
+        self.retry_budget = retry_budget
+        self.circuit_breaker = circuit_breaker
+        self.latency_histograms = LatencyHistograms()
 
-    async def _get_headers(self) -> typing.Dict[str, str]:
+    async def _get_headers(self) -> typing.Mapping[str, str]:
         if self.async_base_headers is not None:
             return await self.async_base_headers()
         return self.base_headers()
@@ -542,6 +680,14 @@ class AsyncHttpClient:
             raise ValueError("A base_url is required to make this request, please provide one and try again.")
         return base_url
 
+    async def _send_hedged(
+        self, path: typing.Optional[str], policy: HedgePolicy, request: httpx.Request
+    ) -> httpx.Response:
+        histogram = self.latency_histograms[f"{request.method} {path}"]
+        return await asend_hedged(
+            self.httpx_client, request, hedge_delay(histogram, policy), histogram, _hedge_permit(self, path)
+        )
+
     async def request(
         self,
         path: typing.Optional[str] = None,
@@ -608,14 +754,10 @@ class AsyncHttpClient:
         )
 
         _request_url = _build_url(base_url, path)
-        _request_headers = jsonable_encoder(
-            remove_none_from_dict(
-                {
-                    **_headers,
-                    **(headers if headers is not None else {}),
-                    **(request_options.get("additional_headers", {}) or {} if request_options is not None else {}),
-                }
-            )
+        _request_headers = _merge_headers(
+            _headers,
+            headers,
+            request_options.get("additional_headers") if request_options is not None else None,
         )
 
         if self.logger.is_debug():
@@ -627,7 +769,9 @@ class AsyncHttpClient:
                 has_body=json_body is not None or data_body is not None,
             )
 
-        response = await self.httpx_client.request(
+        max_retries: int = request_options.get("max_retries", 2) if request_options is not None else 2
+        _host = _request_host(_request_url)
+        _send_kwargs: typing.Dict[str, typing.Any] = dict(
             method=method,
             url=_request_url,
             headers=_request_headers,
@@ -638,24 +782,30 @@ class AsyncHttpClient:
             files=request_files,
             timeout=timeout,
         )
-
-        max_retries: int = request_options.get("max_retries", 2) if request_options is not None else 2
-        if _should_retry(response=response):
-            if retries < max_retries:
-                await asyncio.sleep(_retry_timeout(response=response, retries=retries))
-                return await self.request(
-                    path=path,
-                    method=method,
-                    base_url=base_url,
-                    params=params,
-                    json=json,
-                    content=content,
-                    files=files,
-                    headers=headers,
-                    request_options=request_options,
-                    retries=retries + 1,
-                    omit=omit,
-                )
+        _hedge = _hedge_policy(method, path, request_options)
+        response: typing.Optional[httpx.Response] = None
+        while True:
+            if not _allow_request(self, _host, retrying=response is not None):
+                break
+            if self.rate_limiter is not None:
+                _delay = self.rate_limiter.reserve(path)
+                if _delay > 0:
+                    await asyncio.sleep(_delay)
+            try:
+                if _hedge is not None:
+                    response = await self._send_hedged(path, _hedge, self.httpx_client.build_request(**_send_kwargs))
+                    await response.aread()
+                else:
+                    response = await self.httpx_client.request(**_send_kwargs)
+            except httpx.TransportError:
+                _observe_error(self, _host)
+                raise
+            _observe_response(self, path, _host, response)
+            if not _may_retry(self, response, retries, max_retries):
+                break
+            await asyncio.sleep(_retry_timeout(response=response, retries=retries))
+            retries += 1
+        assert response is not None
 
         if self.logger.is_debug():
             if 200 <= response.status_code < 400:
@@ -744,14 +894,10 @@ class AsyncHttpClient:
         )
 
         _request_url = _build_url(base_url, path)
-        _request_headers = jsonable_encoder(
-            remove_none_from_dict(
-                {
-                    **_headers,
-                    **(headers if headers is not None else {}),
-                    **(request_options.get("additional_headers", {}) if request_options is not None else {}),
-                }
-            )
+        _request_headers = _merge_headers(
+            _headers,
+            headers,
+            request_options.get("additional_headers") if request_options is not None else None,
         )
 
         if self.logger.is_debug():
@@ -762,7 +908,8 @@ class AsyncHttpClient:
                 headers=_redact_headers(_request_headers),
             )
 
-        async with self.httpx_client.stream(
+        _host = _request_host(_request_url)
+        _send_kwargs: typing.Dict[str, typing.Any] = dict(
             method=method,
             url=_request_url,
             headers=_request_headers,
@@ -772,5 +919,26 @@ class AsyncHttpClient:
             content=content,
             files=request_files,
             timeout=timeout,
-        ) as stream:
-            yield stream
+        )
+        _hedge = _hedge_policy(method, path, request_options)
+        _allow_request(self, _host, retrying=False)
+        if self.rate_limiter is not None:
+            _delay = self.rate_limiter.reserve(path)
+            if _delay > 0:
+                await asyncio.sleep(_delay)
+
+        try:
+            if _hedge is not None:
+                response = await self._send_hedged(path, _hedge, self.httpx_client.build_request(**_send_kwargs))
+                try:
+                    _observe_response(self, path, _host, response)
+                    yield response
+                finally:
+                    await response.aclose()
+            else:
+                async with self.httpx_client.stream(**_send_kwargs) as stream:
+                    _observe_response(self, path, _host, stream)
+                    yield stream
+        except httpx.TransportError:
+            _observe_error(self, _host)
+            raise
@@ -0,0 +1,207 @@
+# THIS FILE IS MANUALLY MAINTAINED: see .fernignore
+import functools
+import json
+import typing
+from json.decoder import JSONDecodeError
+
+import pydantic
+
+from .pydantic_utilities import IS_PYDANTIC_V2, UniversalBaseModel
+from .serialization import FieldMetadata
+
+JsonCodecName = typing.Literal["auto", "json", "orjson", "msgspec"]
+
+
+class JsonCodec:
+    """
+    Encodes and decodes the JSON frames exchanged over the SDK's websocket connections.
+
+    This is the standard library implementation. `OrjsonCodec` and `MsgspecCodec` are drop-in replacements
+    that are used when the corresponding package is installed and selected via `json_codec` on the client.
+    Websocket frames are text, so encoders return `str` and decoders accept either `str` or `bytes`.
+    """
+
+    name: str = "json"
+
+    def loads(self, data: typing.Union[str, bytes]) -> typing.Any:
+        return json.loads(data)
+
+    def dumps(self, obj: typing.Any) -> str:
+        return json.dumps(obj)
+
+    def dumps_model(self, model: typing.Any) -> str:
+        return self.dumps(model.dict())
+
+
+def _is_dict_serializer(serialization: typing.Any) -> bool:
+    function = serialization.get("function") if isinstance(serialization, dict) else None
+    return getattr(function, "__qualname__", None) == "UniversalBaseModel.serialize_model"
+
+
+class _ModelStandIn(type):
+    """
+    Stands in for a model class in a copied core schema. Given the model class itself, pydantic-core reuses the
+    serializer already built for it, which would bring the `.dict()` serializer back.
+    """
+
+    model: type
+
+    def __instancecheck__(cls, instance: typing.Any) -> bool:
+        return isinstance(instance, cls.model)
+
+
+def _without_dict_serializers(schema: typing.Any) -> typing.Any:
+    """Copy of a core schema without UniversalBaseModel's json-mode serializer, which goes through `.dict()`."""
+    if isinstance(schema, dict):
+        copy = {
+            key: _without_dict_serializers(value)
+            for key, value in schema.items()
+            if not (key == "serialization" and _is_dict_serializer(value))
+        }
+        if copy.get("type") == "model":
+            cls = copy["cls"]
+            copy["cls"] = _ModelStandIn(cls.__name__, (), {"model": cls})
+        return copy
+    if isinstance(schema, list):
+        return [_without_dict_serializers(value) for value in schema]
+    return schema
+
+
+def _serializes_like_dict(schema: typing.Any) -> bool:
+    """
+    Whether pydantic-core alone produces what `.dict()` does for a schema: not when it holds datetimes, which
+    `.dict()` formats with `serialize_datetime`, or fields renamed with `FieldMetadata`.
+    """
+    if isinstance(schema, dict):
+        if schema.get("type") == "datetime":
+            return False
+        cls = schema.get("cls") if schema.get("type") == "model" else None
+        if cls is not None and any(
+            isinstance(metadata, FieldMetadata) for field in cls.model_fields.values() for metadata in field.metadata
+        ):
+            return False
+        return all(_serializes_like_dict(value) for value in schema.values())
+    if isinstance(schema, list):
+        return all(_serializes_like_dict(value) for value in schema)
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _model_serializer(cls: typing.Type[UniversalBaseModel]) -> typing.Optional[typing.Any]:
+    """A pydantic-core serializer for `cls` that skips `.dict()`, or `None` when it wouldn't match `.dict()`."""
+    import pydantic_core
+
+    schema = cls.__pydantic_core_schema__  # type: ignore[attr-defined]
+    if not _serializes_like_dict(schema):
+        return None
+    return pydantic_core.SchemaSerializer(_without_dict_serializers(schema))
+
+
+def _unset_nones(value: typing.Any) -> typing.Any:
+    """
+    The `exclude` argument that drops the fields `.dict()` drops: those that are `None` without having been set.
+    Fields with any other value are kept whether or not they were set, as `.dict()` keeps non-`None` defaults.
+    """
+    if isinstance(value, pydantic.BaseModel):
+        fields_set = value.model_fields_set  # type: ignore[attr-defined]
+        exclude: typing.Dict[typing.Any, typing.Any] = {}
+        for name in type(value).model_fields:  # type: ignore[attr-defined]
+            item = getattr(value, name)
+            if item is None:
+                if name not in fields_set:
+                    exclude[name] = True
+            else:
+                nested = _unset_nones(item)
+                if nested:
+                    exclude[name] = nested
+        return exclude
+    if isinstance(value, (list, tuple)):
+        items = enumerate(value)
+    elif isinstance(value, dict):
+        items = iter(value.items())
+    else:
+        return None
+    exclude = {}
+    for key, item in items:
+        nested = _unset_nones(item)
+        if nested:
+            exclude[key] = nested
+    return exclude
+
+
+class _PydanticJsonCodec(JsonCodec):
+    """Serializes SDK models straight to JSON with pydantic-core rather than through the dict of `.dict()`."""
+
+    def dumps_model(self, model: typing.Any) -> str:
+        serializer = None
+        if IS_PYDANTIC_V2 and isinstance(model, UniversalBaseModel):
+            serializer = _model_serializer(type(model))
+        if serializer is None:
+            return self.dumps(model.dict())
+        # The same output as `.dict()`, which merges an exclude_unset and an exclude_none dump: fields by alias,
+        # leaving out only the unset ones that are None
+        return serializer.to_json(model, by_alias=True, exclude=_unset_nones(model) or None).decode("utf-8")
+
+
+class OrjsonCodec(_PydanticJsonCodec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def loads(self, data: typing.Union[str, bytes]) -> typing.Any:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers' error handling is unchanged.
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: typing.Any) -> str:
+        return self._orjson.dumps(obj, option=self._options).decode("utf-8")
+
+
+class MsgspecCodec(_PydanticJsonCodec):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._decode_error = msgspec.DecodeError
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: typing.Union[str, bytes]) -> typing.Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as exc:
+            doc = data if isinstance(data, str) else bytes(data).decode("utf-8", errors="replace")
+            raise JSONDecodeError(str(exc), doc, 0) from exc
+
+    def dumps(self, obj: typing.Any) -> str:
+        return self._encoder.encode(obj).decode("utf-8")
+
+
+_default_json_codec: JsonCodec = JsonCodec()
+
+
+def create_json_codec(codec: typing.Optional[typing.Union[JsonCodecName, JsonCodec]] = None) -> JsonCodec:
+    """
+    Resolve the `json_codec` client option. `"auto"` prefers orjson, then msgspec, and falls back to the
+    standard library when neither is installed. Naming a specific codec requires its package to be installed.
+    """
+    if codec is None or codec == "json":
+        return _default_json_codec
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec == "orjson":
+        return OrjsonCodec()
+    if codec == "msgspec":
+        return MsgspecCodec()
+    if codec == "auto":
+        for candidate in (OrjsonCodec, MsgspecCodec):
+            try:
+                return candidate()
+            except ImportError:
+                continue
+        return _default_json_codec
+    raise ValueError(f"Unknown JSON codec: {codec!r}")
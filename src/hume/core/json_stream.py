@@ -0,0 +1,103 @@
+# THIS FILE IS MANUALLY MAINTAINED: see .fernignore
+"""
+Incremental parsing of a JSON array whose elements are yielded as soon as they have arrived.
+
+Only the element being received is buffered, so memory follows the largest element rather than the whole
+document. Elements are decoded with the C scanner of the standard library's `json` module. An incomplete
+element is retried only once the buffer has doubled, which keeps the total parsing work linear.
+"""
+
+import codecs
+import json
+import typing
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789.eE+-"
+_DECODER = json.JSONDecoder()
+
+
+class JsonArrayParser:
+    """Push parser: `feed` text as it arrives and get back the elements it completes."""
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._pos = 0
+        # Text received since the buffer was last assembled, so a large element isn't copied on every chunk
+        self._pending: typing.List[str] = []
+        self._pending_size = 0
+        # "start" -> "first" -> ("separator" <-> "value") -> "end"
+        self._state = "start"
+        self._retry_at = 0
+
+    def feed(self, text: str, final: bool = False) -> typing.List[typing.Any]:
+        self._pending.append(text)
+        self._pending_size += len(text)
+        if not final and len(self._buffer) - self._pos + self._pending_size < self._retry_at:
+            return []
+        buffer = self._buffer = self._buffer[self._pos :] + "".join(self._pending)
+        self._pos = 0
+        self._pending = []
+        self._pending_size = 0
+        items: typing.List[typing.Any] = []
+        while True:
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos == len(buffer):
+                break
+            char = buffer[pos]
+            if self._state == "end":
+                raise ValueError(f"Unexpected data after the end of the JSON array at position {pos}")
+            if self._state == "start":
+                if char != "[":
+                    raise ValueError("Expected a JSON array")
+                self._pos += 1
+                self._state = "first"
+                continue
+            if self._state == "separator" or (self._state == "first" and char == "]"):
+                if char not in ",]":
+                    raise ValueError(f"Expected ',' or ']' at position {pos}")
+                self._pos += 1
+                self._state = "value" if char == "," else "end"
+                continue
+            if not final and len(buffer) - pos < self._retry_at:
+                break
+            try:
+                item, end = _DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                self._retry_at = 2 * (len(buffer) - pos)
+                break
+            if not final and type(item) in (int, float) and (end == len(buffer) or buffer[end] in _NUMBER_CHARS):
+                # A number cut off at the end of the buffer may continue in the next chunk
+                self._retry_at = len(buffer) - pos + 1
+                break
+            items.append(item)
+            self._pos = end
+            self._state = "separator"
+            self._retry_at = 0
+        if final and self._state != "end":
+            raise ValueError("The JSON array ended early")
+        return items
+
+
+def iter_json_array(chunks: typing.Iterable[bytes]) -> typing.Iterator[typing.Any]:
+    """Yield the elements of the UTF-8 JSON array streamed in `chunks`."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parser = JsonArrayParser()
+    for chunk in chunks:
+        yield from parser.feed(decoder.decode(chunk))
+    yield from parser.feed(decoder.decode(b"", final=True), final=True)
+
+
+async def aiter_json_array(chunks: typing.AsyncIterable[bytes]) -> typing.AsyncIterator[typing.Any]:
+    """Yield the elements of the UTF-8 JSON array streamed in `chunks`."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parser = JsonArrayParser()
+    async for chunk in chunks:
+        for item in parser.feed(decoder.decode(chunk)):
+            yield item
+    for item in parser.feed(decoder.decode(b"", final=True), final=True):
+        yield item
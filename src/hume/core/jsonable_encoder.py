@@ -27,9 +27,13 @@ from .pydantic_utilities import (
 SetIntStr = Set[Union[int, str]]
 DictIntStrAny = Dict[Union[int, str], Any]
 
+# Exact types that are already JSON-compatible. Subclasses (e.g. str-valued enums) take the full path.
+_JSON_PRIMITIVES = frozenset({str, int, float, bool, type(None)})
+
 
 def jsonable_encoder(obj: Any, custom_encoder: Optional[Dict[Any, Callable[[Any], Any]]] = None) -> Any:
-    custom_encoder = custom_encoder or {}
+    if not custom_encoder:
+        return _encode(obj)
     # Generated SDKs use Ellipsis (`...`) as the sentinel value for "OMIT".
     # OMIT values should be excluded from serialized payloads.
     if obj is Ellipsis:
@@ -106,3 +110,94 @@ def jsonable_encoder(obj: Any, custom_encoder: Optional[Dict[Any, Callable[[Any]
         return jsonable_encoder(data, custom_encoder=custom_encoder)
 
     return to_jsonable_with_fallback(obj, fallback_serializer)
+
+
+# Single-pass encoder used when there is no custom encoder, which is every request body the SDK sends. It produces
+# the same output as the general path above but dispatches on exact type, keeps JSON primitives inline instead of
+# recursing into them, and doesn't copy dict keys into a set.
+
+
+def _encode(obj: Any) -> Any:
+    obj_type = type(obj)
+    if obj_type in _JSON_PRIMITIVES:
+        return obj
+    if obj_type is dict:
+        return _encode_dict(obj)
+    if obj_type is list or obj_type is tuple:
+        return _encode_list(obj)
+    return _encode_other(obj)
+
+
+def _encode_dict(obj: Dict[Any, Any]) -> Dict[Any, Any]:
+    encoded_dict = {}
+    for key, value in obj.items():
+        # Generated SDKs use Ellipsis (`...`) as the sentinel value for "OMIT".
+        if value is Ellipsis:
+            continue
+        if type(key) is not str:
+            key = _encode(key)
+        encoded_dict[key] = value if type(value) in _JSON_PRIMITIVES else _encode(value)
+    return encoded_dict
+
+
+def _encode_list(obj: Any) -> List[Any]:
+    return [item if type(item) in _JSON_PRIMITIVES else _encode(item) for item in obj if item is not Ellipsis]
+
+
+def _has_default_json_encoders(model: pydantic.BaseModel) -> bool:
+    if IS_PYDANTIC_V2:
+        # `model_config` is a dict, so the general path never finds encoders on v2 models either
+        return True
+    encoders = getattr(model.__config__, "json_encoders", {})  # type: ignore # Pydantic v1
+    return all(type_ is dt.datetime and encoder is serialize_datetime for type_, encoder in encoders.items())
+
+
+def _encode_other(obj: Any) -> Any:
+    if obj is Ellipsis:
+        return None
+    if isinstance(obj, pydantic.BaseModel):
+        if not _has_default_json_encoders(obj):
+            return jsonable_encoder(obj, custom_encoder=getattr(obj.__config__, "json_encoders", {}))
+        obj_dict = obj.dict(by_alias=True)
+        if "__root__" in obj_dict:
+            obj_dict = obj_dict["__root__"]
+        if "root" in obj_dict:
+            obj_dict = obj_dict["root"]
+        return _encode(obj_dict)
+    if dataclasses.is_dataclass(obj):
+        return _encode(dataclasses.asdict(obj))  # type: ignore
+    if isinstance(obj, bytes):
+        return base64.b64encode(obj).decode("utf-8")
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, PurePath):
+        return str(obj)
+    if isinstance(obj, (str, int, float)):
+        return obj
+    if isinstance(obj, dt.datetime):
+        return serialize_datetime(obj)
+    if isinstance(obj, dt.date):
+        return str(obj)
+    if isinstance(obj, dict):
+        return _encode_dict(obj)
+    if isinstance(obj, (list, set, frozenset, GeneratorType, tuple)):
+        return _encode_list(obj)
+
+    def fallback_serializer(o: Any) -> Any:
+        attempt_encode = encode_by_type(o)
+        if attempt_encode is not None:
+            return attempt_encode
+
+        try:
+            data = dict(o)
+        except Exception as e:
+            errors: List[Exception] = []
+            errors.append(e)
+            try:
+                data = vars(o)
+            except Exception as e:
+                errors.append(e)
+                raise ValueError(errors) from e
+        return _encode(data)
+
+    return to_jsonable_with_fallback(obj, fallback_serializer)
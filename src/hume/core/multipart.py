@@ -0,0 +1,215 @@
+# THIS FILE IS MANUALLY MAINTAINED: see .fernignore
+"""
+Streaming multipart/form-data request bodies.
+
+Files are read in chunks as the body is sent, so memory stays flat however large the upload. Files given as paths
+are opened one at a time, only while they are being sent. The body's length is computed up front whenever every
+part's size is known, so it is sent with a Content-Length rather than chunked.
+"""
+
+import asyncio
+import io
+import mimetypes
+import os
+import re
+import typing
+
+from .file import File
+
+UploadFile = typing.Union[File, "os.PathLike[str]"]
+ProgressCallback = typing.Callable[[int, typing.Optional[int]], None]
+"""Called with the bytes sent so far and the total, if known, after each chunk."""
+
+DEFAULT_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Escaping of names and filenames as in the HTML5 form submission algorithm, as httpx does
+_FORM_PARAM_ESCAPES = {'"': "%22", "\\": "\\\\", **{chr(c): f"%{c:02X}" for c in range(0x20) if c != 0x1B}}
+_FORM_PARAM_RE = re.compile("|".join(re.escape(c) for c in _FORM_PARAM_ESCAPES))
+
+
+def _form_param(name: str, value: str) -> str:
+    return f'{name}="{_FORM_PARAM_RE.sub(lambda m: _FORM_PARAM_ESCAPES[m.group(0)], value)}"'
+
+
+def _file_size(file: typing.Any) -> typing.Optional[int]:
+    """Bytes left to read from `file`, without reading it."""
+    try:
+        return os.fstat(file.fileno()).st_size - file.tell()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        pass
+    try:
+        offset = file.tell()
+        end = file.seek(0, os.SEEK_END)
+        file.seek(offset)
+        return end - offset
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+class _Part:
+    def __init__(self, name: str, value: UploadFile) -> None:
+        filename: typing.Optional[str]
+        content_type: typing.Optional[str] = None
+        headers: typing.Mapping[str, str] = {}
+        content: typing.Any
+        if isinstance(value, tuple):
+            filename, content, *rest = value
+            if rest:
+                content_type = rest[0]
+            if len(rest) > 1:
+                headers = rest[1]
+        elif isinstance(value, os.PathLike):
+            filename, content = os.path.basename(os.fspath(value)), value
+        else:
+            filename, content = os.path.basename(str(getattr(value, "name", "upload"))), value
+        if isinstance(content, io.TextIOBase):
+            raise TypeError("Multipart file uploads must be opened in binary mode, not text mode")
+        if content_type is None and filename:
+            content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+        lines = [f"Content-Disposition: form-data; {_form_param('name', name)}"]
+        if filename:
+            lines[0] += f"; {_form_param('filename', filename)}"
+        if content_type is not None and not any(key.lower() == "content-type" for key in headers):
+            lines.append(f"Content-Type: {content_type}")
+        lines.extend(f"{key}: {header}" for key, header in headers.items())
+        self.head = ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8")
+
+        self.content = content.encode("utf-8") if isinstance(content, str) else content
+        self.size: typing.Optional[int]
+        self._start: typing.Optional[int] = None
+        if isinstance(self.content, (bytes, bytearray, memoryview)):
+            self.size = len(self.content)
+        elif isinstance(self.content, os.PathLike):
+            self.size = os.path.getsize(self.content)
+        else:
+            self.size = _file_size(self.content)
+            try:
+                self._start = self.content.tell()
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                pass
+
+    def open(self) -> typing.Tuple[typing.Optional[typing.BinaryIO], bool]:
+        """The file to read, and whether it was opened here and should be closed after."""
+        if isinstance(self.content, (bytes, bytearray, memoryview)):
+            return None, False
+        if isinstance(self.content, os.PathLike):
+            return open(self.content, "rb"), True
+        # Rewind, so that a retried request sends the file again
+        if self._start is not None:
+            self.content.seek(self._start)
+        return self.content, False
+
+
+class MultipartEncoder:
+    """
+    A multipart/form-data body to pass as `content`, with `headers`, to a sync request.
+
+    Fields take the values `core.File` does, or a path. The body can be sent more than once, as it is when a
+    request is retried, provided its files can seek back to where they started.
+    """
+
+    def __init__(
+        self,
+        fields: typing.Sequence[typing.Tuple[str, UploadFile]],
+        *,
+        boundary: typing.Optional[str] = None,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        on_progress: typing.Optional[ProgressCallback] = None,
+    ) -> None:
+        self.boundary = boundary if boundary is not None else os.urandom(16).hex()
+        self._parts = [_Part(name, value) for name, value in fields]
+        self._chunk_size = chunk_size
+        self._on_progress = on_progress
+        self._delimiter = f"--{self.boundary}\r\n".encode("ascii")
+        self._close = f"--{self.boundary}--\r\n".encode("ascii")
+
+    @property
+    def content_length(self) -> typing.Optional[int]:
+        length = len(self._close)
+        for part in self._parts:
+            if part.size is None:
+                return None
+            length += len(self._delimiter) + len(part.head) + part.size + 2
+        return length
+
+    @property
+    def headers(self) -> typing.Dict[str, str]:
+        headers = {"Content-Type": f"multipart/form-data; boundary={self.boundary}"}
+        length = self.content_length
+        if length is not None:
+            headers["Content-Length"] = str(length)
+        return headers
+
+    def _chunks(self) -> typing.Iterator[typing.Union[bytes, typing.Tuple[typing.BinaryIO, bool]]]:
+        # Yields bytes to send, or a file to send the contents of
+        for part in self._parts:
+            yield self._delimiter + part.head
+            file, owned = part.open()
+            if file is None:
+                yield bytes(part.content)
+            else:
+                yield file, owned
+            yield b"\r\n"
+        yield self._close
+
+    def _progress(self, sent: int, total: typing.Optional[int]) -> None:
+        if self._on_progress is not None:
+            self._on_progress(sent, total)
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        total = self.content_length
+        sent = 0
+        for chunk in self._chunks():
+            if isinstance(chunk, bytes):
+                sent += len(chunk)
+                yield chunk
+                self._progress(sent, total)
+                continue
+            file, owned = chunk
+            try:
+                for data in iter(lambda: file.read(self._chunk_size), b""):
+                    sent += len(data)
+                    yield data
+                    self._progress(sent, total)
+            finally:
+                if owned:
+                    file.close()
+
+    def stream_async(self) -> "AsyncMultipartStream":
+        return AsyncMultipartStream(self)
+
+
+class AsyncMultipartStream:
+    """The body of a `MultipartEncoder` for an async request. Files are read in the default executor."""
+
+    def __init__(self, encoder: MultipartEncoder) -> None:
+        self._encoder = encoder
+
+    @property
+    def headers(self) -> typing.Dict[str, str]:
+        return self._encoder.headers
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        encoder = self._encoder
+        loop = asyncio.get_running_loop()
+        total = encoder.content_length
+        sent = 0
+        for chunk in encoder._chunks():
+            if isinstance(chunk, bytes):
+                sent += len(chunk)
+                yield chunk
+                encoder._progress(sent, total)
+                continue
+            file, owned = chunk
+            try:
+                while True:
+                    data = await loop.run_in_executor(None, file.read, encoder._chunk_size)
+                    if not data:
+                        break
+                    sent += len(data)
+                    yield data
+                    encoder._progress(sent, total)
+            finally:
+                if owned:
+                    file.close()
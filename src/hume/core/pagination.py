@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import collections
+import dataclasses
+import itertools
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import AsyncIterator, Awaitable, Callable, Generic, Iterator, List, Optional, TypeVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Generic, Iterator, List, Optional, Tuple, TypeVar
 
 # Generic to represent the underlying type of the results within a page
 T = TypeVar("T")
@@ -20,6 +27,23 @@ R = TypeVar("R")
 #     # This should be the outer function that returns the SyncPager again
 #     get_next=lambda: list(..., cursor: response.cursor) (or list(..., offset: offset + 1))
 # )
+#
+# Endpoints paginated by `page_number` also pass `get_page`, which fetches any page directly. Together with the
+# `page_number`/`total_pages` fields of the response it lets `with_prefetch(..., fan_out=True)` request several
+# known pages at once instead of walking the `get_next` chain.
+
+
+def _page_range(response: Any) -> Optional[Tuple[int, int]]:
+    """(current page number, total pages) when the response reports them."""
+    page_number = getattr(response, "page_number", None)
+    total_pages = getattr(response, "total_pages", None)
+    if isinstance(page_number, int) and isinstance(total_pages, int):
+        return page_number, total_pages
+    return None
+
+
+def _is_last(page: Any) -> bool:
+    return page is None or page.items is None or len(page.items) == 0
 
 
 @dataclass(frozen=True)
@@ -28,6 +52,19 @@ class SyncPager(Generic[T, R]):
     has_next: bool
     items: Optional[List[T]]
     response: R
+    get_page: Optional[Callable[[int], Optional[SyncPager[T, R]]]] = None
+    prefetch: int = 0
+    fan_out: bool = False
+
+    def with_prefetch(self, depth: int, *, fan_out: bool = False) -> SyncPager[T, R]:
+        """
+        Return this pager configured to fetch up to `depth` pages ahead of the consumer on a thread pool.
+
+        By default the next pages are fetched one after another in the background. With `fan_out`, once the
+        response reports `total_pages`, up to `depth` known page numbers are requested concurrently. Pages are
+        always yielded in order, and pending requests are cancelled when iteration stops early.
+        """
+        return dataclasses.replace(self, prefetch=depth, fan_out=fan_out)
 
     # Here we type ignore the iterator to avoid a mypy error
     # caused by the type conflict with Pydanitc's __iter__ method
@@ -38,6 +75,14 @@ class SyncPager(Generic[T, R]):
                 yield from page.items
 
     def iter_pages(self) -> Iterator[SyncPager[T, R]]:
+        if self.prefetch > 0:
+            page_range = _page_range(self.response)
+            if self.fan_out and self.get_page is not None and page_range is not None:
+                yield from self._iter_pages_fan_out(*page_range)
+            else:
+                yield from self._iter_pages_prefetched()
+            return
+
         page: Optional[SyncPager[T, R]] = self
         while page is not None:
             yield page
@@ -49,6 +94,72 @@ class SyncPager(Generic[T, R]):
             if page is None or page.items is None or len(page.items) == 0:
                 return
 
+    def _iter_pages_prefetched(self) -> Iterator[SyncPager[T, R]]:
+        # Each page only knows how to fetch the one after it, so a single worker walks the chain and stays up to
+        # `prefetch` pages ahead of the consumer.
+        pages: queue.Queue = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+
+        def put(item: Tuple[Optional[SyncPager[T, R]], Optional[BaseException]]) -> None:
+            # Give up once the consumer has gone away rather than blocking on a full queue forever
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def walk(page: SyncPager[T, R]) -> None:
+            try:
+                while not stop.is_set() and page.has_next and page.get_next is not None:
+                    next_page = page.get_next()
+                    if _is_last(next_page):
+                        break
+                    assert next_page is not None
+                    put((next_page, None))
+                    page = next_page
+            except BaseException as exc:
+                put((None, exc))
+                return
+            put((None, None))
+
+        yield self
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            executor.submit(walk, self)
+            while True:
+                page, exc = pages.get()
+                if exc is not None:
+                    raise exc
+                if page is None:
+                    return
+                yield page
+        finally:
+            stop.set()
+            executor.shutdown(wait=False)
+
+    def _iter_pages_fan_out(self, page_number: int, total_pages: int) -> Iterator[SyncPager[T, R]]:
+        assert self.get_page is not None
+        get_page = self.get_page
+        numbers = iter(range(page_number + 1, total_pages))
+
+        yield self
+        executor = ThreadPoolExecutor(max_workers=self.prefetch)
+        futures: Deque[Future] = collections.deque(
+            executor.submit(get_page, n) for n in itertools.islice(numbers, self.prefetch)
+        )
+        try:
+            while futures:
+                page = futures.popleft().result()
+                if _is_last(page):
+                    return
+                for n in itertools.islice(numbers, 1):
+                    futures.append(executor.submit(get_page, n))
+                yield page
+        finally:
+            # Requests already on the wire finish in the background; queued ones never start
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def next_page(self) -> Optional[SyncPager[T, R]]:
         return self.get_next() if self.get_next is not None else None
 
@@ -59,6 +170,19 @@ class AsyncPager(Generic[T, R]):
     has_next: bool
     items: Optional[List[T]]
     response: R
+    get_page: Optional[Callable[[int], Awaitable[Optional[AsyncPager[T, R]]]]] = None
+    prefetch: int = 0
+    fan_out: bool = False
+
+    def with_prefetch(self, depth: int, *, fan_out: bool = False) -> AsyncPager[T, R]:
+        """
+        Return this pager configured to fetch up to `depth` pages ahead of the consumer in background tasks.
+
+        By default the next pages are fetched one after another in the background. With `fan_out`, once the
+        response reports `total_pages`, up to `depth` known page numbers are requested concurrently. Pages are
+        always yielded in order, and pending requests are cancelled when iteration stops early.
+        """
+        return dataclasses.replace(self, prefetch=depth, fan_out=fan_out)
 
     async def __aiter__(self) -> AsyncIterator[T]:
         async for page in self.iter_pages():
@@ -67,6 +191,19 @@ class AsyncPager(Generic[T, R]):
                     yield item
 
     async def iter_pages(self) -> AsyncIterator[AsyncPager[T, R]]:
+        if self.prefetch > 0:
+            page_range = _page_range(self.response)
+            if self.fan_out and self.get_page is not None and page_range is not None:
+                pages = self._iter_pages_fan_out(*page_range)
+            else:
+                pages = self._iter_pages_prefetched()
+            try:
+                async for prefetched in pages:
+                    yield prefetched
+            finally:
+                await pages.aclose()
+            return
+
         page: Optional[AsyncPager[T, R]] = self
         while page is not None:
             yield page
@@ -78,5 +215,58 @@ class AsyncPager(Generic[T, R]):
             if page is None or page.items is None or len(page.items) == 0:
                 return
 
+    async def _iter_pages_prefetched(self) -> AsyncIterator[AsyncPager[T, R]]:
+        pages: asyncio.Queue = asyncio.Queue(maxsize=self.prefetch)
+
+        async def walk(page: AsyncPager[T, R]) -> None:
+            try:
+                while page.has_next and page.get_next is not None:
+                    next_page = await page.get_next()
+                    if _is_last(next_page):
+                        break
+                    assert next_page is not None
+                    await pages.put((next_page, None))
+                    page = next_page
+            except Exception as exc:
+                await pages.put((None, exc))
+                return
+            await pages.put((None, None))
+
+        yield self
+        walker = asyncio.ensure_future(walk(self))
+        try:
+            while True:
+                page, exc = await pages.get()
+                if exc is not None:
+                    raise exc
+                if page is None:
+                    return
+                yield page
+        finally:
+            walker.cancel()
+            await asyncio.gather(walker, return_exceptions=True)
+
+    async def _iter_pages_fan_out(self, page_number: int, total_pages: int) -> AsyncIterator[AsyncPager[T, R]]:
+        assert self.get_page is not None
+        get_page = self.get_page
+        numbers = iter(range(page_number + 1, total_pages))
+
+        yield self
+        tasks: Deque[asyncio.Future] = collections.deque(
+            asyncio.ensure_future(get_page(n)) for n in itertools.islice(numbers, self.prefetch)
+        )
+        try:
+            while tasks:
+                page = await tasks.popleft()
+                if _is_last(page):
+                    return
+                for n in itertools.islice(numbers, 1):
+                    tasks.append(asyncio.ensure_future(get_page(n)))
+                yield page
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def next_page(self) -> Optional[AsyncPager[T, R]]:
         return await self.get_next() if self.get_next is not None else None
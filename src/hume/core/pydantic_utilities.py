@@ -2,6 +2,7 @@
 
 # nopycln: file
 import datetime as dt
+import functools
 import inspect
 import json
 import logging
@@ -253,6 +254,49 @@ def parse_sse_obj(sse: "ServerSentEvent", type_: Type[T]) -> T:
         return parse_obj_as(type_, sse_event)
 
 
+# Upper bound on the number of distinct types whose validators are kept alive by `parse_obj_as`.
+# The SDK itself only parses a few hundred generated types, so this is never hit in practice.
+_VALIDATOR_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
+def _has_pydantic_aliases(type_: Type[pydantic.BaseModel]) -> bool:
+    """Whether the model declares real Pydantic aliases (pydantic.Field(alias=...)) on any of its fields."""
+    if IS_PYDANTIC_V2:
+        for field_name, field_info in getattr(type_, "model_fields", {}).items():  # type: ignore[attr-defined]
+            alias = getattr(field_info, "alias", None)
+            if alias is not None and alias != field_name:
+                return True
+        return False
+    for field in getattr(type_, "__fields__", {}).values():
+        alias = getattr(field, "alias", None)
+        name = getattr(field, "name", None)
+        if alias is not None and name is not None and alias != name:
+            return True
+    return False
+
+
+if IS_PYDANTIC_V2:
+
+    @functools.lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
+    def _get_type_adapter(type_: Any) -> "pydantic.TypeAdapter[Any]":  # type: ignore[name-defined]
+        return pydantic.TypeAdapter(type_)  # type: ignore[attr-defined]
+
+    def _validate_as(type_: Any, object_: Any) -> Any:
+        try:
+            adapter = _get_type_adapter(type_)
+        except TypeError:
+            # Unhashable annotation (e.g. Annotated metadata without __hash__); build the adapter uncached.
+            adapter = pydantic.TypeAdapter(type_)  # type: ignore[attr-defined]
+        return adapter.validate_python(object_)
+
+else:
+
+    def _validate_as(type_: Any, object_: Any) -> Any:
+        # Pydantic v1 already memoizes the parsing model it builds for each type.
+        return pydantic.parse_obj_as(type_, object_)
+
+
 def parse_obj_as(type_: Type[T], object_: Any) -> T:
     # convert_and_respect_annotation_metadata is required for TypedDict aliasing.
     #
@@ -261,33 +305,58 @@ def parse_obj_as(type_: Type[T], object_: Any) -> T:
     #   unchanged so Pydantic can validate them.
     # - If the model encodes aliasing only via FieldMetadata annotations, then we MUST pre-dealias because Pydantic
     #   will not recognize those aliases during validation.
-    if inspect.isclass(type_) and issubclass(type_, pydantic.BaseModel):
-        has_pydantic_aliases = False
-        if IS_PYDANTIC_V2:
-            for field_name, field_info in getattr(type_, "model_fields", {}).items():  # type: ignore[attr-defined]
-                alias = getattr(field_info, "alias", None)
-                if alias is not None and alias != field_name:
-                    has_pydantic_aliases = True
-                    break
-        else:
-            for field in getattr(type_, "__fields__", {}).values():
-                alias = getattr(field, "alias", None)
-                name = getattr(field, "name", None)
-                if alias is not None and name is not None and alias != name:
-                    has_pydantic_aliases = True
-                    break
-
-        dealiased_object = (
-            object_
-            if has_pydantic_aliases
-            else convert_and_respect_annotation_metadata(object_=object_, annotation=type_, direction="read")
-        )
+    #
+    # Both the alias scan and the validator are cached per type, since this sits on the hot path of every
+    # socket message and API response.
+    if inspect.isclass(type_) and issubclass(type_, pydantic.BaseModel) and _has_pydantic_aliases(type_):
+        dealiased_object = object_
     else:
         dealiased_object = convert_and_respect_annotation_metadata(object_=object_, annotation=type_, direction="read")
-    if IS_PYDANTIC_V2:
-        adapter = pydantic.TypeAdapter(type_)  # type: ignore[attr-defined]
-        return adapter.validate_python(dealiased_object)
-    return pydantic.parse_obj_as(type_, dealiased_object)
+    return cast(T, _validate_as(type_, dealiased_object))
+
+
+@functools.lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
+def _get_variants_by_discriminator(type_: Any, discriminator: str) -> Dict[Any, Type[Any]]:
+    """
+    Build a dispatch table from discriminator value to union member, for unions whose members each declare the
+    discriminator as a single-valued Literal field. Values claimed by more than one member are left out.
+    """
+    variants_by_value: Dict[Any, Type[Any]] = {}
+    ambiguous_values: Set[Any] = set()
+    for variant in typing_extensions.get_args(type_) if typing_extensions.get_origin(type_) is Union else ():
+        if not (inspect.isclass(variant) and issubclass(variant, pydantic.BaseModel)):
+            continue
+        disc_annotation = _get_field_annotation(variant, discriminator)
+        if disc_annotation is None or not is_literal_type(disc_annotation):
+            continue
+        literal_args = get_args(disc_annotation)
+        if len(literal_args) != 1:
+            continue
+        if literal_args[0] in variants_by_value:
+            ambiguous_values.add(literal_args[0])
+        variants_by_value[literal_args[0]] = variant
+    for value in ambiguous_values:
+        del variants_by_value[value]
+    return variants_by_value
+
+
+def parse_union_obj_as(type_: Type[T], object_: Any, discriminator: str = "type") -> T:
+    """
+    Parse an object into an undiscriminated union by dispatching on its discriminator field.
+
+    Validation of a plain `typing.Union` tries each member in turn. When every member carries a Literal
+    discriminator, the incoming value identifies the one member to validate against. Objects with a missing or
+    unknown discriminator value fall back to validating against the whole union.
+    """
+    if isinstance(object_, Mapping):
+        try:
+            variant = _get_variants_by_discriminator(type_, discriminator).get(object_.get(discriminator))
+        except TypeError:
+            # Unhashable union or discriminator value
+            variant = None
+        if variant is not None:
+            return cast(T, parse_obj_as(variant, object_))
+    return parse_obj_as(type_, object_)
 
 
 def to_jsonable_with_fallback(obj: Any, fallback_serializer: Callable[[Any], Any]) -> Any:
@@ -298,6 +367,26 @@ def to_jsonable_with_fallback(obj: Any, fallback_serializer: Callable[[Any], Any
     return fallback_serializer(obj)
 
 
+@functools.lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
+def _get_field_alias_maps(model: Type[pydantic.BaseModel]) -> Tuple[Dict[str, str], Set[str]]:
+    """
+    Returns the field-name-to-alias mapping of a model, along with the keys that are both an alias for one field
+    and the name of another. Computed once per model class rather than on every validation.
+    """
+    fields = getattr(model, "model_fields", {}) if IS_PYDANTIC_V2 else getattr(model, "__fields__", {})
+    name_to_alias: Dict[str, str] = {}
+    alias_to_name: Dict[str, str] = {}
+
+    for name, field in fields.items():
+        alias = getattr(field, "alias", None) or name
+        name_to_alias[name] = alias
+        if alias != name:
+            alias_to_name[alias] = name
+
+    ambiguous_keys = set(alias_to_name.keys()).intersection(set(name_to_alias.keys()))
+    return name_to_alias, ambiguous_keys
+
+
 class UniversalBaseModel(pydantic.BaseModel):
     if IS_PYDANTIC_V2:
         model_config: ClassVar[pydantic.ConfigDict] = pydantic.ConfigDict(  # type: ignore[typeddict-unknown-key]
@@ -315,18 +404,9 @@ class UniversalBaseModel(pydantic.BaseModel):
             if not isinstance(data, Mapping):
                 return data
 
-            fields = getattr(cls, "model_fields", {})  # type: ignore[attr-defined]
-            name_to_alias: Dict[str, str] = {}
-            alias_to_name: Dict[str, str] = {}
-
-            for name, field_info in fields.items():
-                alias = getattr(field_info, "alias", None) or name
-                name_to_alias[name] = alias
-                if alias != name:
-                    alias_to_name[alias] = name
+            name_to_alias, ambiguous_keys = _get_field_alias_maps(cls)
 
             # Detect ambiguous keys: a key that is an alias for one field and a name for another.
-            ambiguous_keys = set(alias_to_name.keys()).intersection(set(name_to_alias.keys()))
             for key in ambiguous_keys:
                 if key in data and name_to_alias[key] not in data:
                     raise ValueError(
@@ -362,17 +442,8 @@ class UniversalBaseModel(pydantic.BaseModel):
             if not isinstance(values, Mapping):
                 return values
 
-            fields = getattr(cls, "__fields__", {})
-            name_to_alias: Dict[str, str] = {}
-            alias_to_name: Dict[str, str] = {}
-
-            for name, field in fields.items():
-                alias = getattr(field, "alias", None) or name
-                name_to_alias[name] = alias
-                if alias != name:
-                    alias_to_name[alias] = name
+            name_to_alias, ambiguous_keys = _get_field_alias_maps(cls)
 
-            ambiguous_keys = set(alias_to_name.keys()).intersection(set(name_to_alias.keys()))
             for key in ambiguous_keys:
                 if key in values and name_to_alias[key] not in values:
                     raise ValueError(
@@ -0,0 +1,188 @@
+# THIS FILE IS MANUALLY MAINTAINED: see .fernignore
+"""
+Client-side rate limiting of HTTP requests, with a token bucket per group of endpoints.
+
+Requests reserve a token before they are sent and wait for it outside any lock, so one `RateLimiter` can be shared
+by clients in any number of threads and event loops. Buckets also follow the API's own accounting: while
+`x-ratelimit-remaining` says fewer requests are left before `x-ratelimit-reset` than the bucket would allow, they are
+spread evenly until the reset, and a 429 holds back the whole group for its `retry-after`.
+"""
+
+import threading
+import time
+import typing
+
+import httpx
+
+from .http_client import MAX_RETRY_DELAY_SECONDS, _parse_retry_after, _parse_x_ratelimit_reset
+
+RateLimitGroup = typing.Literal["tts", "evi", "batch", "default"]
+RATE_LIMIT_GROUPS: typing.Tuple[RateLimitGroup, ...] = ("tts", "evi", "batch", "default")
+
+_GROUP_PREFIXES: typing.Tuple[typing.Tuple[str, RateLimitGroup], ...] = (
+    ("v0/tts", "tts"),
+    ("v0/evi", "evi"),
+    ("v0/batch", "batch"),
+)
+
+
+def rate_limit_group(path: typing.Optional[str]) -> RateLimitGroup:
+    """The group of endpoints a request path belongs to."""
+    path = (path or "").lstrip("/")
+    for prefix, group in _GROUP_PREFIXES:
+        if path.startswith(prefix):
+            return group
+    return "default"
+
+
+class TokenBucket:
+    """
+    Allows `rate` requests per second on average, and bursts of up to `burst`.
+
+    A bucket without a `rate` only holds requests back when the API asks it to.
+    """
+
+    def __init__(self, rate: typing.Optional[float] = None, burst: typing.Optional[float] = None) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        self._lock = threading.Lock()
+        self._rate = rate
+        self._burst = burst if burst is not None else max(1.0, rate or 1.0)
+        self._tokens = self._burst
+        # Tokens accrue from this time on, which is in the future while the bucket is held
+        self._updated = time.monotonic()
+        # A lower rate announced by the API, until its window resets
+        self._window_rate: typing.Optional[float] = None
+        self._window_end = 0.0
+
+    def _effective_rate(self, now: float) -> typing.Optional[float]:
+        if self._window_rate is not None and now < self._window_end:
+            return self._window_rate if self._rate is None else min(self._rate, self._window_rate)
+        self._window_rate = None
+        return self._rate
+
+    def _refill(self, now: float) -> typing.Optional[float]:
+        rate = self._effective_rate(now)
+        if now > self._updated:
+            if rate is not None:
+                self._tokens = min(self._burst, self._tokens + (now - self._updated) * rate)
+            else:
+                self._tokens = self._burst
+            self._updated = now
+        return rate
+
+    def reserve(self) -> float:
+        """Take a token, and return how many seconds to wait before sending the request it is for."""
+        with self._lock:
+            now = time.monotonic()
+            rate = self._refill(now)
+            held = max(0.0, self._updated - now)
+            if rate is None:
+                return held
+            self._tokens -= 1
+            return held + max(0.0, -self._tokens) / rate
+
+    def try_reserve(self) -> bool:
+        """Take a token only if a request could be sent right away. For optional requests, such as hedges."""
+        with self._lock:
+            now = time.monotonic()
+            rate = self._refill(now)
+            if now < self._updated:
+                return False
+            if rate is None:
+                return True
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def hold(self, seconds: float) -> None:
+        """Send nothing for `seconds`, after which the bucket starts refilling from empty."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._updated = max(self._updated, now + seconds)
+            self._tokens = min(self._tokens, 0.0)
+
+    def limit_window(self, remaining: int, reset_after: float) -> None:
+        """Spread the `remaining` requests the API allows evenly over the `reset_after` seconds until it resets."""
+        if remaining <= 0:
+            self.hold(reset_after)
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._window_rate = remaining / reset_after
+            self._window_end = now + reset_after
+            if self._rate is None or self._window_rate < self._rate:
+                # What's left of a burst could overshoot the window
+                self._tokens = min(self._tokens, 1.0)
+
+
+class RateLimiter:
+    """
+    Token buckets for the TTS, EVI, batch and remaining ("default") endpoints.
+
+    `rates` is the requests per second allowed in every group, or a mapping of group to requests per second. Groups
+    without a rate are unlimited, except when the API's rate limit headers hold them back. Pass the same instance as
+    `rate_limit` to several clients to share the buckets between them.
+    """
+
+    def __init__(
+        self,
+        rates: typing.Optional[typing.Union[float, typing.Mapping[str, float]]] = None,
+        *,
+        burst: typing.Optional[float] = None,
+    ) -> None:
+        if isinstance(rates, typing.Mapping):
+            unknown = set(rates) - set(RATE_LIMIT_GROUPS)
+            if unknown:
+                raise ValueError(f"Unknown rate limit groups: {', '.join(sorted(unknown))}")
+            group_rates: typing.Mapping[str, typing.Optional[float]] = rates
+        else:
+            group_rates = dict.fromkeys(RATE_LIMIT_GROUPS, rates)
+        self._buckets: typing.Dict[str, TokenBucket] = {
+            group: TokenBucket(group_rates.get(group), burst) for group in RATE_LIMIT_GROUPS
+        }
+
+    def bucket(self, path: typing.Optional[str]) -> TokenBucket:
+        return self._buckets[rate_limit_group(path)]
+
+    def reserve(self, path: typing.Optional[str]) -> float:
+        """Take a token for a request to `path`, and return how many seconds to wait before sending it."""
+        return self.bucket(path).reserve()
+
+    def try_reserve(self, path: typing.Optional[str]) -> bool:
+        """Take a token for a request to `path` only if it could be sent right away."""
+        return self.bucket(path).try_reserve()
+
+    def observe(self, path: typing.Optional[str], response: httpx.Response) -> None:
+        """Adjust the bucket of `path` to the rate limit headers of a response from it."""
+        bucket = self.bucket(path)
+        if response.status_code == 429:
+            retry_after = _parse_retry_after(response.headers) or _parse_x_ratelimit_reset(response.headers)
+            bucket.hold(min(retry_after if retry_after is not None else 1.0, MAX_RETRY_DELAY_SECONDS))
+            return
+        remaining = response.headers.get("x-ratelimit-remaining")
+        if remaining is None:
+            return
+        reset_after = _parse_x_ratelimit_reset(response.headers)
+        try:
+            remaining_requests = int(remaining)
+        except ValueError:
+            return
+        if reset_after is not None:
+            bucket.limit_window(remaining_requests, min(reset_after, MAX_RETRY_DELAY_SECONDS))
+
+
+RateLimit = typing.Union[float, typing.Mapping[str, float], RateLimiter]
+
+
+def create_rate_limiter(rate_limit: typing.Optional[RateLimit] = None) -> typing.Optional[RateLimiter]:
+    """
+    Resolve the `rate_limit` client option: requests per second for every group, a mapping of group to requests per
+    second, or a `RateLimiter` to share with other clients.
+    """
+    if rate_limit is None or isinstance(rate_limit, RateLimiter):
+        return rate_limit
+    return RateLimiter(rate_limit)
@@ -2,6 +2,8 @@
 
 import typing
 
+from .hedging import HedgePolicy
+
 try:
     from typing import NotRequired  # type: ignore
 except ImportError:
@@ -25,6 +27,8 @@ class RequestOptions(typing.TypedDict, total=False):
         - additional_body_parameters: typing.Dict[str, typing.Any]. A dictionary containing additional parameters to spread into the request's body parameters dict
 
         - chunk_size: int. The size, in bytes, to process each chunk of data being streamed back within the response. This equates to leveraging `chunk_size` within `requests` or `httpx`, and is only leveraged for file downloads.
+
+        - hedge: HedgePolicy. Send a duplicate of the request if it is slow to respond, and use whichever response starts first. Only applies to endpoints that are safe to send twice, such as TTS synthesis. Pass `{}` for the defaults.
     """
 
     timeout_in_seconds: NotRequired[int]
@@ -33,3 +37,4 @@ class RequestOptions(typing.TypedDict, total=False):
     additional_query_parameters: NotRequired[typing.Dict[str, typing.Any]]
     additional_body_parameters: NotRequired[typing.Dict[str, typing.Any]]
     chunk_size: NotRequired[int]
+    hedge: NotRequired[HedgePolicy]
@@ -0,0 +1,93 @@
+# THIS FILE IS MANUALLY MAINTAINED: see .fernignore
+"""
+A cap on retries relative to recent successful requests.
+
+Without one, every caller retries every failed request during an incident, multiplying the load on an API that is
+already struggling. With a budget, retries stop once they reach `ratio` of the requests that succeeded in the last
+`ttl` seconds, while `min_retries_per_second` still lets a client that has sent little retry the odd failure.
+"""
+
+import dataclasses
+import math
+import threading
+import time
+import typing
+
+DEFAULT_RETRY_RATIO = 0.2
+DEFAULT_MIN_RETRIES_PER_SECOND = 1.0
+DEFAULT_RETRY_BUDGET_TTL = 10.0
+
+
+@dataclasses.dataclass(frozen=True)
+class RetryBudgetState:
+    successes: int
+    """Requests that succeeded in the last `ttl` seconds."""
+    retries: int
+    """Retries made in the last `ttl` seconds."""
+    available: float
+    """Retries that can still be made."""
+
+
+class RetryBudget:
+    """
+    Allows retries up to `ratio` of the requests that succeeded in the last `ttl` seconds, plus
+    `min_retries_per_second`. Safe to share between threads, event loops and clients.
+    """
+
+    def __init__(
+        self,
+        ratio: float = DEFAULT_RETRY_RATIO,
+        *,
+        min_retries_per_second: float = DEFAULT_MIN_RETRIES_PER_SECOND,
+        ttl: float = DEFAULT_RETRY_BUDGET_TTL,
+    ) -> None:
+        if ratio < 0 or min_retries_per_second < 0 or ttl < 1:
+            raise ValueError("ratio and min_retries_per_second can't be negative, and ttl must be at least 1 second")
+        self._lock = threading.Lock()
+        self._ratio = ratio
+        self._reserve = min_retries_per_second * ttl
+        # Counts per second of the window, in a ring indexed by the second modulo its size
+        size = math.ceil(ttl)
+        self._seconds = [-1] * size
+        self._successes = [0] * size
+        self._retries = [0] * size
+
+    def _slot(self, now: int) -> int:
+        index = now % len(self._seconds)
+        if self._seconds[index] != now:
+            self._seconds[index] = now
+            self._successes[index] = 0
+            self._retries[index] = 0
+        return index
+
+    def _totals(self, now: int) -> typing.Tuple[int, int]:
+        oldest = now - len(self._seconds)
+        successes = retries = 0
+        for second, success_count, retry_count in zip(self._seconds, self._successes, self._retries):
+            if second > oldest:
+                successes += success_count
+                retries += retry_count
+        return successes, retries
+
+    def _available(self, successes: int, retries: int) -> float:
+        return self._reserve + self._ratio * successes - retries
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._successes[self._slot(int(time.monotonic()))] += 1
+
+    def try_retry(self) -> bool:
+        """Spend one retry, if the budget has one left."""
+        with self._lock:
+            now = int(time.monotonic())
+            if self._available(*self._totals(now)) < 1:
+                return False
+            self._retries[self._slot(now)] += 1
+            return True
+
+    def state(self) -> RetryBudgetState:
+        with self._lock:
+            successes, retries = self._totals(int(time.monotonic()))
+        return RetryBudgetState(
+            successes=successes, retries=retries, available=max(0.0, self._available(successes, retries))
+        )
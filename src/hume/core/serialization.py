@@ -1,5 +1,6 @@
 # This file was auto-generated by Fern from our API Definition.
 
+import abc
 import collections
 import inspect
 import typing
@@ -39,6 +40,9 @@ def convert_and_respect_annotation_metadata(
     TypedDicts, which cannot support aliasing out of the box, and can be extended for additional
     utilities, such as defaults.
 
+    The type is compiled into a conversion plan once per (type, direction) and cached, so subtrees
+    without any aliasing are returned as-is without visiting their elements.
+
     Parameters
     ----------
     object_ : typing.Any
@@ -58,137 +62,217 @@ def convert_and_respect_annotation_metadata(
     if inner_type is None:
         inner_type = annotation
 
-    clean_type = _remove_annotations(inner_type)
-    # Pydantic models
-    if (
-        inspect.isclass(clean_type)
-        and issubclass(clean_type, pydantic.BaseModel)
-        and isinstance(object_, typing.Mapping)
-    ):
-        return _convert_mapping(object_, clean_type, direction)
-    # TypedDicts
-    if typing_extensions.is_typeddict(clean_type) and isinstance(object_, typing.Mapping):
-        return _convert_mapping(object_, clean_type, direction)
-
-    if (
-        typing_extensions.get_origin(clean_type) == typing.Dict
-        or typing_extensions.get_origin(clean_type) == dict
-        or clean_type == typing.Dict
-    ) and isinstance(object_, typing.Dict):
-        key_type = typing_extensions.get_args(clean_type)[0]
-        value_type = typing_extensions.get_args(clean_type)[1]
-
-        return {
-            key: convert_and_respect_annotation_metadata(
-                object_=value,
-                annotation=annotation,
-                inner_type=value_type,
-                direction=direction,
-            )
-            for key, value in object_.items()
-        }
-
-    # If you're iterating on a string, do not bother to coerce it to a sequence.
-    if not isinstance(object_, str):
-        if (
-            typing_extensions.get_origin(clean_type) == typing.Set
-            or typing_extensions.get_origin(clean_type) == set
-            or clean_type == typing.Set
-        ) and isinstance(object_, typing.Set):
-            inner_type = typing_extensions.get_args(clean_type)[0]
-            return {
-                convert_and_respect_annotation_metadata(
-                    object_=item,
-                    annotation=annotation,
-                    inner_type=inner_type,
-                    direction=direction,
-                )
-                for item in object_
-            }
-        elif (
-            (
-                typing_extensions.get_origin(clean_type) == typing.List
-                or typing_extensions.get_origin(clean_type) == list
-                or clean_type == typing.List
-            )
-            and isinstance(object_, typing.List)
-        ) or (
-            (
-                typing_extensions.get_origin(clean_type) == typing.Sequence
-                or typing_extensions.get_origin(clean_type) == collections.abc.Sequence
-                or clean_type == typing.Sequence
-            )
-            and isinstance(object_, typing.Sequence)
-        ):
-            inner_type = typing_extensions.get_args(clean_type)[0]
-            return [
-                convert_and_respect_annotation_metadata(
-                    object_=item,
-                    annotation=annotation,
-                    inner_type=inner_type,
-                    direction=direction,
-                )
-                for item in object_
-            ]
-
-    if typing_extensions.get_origin(clean_type) == typing.Union:
+    return _apply_plan(_get_conversion_plan(inner_type, direction), object_)
+
+
+class _ConversionPlan(abc.ABC):
+    """
+    Compiled conversion for a single type. A plan of `None` means the type (and everything nested in it)
+    needs no conversion, so the object can be passed through untouched.
+    """
+
+    @abc.abstractmethod
+    def convert(self, object_: typing.Any) -> typing.Any: ...
+
+
+def _apply_plan(plan: typing.Optional[_ConversionPlan], object_: typing.Any) -> typing.Any:
+    if plan is None or object_ is None:
+        return object_
+    return plan.convert(object_)
+
+
+class _MappingPlan(_ConversionPlan):
+    """Pydantic models and TypedDicts: renames keys and recurses into the values that need it."""
+
+    def __init__(self, keys: typing.Dict[str, typing.Tuple[str, typing.Optional[_ConversionPlan]]]) -> None:
+        # Maps each incoming key to its outgoing key and the plan for its value
+        self.keys = keys
+
+    def convert(self, object_: typing.Any) -> typing.Any:
+        if not isinstance(object_, typing.Mapping):
+            return object_
+        converted_object: typing.Dict[str, object] = {}
+        for key, value in object_.items():
+            entry = self.keys.get(key)
+            if entry is None:
+                converted_object[key] = value
+            else:
+                converted_object[entry[0]] = _apply_plan(entry[1], value)
+        return converted_object
+
+
+class _DictPlan(_ConversionPlan):
+    def __init__(self, value_plan: _ConversionPlan) -> None:
+        self.value_plan = value_plan
+
+    def convert(self, object_: typing.Any) -> typing.Any:
+        if not isinstance(object_, typing.Dict):
+            return object_
+        return {key: _apply_plan(self.value_plan, value) for key, value in object_.items()}
+
+
+class _SetPlan(_ConversionPlan):
+    def __init__(self, item_plan: _ConversionPlan) -> None:
+        self.item_plan = item_plan
+
+    def convert(self, object_: typing.Any) -> typing.Any:
+        if isinstance(object_, str) or not isinstance(object_, typing.Set):
+            return object_
+        return {_apply_plan(self.item_plan, item) for item in object_}
+
+
+class _SequencePlan(_ConversionPlan):
+    def __init__(self, item_plan: _ConversionPlan, container: typing.Any) -> None:
+        self.item_plan = item_plan
+        # Either `list` for List[...] annotations or `collections.abc.Sequence` for Sequence[...] annotations
+        self.container = container
+
+    def convert(self, object_: typing.Any) -> typing.Any:
+        # If you're iterating on a string, do not bother to coerce it to a sequence.
+        if isinstance(object_, str) or not isinstance(object_, self.container):
+            return object_
+        return [_apply_plan(self.item_plan, item) for item in object_]
+
+
+class _UnionPlan(_ConversionPlan):
+    def __init__(self, member_plans: typing.List[_ConversionPlan]) -> None:
+        self.member_plans = member_plans
+
+    def convert(self, object_: typing.Any) -> typing.Any:
         # We should be able to ~relatively~ safely try to convert keys against all
         # member types in the union, the edge case here is if one member aliases a field
         # of the same name to a different name from another member
         # Or if another member aliases a field of the same name that another member does not.
-        for member in typing_extensions.get_args(clean_type):
-            object_ = convert_and_respect_annotation_metadata(
-                object_=object_,
-                annotation=annotation,
-                inner_type=member,
-                direction=direction,
-            )
+        for member_plan in self.member_plans:
+            object_ = _apply_plan(member_plan, object_)
         return object_
 
-    annotated_type = _get_annotation(annotation)
-    if annotated_type is None:
-        return object_
 
-    # If the object is not a TypedDict, a Union, or other container (list, set, sequence, etc.)
-    # Then we can safely call it on the recursive conversion.
-    return object_
+class _DeferredPlan(_ConversionPlan):
+    """Stands in for a plan that is still being compiled, so that recursive types terminate."""
 
+    def __init__(self) -> None:
+        self.target: typing.Optional[_ConversionPlan] = None
 
-def _convert_mapping(
-    object_: typing.Mapping[str, object],
-    expected_type: typing.Any,
-    direction: typing.Literal["read", "write"],
-) -> typing.Mapping[str, object]:
-    converted_object: typing.Dict[str, object] = {}
+    def convert(self, object_: typing.Any) -> typing.Any:
+        return _apply_plan(self.target, object_)
+
+
+_PlanCacheKey = typing.Tuple[typing.Any, str]
+_conversion_plans: typing.Dict[_PlanCacheKey, typing.Optional[_ConversionPlan]] = {}
+
+
+def _get_conversion_plan(
+    type_: typing.Any, direction: typing.Literal["read", "write"]
+) -> typing.Optional[_ConversionPlan]:
+    clean_type = _remove_annotations(type_)
     try:
-        annotations = typing_extensions.get_type_hints(expected_type, include_extras=True)
-    except NameError:
-        # The TypedDict contains a circular reference, so
-        # we use the __annotations__ attribute directly.
-        annotations = getattr(expected_type, "__annotations__", {})
-    aliases_to_field_names = _get_alias_to_field_name(annotations)
-    for key, value in object_.items():
-        if direction == "read" and key in aliases_to_field_names:
-            dealiased_key = aliases_to_field_names.get(key)
-            if dealiased_key is not None:
-                type_ = annotations.get(dealiased_key)
+        return _conversion_plans[(clean_type, direction)]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable annotation, compile without caching.
+        return _PlanCompiler(direction).compile(clean_type)
+
+    compiler = _PlanCompiler(direction)
+    plan = compiler.compile(clean_type)
+    if compiler.cacheable:
+        # Plans are only published once fully built, so concurrent readers never observe a partial plan.
+        _conversion_plans.update(compiler.compiled)
+    return plan
+
+
+class _PlanCompiler:
+    def __init__(self, direction: typing.Literal["read", "write"]) -> None:
+        self.direction = direction
+        self.compiled: typing.Dict[_PlanCacheKey, typing.Optional[_ConversionPlan]] = {}
+        # Plans compiled against unresolved forward references must be rebuilt on the next call.
+        self.cacheable = True
+
+    def compile(self, type_: typing.Any) -> typing.Optional[_ConversionPlan]:
+        clean_type = _remove_annotations(type_)
+        key = (clean_type, self.direction)
+        try:
+            if key in _conversion_plans:
+                return _conversion_plans[key]
+            if key in self.compiled:
+                return self.compiled[key]
+        except TypeError:
+            return self._compile(clean_type)
+
+        if _is_mapping_type(clean_type):
+            # Register a placeholder first so that self-referencing models resolve to it.
+            deferred = _DeferredPlan()
+            self.compiled[key] = deferred
+            plan = self._compile(clean_type)
+            deferred.target = plan
         else:
-            type_ = annotations.get(key)
+            plan = self._compile(clean_type)
+        self.compiled[key] = plan
+        return plan
+
+    def _compile(self, clean_type: typing.Any) -> typing.Optional[_ConversionPlan]:
+        if _is_mapping_type(clean_type):
+            return self._compile_mapping(clean_type)
+
+        origin = typing_extensions.get_origin(clean_type)
+        args = typing_extensions.get_args(clean_type)
+
+        if origin == typing.Dict or origin == dict or clean_type == typing.Dict:
+            value_plan = self.compile(args[1]) if len(args) == 2 else None
+            return _DictPlan(value_plan) if value_plan is not None else None
+
+        if origin == typing.Set or origin == set or clean_type == typing.Set:
+            item_plan = self.compile(args[0]) if args else None
+            return _SetPlan(item_plan) if item_plan is not None else None
+
+        if origin == typing.List or origin == list or clean_type == typing.List:
+            item_plan = self.compile(args[0]) if args else None
+            return _SequencePlan(item_plan, list) if item_plan is not None else None
+
+        if origin == typing.Sequence or origin == collections.abc.Sequence or clean_type == typing.Sequence:
+            item_plan = self.compile(args[0]) if args else None
+            return _SequencePlan(item_plan, collections.abc.Sequence) if item_plan is not None else None
+
+        if origin == typing.Union:
+            member_plans = [plan for plan in (self.compile(member) for member in args) if plan is not None]
+            return _UnionPlan(member_plans) if member_plans else None
+
+        # If the type is not a TypedDict, a Union, or other container (list, set, sequence, etc.)
+        # Then there is nothing to convert.
+        return None
+
+    def _compile_mapping(self, expected_type: typing.Any) -> typing.Optional[_ConversionPlan]:
+        try:
+            annotations = typing_extensions.get_type_hints(expected_type, include_extras=True)
+        except NameError:
+            # The TypedDict contains a circular reference, so
+            # we use the __annotations__ attribute directly.
+            annotations = getattr(expected_type, "__annotations__", {})
+            self.cacheable = False
+        aliases_to_field_names = _get_alias_to_field_name(annotations)
+
+        keys: typing.Dict[str, typing.Tuple[str, typing.Optional[_ConversionPlan]]] = {}
+        for field_name, type_ in annotations.items():
+            if self.direction == "read":
+                keys[field_name] = (field_name, self.compile(type_))
+            else:
+                keys[field_name] = (_get_alias_from_type(type_=type_) or field_name, self.compile(type_))
         # Note you can't get the annotation by the field name if you're in read mode, so you must check the aliases map
-        #
-        # So this is effectively saying if we're in write mode, and we don't have a type, or if we're in read mode and we don't have an alias
-        # then we can just pass the value through as is
-        if type_ is None:
-            converted_object[key] = value
-        elif direction == "read" and key not in aliases_to_field_names:
-            converted_object[key] = convert_and_respect_annotation_metadata(
-                object_=value, annotation=type_, direction=direction
-            )
-        else:
-            converted_object[_alias_key(key, type_, direction, aliases_to_field_names)] = (
-                convert_and_respect_annotation_metadata(object_=value, annotation=type_, direction=direction)
-            )
-    return converted_object
+        if self.direction == "read":
+            for alias, field_name in aliases_to_field_names.items():
+                keys[alias] = (field_name, self.compile(annotations[field_name]))
+
+        if all(output_key == key and plan is None for key, (output_key, plan) in keys.items()):
+            return None
+        return _MappingPlan(keys)
+
+
+def _is_mapping_type(clean_type: typing.Any) -> bool:
+    # Pydantic models and TypedDicts
+    return (
+        inspect.isclass(clean_type) and issubclass(clean_type, pydantic.BaseModel)
+    ) or typing_extensions.is_typeddict(clean_type)
 
 
 def _get_annotation(type_: typing.Any) -> typing.Optional[typing.Any]:
@@ -263,14 +347,3 @@ def _get_alias_from_type(type_: typing.Any) -> typing.Optional[str]:
             if isinstance(annotation, FieldMetadata) and annotation.alias is not None:
                 return annotation.alias
     return None
-
-
-def _alias_key(
-    key: str,
-    type_: typing.Any,
-    direction: typing.Literal["read", "write"],
-    aliases_to_field_names: typing.Dict[str, str],
-) -> str:
-    if direction == "read":
-        return aliases_to_field_names.get(key, key)
-    return _get_alias_from_type(type_=type_) or key
@@ -0,0 +1,58 @@
+# THIS FILE IS MANUALLY MAINTAINED: see .fernignore
+"""Locating the sample data in WAV audio, shared by EVI audio output and TTS file output."""
+
+from __future__ import annotations
+
+import dataclasses
+import struct
+from typing import Optional, Tuple
+
+_RIFF_HEADER_SIZE = 12
+_CHUNK_HEADER_SIZE = 8
+
+
+@dataclasses.dataclass(frozen=True)
+class WavFormat:
+    """Contents of a WAV `fmt ` chunk."""
+
+    audio_format: int
+    channels: int
+    sample_rate: int
+    sample_width: int
+    """Bytes per sample."""
+
+
+def parse_wav_header(buffer: memoryview) -> Tuple[Optional[WavFormat], int, int]:
+    """
+    Locate the sample data in a WAV buffer. Returns (format, data offset, data size).
+
+    Buffers that aren't RIFF/WAVE are treated as raw PCM. A `data` chunk whose declared size is zero or runs
+    past the end of the buffer (as written by streaming encoders) is taken to extend to the end of the buffer.
+    """
+    total = buffer.nbytes
+    if total < _RIFF_HEADER_SIZE or buffer[0:4] != b"RIFF" or buffer[8:12] != b"WAVE":
+        return None, 0, total
+
+    wav_format: Optional[WavFormat] = None
+    position = _RIFF_HEADER_SIZE
+    while position + _CHUNK_HEADER_SIZE <= total:
+        chunk_id = buffer[position : position + 4]
+        (chunk_size,) = struct.unpack_from("<I", buffer, position + 4)
+        body = position + _CHUNK_HEADER_SIZE
+        if chunk_id == b"fmt " and body + 16 <= total:
+            audio_format, channels, sample_rate, _, _, bits_per_sample = struct.unpack_from("<HHIIHH", buffer, body)
+            wav_format = WavFormat(
+                audio_format=audio_format,
+                channels=channels,
+                sample_rate=sample_rate,
+                sample_width=bits_per_sample // 8,
+            )
+        elif chunk_id == b"data":
+            available = total - body
+            if chunk_size == 0 or chunk_size > available:
+                chunk_size = available
+            return wav_format, body, chunk_size
+        # Chunks are word aligned
+        position = body + chunk_size + (chunk_size & 1)
+
+    return wav_format, total, 0
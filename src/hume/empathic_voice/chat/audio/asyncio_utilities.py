@@ -1,10 +1,80 @@
 # THIS FILE IS MANUALLY MAINTAINED: see .fernignore
 import dataclasses
 from asyncio import Queue as BaseQueue
-from typing import AsyncGenerator, AsyncIterator, Generic, TypeVar
+from typing import AsyncGenerator, AsyncIterator, Generic, Literal, Optional, TypeVar, Union
 
 T = TypeVar("T")
 
+OverflowPolicy = Literal["drop_oldest", "drop_newest", "coalesce"]
+
+
+class BoundedByteQueue(BaseQueue):
+    """Queue of byte chunks that never blocks or grows past its bounds when the consumer falls behind.
+
+    `put_nowait` on a full queue applies the overflow policy instead of raising `QueueFull`:
+
+    * `drop_oldest` discards the oldest queued chunk, so the consumer resumes with the freshest audio.
+    * `drop_newest` discards the incoming chunk.
+    * `coalesce` appends the incoming chunk to the newest queued one, keeping all of the audio in fewer, larger
+      items. Once `max_bytes`, which this policy requires, is reached the oldest chunks are dropped.
+
+    `queued_bytes` and `dropped_bytes` report the current backlog and the total discarded so far.
+    """
+
+    def __init__(self, maxsize: int, overflow: OverflowPolicy = "drop_oldest", max_bytes: Optional[int] = None):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if overflow not in ("drop_oldest", "drop_newest", "coalesce"):
+            raise ValueError(f"Unknown overflow policy: {overflow!r}")
+        if overflow == "coalesce" and (max_bytes is None or max_bytes <= 0):
+            raise ValueError("The coalesce overflow policy requires a positive max_bytes")
+        super().__init__(maxsize)
+        self.overflow = overflow
+        self.max_bytes = max_bytes
+        self.queued_bytes = 0
+        self.dropped_bytes = 0
+        self.dropped_chunks = 0
+
+    # asyncio.Queue storage hooks; `_queue` is the deque created by `Queue._init`
+    def _put(self, item: Union[bytes, bytearray]) -> None:
+        self._queue.append(item)  # type: ignore[attr-defined]
+        self.queued_bytes += len(item)
+
+    def _get(self) -> bytes:
+        item = self._queue.popleft()  # type: ignore[attr-defined]
+        self.queued_bytes -= len(item)
+        return bytes(item) if isinstance(item, bytearray) else item
+
+    def _drop(self, size: int) -> None:
+        self.dropped_bytes += size
+        self.dropped_chunks += 1
+
+    def _drop_oldest(self) -> None:
+        self._drop(len(self._get()))
+        self.task_done()
+
+    async def put(self, item: bytes) -> None:
+        """Put an item into the queue, applying the overflow policy rather than waiting for space."""
+        self.put_nowait(item)
+
+    def put_nowait(self, item: bytes) -> None:
+        if self.overflow == "coalesce":
+            while self.qsize() and self.queued_bytes + len(item) > self.max_bytes:
+                self._drop_oldest()
+        if not self.full():
+            super().put_nowait(item)
+        elif self.overflow == "drop_newest":
+            self._drop(len(item))
+        elif self.overflow == "drop_oldest":
+            self._drop_oldest()
+            super().put_nowait(item)
+        else:
+            tail = self._queue[-1]  # type: ignore[attr-defined]
+            if not isinstance(tail, bytearray):
+                tail = self._queue[-1] = bytearray(tail)  # type: ignore[attr-defined]
+            tail += item
+            self.queued_bytes += len(item)
+
 
 # NOTE: asyncio.Queue isn't itself async iterable
 @dataclasses.dataclass
@@ -19,6 +89,19 @@ class Stream(Generic[T]):
         """Create a new async iterable stream."""
         return cls.from_queue(BaseQueue())
 
+    @classmethod
+    def bounded(
+        cls, maxsize: int, overflow: OverflowPolicy = "drop_oldest", max_bytes: Optional[int] = None
+    ) -> "Stream[T]":
+        """Create a new async iterable byte stream backed by a `BoundedByteQueue`.
+
+        Args:
+            maxsize (int): Maximum number of queued chunks.
+            overflow (OverflowPolicy): What to do with new chunks once the queue is full.
+            max_bytes (int | None): Byte limit, required by the `coalesce` policy.
+        """
+        return cls.from_queue(BoundedByteQueue(maxsize, overflow, max_bytes))
+
     @classmethod
     def from_queue(cls, queue: BaseQueue) -> "Stream[T]":
         """Create a new async iterable stream from a queue.
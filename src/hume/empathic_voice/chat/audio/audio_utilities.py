@@ -1,13 +1,16 @@
 # THIS FILE IS MANUALLY MAINTAINED: see .fernignore
 """
 * WAV/PCM handled with `wave` module
-* MP3 decoded by shelling out to ffmpeg (`ffmpeg` must be in $PATH)
+* MP3 decoded in process with PyAV when installed, otherwise by ffmpeg workers (`ffmpeg` must be in $PATH);
+  see `decoders.py`
 """
 
 from __future__ import annotations
-import asyncio, io, wave, queue, shlex
+import asyncio, io, wave
 from typing import TYPE_CHECKING, AsyncIterable, Optional, Callable, Awaitable
 
+from hume.empathic_voice.chat.audio.decoders import AudioDecoder, create_audio_decoder
+
 _missing: Optional[Exception] = None
 try:
     import sounddevice as sd  # type: ignore
@@ -29,6 +32,9 @@ _S16_DTYPE = "int16"
 _BYTES_PER_SAMP = 2
 _DEFAULT_BLOCKSIZE = 256
 
+# Shared so that ffmpeg worker processes are reused across playback streams
+_default_decoder: Optional[AudioDecoder] = None
+
 def _looks_like_mp3(buf: bytes) -> bool:
     return buf[:3] == b"ID3" or buf[:2] in (b"\xff\xfb", b"\xff\xf3", b"\xff\xf2")
 
@@ -50,10 +56,11 @@ async def play_audio(
     device: Optional[int] = None,
     blocksize = None,
     sample_rate: int = 48000,
+    ring_buffer: Optional[PcmRingBuffer] = None,
 ) -> None:
     async def _one_chunk():
         yield blob
-    await play_audio_streaming(_one_chunk().__aiter__(), device=device, blocksize=blocksize, sample_rate=sample_rate)
+    await play_audio_streaming(_one_chunk().__aiter__(), device=device, blocksize=blocksize, sample_rate=sample_rate, ring_buffer=ring_buffer)
 
 
 async def play_audio_streaming(
@@ -64,6 +71,8 @@ async def play_audio_streaming(
     sample_rate: int = 48000,
     on_playback_active: Optional[Callable[[], Awaitable[None]]] = None,
     on_playback_idle: Optional[Callable[[], Awaitable[None]]] = None,
+    ring_buffer: Optional[PcmRingBuffer] = None,
+    decoder: Optional[AudioDecoder] = None,
 ) -> None:
     _need_deps()
     iterator = chunks.__aiter__()
@@ -73,86 +82,180 @@ async def play_audio_streaming(
         await on_playback_active()
 
     if _looks_like_mp3(first):
-        await _stream_mp3(chunks, first, device=device, on_playback_active=on_playback_active, on_playback_idle=on_playback_idle)
+        await _stream_mp3(chunks, first, device=device, on_playback_active=on_playback_active, on_playback_idle=on_playback_idle, ring_buffer=ring_buffer, decoder=decoder)
     elif _looks_like_wav(first):
-        await _stream_wav(chunks, first, device=device, on_playback_active=on_playback_active, on_playback_idle=on_playback_idle)
+        await _stream_wav(chunks, first, device=device, on_playback_active=on_playback_active, on_playback_idle=on_playback_idle, ring_buffer=ring_buffer)
     else:
         async def _reassembled():
             yield first
             async for chunk in chunks:
                 yield chunk
-        await _stream_pcm(_reassembled(), sample_rate, 1, device=device, blocksize=blocksize, on_playback_active=on_playback_active, on_playback_idle=on_playback_idle)
+        await _stream_pcm(_reassembled(), sample_rate, 1, device=device, blocksize=blocksize, on_playback_active=on_playback_active, on_playback_idle=on_playback_idle, ring_buffer=ring_buffer)
     
     if on_playback_idle:
         await on_playback_idle()
 
+class PcmRingBuffer:
+    """
+    Preallocated byte ring that carries PCM from the event loop to the sounddevice callback.
+
+    There is exactly one writer (the feeder coroutine) and one reader (the audio thread), and each only
+    advances its own cursor, so the real-time callback never takes a lock or copies more than it plays.
+    Pass an instance to `play_audio_streaming` to choose the capacity and to watch the counters. The same
+    instance can be passed for any number of streams, one at a time; each stream starts by resetting it.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._view = memoryview(bytearray(capacity))
+        # Monotonic byte totals; the ring offset is the total modulo capacity.
+        self._written = 0
+        self._read = 0
+        self._closed = False
+        self.underruns = 0
+        """Callbacks that found less audio buffered than the device asked for before the stream ended."""
+        self.peak_fill_level = 0
+
+    @property
+    def fill_level(self) -> int:
+        """Bytes currently buffered."""
+        return self._written - self._read
+
+    @property
+    def bytes_written(self) -> int:
+        return self._written
+
+    @property
+    def bytes_read(self) -> int:
+        return self._read
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        """Mark the end of the stream; the reader drains what is left and then stops."""
+        self._closed = True
+
+    def reset(self) -> None:
+        """Empty and reopen the ring for another stream. `underruns` and `peak_fill_level` keep counting."""
+        self._written = 0
+        self._read = 0
+        self._closed = False
+
+    def write(self, data: "ReadableBuffer") -> int:
+        """Copy as much of `data` as fits. Returns the number of bytes written. Writer side only."""
+        src = memoryview(data).cast("B")
+        n = min(src.nbytes, self.capacity - self.fill_level)
+        if n <= 0:
+            return 0
+        start = self._written % self.capacity
+        first = min(n, self.capacity - start)
+        self._view[start : start + first] = src[:first]
+        if n > first:
+            self._view[: n - first] = src[first:n]
+        # Publish only after the bytes are in place
+        self._written += n
+        self.peak_fill_level = max(self.peak_fill_level, self.fill_level)
+        return n
+
+    def read_into(self, out: memoryview, n: int) -> int:
+        """Copy up to `n` buffered bytes to the start of `out`. Returns the number of bytes copied. Reader side only."""
+        n = min(n, self.fill_level)
+        if n <= 0:
+            return 0
+        start = self._read % self.capacity
+        first = min(n, self.capacity - start)
+        out[:first] = self._view[start : start + first]
+        if n > first:
+            out[first:n] = self._view[: n - first]
+        self._read += n
+        return n
+
+
+# How long the feeder waits for the audio thread to free space in a full ring buffer
+_FEEDER_POLL_SECONDS = 0.005
+_DEFAULT_BUFFER_SECONDS = 2.0
+
+
+def _make_pcm_callback(
+    ring: PcmRingBuffer,
+    n_channels: int,
+    loop: asyncio.AbstractEventLoop,
+    on_playback_active: Optional[Callable[[], Awaitable[None]]] = None,
+    on_playback_idle: Optional[Callable[[], Awaitable[None]]] = None,
+) -> Callable[..., None]:
+    was_idle = False
+    silence = b""
+
+    def cb(outdata, frames, *_):
+        nonlocal was_idle, silence
+        need = frames * n_channels * _BYTES_PER_SAMP
+        out = memoryview(outdata).cast("B")
+        got = ring.read_into(out, need)
+        if got and was_idle and on_playback_active:
+            was_idle = False
+            loop.call_soon_threadsafe(lambda: asyncio.create_task(on_playback_active()))
+        if got == need:
+            return
+        if ring.closed and ring.fill_level == 0 and got == 0:
+            # Stream is finished, stop playback
+            raise sd.CallbackStop
+        # Not enough data - pad with silence
+        if len(silence) < need:
+            silence = bytes(need)
+        out[got:need] = silence[: need - got]
+        if not ring.closed:
+            ring.underruns += 1
+            if not was_idle and on_playback_idle:
+                was_idle = True
+                loop.call_soon_threadsafe(lambda: asyncio.create_task(on_playback_idle()))
+
+    return cb
+
+
 async def _stream_pcm(
-    pcm_chunks: AsyncIterable[bytes],
+    pcm_chunks: AsyncIterable[ReadableBuffer],
     sample_rate: int,
     n_channels: int,
     device: Optional[int] = None,
     blocksize: Optional[int] = _DEFAULT_BLOCKSIZE,
     on_playback_active: Optional[Callable[[], Awaitable[None]]] = None,
     on_playback_idle: Optional[Callable[[], Awaitable[None]]] = None,
+    ring_buffer: Optional[PcmRingBuffer] = None,
 ) -> None:
     """Generic PCM player: pulls raw PCM from chunks and plays via sounddevice."""
     _need_deps()
     loop = asyncio.get_running_loop()
     done_event = asyncio.Event()
+    ring = ring_buffer if ring_buffer is not None else PcmRingBuffer(int(sample_rate * _DEFAULT_BUFFER_SECONDS) * n_channels * _BYTES_PER_SAMP)
+    # A caller's ring may have carried, and closed on, an earlier stream
+    ring.reset()
 
     def finished_cb():
         loop.call_soon_threadsafe(done_event.set)
 
-    pcm_queue: queue.Queue[Optional[bytes]] = queue.Queue(maxsize=32)
-
-    # pump PCM into the queue
+    # pump PCM into the ring buffer
     async def feeder():
-        async for data in pcm_chunks:
-            pcm_queue.put(data)
-        pcm_queue.put(None)
+        try:
+            async for data in pcm_chunks:
+                view = memoryview(data).cast("B")
+                while view:
+                    view = view[ring.write(view) :]
+                    if view:
+                        await asyncio.sleep(_FEEDER_POLL_SECONDS)
+        finally:
+            ring.close()
 
-    # consume queue in sounddevice callback
+    # consume the ring buffer in the sounddevice callback
     async def player():
-        buf = b""
-        finished = False
-        was_idle = False
-        def cb(outdata, frames, *_):
-            nonlocal buf, finished, was_idle
-            need = frames * n_channels * _BYTES_PER_SAMP
-            while len(buf) < need:
-                try:
-                    part = pcm_queue.get_nowait()
-                    if part is None:
-                        finished = True
-                        break
-                    buf += part
-                    if was_idle and on_playback_active:
-                        was_idle = False
-                        loop.call_soon_threadsafe(lambda: asyncio.create_task(on_playback_active()))
-                except queue.Empty:
-                    if not was_idle and on_playback_idle:
-                        was_idle = True
-                        loop.call_soon_threadsafe(lambda: asyncio.create_task(on_playback_idle()))
-                    break
-            
-            if len(buf) >= need:
-                # We have enough data
-                outdata[:] = buf[:need]
-                buf = buf[need:]
-            elif finished:
-                # Stream is finished, stop playback
-                raise sd.CallbackStop
-            else:
-                # Not enough data and stream not finished - fill with silence
-                silence = b'\x00' * (need - len(buf))
-                outdata[:] = buf + silence
-                buf = b""
-
         with sd.RawOutputStream(
           samplerate=sample_rate,
           channels=n_channels,
           dtype=_S16_DTYPE,
-          callback=cb,
+          callback=_make_pcm_callback(ring, n_channels, loop, on_playback_active, on_playback_idle),
           blocksize=blocksize,
           device=device,
           finished_callback=finished_cb):
@@ -166,6 +269,7 @@ async def _stream_wav(
     device: Optional[int] = None,
     on_playback_active: Optional[Callable[[], Awaitable[None]]] = None,
     on_playback_idle: Optional[Callable[[], Awaitable[None]]] = None,
+    ring_buffer: Optional[PcmRingBuffer] = None,
 ) -> None:
     # build header + ensure we have 44 bytes
     header = bytearray(first)
@@ -180,7 +284,7 @@ async def _stream_wav(
         async for c in iterator:
             yield c
 
-    await _stream_pcm(pcm_gen(), sample_rate, n_channels, device=device, on_playback_active=on_playback_active, on_playback_idle=on_playback_idle)
+    await _stream_pcm(pcm_gen(), sample_rate, n_channels, device=device, on_playback_active=on_playback_active, on_playback_idle=on_playback_idle, ring_buffer=ring_buffer)
 
 async def _stream_mp3(
     chunks: AsyncIterable[bytes],
@@ -188,39 +292,18 @@ async def _stream_mp3(
     device: Optional[int] = None,
     on_playback_active: Optional[Callable[[], Awaitable[None]]] = None,
     on_playback_idle: Optional[Callable[[], Awaitable[None]]] = None,
+    ring_buffer: Optional[PcmRingBuffer] = None,
+    decoder: Optional[AudioDecoder] = None,
 ) -> None:
-    cmd = (
-        "ffmpeg -hide_banner -loglevel error -i pipe:0 "
-        "-f s16le -acodec pcm_s16le -ac 2 -ar 48000 -"
-    )
-    proc = await asyncio.create_subprocess_exec(
-        *shlex.split(cmd),
-        stdin=asyncio.subprocess.PIPE,
-        stdout=asyncio.subprocess.PIPE,
-    )
+    global _default_decoder
+    if decoder is None:
+        if _default_decoder is None:
+            _default_decoder = create_audio_decoder()
+        decoder = _default_decoder
 
-    iterator = chunks.__aiter__()
+    async def mp3_chunks():
+        yield first
+        async for chunk in chunks:
+            yield chunk
 
-    # feed MP3 into ffmpeg
-    async def feed():
-        assert proc.stdin
-        proc.stdin.write(first)
-        async for chunk in iterator:
-            proc.stdin.write(chunk)
-            await proc.stdin.drain()
-        proc.stdin.close()
-
-    async def pcm_generator():
-        assert proc.stdout
-        # start feeding in background
-        feed_task = asyncio.create_task(feed())
-        # yield decoded PCM as it comes
-        while True:
-            data = await proc.stdout.read(8192)
-            if not data:
-                break
-            yield data
-        await feed_task
-        await proc.wait()
-
-    await _stream_pcm(pcm_generator(), 48_000, 2, device=device, on_playback_active=on_playback_active, on_playback_idle=on_playback_idle)
+    await _stream_pcm(decoder.decode(mp3_chunks()), decoder.sample_rate, decoder.channels, device=device, on_playback_active=on_playback_active, on_playback_idle=on_playback_idle, ring_buffer=ring_buffer)
@@ -4,9 +4,10 @@
 import asyncio
 import logging
 from dataclasses import dataclass
-from typing import AsyncIterable
+from typing import AsyncIterable, Union
 
 from hume.empathic_voice.chat.audio.audio_utilities import play_audio_streaming
+from hume.empathic_voice.chat.audio.decoded_audio import DecodedAudioOutput
 from hume.empathic_voice.chat.audio.microphone_sender import Sender
 from hume.empathic_voice.chat.client import AsyncChatSocketClient
 
@@ -17,20 +18,21 @@ class ChatClient:
     """Async client for handling messages to and from an EVI connection."""
 
     sender: Sender
-    byte_strs: AsyncIterable[bytes]
+    byte_strs: AsyncIterable[Union[bytes, DecodedAudioOutput]]
 
     @classmethod
-    def new(cls, *, sender: Sender, byte_strs: AsyncIterable[bytes]) -> "ChatClient":
+    def new(cls, *, sender: Sender, byte_strs: AsyncIterable[Union[bytes, DecodedAudioOutput]]) -> "ChatClient":
         """Create a new chat client.
 
         Args:
             sender (_Sender): Sender for audio data.
-            byte_strs (Stream[bytes]): Byte stream of audio data. 
+            byte_strs (Stream[bytes | DecodedAudioOutput]): Stream of audio chunks, either as decoded WAV bytes
+                or as events from a socket connected with `decode_audio=True`.
         """
         return cls(sender=sender, byte_strs=byte_strs)
 
     async def _play(self) -> None:
-        async def iterable() -> AsyncIterable[bytes]:
+        async def iterable() -> AsyncIterable[Union[bytes, memoryview]]:
             first = True
             async for byte_str in self.byte_strs:
                 # Each chunk of audio data sent from evi is a .wav
@@ -38,15 +40,20 @@ class ChatClient:
                 # stream rather than playing each individual .wav file
                 # and starting and stopping the audio player for each
                 # chunk.
-                # 
-                # Every .wav file starts with a 44 byte header that
-                # declares metadata like the sample rate and the number
-                # of channels. We assume that the first .wav header
-                # applies for the entire stream, so for all but the
-                # first chunk we skip the first 44 bytes.
-                if not first:
-                    byte_str = byte_str[44:]
-                yield byte_str
+                #
+                # We assume that the first .wav header applies for the
+                # entire stream, so for all but the first chunk we skip
+                # the header. Skipping is done with a view rather than a
+                # slice so the chunk isn't copied.
+                if isinstance(byte_str, DecodedAudioOutput):
+                    yield byte_str.wav if first else byte_str.pcm
+                elif first:
+                    yield byte_str
+                else:
+                    # Every .wav file starts with a 44 byte header that
+                    # declares metadata like the sample rate and the
+                    # number of channels.
+                    yield memoryview(byte_str)[44:]
                 first = False
         await play_audio_streaming(
             iterable(),
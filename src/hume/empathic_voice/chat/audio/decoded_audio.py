@@ -0,0 +1,46 @@
+# THIS FILE IS MANUALLY MAINTAINED: see .fernignore
+"""Decoded form of EVI `audio_output` messages, for consumers that only need the raw audio."""
+
+from __future__ import annotations
+
+import binascii
+import dataclasses
+from typing import Any, Literal, Mapping, Optional
+
+from hume.core.wav import WavFormat, parse_wav_header
+
+
+@dataclasses.dataclass(frozen=True)
+class DecodedAudioOutput:
+    """
+    An `audio_output` message whose base64 payload has already been decoded.
+
+    `wav` is the decoded chunk as sent by EVI (a complete WAV file). `pcm` is a view over the sample data
+    inside it, so the WAV header is skipped by offset rather than by copying the buffer.
+    """
+
+    id: str
+    index: int
+    wav: memoryview
+    pcm: memoryview
+    format: Optional[WavFormat]
+    header_size: int
+    """Offset of `pcm` within `wav`."""
+    custom_session_id: Optional[str] = None
+    type: Literal["audio_output"] = "audio_output"
+
+    @classmethod
+    def from_message(cls, message: Mapping[str, Any]) -> "DecodedAudioOutput":
+        """Build from the JSON form of an `audio_output` message, without validating it into an `AudioOutput`."""
+        # a2b_base64 reads ASCII str directly, skipping the intermediate bytes copy that base64.b64decode makes.
+        wav = memoryview(binascii.a2b_base64(message["data"]))
+        wav_format, data_offset, data_size = parse_wav_header(wav)
+        return cls(
+            id=message["id"],
+            index=message["index"],
+            wav=wav,
+            pcm=wav[data_offset : data_offset + data_size],
+            format=wav_format,
+            header_size=data_offset,
+            custom_session_id=message.get("custom_session_id"),
+        )
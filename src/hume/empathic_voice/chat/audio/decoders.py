@@ -0,0 +1,233 @@
+# THIS FILE IS MANUALLY MAINTAINED: see .fernignore
+"""
+Compressed audio -> s16le PCM decoders used by `audio_utilities` for MP3 playback.
+
+* `PyAVDecoder` decodes in process with PyAV (`pip install av`) when it is installed
+* `FfmpegDecoder` shells out to `ffmpeg`, keeping warm worker processes so a stream doesn't wait on a spawn
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import shlex
+from typing import AsyncIterable, AsyncIterator, List, Literal, Optional, Protocol, Union
+
+AudioDecoderName = Literal["auto", "pyav", "ffmpeg"]
+
+_ID3_HEADER_SIZE = 10
+_READ_SIZE = 8192
+
+
+class AudioDecoder(Protocol):
+    """Decodes a stream of compressed audio chunks into interleaved s16le PCM."""
+
+    sample_rate: int
+    channels: int
+
+    def decode(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        """Yield PCM at `sample_rate`/`channels` as soon as each part of `chunks` is decoded."""
+        ...
+
+
+async def _skip_id3(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Drop a leading ID3v2 tag, which the raw MP3 parser would otherwise try to decode as audio."""
+    iterator = chunks.__aiter__()
+    head = b""
+    async for chunk in iterator:
+        head += chunk
+        if len(head) >= _ID3_HEADER_SIZE or head[: len("ID3")] != b"ID3"[: len(head)]:
+            break
+    if head[:3] == b"ID3" and len(head) >= _ID3_HEADER_SIZE:
+        # Tag size is a 28-bit "syncsafe" integer and excludes the header
+        size = _ID3_HEADER_SIZE + (head[6] << 21 | head[7] << 14 | head[8] << 7 | head[9])
+        while len(head) < size:
+            try:
+                head += await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+        head = head[size:]
+    if head:
+        yield head
+    async for chunk in iterator:
+        yield chunk
+
+
+class PyAVDecoder:
+    """In-process decoder backed by PyAV's bindings to the FFmpeg libraries."""
+
+    def __init__(self, *, sample_rate: int = 48_000, channels: int = 2, codec: str = "mp3") -> None:
+        import av  # type: ignore
+
+        self._av = av
+        self._codec = codec
+        self._layout: Union[str, int] = {1: "mono", 2: "stereo"}.get(channels, channels)
+        self.sample_rate = sample_rate
+        self.channels = channels
+
+    async def decode(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        codec = self._av.CodecContext.create(self._codec, "r")
+        resampler = self._av.AudioResampler(format="s16", layout=self._layout, rate=self.sample_rate)
+        frame_size = self.channels * 2
+
+        def pcm(frames) -> bytes:
+            # Plane buffers are padded past the last sample
+            return b"".join(bytes(f.planes[0])[: f.samples * frame_size] for f in frames)
+
+        def decode_packets(packets) -> bytes:
+            out = []
+            for packet in packets:
+                try:
+                    frames = codec.decode(packet)
+                except self._av.InvalidDataError:
+                    continue
+                for frame in frames:
+                    out.append(pcm(resampler.resample(frame)))
+            return b"".join(out)
+
+        async for chunk in _skip_id3(chunks):
+            data = decode_packets(codec.parse(bytes(chunk)))
+            if data:
+                yield data
+        # Flush the parser, then the decoder, then the resampler
+        tail = decode_packets(codec.parse(None))
+        tail += b"".join(pcm(resampler.resample(frame)) for frame in codec.decode(None))
+        tail += pcm(resampler.resample(None))
+        if tail:
+            yield tail
+
+
+class FfmpegDecoder:
+    """
+    Decoder that pipes each stream through an `ffmpeg` process.
+
+    An ffmpeg process decodes a single stream, so instead of spawning one when playback starts this keeps
+    `pool_size` processes started and waiting on stdin, and replaces each one in the background as it is used.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int = 48_000,
+        channels: int = 2,
+        input_format: str = "mp3",
+        pool_size: int = 1,
+        executable: str = "ffmpeg",
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.pool_size = pool_size
+        self._cmd = [executable] + shlex.split(
+            f"-hide_banner -loglevel error -f {input_format} -i pipe:0 "
+            f"-f s16le -acodec pcm_s16le -ac {channels} -ar {sample_rate} -"
+        )
+        self._idle: List[asyncio.subprocess.Process] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._refill: Optional[asyncio.Task] = None
+
+    async def _spawn(self) -> asyncio.subprocess.Process:
+        return await asyncio.create_subprocess_exec(
+            *self._cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+
+    async def _fill(self) -> None:
+        while len(self._idle) < self.pool_size:
+            self._idle.append(await self._spawn())
+
+    def _bind_loop(self) -> None:
+        # Worker pipes belong to the loop that spawned them; start over when used from a new one
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._idle = []
+            self._refill = None
+
+    async def _acquire(self) -> asyncio.subprocess.Process:
+        self._bind_loop()
+        proc = None
+        while self._idle:
+            candidate = self._idle.pop(0)
+            if candidate.returncode is None:
+                proc = candidate
+                break
+        if proc is None:
+            proc = await self._spawn()
+        if self.pool_size > 0 and (self._refill is None or self._refill.done()):
+            self._refill = asyncio.create_task(self._fill())
+        return proc
+
+    async def warm(self) -> None:
+        """Start the worker processes ahead of the first stream."""
+        self._bind_loop()
+        await self._fill()
+
+    async def decode(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        proc = await self._acquire()
+        assert proc.stdin and proc.stdout
+        stdin, stdout = proc.stdin, proc.stdout
+
+        async def feed() -> None:
+            try:
+                async for chunk in chunks:
+                    stdin.write(chunk)
+                    await stdin.drain()
+            finally:
+                stdin.close()
+
+        feed_task = asyncio.create_task(feed())
+        finished = False
+        try:
+            while True:
+                data = await stdout.read(_READ_SIZE)
+                if not data:
+                    break
+                yield data
+            await feed_task
+            finished = True
+        finally:
+            if not feed_task.done():
+                feed_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, ConnectionError):
+                    await feed_task
+            # After a clean end of output the worker is exiting on its own and only needs reaping; it is killed
+            # only when the stream was abandoned or failed
+            if not finished and proc.returncode is None:
+                with contextlib.suppress(ProcessLookupError):
+                    proc.kill()
+            await proc.wait()
+
+    async def aclose(self) -> None:
+        """Stop the idle worker processes."""
+        if self._refill is not None and not self._refill.done():
+            self._refill.cancel()
+        idle, self._idle = self._idle, []
+        for proc in idle:
+            with contextlib.suppress(ProcessLookupError):
+                proc.kill()
+            await proc.wait()
+
+
+def create_audio_decoder(
+    decoder: Optional[Union[AudioDecoderName, AudioDecoder]] = None,
+    *,
+    sample_rate: int = 48_000,
+    channels: int = 2,
+) -> AudioDecoder:
+    """
+    Resolve a decoder choice. `"auto"` (the default) decodes in process with PyAV when it is installed and
+    falls back to ffmpeg worker processes otherwise.
+    """
+    if decoder is not None and not isinstance(decoder, str):
+        return decoder
+    if decoder == "ffmpeg":
+        return FfmpegDecoder(sample_rate=sample_rate, channels=channels)
+    if decoder == "pyav":
+        return PyAVDecoder(sample_rate=sample_rate, channels=channels)
+    if decoder is None or decoder == "auto":
+        try:
+            return PyAVDecoder(sample_rate=sample_rate, channels=channels)
+        except ImportError:
+            return FfmpegDecoder(sample_rate=sample_rate, channels=channels)
+    raise ValueError(f"Unknown audio decoder: {decoder!r}")
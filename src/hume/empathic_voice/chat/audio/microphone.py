@@ -12,7 +12,7 @@ from typing import AsyncIterator, ClassVar, Iterator, List
 from exceptiongroup import ExceptionGroup
 
 from hume.core.api_error import ApiError
-from hume.empathic_voice.chat.audio.asyncio_utilities import Stream
+from hume.empathic_voice.chat.audio.asyncio_utilities import OverflowPolicy, Stream
 
 _FAILED_IMPORTS: List[ModuleNotFoundError] = []
 
@@ -31,6 +31,9 @@ except ModuleNotFoundError as e:
 
 logger = logging.getLogger(__name__)
 
+# NOTE: Microphone.DATA_TYPE is int16
+_BYTES_PER_SAMPLE = 2
+
 
 @dataclasses.dataclass
 class Microphone:
@@ -39,6 +42,11 @@ class Microphone:
     # NOTE: use int16 for compatibility with deepgram
     DATA_TYPE: ClassVar[str] = "int16"
     DEFAULT_DEVICE: ClassVar[int | None] = None
+    # NOTE: sounddevice delivers blocks of roughly 10 ms, so this holds a few seconds of backlog
+    DEFAULT_QUEUE_SIZE: ClassVar[int] = 256
+    DEFAULT_OVERFLOW: ClassVar[OverflowPolicy] = "drop_oldest"
+    # NOTE: only the "coalesce" policy caps the backlog by size; without max_bytes it holds this much audio
+    DEFAULT_COALESCE_SECONDS: ClassVar[float] = 3.0
 
     stream: Stream[bytes]
     num_channels: int
@@ -48,11 +56,23 @@ class Microphone:
     # [https://python-sounddevice.readthedocs.io/en/0.4.6/examples.html#creating-an-asyncio-generator-for-audio-blocks]
     @classmethod
     @contextlib.contextmanager
-    def context(cls, *, device: int | None = DEFAULT_DEVICE) -> Iterator["Microphone"]:
+    def context(
+        cls,
+        *,
+        device: int | None = DEFAULT_DEVICE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        overflow: OverflowPolicy = DEFAULT_OVERFLOW,
+        max_bytes: int | None = None,
+    ) -> Iterator["Microphone"]:
         """Create a new microphone context.
 
         Args:
             device (int | None): Input device ID.
+            queue_size (int): Maximum number of audio blocks buffered while the consumer is behind.
+            overflow (OverflowPolicy): What to do with new blocks once the buffer is full: "drop_oldest",
+                "drop_newest" or "coalesce" (merge them into the newest buffered block).
+            max_bytes (int | None): Maximum bytes of audio buffered under "coalesce". Defaults to
+                `DEFAULT_COALESCE_SECONDS` of audio.
         """
         if _FAILED_IMPORTS:
             raise ExceptionGroup("Importing audio libraries failed. Ensure you have installed the hume[microphone] extra `pip install 'hume[microphone]'` to use audio features.", _FAILED_IMPORTS)
@@ -78,7 +98,11 @@ class Microphone:
         # NOTE: use asyncio.get_running_loop() over asyncio.get_event_loop() per
         # [https://docs.python.org/3/library/asyncio-eventloop.html#asyncio.get_event_loop]
         sample_rate = int(sound_device["default_samplerate"])
-        microphone = cls(stream=Stream.new(), num_channels=num_channels, sample_rate=sample_rate)
+        if overflow == "coalesce" and max_bytes is None:
+            max_bytes = int(sample_rate * cls.DEFAULT_COALESCE_SECONDS) * num_channels * _BYTES_PER_SAMPLE
+        microphone = cls(
+            stream=Stream.bounded(queue_size, overflow, max_bytes), num_channels=num_channels, sample_rate=sample_rate
+        )
         event_loop = asyncio.get_running_loop()
 
         # pylint: disable=c-extension-no-member
@@ -91,6 +115,16 @@ class Microphone:
         with RawInputStream(callback=callback, dtype=cls.DATA_TYPE, device=device):
             yield microphone
 
+    @property
+    def queued_bytes(self) -> int:
+        """Bytes of audio captured but not yet consumed."""
+        return getattr(self.stream.queue, "queued_bytes", 0)
+
+    @property
+    def dropped_bytes(self) -> int:
+        """Bytes of audio discarded because the consumer fell behind."""
+        return getattr(self.stream.queue, "dropped_bytes", 0)
+
     def __aiter__(self) -> AsyncIterator[bytes]:
         """Iterate over bytes of microphone input."""
         return self.stream
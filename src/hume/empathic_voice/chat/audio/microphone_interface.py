@@ -10,7 +10,7 @@ from hume.empathic_voice.chat.audio.microphone_sender import MicrophoneSender
 from hume.empathic_voice.chat.socket_client import AsyncChatSocketClient
 from hume.empathic_voice.chat.audio.chat_client import ChatClient
 from hume.empathic_voice.types import AudioConfiguration
-from hume.empathic_voice.chat.audio.asyncio_utilities import Stream
+from hume.empathic_voice.chat.audio.asyncio_utilities import OverflowPolicy, Stream
 from hume.empathic_voice.types.session_settings import SessionSettings
 
 logger = logging.getLogger(__name__)
@@ -28,6 +28,10 @@ class MicrophoneInterface:
         byte_stream: Stream[bytes],
         device: int | None = Microphone.DEFAULT_DEVICE,
         allow_user_interrupt: bool = DEFAULT_ALLOW_USER_INTERRUPT,
+        queue_size: int = Microphone.DEFAULT_QUEUE_SIZE,
+        overflow: OverflowPolicy = Microphone.DEFAULT_OVERFLOW,
+        max_bytes: int | None = None,
+        frame_duration: float = MicrophoneSender.DEFAULT_FRAME_DURATION,
     ) -> None:
         """Start the microphone interface.
 
@@ -36,9 +40,17 @@ class MicrophoneInterface:
             device (int | None): Device index for the microphone.
             allow_user_interrupt (bool): Whether to allow the user to interrupt EVI. If False, the user's microphone input is stopped from flowing to the WebSocket when audio from the assistant is playing.
             byte_stream (Stream[bytes]): Byte stream of audio data.
+            queue_size (int): Maximum number of microphone blocks buffered while the socket is behind.
+            overflow (OverflowPolicy): What to do with microphone blocks once that buffer is full.
+            max_bytes (int | None): Maximum bytes of microphone audio buffered under the "coalesce" policy.
+            frame_duration (float): Seconds of microphone audio sent in each websocket message.
         """
-        with Microphone.context(device=device) as microphone:
-            sender = MicrophoneSender.new(microphone=microphone, allow_interrupt=allow_user_interrupt)
+        with Microphone.context(
+            device=device, queue_size=queue_size, overflow=overflow, max_bytes=max_bytes
+        ) as microphone:
+            sender = MicrophoneSender.new(
+                microphone=microphone, allow_interrupt=allow_user_interrupt, frame_duration=frame_duration
+            )
             chat_client = ChatClient.new(sender=sender, byte_strs=byte_stream)
             print("Configuring socket with microphone settings...")
             audio_config = AudioConfiguration(sample_rate=microphone.sample_rate,
@@ -49,6 +49,7 @@ class ChatClient:
         verbose_transcription: typing.Optional[bool] = None,
         api_key: typing.Optional[str] = None,
         session_settings: typing.Optional[ConnectSessionSettings] = None,
+        decode_audio: bool = False,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> typing.Iterator[ChatSocketClient]:
         """
@@ -105,6 +106,9 @@ class ChatClient:
 
         session_settings : ConnectSessionSettings
 
+        decode_audio : bool
+            Yield `audio_output` messages as `DecodedAudioOutput` events, with the audio already base64-decoded and the WAV header located, instead of validating them into `AudioOutput` models.
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
@@ -140,7 +144,11 @@ class ChatClient:
             headers.update(request_options["additional_headers"])
         try:
             with websockets_sync_client.connect(ws_url, additional_headers=headers) as protocol:
-                yield ChatSocketClient(websocket=protocol)
+                yield ChatSocketClient(
+                    websocket=protocol,
+                    json_codec=self._raw_client._client_wrapper.get_json_codec(),
+                    decode_audio=decode_audio,
+                )
         except InvalidWebSocketStatus as exc:
             status_code: int = get_status_code(exc)
             if status_code == 401:
@@ -184,6 +192,7 @@ class AsyncChatClient:
         verbose_transcription: typing.Optional[bool] = None,
         api_key: typing.Optional[str] = None,
         session_settings: typing.Optional[ConnectSessionSettings] = None,
+        decode_audio: bool = False,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> typing.AsyncIterator[AsyncChatSocketClient]:
         """
@@ -240,6 +249,9 @@ class AsyncChatClient:
 
         session_settings : typing.Optional[ConnectSessionSettings]
 
+        decode_audio : bool
+            Yield `audio_output` messages as `DecodedAudioOutput` events, with the audio already base64-decoded and the WAV header located, instead of validating them into `AudioOutput` models.
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
@@ -277,7 +289,11 @@ class AsyncChatClient:
             headers.update(request_options["additional_headers"])
         try:
             async with websockets_client_connect(ws_url, extra_headers=headers) as protocol:
-                yield AsyncChatSocketClient(websocket=protocol)
+                yield AsyncChatSocketClient(
+                    websocket=protocol,
+                    json_codec=self._raw_client._client_wrapper.get_json_codec(),
+                    decode_audio=decode_audio,
+                )
         except InvalidWebSocketStatus as exc:
             status_code: int = get_status_code(exc)
             if status_code == 401:
@@ -36,6 +36,7 @@ class RawChatClient:
         verbose_transcription: typing.Optional[bool] = None,
         api_key: typing.Optional[str] = None,
         session_settings: ConnectSessionSettings,
+        decode_audio: bool = False,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> typing.Iterator[ChatSocketClient]:
         """
@@ -92,6 +93,9 @@ class RawChatClient:
 
         session_settings : ConnectSessionSettings
 
+        decode_audio : bool
+            Yield `audio_output` messages as `DecodedAudioOutput` events, with the audio already base64-decoded and the WAV header located, instead of validating them into `AudioOutput` models.
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
@@ -125,7 +129,11 @@ class RawChatClient:
             headers.update(request_options["additional_headers"])
         try:
             with websockets_sync_client.connect(ws_url, additional_headers=headers) as protocol:
-                yield ChatSocketClient(websocket=protocol)
+                yield ChatSocketClient(
+                    websocket=protocol,
+                    json_codec=self._client_wrapper.get_json_codec(),
+                    decode_audio=decode_audio,
+                )
         except InvalidWebSocketStatus as exc:
             status_code: int = get_status_code(exc)
             if status_code == 401:
@@ -157,6 +165,7 @@ class AsyncRawChatClient:
         verbose_transcription: typing.Optional[bool] = None,
         api_key: typing.Optional[str] = None,
         session_settings: ConnectSessionSettings,
+        decode_audio: bool = False,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> typing.AsyncIterator[AsyncChatSocketClient]:
         """
@@ -213,6 +222,9 @@ class AsyncRawChatClient:
 
         session_settings : ConnectSessionSettings
 
+        decode_audio : bool
+            Yield `audio_output` messages as `DecodedAudioOutput` events, with the audio already base64-decoded and the WAV header located, instead of validating them into `AudioOutput` models.
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
@@ -246,7 +258,11 @@ class AsyncRawChatClient:
             headers.update(request_options["additional_headers"])
         try:
             async with websockets_client_connect(ws_url, extra_headers=headers) as protocol:
-                yield AsyncChatSocketClient(websocket=protocol)
+                yield AsyncChatSocketClient(
+                    websocket=protocol,
+                    json_codec=self._client_wrapper.get_json_codec(),
+                    decode_audio=decode_audio,
+                )
         except InvalidWebSocketStatus as exc:
             status_code: int = get_status_code(exc)
             if status_code == 401:
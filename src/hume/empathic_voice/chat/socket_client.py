@@ -1,6 +1,5 @@
 # This file was auto-generated by Fern from our API Definition.
 
-import json
 import typing
 from json.decoder import JSONDecodeError
 
@@ -10,7 +9,8 @@ from typing_extensions import deprecated
 from contextlib import asynccontextmanager
 
 from ...core.events import EventEmitterMixin, EventType
-from ...core.pydantic_utilities import parse_obj_as
+from ...core.json_codec import JsonCodec, create_json_codec
+from ...core.pydantic_utilities import parse_union_obj_as
 from ..types.assistant_input import AssistantInput
 from ..types.audio_input import AudioInput
 from ..types.pause_assistant_message import PauseAssistantMessage
@@ -21,6 +21,7 @@ from ..types.tool_response_message import ToolResponseMessage
 from ..types.user_input import UserInput
 from .types.publish_event import PublishEvent
 from ..types.subscribe_event import SubscribeEvent
+from .audio.decoded_audio import DecodedAudioOutput
 
 try:
     from websockets.legacy.client import WebSocketClientProtocol  # type: ignore
@@ -83,13 +84,21 @@ class ChatConnectOptions(typing.TypedDict, total=False):
     """
 
 class AsyncChatSocketClient(EventEmitterMixin):
-    def __init__(self, *, websocket: WebSocketClientProtocol):
+    def __init__(
+        self,
+        *,
+        websocket: WebSocketClientProtocol,
+        json_codec: typing.Optional[JsonCodec] = None,
+        decode_audio: bool = False,
+    ):
         super().__init__()
         self._websocket = websocket
+        self._json_codec = json_codec if json_codec is not None else create_json_codec()
+        self._decode_audio = decode_audio
 
     async def __aiter__(self):
         async for message in self._websocket:
-            yield parse_obj_as(ChatSocketClientResponse, json.loads(message))  # type: ignore
+            yield self._parse_message(self._json_codec.loads(message))
 
     async def start_listening(self):
         """
@@ -104,8 +113,8 @@ class AsyncChatSocketClient(EventEmitterMixin):
         await self._emit_async(EventType.OPEN, None)
         try:
             async for raw_message in self._websocket:
-                json_data = json.loads(raw_message)
-                parsed = parse_obj_as(ChatSocketClientResponse, json_data)  # type: ignore
+                json_data = self._json_codec.loads(raw_message)
+                parsed = self._parse_message(json_data)
                 await self._emit_async(EventType.MESSAGE, parsed)
         except (websockets.WebSocketException, JSONDecodeError) as exc:
             await self._emit_async(EventType.ERROR, exc)
@@ -119,27 +128,32 @@ class AsyncChatSocketClient(EventEmitterMixin):
         """
         await self._send_model(message)
 
-    async def recv(self) -> ChatSocketClientResponse:
+    async def recv(self) -> typing.Union[ChatSocketClientResponse, DecodedAudioOutput]:
         """
         Receive a message from the websocket connection.
         """
         data = await self._websocket.recv()
-        json_data = json.loads(data)
-        return parse_obj_as(ChatSocketClientResponse, json_data)  # type: ignore
+        json_data = self._json_codec.loads(data)
+        return self._parse_message(json_data)
 
     async def _send(self, data: typing.Any) -> None:
         """
         Send a message to the websocket connection.
         """
         if isinstance(data, dict):
-            data = json.dumps(data)
+            data = self._json_codec.dumps(data)
         await self._websocket.send(data)
 
     async def _send_model(self, data: typing.Any) -> None:
         """
         Send a Pydantic model to the websocket connection.
         """
-        await self._send(data.dict())
+        await self._websocket.send(self._json_codec.dumps_model(data))
+
+    def _parse_message(self, json_data: typing.Any) -> typing.Union[ChatSocketClientResponse, DecodedAudioOutput]:
+        if self._decode_audio and isinstance(json_data, dict) and json_data.get("type") == "audio_output":
+            return DecodedAudioOutput.from_message(json_data)
+        return parse_union_obj_as(ChatSocketClientResponse, json_data)  # type: ignore
 
     @deprecated("Use send_publish instead.")
     async def send_audio_input(self, message: AudioInput) -> None:
@@ -175,13 +189,21 @@ class AsyncChatSocketClient(EventEmitterMixin):
 
 
 class ChatSocketClient(EventEmitterMixin):
-    def __init__(self, *, websocket: websockets_sync_connection.Connection):
+    def __init__(
+        self,
+        *,
+        websocket: websockets_sync_connection.Connection,
+        json_codec: typing.Optional[JsonCodec] = None,
+        decode_audio: bool = False,
+    ):
         super().__init__()
         self._websocket = websocket
+        self._json_codec = json_codec if json_codec is not None else create_json_codec()
+        self._decode_audio = decode_audio
 
     def __iter__(self):
         for message in self._websocket:
-            yield parse_obj_as(ChatSocketClientResponse, json.loads(message))  # type: ignore
+            yield self._parse_message(self._json_codec.loads(message))
 
     def start_listening(self):
         """
@@ -196,8 +218,8 @@ class ChatSocketClient(EventEmitterMixin):
         self._emit(EventType.OPEN, None)
         try:
             for raw_message in self._websocket:
-                json_data = json.loads(raw_message)
-                parsed = parse_obj_as(ChatSocketClientResponse, json_data)  # type: ignore
+                json_data = self._json_codec.loads(raw_message)
+                parsed = self._parse_message(json_data)
                 self._emit(EventType.MESSAGE, parsed)
         except (websockets.WebSocketException, JSONDecodeError) as exc:
             self._emit(EventType.ERROR, exc)
@@ -211,27 +233,32 @@ class ChatSocketClient(EventEmitterMixin):
         """
         self._send_model(message)
 
-    def recv(self) -> ChatSocketClientResponse:
+    def recv(self) -> typing.Union[ChatSocketClientResponse, DecodedAudioOutput]:
         """
         Receive a message from the websocket connection.
         """
         data = self._websocket.recv()
-        json_data = json.loads(data)
-        return parse_obj_as(ChatSocketClientResponse, json_data)  # type: ignore
+        json_data = self._json_codec.loads(data)
+        return self._parse_message(json_data)
 
     def _send(self, data: typing.Any) -> None:
         """
         Send a message to the websocket connection.
         """
         if isinstance(data, dict):
-            data = json.dumps(data)
+            data = self._json_codec.dumps(data)
         self._websocket.send(data)
 
     def _send_model(self, data: typing.Any) -> None:
         """
         Send a Pydantic model to the websocket connection.
         """
-        self._send(data.dict())
+        self._websocket.send(self._json_codec.dumps_model(data))
+
+    def _parse_message(self, json_data: typing.Any) -> typing.Union[ChatSocketClientResponse, DecodedAudioOutput]:
+        if self._decode_audio and isinstance(json_data, dict) and json_data.get("type") == "audio_output":
+            return DecodedAudioOutput.from_message(json_data)
+        return parse_union_obj_as(ChatSocketClientResponse, json_data)  # type: ignore
     
     @deprecated("Use send_publish instead.")
     def send_audio_input(self, message: AudioInput) -> None:
@@ -96,7 +96,16 @@ class RawChatGroupsClient:
                     config_id=config_id,
                     request_options=request_options,
                 )
-                return SyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                _get_page = lambda _page_number: self.list_chat_groups(
+                    page_number=_page_number,
+                    page_size=page_size,
+                    ascending_order=ascending_order,
+                    config_id=config_id,
+                    request_options=request_options,
+                )
+                return SyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
@@ -337,7 +346,16 @@ class RawChatGroupsClient:
                     ascending_order=ascending_order,
                     request_options=request_options,
                 )
-                return SyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                _get_page = lambda _page_number: self.list_chat_group_events(
+                    id,
+                    page_size=page_size,
+                    page_number=_page_number,
+                    ascending_order=ascending_order,
+                    request_options=request_options,
+                )
+                return SyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
@@ -434,7 +452,18 @@ class AsyncRawChatGroupsClient:
                         request_options=request_options,
                     )
 
-                return AsyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                async def _get_page(_page_number: int):
+                    return await self.list_chat_groups(
+                        page_number=_page_number,
+                        page_size=page_size,
+                        ascending_order=ascending_order,
+                        config_id=config_id,
+                        request_options=request_options,
+                    )
+
+                return AsyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
@@ -678,7 +707,18 @@ class AsyncRawChatGroupsClient:
                         request_options=request_options,
                     )
 
-                return AsyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                async def _get_page(_page_number: int):
+                    return await self.list_chat_group_events(
+                        id,
+                        page_size=page_size,
+                        page_number=_page_number,
+                        ascending_order=ascending_order,
+                        request_options=request_options,
+                    )
+
+                return AsyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
@@ -99,7 +99,17 @@ class RawChatsClient:
                     status=status,
                     request_options=request_options,
                 )
-                return SyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                _get_page = lambda _page_number: self.list_chats(
+                    page_number=_page_number,
+                    page_size=page_size,
+                    ascending_order=ascending_order,
+                    config_id=config_id,
+                    status=status,
+                    request_options=request_options,
+                )
+                return SyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
@@ -185,7 +195,16 @@ class RawChatsClient:
                     ascending_order=ascending_order,
                     request_options=request_options,
                 )
-                return SyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                _get_page = lambda _page_number: self.list_chat_events(
+                    id,
+                    page_size=page_size,
+                    page_number=_page_number,
+                    ascending_order=ascending_order,
+                    request_options=request_options,
+                )
+                return SyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
@@ -337,7 +356,19 @@ class AsyncRawChatsClient:
                         request_options=request_options,
                     )
 
-                return AsyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                async def _get_page(_page_number: int):
+                    return await self.list_chats(
+                        page_number=_page_number,
+                        page_size=page_size,
+                        ascending_order=ascending_order,
+                        config_id=config_id,
+                        status=status,
+                        request_options=request_options,
+                    )
+
+                return AsyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
@@ -426,7 +457,18 @@ class AsyncRawChatsClient:
                         request_options=request_options,
                     )
 
-                return AsyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                async def _get_page(_page_number: int):
+                    return await self.list_chat_events(
+                        id,
+                        page_size=page_size,
+                        page_number=_page_number,
+                        ascending_order=ascending_order,
+                        request_options=request_options,
+                    )
+
+                return AsyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
@@ -108,7 +108,16 @@ class RawConfigsClient:
                     name=name,
                     request_options=request_options,
                 )
-                return SyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                _get_page = lambda _page_number: self.list_configs(
+                    page_number=_page_number,
+                    page_size=page_size,
+                    restrict_to_most_recent=restrict_to_most_recent,
+                    name=name,
+                    request_options=request_options,
+                )
+                return SyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
@@ -347,7 +356,16 @@ class RawConfigsClient:
                     restrict_to_most_recent=restrict_to_most_recent,
                     request_options=request_options,
                 )
-                return SyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                _get_page = lambda _page_number: self.list_config_versions(
+                    id,
+                    page_number=_page_number,
+                    page_size=page_size,
+                    restrict_to_most_recent=restrict_to_most_recent,
+                    request_options=request_options,
+                )
+                return SyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
@@ -879,7 +897,18 @@ class AsyncRawConfigsClient:
                         request_options=request_options,
                     )
 
-                return AsyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                async def _get_page(_page_number: int):
+                    return await self.list_configs(
+                        page_number=_page_number,
+                        page_size=page_size,
+                        restrict_to_most_recent=restrict_to_most_recent,
+                        name=name,
+                        request_options=request_options,
+                    )
+
+                return AsyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
@@ -1121,7 +1150,18 @@ class AsyncRawConfigsClient:
                         request_options=request_options,
                     )
 
-                return AsyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                async def _get_page(_page_number: int):
+                    return await self.list_config_versions(
+                        id,
+                        page_number=_page_number,
+                        page_size=page_size,
+                        restrict_to_most_recent=restrict_to_most_recent,
+                        request_options=request_options,
+                    )
+
+                return AsyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
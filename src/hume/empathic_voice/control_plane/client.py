@@ -85,6 +85,7 @@ class ControlPlaneClient:
         chat_id: str,
         *,
         access_token: typing.Optional[str] = None,
+        decode_audio: bool = False,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> typing.Iterator[ControlPlaneSocketClient]:
         """
@@ -102,6 +103,9 @@ class ControlPlaneClient:
 
             For more details, refer to the [Authentication Strategies Guide](/docs/introduction/api-key#authentication-strategies).
 
+        decode_audio : bool
+            Yield `audio_output` messages as `DecodedAudioOutput` events, with the audio already base64-decoded and the WAV header located, instead of validating them into `AudioOutput` models.
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
@@ -131,7 +135,11 @@ class ControlPlaneClient:
             headers.update(request_options["additional_headers"])
         try:
             with websockets_sync_client.connect(ws_url, additional_headers=headers) as protocol:
-                yield ControlPlaneSocketClient(websocket=protocol)
+                yield ControlPlaneSocketClient(
+                    websocket=protocol,
+                    json_codec=self._raw_client._client_wrapper.get_json_codec(),
+                    decode_audio=decode_audio,
+                )
         except InvalidWebSocketStatus as exc:
             status_code: int = get_status_code(exc)
             if status_code == 401:
@@ -215,6 +223,7 @@ class AsyncControlPlaneClient:
         chat_id: str,
         *,
         access_token: typing.Optional[str] = None,
+        decode_audio: bool = False,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> typing.AsyncIterator[AsyncControlPlaneSocketClient]:
         """
@@ -232,6 +241,9 @@ class AsyncControlPlaneClient:
 
             For more details, refer to the [Authentication Strategies Guide](/docs/introduction/api-key#authentication-strategies).
 
+        decode_audio : bool
+            Yield `audio_output` messages as `DecodedAudioOutput` events, with the audio already base64-decoded and the WAV header located, instead of validating them into `AudioOutput` models.
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
@@ -261,7 +273,11 @@ class AsyncControlPlaneClient:
             headers.update(request_options["additional_headers"])
         try:
             async with websockets_client_connect(ws_url, extra_headers=headers) as protocol:
-                yield AsyncControlPlaneSocketClient(websocket=protocol)
+                yield AsyncControlPlaneSocketClient(
+                    websocket=protocol,
+                    json_codec=self._raw_client._client_wrapper.get_json_codec(),
+                    decode_audio=decode_audio,
+                )
         except InvalidWebSocketStatus as exc:
             status_code: int = get_status_code(exc)
             if status_code == 401:
@@ -95,6 +95,7 @@ class RawControlPlaneClient:
         chat_id: str,
         *,
         access_token: typing.Optional[str] = None,
+        decode_audio: bool = False,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> typing.Iterator[ControlPlaneSocketClient]:
         """
@@ -112,6 +113,9 @@ class RawControlPlaneClient:
 
             For more details, refer to the [Authentication Strategies Guide](/docs/introduction/api-key#authentication-strategies).
 
+        decode_audio : bool
+            Yield `audio_output` messages as `DecodedAudioOutput` events, with the audio already base64-decoded and the WAV header located, instead of validating them into `AudioOutput` models.
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
@@ -141,7 +145,11 @@ class RawControlPlaneClient:
             headers.update(request_options["additional_headers"])
         try:
             with websockets_sync_client.connect(ws_url, additional_headers=headers) as protocol:
-                yield ControlPlaneSocketClient(websocket=protocol)
+                yield ControlPlaneSocketClient(
+                    websocket=protocol,
+                    json_codec=self._client_wrapper.get_json_codec(),
+                    decode_audio=decode_audio,
+                )
         except InvalidWebSocketStatus as exc:
             status_code: int = get_status_code(exc)
             if status_code == 401:
@@ -222,6 +230,7 @@ class AsyncRawControlPlaneClient:
         chat_id: str,
         *,
         access_token: typing.Optional[str] = None,
+        decode_audio: bool = False,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> typing.AsyncIterator[AsyncControlPlaneSocketClient]:
         """
@@ -239,6 +248,9 @@ class AsyncRawControlPlaneClient:
 
             For more details, refer to the [Authentication Strategies Guide](/docs/introduction/api-key#authentication-strategies).
 
+        decode_audio : bool
+            Yield `audio_output` messages as `DecodedAudioOutput` events, with the audio already base64-decoded and the WAV header located, instead of validating them into `AudioOutput` models.
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
@@ -268,7 +280,11 @@ class AsyncRawControlPlaneClient:
             headers.update(request_options["additional_headers"])
         try:
             async with websockets_client_connect(ws_url, extra_headers=headers) as protocol:
-                yield AsyncControlPlaneSocketClient(websocket=protocol)
+                yield AsyncControlPlaneSocketClient(
+                    websocket=protocol,
+                    json_codec=self._client_wrapper.get_json_codec(),
+                    decode_audio=decode_audio,
+                )
         except InvalidWebSocketStatus as exc:
             status_code: int = get_status_code(exc)
             if status_code == 401:
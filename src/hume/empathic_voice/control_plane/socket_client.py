@@ -1,15 +1,16 @@
 # This file was auto-generated by Fern from our API Definition.
 
-import json
 import typing
 from json.decoder import JSONDecodeError
 
 import websockets
 import websockets.sync.connection as websockets_sync_connection
 from ...core.events import EventEmitterMixin, EventType
-from ...core.pydantic_utilities import parse_obj_as
+from ...core.json_codec import JsonCodec, create_json_codec
+from ...core.pydantic_utilities import parse_union_obj_as
 from ..types.control_plane_publish_event import ControlPlanePublishEvent
 from ..types.subscribe_event import SubscribeEvent
+from ..chat.audio.decoded_audio import DecodedAudioOutput
 
 try:
     from websockets.legacy.client import WebSocketClientProtocol  # type: ignore
@@ -20,16 +21,24 @@ ControlPlaneSocketClientResponse = typing.Union[SubscribeEvent]
 
 
 class AsyncControlPlaneSocketClient(EventEmitterMixin):
-    def __init__(self, *, websocket: WebSocketClientProtocol):
+    def __init__(
+        self,
+        *,
+        websocket: WebSocketClientProtocol,
+        json_codec: typing.Optional[JsonCodec] = None,
+        decode_audio: bool = False,
+    ):
         super().__init__()
         self._websocket = websocket
+        self._json_codec = json_codec if json_codec is not None else create_json_codec()
+        self._decode_audio = decode_audio
 
     async def __aiter__(self):
         async for message in self._websocket:
             if isinstance(message, bytes):
                 yield message
             else:
-                yield parse_obj_as(ControlPlaneSocketClientResponse, json.loads(message))  # type: ignore
+                yield self._parse_message(self._json_codec.loads(message))
 
     async def start_listening(self):
         """
@@ -47,8 +56,8 @@ class AsyncControlPlaneSocketClient(EventEmitterMixin):
                 if isinstance(raw_message, bytes):
                     parsed = raw_message
                 else:
-                    json_data = json.loads(raw_message)
-                    parsed = parse_obj_as(ControlPlaneSocketClientResponse, json_data)  # type: ignore
+                    json_data = self._json_codec.loads(raw_message)
+                    parsed = self._parse_message(json_data)
                 await self._emit_async(EventType.MESSAGE, parsed)
         except (websockets.WebSocketException, JSONDecodeError) as exc:
             await self._emit_async(EventType.ERROR, exc)
@@ -62,42 +71,57 @@ class AsyncControlPlaneSocketClient(EventEmitterMixin):
         """
         await self._send_model(message)
 
-    async def recv(self) -> ControlPlaneSocketClientResponse:
+    async def recv(self) -> typing.Union[ControlPlaneSocketClientResponse, DecodedAudioOutput]:
         """
         Receive a message from the websocket connection.
         """
         data = await self._websocket.recv()
         if isinstance(data, bytes):
             return data  # type: ignore
-        json_data = json.loads(data)
-        return parse_obj_as(ControlPlaneSocketClientResponse, json_data)  # type: ignore
+        json_data = self._json_codec.loads(data)
+        return self._parse_message(json_data)
 
     async def _send(self, data: typing.Any) -> None:
         """
         Send a message to the websocket connection.
         """
         if isinstance(data, dict):
-            data = json.dumps(data)
+            data = self._json_codec.dumps(data)
         await self._websocket.send(data)
 
     async def _send_model(self, data: typing.Any) -> None:
         """
         Send a Pydantic model to the websocket connection.
         """
-        await self._send(data.dict())
+        await self._websocket.send(self._json_codec.dumps_model(data))
+
+    def _parse_message(
+        self, json_data: typing.Any
+    ) -> typing.Union[ControlPlaneSocketClientResponse, DecodedAudioOutput]:
+        if self._decode_audio and isinstance(json_data, dict) and json_data.get("type") == "audio_output":
+            return DecodedAudioOutput.from_message(json_data)
+        return parse_union_obj_as(ControlPlaneSocketClientResponse, json_data)  # type: ignore
 
 
 class ControlPlaneSocketClient(EventEmitterMixin):
-    def __init__(self, *, websocket: websockets_sync_connection.Connection):
+    def __init__(
+        self,
+        *,
+        websocket: websockets_sync_connection.Connection,
+        json_codec: typing.Optional[JsonCodec] = None,
+        decode_audio: bool = False,
+    ):
         super().__init__()
         self._websocket = websocket
+        self._json_codec = json_codec if json_codec is not None else create_json_codec()
+        self._decode_audio = decode_audio
 
     def __iter__(self):
         for message in self._websocket:
             if isinstance(message, bytes):
                 yield message
             else:
-                yield parse_obj_as(ControlPlaneSocketClientResponse, json.loads(message))  # type: ignore
+                yield self._parse_message(self._json_codec.loads(message))
 
     def start_listening(self):
         """
@@ -115,8 +139,8 @@ class ControlPlaneSocketClient(EventEmitterMixin):
                 if isinstance(raw_message, bytes):
                     parsed = raw_message
                 else:
-                    json_data = json.loads(raw_message)
-                    parsed = parse_obj_as(ControlPlaneSocketClientResponse, json_data)  # type: ignore
+                    json_data = self._json_codec.loads(raw_message)
+                    parsed = self._parse_message(json_data)
                 self._emit(EventType.MESSAGE, parsed)
         except (websockets.WebSocketException, JSONDecodeError) as exc:
             self._emit(EventType.ERROR, exc)
@@ -130,26 +154,33 @@ class ControlPlaneSocketClient(EventEmitterMixin):
         """
         self._send_model(message)
 
-    def recv(self) -> ControlPlaneSocketClientResponse:
+    def recv(self) -> typing.Union[ControlPlaneSocketClientResponse, DecodedAudioOutput]:
         """
         Receive a message from the websocket connection.
         """
         data = self._websocket.recv()
         if isinstance(data, bytes):
             return data  # type: ignore
-        json_data = json.loads(data)
-        return parse_obj_as(ControlPlaneSocketClientResponse, json_data)  # type: ignore
+        json_data = self._json_codec.loads(data)
+        return self._parse_message(json_data)
 
     def _send(self, data: typing.Any) -> None:
         """
         Send a message to the websocket connection.
         """
         if isinstance(data, dict):
-            data = json.dumps(data)
+            data = self._json_codec.dumps(data)
         self._websocket.send(data)
 
     def _send_model(self, data: typing.Any) -> None:
         """
         Send a Pydantic model to the websocket connection.
         """
-        self._send(data.dict())
+        self._websocket.send(self._json_codec.dumps_model(data))
+
+    def _parse_message(
+        self, json_data: typing.Any
+    ) -> typing.Union[ControlPlaneSocketClientResponse, DecodedAudioOutput]:
+        if self._decode_audio and isinstance(json_data, dict) and json_data.get("type") == "audio_output":
+            return DecodedAudioOutput.from_message(json_data)
+        return parse_union_obj_as(ControlPlaneSocketClientResponse, json_data)  # type: ignore
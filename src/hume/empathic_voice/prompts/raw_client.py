@@ -97,7 +97,16 @@ class RawPromptsClient:
                     name=name,
                     request_options=request_options,
                 )
-                return SyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                _get_page = lambda _page_number: self.list_prompts(
+                    page_number=_page_number,
+                    page_size=page_size,
+                    restrict_to_most_recent=restrict_to_most_recent,
+                    name=name,
+                    request_options=request_options,
+                )
+                return SyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
@@ -725,7 +734,18 @@ class AsyncRawPromptsClient:
                         request_options=request_options,
                     )
 
-                return AsyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                async def _get_page(_page_number: int):
+                    return await self.list_prompts(
+                        page_number=_page_number,
+                        page_size=page_size,
+                        restrict_to_most_recent=restrict_to_most_recent,
+                        name=name,
+                        request_options=request_options,
+                    )
+
+                return AsyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
@@ -95,7 +95,16 @@ class RawToolsClient:
                     name=name,
                     request_options=request_options,
                 )
-                return SyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                _get_page = lambda _page_number: self.list_tools(
+                    page_number=_page_number,
+                    page_size=page_size,
+                    restrict_to_most_recent=restrict_to_most_recent,
+                    name=name,
+                    request_options=request_options,
+                )
+                return SyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
@@ -274,7 +283,16 @@ class RawToolsClient:
                     restrict_to_most_recent=restrict_to_most_recent,
                     request_options=request_options,
                 )
-                return SyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                _get_page = lambda _page_number: self.list_tool_versions(
+                    id,
+                    page_number=_page_number,
+                    page_size=page_size,
+                    restrict_to_most_recent=restrict_to_most_recent,
+                    request_options=request_options,
+                )
+                return SyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
@@ -752,7 +770,18 @@ class AsyncRawToolsClient:
                         request_options=request_options,
                     )
 
-                return AsyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                async def _get_page(_page_number: int):
+                    return await self.list_tools(
+                        page_number=_page_number,
+                        page_size=page_size,
+                        restrict_to_most_recent=restrict_to_most_recent,
+                        name=name,
+                        request_options=request_options,
+                    )
+
+                return AsyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
@@ -934,7 +963,18 @@ class AsyncRawToolsClient:
                         request_options=request_options,
                     )
 
-                return AsyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                async def _get_page(_page_number: int):
+                    return await self.list_tool_versions(
+                        id,
+                        page_number=_page_number,
+                        page_size=page_size,
+                        restrict_to_most_recent=restrict_to_most_recent,
+                        request_options=request_options,
+                    )
+
+                return AsyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
@@ -0,0 +1,364 @@
+# THIS FILE IS MANUALLY MAINTAINED: see .fernignore
+"""
+Unpacking of a batch job's artifacts ZIP while it downloads.
+
+ZIP members are read from their local headers in the order they arrive, so the archive never has to be written
+to disk and reopened. Members may be followed by a data descriptor instead of giving their size up front, as in
+streamed archives; for stored members the descriptor must then start with its signature.
+"""
+
+import asyncio
+import dataclasses
+import os
+import struct
+import tempfile
+import typing
+import zipfile
+import zlib
+
+# Members up to this size are kept in memory, larger ones spill to a temporary file
+DEFAULT_SPOOL_SIZE = 8 * 1024 * 1024
+
+_LOCAL_HEADER = struct.Struct("<4sHHHHHIIIHH")
+_LOCAL_SIGNATURE = b"PK\x03\x04"
+_DESCRIPTOR_SIGNATURE = b"PK\x07\x08"
+# The central directory follows the last member, and has nothing the local headers didn't
+_END_SIGNATURES = (b"PK\x01\x02", b"PK\x05\x06", b"PK\x06\x06")
+_STORED = 0
+_DEFLATED = 8
+_ENCRYPTED_FLAG = 0x1
+_DESCRIPTOR_FLAG = 0x8
+_UTF8_FLAG = 0x800
+_ZIP64_EXTRA = 0x0001
+_ZIP64_LIMIT = 0xFFFFFFFF
+
+_Sink = typing.Optional[typing.BinaryIO]
+
+
+@dataclasses.dataclass
+class ArtifactMember:
+    """One file of the artifacts ZIP."""
+
+    name: str
+    """Path of the file inside the archive."""
+    size: int
+    file: typing.BinaryIO
+    """The uncompressed contents, positioned at the start."""
+
+    def read(self) -> bytes:
+        return self.file.read()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def _zip64_sizes(extra: bytes, compressed: int, uncompressed: int) -> typing.Tuple[int, int, bool]:
+    pos = 0
+    while pos + 4 <= len(extra):
+        tag, length = struct.unpack_from("<HH", extra, pos)
+        if tag == _ZIP64_EXTRA:
+            values = iter(struct.unpack_from(f"<{length // 8}Q", extra, pos + 4))
+            # Only the fields that overflowed are present, uncompressed size first
+            if uncompressed == _ZIP64_LIMIT:
+                uncompressed = next(values)
+            if compressed == _ZIP64_LIMIT:
+                compressed = next(values)
+            return compressed, uncompressed, True
+        pos += 4 + length
+    return compressed, uncompressed, False
+
+
+def member_path(root: str, name: str) -> str:
+    """Where member `name` is extracted under `root`, ignoring absolute paths and `..` as `zipfile` does."""
+    name = os.path.splitdrive(name.replace("\\", "/"))[1]
+    parts = [part for part in name.split("/") if part not in ("", ".", "..")]
+    return os.path.join(root, *parts)
+
+
+class ZipStreamReader:
+    """
+    Push parser: `feed` the archive as it arrives and get back the members it completes.
+
+    `open_member` is called with the name of each member as its data starts and returns the file to write the
+    uncompressed data to, or `None` to skip it. Completed members are returned as (name, file, size).
+    """
+
+    def __init__(self, open_member: typing.Callable[[str], _Sink]) -> None:
+        self._open_member = open_member
+        self._buffer = bytearray()
+        self._state = "header"
+        self._name = ""
+        self._sink: _Sink = None
+        self._decompressor: typing.Optional["zlib._Decompress"] = None
+        self._descriptor = False
+        self._zip64 = False
+        self._remaining = 0
+        self._expected_crc = 0
+        self._crc = 0
+        self._size = 0
+
+    def _write(self, data: bytes) -> None:
+        if data:
+            self._crc = zlib.crc32(data, self._crc)
+            self._size += len(data)
+            if self._sink is not None:
+                self._sink.write(data)
+
+    def _finish(self) -> typing.Tuple[str, _Sink, int]:
+        if self._crc != self._expected_crc:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {self._name!r}")
+        member = (self._name, self._sink, self._size)
+        self._sink = None
+        self._decompressor = None
+        self._state = "header"
+        return member
+
+    def _start(self) -> bool:
+        buffer = self._buffer
+        if len(buffer) < _LOCAL_HEADER.size:
+            return False
+        (_, _, flags, method, _, _, crc, compressed, uncompressed, name_length, extra_length) = (
+            _LOCAL_HEADER.unpack_from(buffer)
+        )
+        end = _LOCAL_HEADER.size + name_length + extra_length
+        if len(buffer) < end:
+            return False
+        raw_name = bytes(buffer[_LOCAL_HEADER.size : _LOCAL_HEADER.size + name_length])
+        name = raw_name.decode("utf-8" if flags & _UTF8_FLAG else "cp437")
+        compressed, uncompressed, self._zip64 = _zip64_sizes(
+            bytes(buffer[_LOCAL_HEADER.size + name_length : end]), compressed, uncompressed
+        )
+        if flags & _ENCRYPTED_FLAG:
+            raise zipfile.BadZipFile(f"File {name!r} is encrypted")
+        if method not in (_STORED, _DEFLATED):
+            raise zipfile.BadZipFile(f"File {name!r} uses unsupported compression method {method}")
+        self._descriptor = bool(flags & _DESCRIPTOR_FLAG)
+        del buffer[:end]
+        self._name = name
+        self._expected_crc = crc
+        self._remaining = compressed
+        self._crc = 0
+        self._size = 0
+        self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS) if method == _DEFLATED else None
+        self._sink = self._open_member(name)
+        self._state = "data"
+        return True
+
+    def _scan_stored(self) -> bool:
+        # A stored member followed by a data descriptor ends at the descriptor whose CRC-32 and size match
+        # the data before it
+        buffer = self._buffer
+        size = 4 + 4 + (16 if self._zip64 else 8)
+        while True:
+            found = buffer.find(_DESCRIPTOR_SIGNATURE)
+            if found < 0:
+                # Keep what could be the start of a signature
+                keep = min(len(buffer), len(_DESCRIPTOR_SIGNATURE) - 1)
+                self._write(bytes(buffer[: len(buffer) - keep]))
+                del buffer[: len(buffer) - keep]
+                return False
+            self._write(bytes(buffer[:found]))
+            del buffer[:found]
+            if len(buffer) < size:
+                return False
+            crc, compressed = struct.unpack_from("<IQ" if self._zip64 else "<II", buffer, 4)
+            if crc == self._crc and compressed == self._size:
+                self._expected_crc = crc
+                del buffer[:size]
+                return True
+            self._write(bytes(buffer[:1]))
+            del buffer[:1]
+
+    def feed(self, data: bytes) -> typing.List[typing.Tuple[str, _Sink, int]]:
+        self._buffer += data
+        completed: typing.List[typing.Tuple[str, _Sink, int]] = []
+        try:
+            self._read(completed)
+        except BaseException:
+            # Members already completed by this call are never returned, so their files would be left open
+            for _, sink, _ in completed:
+                if sink is not None:
+                    sink.close()
+            raise
+        return completed
+
+    def _read(self, completed: typing.List[typing.Tuple[str, _Sink, int]]) -> None:
+        buffer = self._buffer
+        while True:
+            if self._state == "done":
+                buffer.clear()
+                break
+            if self._state == "header":
+                if len(buffer) < 4:
+                    break
+                signature = bytes(buffer[:4])
+                if signature in _END_SIGNATURES:
+                    self._state = "done"
+                    continue
+                if signature != _LOCAL_SIGNATURE:
+                    raise zipfile.BadZipFile("Expected a ZIP local file header")
+                if not self._start():
+                    break
+            elif self._state == "data" and self._descriptor and self._decompressor is None:
+                if not self._scan_stored():
+                    break
+                completed.append(self._finish())
+            elif self._state == "data" and self._descriptor:
+                if not buffer:
+                    break
+                assert self._decompressor is not None
+                self._write(self._decompressor.decompress(bytes(buffer)))
+                buffer.clear()
+                if not self._decompressor.eof:
+                    break
+                buffer += self._decompressor.unused_data
+                self._state = "descriptor"
+            elif self._state == "data":
+                if self._remaining:
+                    if not buffer:
+                        break
+                    piece = bytes(buffer[: self._remaining])
+                    del buffer[: len(piece)]
+                    self._remaining -= len(piece)
+                    self._write(self._decompressor.decompress(piece) if self._decompressor is not None else piece)
+                if self._remaining == 0:
+                    if self._decompressor is not None:
+                        self._write(self._decompressor.flush())
+                    completed.append(self._finish())
+            else:
+                # Data descriptor: optional signature, CRC-32, then both sizes
+                if len(buffer) < 4:
+                    break
+                start = 4 if buffer[:4] == _DESCRIPTOR_SIGNATURE else 0
+                end = start + 4 + (16 if self._zip64 else 8)
+                if len(buffer) < end:
+                    break
+                (self._expected_crc,) = struct.unpack_from("<I", buffer, start)
+                del buffer[:end]
+                completed.append(self._finish())
+
+    def finish(self) -> None:
+        """Check that the whole archive was fed."""
+        if self._state != "done":
+            raise zipfile.BadZipFile("The artifacts ZIP ended early")
+
+    def close(self) -> None:
+        """Close the file of a member that was cut short."""
+        sink, self._sink = self._sink, None
+        if sink is not None:
+            sink.close()
+
+
+def _spool(spool_size: int) -> typing.Callable[[str], _Sink]:
+    def open_member(name: str) -> _Sink:
+        if name.endswith("/"):
+            return None
+        return typing.cast(typing.BinaryIO, tempfile.SpooledTemporaryFile(max_size=spool_size))
+
+    return open_member
+
+
+def _extract_to(root: str) -> typing.Callable[[str], _Sink]:
+    def open_member(name: str) -> _Sink:
+        path = member_path(root, name)
+        if name.endswith("/"):
+            os.makedirs(path, exist_ok=True)
+            return None
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        return open(path, "wb")
+
+    return open_member
+
+
+def _members(completed: typing.List[typing.Tuple[str, _Sink, int]]) -> typing.List[ArtifactMember]:
+    members = []
+    for name, file, size in completed:
+        if file is not None:
+            file.seek(0)
+            members.append(ArtifactMember(name=name, size=size, file=file))
+    return members
+
+
+def _close_files(completed: typing.List[typing.Tuple[str, _Sink, int]], root: str) -> typing.List[str]:
+    paths = []
+    for name, file, _ in completed:
+        if file is not None:
+            file.close()
+            paths.append(member_path(root, name))
+    return paths
+
+
+def iter_zip_members(
+    chunks: typing.Iterable[bytes], spool_size: int = DEFAULT_SPOOL_SIZE
+) -> typing.Iterator[ArtifactMember]:
+    """
+    Yield the files of the ZIP archive streamed in `chunks` as each one is complete.
+
+    A member's file is closed once the next member is requested, so read it before moving on.
+    """
+    reader = ZipStreamReader(_spool(spool_size))
+    batch: typing.List[ArtifactMember] = []
+    try:
+        for chunk in chunks:
+            batch = _members(reader.feed(chunk))
+            for member in batch:
+                try:
+                    yield member
+                finally:
+                    member.close()
+        reader.finish()
+    finally:
+        # A chunk can complete several members; close the ones not reached when iteration stops early
+        for member in batch:
+            member.close()
+        reader.close()
+
+
+def extract_zip(chunks: typing.Iterable[bytes], path: str) -> typing.List[str]:
+    """Extract the ZIP archive streamed in `chunks` under `path` and return the paths of the files written."""
+    reader = ZipStreamReader(_extract_to(path))
+    written: typing.List[str] = []
+    try:
+        for chunk in chunks:
+            written.extend(_close_files(reader.feed(chunk), path))
+        reader.finish()
+    finally:
+        reader.close()
+    return written
+
+
+async def aiter_zip_members(
+    chunks: typing.AsyncIterable[bytes], spool_size: int = DEFAULT_SPOOL_SIZE
+) -> typing.AsyncIterator[ArtifactMember]:
+    """As `iter_zip_members`, decompressing in the event loop's default executor."""
+    loop = asyncio.get_running_loop()
+    reader = ZipStreamReader(_spool(spool_size))
+    batch: typing.List[ArtifactMember] = []
+    try:
+        async for chunk in chunks:
+            batch = _members(await loop.run_in_executor(None, reader.feed, chunk))
+            for member in batch:
+                try:
+                    yield member
+                finally:
+                    member.close()
+        reader.finish()
+    finally:
+        # A chunk can complete several members; close the ones not reached when iteration stops early
+        for member in batch:
+            member.close()
+        reader.close()
+
+
+async def aextract_zip(chunks: typing.AsyncIterable[bytes], path: str) -> typing.List[str]:
+    """As `extract_zip`, decompressing and writing in the event loop's default executor."""
+    loop = asyncio.get_running_loop()
+    reader = ZipStreamReader(_extract_to(path))
+    written: typing.List[str] = []
+    try:
+        async for chunk in chunks:
+            written.extend(_close_files(await loop.run_in_executor(None, reader.feed, chunk), path))
+        reader.finish()
+    finally:
+        reader.close()
+    return written
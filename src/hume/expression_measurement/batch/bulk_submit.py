@@ -0,0 +1,224 @@
+# THIS FILE IS MANUALLY MAINTAINED: see .fernignore
+"""
+Planning and bookkeeping for submitting many files or URLs as batch jobs.
+
+Sources are grouped into jobs of up to `max_files_per_job` sources and, for local files, `max_bytes_per_job`
+bytes. Each source is identified by a content hash, of the file's bytes or of the URL, combined with the job
+configuration. A `SubmissionLedger` remembers the job each hash was submitted in, so sources submitted before,
+under any path, are not uploaded again.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import typing
+
+import httpx
+
+from ...core.api_error import ApiError
+from ...core.http_client import MAX_RETRY_DELAY_SECONDS, _parse_retry_after
+from ...core.jsonable_encoder import jsonable_encoder
+from .types.inference_base_request import InferenceBaseRequest
+
+BulkSource = typing.Union[str, "os.PathLike[str]"]
+
+# The batch API accepts up to 100 files or URLs per job
+DEFAULT_MAX_FILES_PER_JOB = 100
+DEFAULT_MAX_BYTES_PER_JOB = 100 * 1024 * 1024
+DEFAULT_BULK_CONCURRENCY = 4
+DEFAULT_RATE_LIMIT_RETRIES = 5
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def is_url(source: BulkSource) -> bool:
+    return isinstance(source, str) and source.startswith(("http://", "https://"))
+
+
+def config_key(config: typing.Optional[InferenceBaseRequest]) -> str:
+    """The job configuration as canonical JSON, so the same source submitted with other models hashes apart."""
+    encoded = jsonable_encoder(config) if config is not None else {}
+    if encoded.get("urls") or encoded.get("text"):
+        raise ValueError("Pass URLs as sources rather than in the job configuration")
+    return json.dumps({k: v for k, v in encoded.items() if v is not None}, sort_keys=True, separators=(",", ":"))
+
+
+def content_hash(source: BulkSource, key: str) -> str:
+    digest = hashlib.sha256(key.encode("utf-8"))
+    if is_url(source):
+        digest.update(b"url:" + typing.cast(str, source).encode("utf-8"))
+        return digest.hexdigest()
+    digest.update(b"file:")
+    with open(source, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SubmissionLedger:
+    """
+    SQLite table of the job each source was submitted in, keyed by content hash.
+
+    Safe to share between threads. Pass `":memory:"` for a ledger that only lasts as long as the object.
+    """
+
+    def __init__(self, path: typing.Union[str, "os.PathLike[str]"] = ":memory:") -> None:
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(os.fspath(path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS submissions ("
+                "content_hash TEXT PRIMARY KEY, source TEXT NOT NULL, job_id TEXT NOT NULL, submitted_at REAL NOT NULL)"
+            )
+
+    def __enter__(self) -> "SubmissionLedger":
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.close()
+
+    def lookup(self, hashes: typing.Iterable[str]) -> typing.Dict[str, str]:
+        """Job ids of the hashes that were submitted before."""
+        found: typing.Dict[str, str] = {}
+        hashes = list(hashes)
+        with self._lock:
+            # SQLite limits the number of parameters per statement
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT content_hash, job_id FROM submissions WHERE content_hash IN ({placeholders})", chunk
+                )
+                found.update(rows)
+        return found
+
+    def record(self, job_id: str, entries: typing.Iterable[typing.Tuple[str, str]]) -> None:
+        """Record the (content hash, source) pairs submitted in `job_id`."""
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO submissions VALUES (?, ?, ?, ?)",
+                [(hash_, source, job_id, now) for hash_, source in entries],
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+@dataclasses.dataclass
+class PlannedSource:
+    source: str
+    content_hash: str
+    size: int
+
+
+@dataclasses.dataclass
+class PlannedJob:
+    urls: typing.List[PlannedSource] = dataclasses.field(default_factory=list)
+    files: typing.List[PlannedSource] = dataclasses.field(default_factory=list)
+
+    @property
+    def sources(self) -> typing.List[PlannedSource]:
+        return self.urls + self.files
+
+
+@dataclasses.dataclass
+class SubmissionPlan:
+    sources: typing.List[str]
+    jobs: typing.List[PlannedJob]
+    submitted: typing.Dict[str, str]
+    """Job ids of the sources found in the ledger."""
+    duplicates: typing.Dict[str, str]
+    """Sources with the same content as an earlier source, which they are submitted with."""
+
+
+def plan_submission(
+    sources: typing.Iterable[BulkSource],
+    config: typing.Optional[InferenceBaseRequest],
+    ledger: typing.Optional[SubmissionLedger],
+    max_files_per_job: int = DEFAULT_MAX_FILES_PER_JOB,
+    max_bytes_per_job: int = DEFAULT_MAX_BYTES_PER_JOB,
+) -> SubmissionPlan:
+    if max_files_per_job < 1 or max_bytes_per_job < 1:
+        raise ValueError("max_files_per_job and max_bytes_per_job must be positive")
+    key = config_key(config)
+    names: typing.List[str] = []
+    names_seen: typing.Set[str] = set()
+    first: typing.Dict[str, str] = {}
+    duplicates: typing.Dict[str, str] = {}
+    planned: typing.List[PlannedSource] = []
+    for source in sources:
+        name = source if is_url(source) else os.fspath(source)
+        if name in names_seen:
+            continue
+        names_seen.add(name)
+        names.append(name)
+        hash_ = content_hash(source, key)
+        if hash_ in first:
+            duplicates[name] = first[hash_]
+            continue
+        first[hash_] = name
+        planned.append(PlannedSource(name, hash_, 0 if is_url(source) else os.path.getsize(name)))
+
+    known = ledger.lookup(first) if ledger is not None else {}
+    submitted = {first[hash_]: job_id for hash_, job_id in known.items()}
+
+    jobs: typing.List[PlannedJob] = []
+    url_job = PlannedJob()
+    file_job = PlannedJob()
+    file_bytes = 0
+    for item in planned:
+        if item.content_hash in known:
+            continue
+        if is_url(item.source):
+            url_job.urls.append(item)
+            if len(url_job.urls) == max_files_per_job:
+                jobs.append(url_job)
+                url_job = PlannedJob()
+            continue
+        # A file larger than the byte limit still goes in a job of its own
+        if file_job.files and (len(file_job.files) == max_files_per_job or file_bytes + item.size > max_bytes_per_job):
+            jobs.append(file_job)
+            file_job, file_bytes = PlannedJob(), 0
+        file_job.files.append(item)
+        file_bytes += item.size
+    jobs.extend(job for job in (url_job, file_job) if job.sources)
+    return SubmissionPlan(sources=names, jobs=jobs, submitted=submitted, duplicates=duplicates)
+
+
+def rate_limit_delay(error: ApiError) -> typing.Optional[float]:
+    """Seconds to hold off after a 429, from its `retry-after` header, or `None` for other errors."""
+    if error.status_code != 429:
+        return None
+    retry_after = _parse_retry_after(httpx.Headers(error.headers or {}))
+    return min(retry_after, MAX_RETRY_DELAY_SECONDS) if retry_after is not None else 1.0
+
+
+class RateLimitGate:
+    """Holds back every upload while the API is asking for backpressure."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._until = 0.0
+
+    def hold(self, seconds: float) -> None:
+        with self._lock:
+            self._until = max(self._until, time.monotonic() + seconds)
+
+    def wait_time(self) -> float:
+        with self._lock:
+            return max(0.0, self._until - time.monotonic())
+
+
+def finish_plan(plan: SubmissionPlan, job_ids: typing.Sequence[str]) -> typing.Dict[str, str]:
+    """Map every source, including those found in the ledger and duplicates, to its job id, in input order."""
+    job_of = dict(plan.submitted)
+    for job, job_id in zip(plan.jobs, job_ids):
+        for item in job.sources:
+            job_of[item.source] = job_id
+    return {source: job_of[plan.duplicates.get(source, source)] for source in plan.sources}
@@ -1,15 +1,55 @@
 import aiofiles
+import asyncio
+import concurrent.futures
+import functools
+import os
+import pathlib
+import time
 import typing
 import json as jsonlib
 from json.decoder import JSONDecodeError
 
 from ...core.request_options import RequestOptions
 from ...core.jsonable_encoder import jsonable_encoder
-from ... import core
 
 from .types.inference_base_request import InferenceBaseRequest
 from ...core.pydantic_utilities import parse_obj_as
 from .types.job_id import JobId
+from .types.union_predict_result import UnionPredictResult
+from ...core.json_stream import aiter_json_array, iter_json_array
+from ...core.multipart import MultipartEncoder, ProgressCallback, UploadFile
+from .artifacts import (
+    DEFAULT_SPOOL_SIZE,
+    ArtifactMember,
+    aextract_zip,
+    aiter_zip_members,
+    extract_zip,
+    iter_zip_members,
+)
+from .bulk_submit import (
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_MAX_BYTES_PER_JOB,
+    DEFAULT_MAX_FILES_PER_JOB,
+    DEFAULT_RATE_LIMIT_RETRIES,
+    BulkSource,
+    PlannedJob,
+    RateLimitGate,
+    SubmissionLedger,
+    finish_plan,
+    plan_submission,
+    rate_limit_delay,
+)
+from .job_waiter import (
+    DEFAULT_LIST_THRESHOLD,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    LIST_PAGE_SIZE,
+    TERMINAL_STATUSES,
+    JobTracker,
+)
+from .types.union_job import UnionJob
+from .columnar import ModelName, PredictionColumns, predictions_to_columns
 from .client import AsyncBatchClient, BatchClient
 from ...core.api_error import ApiError
 
@@ -55,11 +95,98 @@ class BatchClientWithUtils(BatchClient):
             for chunk in self.get_job_artifacts(id=id, request_options=request_options):
                 f.write(chunk)
 
+    def iter_job_artifact_members(
+        self,
+        id: str,
+        *,
+        spool_size: int = DEFAULT_SPOOL_SIZE,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[ArtifactMember]:
+        """
+        Unpack the artifacts ZIP of a completed inference job while it downloads, yielding each file as it completes.
+
+        Parameters
+        ----------
+        id : str
+            The unique identifier for the job.
+
+        spool_size : int
+            Files up to this many bytes are held in memory, larger ones spill to a temporary file.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration. You can pass in configuration such as `chunk_size`, and more to customize the request and response.
+
+        Yields
+        ------
+        typing.Iterator[ArtifactMember]
+            Each file's contents are closed once the next file is requested.
+
+
+        Examples
+        --------
+        from hume import HumeClient
+
+        client = HumeClient(
+            api_key="YOUR_API_KEY",
+        )
+        for member in client.expression_measurement.batch.iter_job_artifact_members(
+            id="job_id",
+        ):
+            print(member.name, member.size)
+        """
+        for member in iter_zip_members(
+            self.get_job_artifacts(id=id, request_options=request_options), spool_size
+        ):
+            yield member
+
+    def extract_job_artifacts(
+        self,
+        id: str,
+        *,
+        path: str = ".",
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.List[str]:
+        """
+        Extract the artifacts ZIP of a completed inference job into a directory while it downloads, without
+        writing the archive itself to disk.
+
+        Parameters
+        ----------
+        id : str
+            The unique identifier for the job.
+
+        path : str
+            The directory to extract the artifacts to.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration. You can pass in configuration such as `chunk_size`, and more to customize the request and response.
+
+        Returns
+        -------
+        typing.List[str]
+            The paths of the files written.
+
+
+        Examples
+        --------
+        from hume import HumeClient
+
+        client = HumeClient(
+            api_key="YOUR_API_KEY",
+        )
+        client.expression_measurement.batch.extract_job_artifacts(
+            id="job_id",
+            path="artifacts",
+        )
+        """
+        return extract_zip(self.get_job_artifacts(id=id, request_options=request_options), path)
+
     def start_inference_job_from_local_file(
         self,
         *,
-        file: typing.List[core.File],
+        file: typing.List[UploadFile],
         json: typing.Optional[InferenceBaseRequest] = None,
+        on_progress: typing.Optional[ProgressCallback] = None,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> str:
         """
@@ -67,12 +194,16 @@ class BatchClientWithUtils(BatchClient):
 
         Parameters
         ----------
-        file : typing.List[core.File]
-            See core.File for more documentation
+        file : typing.List[typing.Union[core.File, os.PathLike]]
+            See core.File for more documentation. Files are streamed from disk in chunks; files given as paths are
+            only opened while they are uploaded.
 
         json : typing.Optional[InferenceBaseRequest]
             The inference job configuration.
 
+        on_progress : typing.Optional[typing.Callable[[int, typing.Optional[int]], None]]
+            Called with the bytes uploaded so far and the size of the whole upload, if known, as the upload proceeds.
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
@@ -90,17 +221,17 @@ class BatchClientWithUtils(BatchClient):
         )
         client.expression_measurement.batch.start_inference_job_from_local_file()
         """
-        files: typing.Dict[str, typing.Any] = {
-            "file": file,
-        }
+        fields: typing.List[typing.Tuple[str, UploadFile]] = [("file", f) for f in file]
         if json is not None:
-            files["json"] = jsonlib.dumps(jsonable_encoder(json)).encode("utf-8")
+            fields.append(("json", jsonlib.dumps(jsonable_encoder(json)).encode("utf-8")))
+        encoder = MultipartEncoder(fields, on_progress=on_progress)
 
         _response = self._raw_client._client_wrapper.httpx_client.request(
             "v0/batch/jobs",
             base_url=self._raw_client._client_wrapper.get_environment().base,
             method="POST",
-            files=files,
+            content=encoder,  # type: ignore[arg-type]
+            headers=encoder.headers,
             request_options=request_options,
         )
         try:
@@ -114,10 +245,421 @@ class BatchClientWithUtils(BatchClient):
                 )
                 return _parsed_response.job_id
             _response_json = _response.json()
+        except JSONDecodeError:
+            raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
+        raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
+
+    def start_bulk_inference_jobs(
+        self,
+        sources: typing.Iterable[BulkSource],
+        *,
+        json: typing.Optional[InferenceBaseRequest] = None,
+        ledger: typing.Optional[typing.Union[str, "os.PathLike[str]", SubmissionLedger]] = None,
+        max_files_per_job: int = DEFAULT_MAX_FILES_PER_JOB,
+        max_bytes_per_job: int = DEFAULT_MAX_BYTES_PER_JOB,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        rate_limit_retries: int = DEFAULT_RATE_LIMIT_RETRIES,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Dict[str, str]:
+        """
+        Start batch inference jobs for many local files and URLs, grouping them into as few jobs as the limits allow.
+
+        Sources whose content, together with the job configuration, is already in the ledger are not submitted
+        again, nor are sources with the same content as another source. Each job is recorded in the ledger as soon
+        as it starts, so a bulk submission that fails part way can be run again to submit only what is left.
+
+        Parameters
+        ----------
+        sources : typing.Iterable[typing.Union[str, os.PathLike]]
+            Paths of local files, and `http://` or `https://` URLs. URLs are submitted in jobs of their own.
+
+        json : typing.Optional[InferenceBaseRequest]
+            The inference job configuration shared by every job, without `urls` or `text`.
+
+        ledger : typing.Optional[typing.Union[str, os.PathLike, SubmissionLedger]]
+            A `SubmissionLedger`, or the path of the SQLite database of one. Without a ledger, only duplicates
+            within `sources` are skipped.
+
+        max_files_per_job : int
+            The most sources to submit in one job.
+
+        max_bytes_per_job : int
+            The most bytes of local files to upload in one job. A larger file is submitted in a job of its own.
+
+        max_concurrency : int
+            The most jobs to submit at once.
+
+        rate_limit_retries : int
+            How many times to retry a job the API rejected with a 429, once the client's own retries are spent.
+            Every submission waits out the `retry-after` of a 429 before going on.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Returns
+        -------
+        typing.Dict[str, str]
+            The job id of each source, in the order they were given.
+
+
+        Examples
+        --------
+        from hume import HumeClient
+        from hume.expression_measurement.batch import InferenceBaseRequest, Models
+
+        client = HumeClient(
+            api_key="YOUR_API_KEY",
+        )
+        client.expression_measurement.batch.start_bulk_inference_jobs(
+            ["recordings/1.wav", "recordings/2.wav", "https://example.com/3.mp4"],
+            json=InferenceBaseRequest(models=Models(prosody={})),
+            ledger="submissions.sqlite",
+        )
+        """
+        owned = ledger is not None and not isinstance(ledger, SubmissionLedger)
+        submission_ledger = SubmissionLedger(ledger) if owned else ledger  # type: ignore[arg-type]
+        try:
+            plan = plan_submission(sources, json, submission_ledger, max_files_per_job, max_bytes_per_job)
+            gate = RateLimitGate()
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                job_ids = list(
+                    executor.map(
+                        lambda job: self._submit_planned_job(
+                            job, json, submission_ledger, gate, rate_limit_retries, request_options
+                        ),
+                        plan.jobs,
+                    )
+                )
+            return finish_plan(plan, job_ids)
+        finally:
+            if owned:
+                submission_ledger.close()
+
+    def _submit_planned_job(
+        self,
+        job: PlannedJob,
+        config: typing.Optional[InferenceBaseRequest],
+        ledger: typing.Optional[SubmissionLedger],
+        gate: RateLimitGate,
+        rate_limit_retries: int,
+        request_options: typing.Optional[RequestOptions],
+    ) -> str:
+        attempt = 0
+        while True:
+            time.sleep(gate.wait_time())
+            try:
+                job_id = self._start_planned_job(job, config, request_options)
+            except ApiError as error:
+                delay = rate_limit_delay(error)
+                if delay is None or attempt >= rate_limit_retries:
+                    raise
+                gate.hold(delay)
+                attempt += 1
+                continue
+            if ledger is not None:
+                ledger.record(job_id, [(item.content_hash, item.source) for item in job.sources])
+            return job_id
+
+    def _start_planned_job(
+        self,
+        job: PlannedJob,
+        config: typing.Optional[InferenceBaseRequest],
+        request_options: typing.Optional[RequestOptions],
+    ) -> str:
+        if job.urls:
+            settings = {
+                name: getattr(config, name)
+                for name in ("models", "transcription", "callback_url", "notify")
+                if config is not None and getattr(config, name) is not None
+            }
+            return self.start_inference_job(
+                urls=[item.source for item in job.urls], request_options=request_options, **settings
+            )
+        files: typing.List[UploadFile] = [pathlib.Path(item.source) for item in job.files]
+        return self.start_inference_job_from_local_file(file=files, json=config, request_options=request_options)
+
+    def get_job_predictions_columnar(
+        self,
+        id: str,
+        *,
+        models: typing.Optional[typing.Sequence[ModelName]] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Dict[str, PredictionColumns]:
+        """
+        Get the predictions of a completed inference job as NumPy arrays, one `PredictionColumns` per model.
+
+        The response JSON is converted directly, without building a pydantic object for every emotion score as
+        `get_job_predictions` does. Requires NumPy.
+
+        Parameters
+        ----------
+        id : str
+            The unique identifier for the job.
+
+        models : typing.Optional[typing.Sequence[ModelName]]
+            Only convert these models' predictions. Defaults to all of them.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Returns
+        -------
+        typing.Dict[str, PredictionColumns]
+
+
+        Examples
+        --------
+        from hume import HumeClient
+
+        client = HumeClient(
+            api_key="YOUR_API_KEY",
+        )
+        columns = client.expression_measurement.batch.get_job_predictions_columnar(
+            id="job_id",
+        )
+        joy = columns["face"].emotion("Joy")
+        """
+        _response = self._raw_client._client_wrapper.httpx_client.request(
+            f"v0/batch/jobs/{jsonable_encoder(id)}/predictions",
+            base_url=self._raw_client._client_wrapper.get_environment().base,
+            method="GET",
+            request_options=request_options,
+        )
+        try:
+            if 200 <= _response.status_code < 300:
+                _raw = self._raw_client._client_wrapper.get_json_codec().loads(_response.content)
+                return predictions_to_columns(_raw, models=models)
+            _response_json = _response.json()
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, body=_response.text)
         raise ApiError(status_code=_response.status_code, body=_response_json)
 
+    def iter_job_predictions(
+        self,
+        id: str,
+        *,
+        raw: bool = False,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[typing.Union[UnionPredictResult, typing.Dict[str, typing.Any]]]:
+        """
+        Stream the JSON predictions of a completed inference job, one result per source as it is downloaded.
+
+        Unlike `get_job_predictions`, which parses the whole response at once, only one source's predictions
+        are held in memory at a time.
+
+        Parameters
+        ----------
+        id : str
+            The unique identifier for the job.
+
+        raw : bool
+            Yield each result as the decoded JSON instead of validating it into an `InferenceSourcePredictResult`.
+            Raw results can be passed straight to `predictions_to_columns`.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration. You can pass in configuration such as `chunk_size`, and more to customize the request and response.
+
+        Yields
+        ------
+        typing.Iterator[typing.Union[UnionPredictResult, typing.Dict[str, typing.Any]]]
+
+
+        Examples
+        --------
+        from hume import HumeClient
+
+        client = HumeClient(
+            api_key="YOUR_API_KEY",
+        )
+        for result in client.expression_measurement.batch.iter_job_predictions(
+            id="job_id",
+        ):
+            print(result.source)
+        """
+        with self._raw_client._client_wrapper.httpx_client.stream(
+            f"v0/batch/jobs/{jsonable_encoder(id)}/predictions",
+            base_url=self._raw_client._client_wrapper.get_environment().base,
+            method="GET",
+            request_options=request_options,
+        ) as _response:
+            if not 200 <= _response.status_code < 300:
+                _response.read()
+                try:
+                    _response_json = _response.json()
+                except JSONDecodeError:
+                    raise ApiError(status_code=_response.status_code, body=_response.text)
+                raise ApiError(status_code=_response.status_code, body=_response_json)
+            _chunk_size = request_options.get("chunk_size", None) if request_options is not None else None
+            for _item in iter_json_array(_response.iter_bytes(chunk_size=_chunk_size)):
+                yield _item if raw else parse_obj_as(UnionPredictResult, _item)  # type: ignore
+
+    def wait_for_job(
+        self,
+        id: str,
+        *,
+        timeout: typing.Optional[float] = None,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> UnionJob:
+        """
+        Wait until a job has completed or failed.
+
+        Parameters
+        ----------
+        id : str
+            The unique identifier for the job.
+
+        timeout : typing.Optional[float]
+            Seconds to wait before raising `TimeoutError`. Waits indefinitely by default.
+
+        min_interval : float
+            The shortest time between two polls of a job, in seconds.
+
+        max_interval : float
+            The longest time between two polls of a job, in seconds. Jobs are polled again after a fifth of the
+            time they have spent queued or in progress so far, within these bounds.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Returns
+        -------
+        UnionJob
+            The job's details, with a `COMPLETED` or `FAILED` state.
+
+
+        Examples
+        --------
+        from hume import HumeClient
+
+        client = HumeClient(
+            api_key="YOUR_API_KEY",
+        )
+        client.expression_measurement.batch.wait_for_job(
+            id="job_id",
+            timeout=600,
+        )
+        """
+        jobs = self.wait_for_jobs(
+            [id],
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            list_threshold=None,
+            request_options=request_options,
+        )
+        try:
+            return next(jobs)
+        finally:
+            jobs.close()
+
+    def wait_for_jobs(
+        self,
+        ids: typing.Iterable[str],
+        *,
+        timeout: typing.Optional[float] = None,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        list_threshold: typing.Optional[int] = DEFAULT_LIST_THRESHOLD,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Generator[UnionJob, None, None]:
+        """
+        Wait for many jobs, yielding each one as it completes or fails.
+
+        Parameters
+        ----------
+        ids : typing.Iterable[str]
+            The unique identifiers of the jobs.
+
+        timeout : typing.Optional[float]
+            Seconds to wait before raising `TimeoutError`. Waits indefinitely by default.
+
+        min_interval : float
+            The shortest time between two polls of a job, in seconds.
+
+        max_interval : float
+            The longest time between two polls of a job, in seconds. Jobs are polled again after a fifth of the
+            time they have spent queued or in progress so far, within these bounds.
+
+        max_concurrency : int
+            The most `get_job_details` requests to have in flight at once.
+
+        list_threshold : typing.Optional[int]
+            While at least this many jobs are pending, each round of polls is a `list_jobs` call for finished jobs
+            instead of a `get_job_details` call per job. `None` always polls jobs one by one.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        typing.Generator[UnionJob, None, None]
+            The details of each job, with a `COMPLETED` or `FAILED` state, in the order they finish.
+
+
+        Examples
+        --------
+        from hume import HumeClient
+
+        client = HumeClient(
+            api_key="YOUR_API_KEY",
+        )
+        for job in client.expression_measurement.batch.wait_for_jobs(
+            ids=["job_id_1", "job_id_2"],
+        ):
+            print(job.job_id, job.state.status)
+        """
+        tracker = JobTracker(
+            ids,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            list_threshold=list_threshold,
+            timeout=timeout,
+        )
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            while tracker.pending:
+                time.sleep(tracker.wait_time())
+                if tracker.use_list():
+                    finished = self._list_finished_jobs(tracker, request_options)
+                    tracker.reschedule()
+                    for job in finished:
+                        if tracker.observe(job):
+                            yield job
+                    continue
+                futures = [
+                    executor.submit(self.get_job_details, id, request_options=request_options)
+                    for id in tracker.due()
+                ]
+                try:
+                    for future in concurrent.futures.as_completed(futures):
+                        job = future.result()
+                        if tracker.observe(job):
+                            yield job
+                finally:
+                    for future in futures:
+                        future.cancel()
+
+    def _list_finished_jobs(
+        self, tracker: JobTracker, request_options: typing.Optional[RequestOptions]
+    ) -> typing.List[UnionJob]:
+        finished: typing.List[UnionJob] = []
+        after: typing.Optional[int] = tracker.created_after()
+        while after is not None:
+            page = self.list_jobs(
+                limit=LIST_PAGE_SIZE,
+                status=TERMINAL_STATUSES,
+                when="created_after",
+                timestamp_ms=after,
+                sort_by="created",
+                direction="asc",
+                request_options=request_options,
+            )
+            finished.extend(page)
+            after = tracker.next_page_after(page, after)
+        return finished
+
 
 class AsyncBatchClientWithUtils(AsyncBatchClient):
     async def get_and_write_job_artifacts(
@@ -161,11 +703,99 @@ class AsyncBatchClientWithUtils(AsyncBatchClient):
             async for chunk in self.get_job_artifacts(id=id, request_options=request_options):
                 await f.write(chunk)
 
+    async def iter_job_artifact_members(
+        self,
+        id: str,
+        *,
+        spool_size: int = DEFAULT_SPOOL_SIZE,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[ArtifactMember]:
+        """
+        Unpack the artifacts ZIP of a completed inference job while it downloads, yielding each file as it completes.
+
+        Parameters
+        ----------
+        id : str
+            The unique identifier for the job.
+
+        spool_size : int
+            Files up to this many bytes are held in memory, larger ones spill to a temporary file.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration. You can pass in configuration such as `chunk_size`, and more to customize the request and response.
+
+        Yields
+        ------
+        typing.AsyncIterator[ArtifactMember]
+            Each file's contents are closed once the next file is requested. Decompression runs in the
+            event loop's default executor.
+
+
+        Examples
+        --------
+        from hume import AsyncHumeClient
+
+        client = AsyncHumeClient(
+            api_key="YOUR_API_KEY",
+        )
+        async for member in client.expression_measurement.batch.iter_job_artifact_members(
+            id="job_id",
+        ):
+            print(member.name, member.size)
+        """
+        async for member in aiter_zip_members(
+            self.get_job_artifacts(id=id, request_options=request_options), spool_size
+        ):
+            yield member
+
+    async def extract_job_artifacts(
+        self,
+        id: str,
+        *,
+        path: str = ".",
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.List[str]:
+        """
+        Extract the artifacts ZIP of a completed inference job into a directory while it downloads, without
+        writing the archive itself to disk.
+
+        Parameters
+        ----------
+        id : str
+            The unique identifier for the job.
+
+        path : str
+            The directory to extract the artifacts to.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration. You can pass in configuration such as `chunk_size`, and more to customize the request and response.
+
+        Returns
+        -------
+        typing.List[str]
+            The paths of the files written.
+
+
+        Examples
+        --------
+        from hume import AsyncHumeClient
+
+        client = AsyncHumeClient(
+            api_key="YOUR_API_KEY",
+        )
+        await client.expression_measurement.batch.extract_job_artifacts(
+            id="job_id",
+            path="artifacts",
+        )
+        """
+        return await aextract_zip(self.get_job_artifacts(id=id, request_options=request_options), path)
+
     async def start_inference_job_from_local_file(
         self,
         *,
-        file: typing.List[core.File],
+        file: typing.List[UploadFile],
         json: typing.Optional[InferenceBaseRequest] = None,
+        on_progress: typing.Optional[ProgressCallback] = None,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> str:
         """
@@ -173,12 +803,16 @@ class AsyncBatchClientWithUtils(AsyncBatchClient):
 
         Parameters
         ----------
-        file : typing.List[core.File]
-            See core.File for more documentation
+        file : typing.List[typing.Union[core.File, os.PathLike]]
+            See core.File for more documentation. Files are streamed from disk in chunks; files given as paths are
+            only opened while they are uploaded.
 
         json : typing.Optional[InferenceBaseRequest]
             The inference job configuration.
 
+        on_progress : typing.Optional[typing.Callable[[int, typing.Optional[int]], None]]
+            Called with the bytes uploaded so far and the size of the whole upload, if known, as the upload proceeds.
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
@@ -196,17 +830,17 @@ class AsyncBatchClientWithUtils(AsyncBatchClient):
         )
         client.expression_measurement.batch.start_inference_job_from_local_file()
         """
-        files: typing.Dict[str, typing.Any] = {
-            "file": file,
-        }
+        fields: typing.List[typing.Tuple[str, UploadFile]] = [("file", f) for f in file]
         if json is not None:
-            files["json"] = jsonlib.dumps(jsonable_encoder(json)).encode("utf-8")
+            fields.append(("json", jsonlib.dumps(jsonable_encoder(json)).encode("utf-8")))
+        encoder = MultipartEncoder(fields, on_progress=on_progress)
 
         _response = await self._raw_client._client_wrapper.httpx_client.request(
             "v0/batch/jobs",
             base_url=self._raw_client._client_wrapper.get_environment().base,
             method="POST",
-            files=files,
+            content=encoder.stream_async(),  # type: ignore[arg-type]
+            headers=encoder.headers,
             request_options=request_options,
         )
         try:
@@ -220,6 +854,431 @@ class AsyncBatchClientWithUtils(AsyncBatchClient):
                 )
                 return _parsed_response.job_id
             _response_json = _response.json()
+        except JSONDecodeError:
+            raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
+        raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
+
+    async def start_bulk_inference_jobs(
+        self,
+        sources: typing.Iterable[BulkSource],
+        *,
+        json: typing.Optional[InferenceBaseRequest] = None,
+        ledger: typing.Optional[typing.Union[str, "os.PathLike[str]", SubmissionLedger]] = None,
+        max_files_per_job: int = DEFAULT_MAX_FILES_PER_JOB,
+        max_bytes_per_job: int = DEFAULT_MAX_BYTES_PER_JOB,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        rate_limit_retries: int = DEFAULT_RATE_LIMIT_RETRIES,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Dict[str, str]:
+        """
+        Start batch inference jobs for many local files and URLs, grouping them into as few jobs as the limits allow.
+
+        Sources whose content, together with the job configuration, is already in the ledger are not submitted
+        again, nor are sources with the same content as another source. Each job is recorded in the ledger as soon
+        as it starts, so a bulk submission that fails part way can be run again to submit only what is left.
+
+        Parameters
+        ----------
+        sources : typing.Iterable[typing.Union[str, os.PathLike]]
+            Paths of local files, and `http://` or `https://` URLs. URLs are submitted in jobs of their own.
+
+        json : typing.Optional[InferenceBaseRequest]
+            The inference job configuration shared by every job, without `urls` or `text`.
+
+        ledger : typing.Optional[typing.Union[str, os.PathLike, SubmissionLedger]]
+            A `SubmissionLedger`, or the path of the SQLite database of one. Without a ledger, only duplicates
+            within `sources` are skipped.
+
+        max_files_per_job : int
+            The most sources to submit in one job.
+
+        max_bytes_per_job : int
+            The most bytes of local files to upload in one job. A larger file is submitted in a job of its own.
+
+        max_concurrency : int
+            The most jobs to submit at once.
+
+        rate_limit_retries : int
+            How many times to retry a job the API rejected with a 429, once the client's own retries are spent.
+            Every submission waits out the `retry-after` of a 429 before going on.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Returns
+        -------
+        typing.Dict[str, str]
+            The job id of each source, in the order they were given.
+
+
+        Examples
+        --------
+        from hume import AsyncHumeClient
+        from hume.expression_measurement.batch import InferenceBaseRequest, Models
+
+        client = AsyncHumeClient(
+            api_key="YOUR_API_KEY",
+        )
+        await client.expression_measurement.batch.start_bulk_inference_jobs(
+            ["recordings/1.wav", "recordings/2.wav", "https://example.com/3.mp4"],
+            json=InferenceBaseRequest(models=Models(prosody={})),
+            ledger="submissions.sqlite",
+        )
+        """
+        owned = ledger is not None and not isinstance(ledger, SubmissionLedger)
+        submission_ledger = SubmissionLedger(ledger) if owned else ledger  # type: ignore[arg-type]
+        try:
+            loop = asyncio.get_running_loop()
+            # Hashing reads every file
+            plan = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    plan_submission, sources, json, submission_ledger, max_files_per_job, max_bytes_per_job
+                ),
+            )
+            gate = RateLimitGate()
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def submit(job: PlannedJob) -> str:
+                async with semaphore:
+                    return await self._submit_planned_job(
+                        job, json, submission_ledger, gate, rate_limit_retries, request_options
+                    )
+
+            # Jobs already uploading when one fails still finish and are recorded, so a rerun doesn't upload them
+            # again; only then is the failure raised and the ledger closed
+            results = await asyncio.gather(*(submit(job) for job in plan.jobs), return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            return finish_plan(plan, typing.cast(typing.List[str], results))
+        finally:
+            if owned:
+                submission_ledger.close()
+
+    async def _submit_planned_job(
+        self,
+        job: PlannedJob,
+        config: typing.Optional[InferenceBaseRequest],
+        ledger: typing.Optional[SubmissionLedger],
+        gate: RateLimitGate,
+        rate_limit_retries: int,
+        request_options: typing.Optional[RequestOptions],
+    ) -> str:
+        attempt = 0
+        while True:
+            await asyncio.sleep(gate.wait_time())
+            try:
+                job_id = await self._start_planned_job(job, config, request_options)
+            except ApiError as error:
+                delay = rate_limit_delay(error)
+                if delay is None or attempt >= rate_limit_retries:
+                    raise
+                gate.hold(delay)
+                attempt += 1
+                continue
+            if ledger is not None:
+                ledger.record(job_id, [(item.content_hash, item.source) for item in job.sources])
+            return job_id
+
+    async def _start_planned_job(
+        self,
+        job: PlannedJob,
+        config: typing.Optional[InferenceBaseRequest],
+        request_options: typing.Optional[RequestOptions],
+    ) -> str:
+        if job.urls:
+            settings = {
+                name: getattr(config, name)
+                for name in ("models", "transcription", "callback_url", "notify")
+                if config is not None and getattr(config, name) is not None
+            }
+            return await self.start_inference_job(
+                urls=[item.source for item in job.urls], request_options=request_options, **settings
+            )
+        files: typing.List[UploadFile] = [pathlib.Path(item.source) for item in job.files]
+        return await self.start_inference_job_from_local_file(file=files, json=config, request_options=request_options)
+
+    async def get_job_predictions_columnar(
+        self,
+        id: str,
+        *,
+        models: typing.Optional[typing.Sequence[ModelName]] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Dict[str, PredictionColumns]:
+        """
+        Get the predictions of a completed inference job as NumPy arrays, one `PredictionColumns` per model.
+
+        The response JSON is converted directly, without building a pydantic object for every emotion score as
+        `get_job_predictions` does. Requires NumPy.
+
+        Parameters
+        ----------
+        id : str
+            The unique identifier for the job.
+
+        models : typing.Optional[typing.Sequence[ModelName]]
+            Only convert these models' predictions. Defaults to all of them.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Returns
+        -------
+        typing.Dict[str, PredictionColumns]
+
+
+        Examples
+        --------
+        from hume import AsyncHumeClient
+
+        client = AsyncHumeClient(
+            api_key="YOUR_API_KEY",
+        )
+        columns = await client.expression_measurement.batch.get_job_predictions_columnar(
+            id="job_id",
+        )
+        joy = columns["face"].emotion("Joy")
+        """
+        _response = await self._raw_client._client_wrapper.httpx_client.request(
+            f"v0/batch/jobs/{jsonable_encoder(id)}/predictions",
+            base_url=self._raw_client._client_wrapper.get_environment().base,
+            method="GET",
+            request_options=request_options,
+        )
+        try:
+            if 200 <= _response.status_code < 300:
+                _raw = self._raw_client._client_wrapper.get_json_codec().loads(_response.content)
+                return predictions_to_columns(_raw, models=models)
+            _response_json = _response.json()
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, body=_response.text)
         raise ApiError(status_code=_response.status_code, body=_response_json)
+
+    async def iter_job_predictions(
+        self,
+        id: str,
+        *,
+        raw: bool = False,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[typing.Union[UnionPredictResult, typing.Dict[str, typing.Any]]]:
+        """
+        Stream the JSON predictions of a completed inference job, one result per source as it is downloaded.
+
+        Unlike `get_job_predictions`, which parses the whole response at once, only one source's predictions
+        are held in memory at a time.
+
+        Parameters
+        ----------
+        id : str
+            The unique identifier for the job.
+
+        raw : bool
+            Yield each result as the decoded JSON instead of validating it into an `InferenceSourcePredictResult`.
+            Raw results can be passed straight to `predictions_to_columns`.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration. You can pass in configuration such as `chunk_size`, and more to customize the request and response.
+
+        Yields
+        ------
+        typing.AsyncIterator[typing.Union[UnionPredictResult, typing.Dict[str, typing.Any]]]
+
+
+        Examples
+        --------
+        from hume import AsyncHumeClient
+
+        client = AsyncHumeClient(
+            api_key="YOUR_API_KEY",
+        )
+        async for result in client.expression_measurement.batch.iter_job_predictions(
+            id="job_id",
+        ):
+            print(result.source)
+        """
+        async with self._raw_client._client_wrapper.httpx_client.stream(
+            f"v0/batch/jobs/{jsonable_encoder(id)}/predictions",
+            base_url=self._raw_client._client_wrapper.get_environment().base,
+            method="GET",
+            request_options=request_options,
+        ) as _response:
+            if not 200 <= _response.status_code < 300:
+                await _response.aread()
+                try:
+                    _response_json = _response.json()
+                except JSONDecodeError:
+                    raise ApiError(status_code=_response.status_code, body=_response.text)
+                raise ApiError(status_code=_response.status_code, body=_response_json)
+            _chunk_size = request_options.get("chunk_size", None) if request_options is not None else None
+            async for _item in aiter_json_array(_response.aiter_bytes(chunk_size=_chunk_size)):
+                yield _item if raw else parse_obj_as(UnionPredictResult, _item)  # type: ignore
+
+    async def wait_for_job(
+        self,
+        id: str,
+        *,
+        timeout: typing.Optional[float] = None,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> UnionJob:
+        """
+        Wait until a job has completed or failed.
+
+        Parameters
+        ----------
+        id : str
+            The unique identifier for the job.
+
+        timeout : typing.Optional[float]
+            Seconds to wait before raising `TimeoutError`. Waits indefinitely by default.
+
+        min_interval : float
+            The shortest time between two polls of a job, in seconds.
+
+        max_interval : float
+            The longest time between two polls of a job, in seconds. Jobs are polled again after a fifth of the
+            time they have spent queued or in progress so far, within these bounds.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Returns
+        -------
+        UnionJob
+            The job's details, with a `COMPLETED` or `FAILED` state.
+
+
+        Examples
+        --------
+        from hume import AsyncHumeClient
+
+        client = AsyncHumeClient(
+            api_key="YOUR_API_KEY",
+        )
+        await client.expression_measurement.batch.wait_for_job(
+            id="job_id",
+            timeout=600,
+        )
+        """
+        jobs = self.wait_for_jobs(
+            [id],
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            list_threshold=None,
+            request_options=request_options,
+        )
+        try:
+            return await jobs.__anext__()
+        finally:
+            await jobs.aclose()
+
+    async def wait_for_jobs(
+        self,
+        ids: typing.Iterable[str],
+        *,
+        timeout: typing.Optional[float] = None,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        list_threshold: typing.Optional[int] = DEFAULT_LIST_THRESHOLD,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncGenerator[UnionJob, None]:
+        """
+        Wait for many jobs, yielding each one as it completes or fails.
+
+        Parameters
+        ----------
+        ids : typing.Iterable[str]
+            The unique identifiers of the jobs.
+
+        timeout : typing.Optional[float]
+            Seconds to wait before raising `TimeoutError`. Waits indefinitely by default.
+
+        min_interval : float
+            The shortest time between two polls of a job, in seconds.
+
+        max_interval : float
+            The longest time between two polls of a job, in seconds. Jobs are polled again after a fifth of the
+            time they have spent queued or in progress so far, within these bounds.
+
+        max_concurrency : int
+            The most `get_job_details` requests to have in flight at once.
+
+        list_threshold : typing.Optional[int]
+            While at least this many jobs are pending, each round of polls is a `list_jobs` call for finished jobs
+            instead of a `get_job_details` call per job. `None` always polls jobs one by one.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        typing.AsyncGenerator[UnionJob, None]
+            The details of each job, with a `COMPLETED` or `FAILED` state, in the order they finish.
+
+
+        Examples
+        --------
+        from hume import AsyncHumeClient
+
+        client = AsyncHumeClient(
+            api_key="YOUR_API_KEY",
+        )
+        async for job in client.expression_measurement.batch.wait_for_jobs(
+            ids=["job_id_1", "job_id_2"],
+        ):
+            print(job.job_id, job.state.status)
+        """
+        tracker = JobTracker(
+            ids,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            list_threshold=list_threshold,
+            timeout=timeout,
+        )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def get_job_details(id: str) -> UnionJob:
+            async with semaphore:
+                return await self.get_job_details(id, request_options=request_options)
+
+        while tracker.pending:
+            await asyncio.sleep(tracker.wait_time())
+            if tracker.use_list():
+                finished = await self._list_finished_jobs(tracker, request_options)
+                tracker.reschedule()
+                for job in finished:
+                    if tracker.observe(job):
+                        yield job
+                continue
+            tasks = [asyncio.ensure_future(get_job_details(id)) for id in tracker.due()]
+            try:
+                for task in asyncio.as_completed(tasks):
+                    job = await task
+                    if tracker.observe(job):
+                        yield job
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+    async def _list_finished_jobs(
+        self, tracker: JobTracker, request_options: typing.Optional[RequestOptions]
+    ) -> typing.List[UnionJob]:
+        finished: typing.List[UnionJob] = []
+        after: typing.Optional[int] = tracker.created_after()
+        while after is not None:
+            page = await self.list_jobs(
+                limit=LIST_PAGE_SIZE,
+                status=TERMINAL_STATUSES,
+                when="created_after",
+                timestamp_ms=after,
+                sort_by="created",
+                direction="asc",
+                request_options=request_options,
+            )
+            finished.extend(page)
+            after = tracker.next_page_after(page, after)
+        return finished
@@ -0,0 +1,220 @@
+# THIS FILE IS MANUALLY MAINTAINED: see .fernignore
+"""
+Columnar views of batch job predictions.
+
+Requires NumPy. Arrow and Parquet export additionally require `pyarrow`.
+"""
+
+import dataclasses
+import math
+import os
+import typing
+
+from .types.union_predict_result import UnionPredictResult
+
+if typing.TYPE_CHECKING:
+    import numpy as np  # type: ignore
+    import pyarrow as pa  # type: ignore
+
+ModelName = typing.Literal["face", "burst", "prosody", "language", "ner", "facemesh"]
+MODEL_NAMES: typing.Tuple[ModelName, ...] = ("face", "burst", "prosody", "language", "ner", "facemesh")
+
+_NAN = math.nan
+_NO_BOX = (_NAN, _NAN, _NAN, _NAN)
+
+
+def _get(obj: typing.Any, key: str) -> typing.Any:
+    # Walks raw JSON and parsed models alike
+    if isinstance(obj, dict):
+        return obj.get(key)
+    return getattr(obj, key, None)
+
+
+def _nan_if_none(value: typing.Optional[float]) -> float:
+    return _NAN if value is None else value
+
+
+@dataclasses.dataclass
+class PredictionColumns:
+    """
+    Predictions of one model as parallel arrays, one row per prediction.
+
+    `scores[i, j]` is the score of emotion `emotions[j]` for row `i`, or NaN if that prediction had no score
+    for it. Missing times, boxes and confidences are NaN and missing frames are -1.
+    """
+
+    model: str
+    emotions: typing.List[str]
+    scores: "np.ndarray"
+    """float32, shape (rows, len(emotions))."""
+    file: "np.ndarray"
+    """Source file or URL of each row."""
+    group: "np.ndarray"
+    """Id of the grouped prediction a row belongs to, e.g. a face or speaker id."""
+    time_begin: "np.ndarray"
+    """Seconds. For face predictions, the frame time, which is also `time_end`."""
+    time_end: "np.ndarray"
+    frame: "np.ndarray"
+    box: "np.ndarray"
+    """float32, shape (rows, 4): x, y, w, h of the face bounding box."""
+    confidence: "np.ndarray"
+    """Face detection probability, or transcription confidence."""
+    text: "np.ndarray"
+    """Transcribed text, or the entity for named entities."""
+
+    def __len__(self) -> int:
+        return len(self.file)
+
+    def emotion(self, name: str) -> "np.ndarray":
+        """Scores of one emotion for every row."""
+        return self.scores[:, self.emotions.index(name)]
+
+    def to_arrow(self) -> "pa.Table":
+        """One column per field and per emotion."""
+        import pyarrow as pa  # type: ignore
+
+        columns = {
+            "file": pa.array(self.file, pa.string()),
+            "group": pa.array(self.group, pa.string()),
+            "time_begin": self.time_begin,
+            "time_end": self.time_end,
+            "frame": self.frame,
+            "box_x": self.box[:, 0],
+            "box_y": self.box[:, 1],
+            "box_w": self.box[:, 2],
+            "box_h": self.box[:, 3],
+            "confidence": self.confidence,
+            "text": pa.array(self.text, pa.string()),
+        }
+        for index, name in enumerate(self.emotions):
+            columns[name] = self.scores[:, index]
+        return pa.table(columns)
+
+    def to_parquet(self, path: typing.Union[str, "os.PathLike[str]"]) -> None:
+        import pyarrow.parquet as pq  # type: ignore
+
+        pq.write_table(self.to_arrow(), path)
+
+
+class _ColumnBuilder:
+    def __init__(self, model: str) -> None:
+        self.model = model
+        self.emotions: typing.List[str] = []
+        self._positions: typing.Dict[str, int] = {}
+        # Emotions come back in the same order for every prediction of a model, so the layout of the last row
+        # is usually reused
+        self._last_names: typing.List[str] = []
+        self._last_layout: typing.Optional[typing.List[int]] = None
+        self.scores: typing.List[typing.List[float]] = []
+        self.file: typing.List[str] = []
+        self.group: typing.List[typing.Optional[str]] = []
+        self.time_begin: typing.List[float] = []
+        self.time_end: typing.List[float] = []
+        self.frame: typing.List[int] = []
+        self.box: typing.List[typing.Tuple[float, float, float, float]] = []
+        self.confidence: typing.List[float] = []
+        self.text: typing.List[typing.Optional[str]] = []
+
+    def _row_scores(self, emotions: typing.Sequence[typing.Any]) -> typing.List[float]:
+        names = [_get(e, "name") for e in emotions]
+        scores = [_get(e, "score") for e in emotions]
+        if names == self.emotions:
+            return scores
+        if names != self._last_names or self._last_layout is None:
+            for name in names:
+                if name not in self._positions:
+                    self._positions[name] = len(self.emotions)
+                    self.emotions.append(name)
+            self._last_names = names
+            self._last_layout = [self._positions[name] for name in names]
+            if names == self.emotions:
+                return scores
+        row = [_NAN] * len(self.emotions)
+        for position, score in zip(self._last_layout, scores):
+            row[position] = score
+        return row
+
+    def add(self, file: str, group: typing.Optional[str], prediction: typing.Any) -> None:
+        self.scores.append(self._row_scores(_get(prediction, "emotions") or []))
+        self.file.append(file)
+        self.group.append(group)
+        time = _get(prediction, "time")
+        if isinstance(time, (int, float)):
+            self.time_begin.append(time)
+            self.time_end.append(time)
+        elif time is not None:
+            self.time_begin.append(_nan_if_none(_get(time, "begin")))
+            self.time_end.append(_nan_if_none(_get(time, "end")))
+        else:
+            self.time_begin.append(_NAN)
+            self.time_end.append(_NAN)
+        frame = _get(prediction, "frame")
+        self.frame.append(frame if frame is not None else -1)
+        box = _get(prediction, "box")
+        self.box.append(tuple(_nan_if_none(_get(box, k)) for k in "xywh") if box else _NO_BOX)  # type: ignore[arg-type]
+        confidence = _get(prediction, "prob")
+        if confidence is None:
+            confidence = _get(prediction, "confidence")
+        self.confidence.append(_nan_if_none(confidence))
+        text = _get(prediction, "text")
+        self.text.append(text if text is not None else _get(prediction, "entity"))
+
+    def build(self) -> PredictionColumns:
+        import numpy as np  # type: ignore
+
+        width = len(self.emotions)
+        scores = np.full((len(self.scores), width), np.nan, dtype=np.float32)
+        # Rows recorded before a new emotion appeared are shorter; fill the common widths in one go each
+        for length in {len(row) for row in self.scores}:
+            rows = [i for i, row in enumerate(self.scores) if len(row) == length]
+            if length:
+                scores[rows, :length] = np.array([self.scores[i] for i in rows], dtype=np.float32)
+
+        return PredictionColumns(
+            model=self.model,
+            emotions=self.emotions,
+            scores=scores,
+            file=np.array(self.file, dtype=object),
+            group=np.array(self.group, dtype=object),
+            time_begin=np.array(self.time_begin, dtype=np.float64),
+            time_end=np.array(self.time_end, dtype=np.float64),
+            frame=np.array(self.frame, dtype=np.int64),
+            box=np.array(self.box, dtype=np.float32).reshape(-1, 4),
+            confidence=np.array(self.confidence, dtype=np.float64),
+            text=np.array(self.text, dtype=object),
+        )
+
+
+def predictions_to_columns(
+    predictions: typing.Iterable[typing.Union[UnionPredictResult, typing.Dict[str, typing.Any]]],
+    models: typing.Optional[typing.Iterable[ModelName]] = None,
+) -> typing.Dict[str, PredictionColumns]:
+    """
+    Convert the results of `get_job_predictions` into a `PredictionColumns` per model that has predictions.
+
+    Accepts parsed results or the raw JSON, which is considerably faster since no model is built per score.
+    Sources that failed are skipped.
+    """
+    wanted = tuple(models) if models is not None else MODEL_NAMES
+    builders: typing.Dict[str, _ColumnBuilder] = {}
+    for result in predictions:
+        results = _get(result, "results")
+        if results is None:
+            continue
+        for inference in _get(results, "predictions") or []:
+            file = _get(inference, "file")
+            model_predictions = _get(inference, "models")
+            if model_predictions is None:
+                continue
+            for model in wanted:
+                output = _get(model_predictions, model)
+                if output is None:
+                    continue
+                builder = builders.get(model)
+                if builder is None:
+                    builder = builders[model] = _ColumnBuilder(model)
+                for group in _get(output, "grouped_predictions") or []:
+                    group_id = _get(group, "id")
+                    for prediction in _get(group, "predictions") or []:
+                        builder.add(file, group_id, prediction)
+    return {model: builder.build() for model, builder in builders.items()}
@@ -0,0 +1,122 @@
+# THIS FILE IS MANUALLY MAINTAINED: see .fernignore
+"""
+Scheduling of status polls for batch jobs that are being waited on.
+
+Each job is polled again after a fraction of the time it has already spent queued or in progress, between
+`min_interval` and `max_interval` seconds: a job that has been running for ten minutes won't finish in the next
+second, and one that just started may. When many jobs are tracked, a round of polls is one `list_jobs` call for
+the jobs that finished since the oldest of them was created, instead of a `get_job_details` call per job.
+"""
+
+import random
+import time
+import typing
+
+from .types.union_job import UnionJob
+
+DEFAULT_MIN_INTERVAL = 1.0
+DEFAULT_MAX_INTERVAL = 30.0
+# Poll again after this fraction of the time the job has been queued or running
+DEFAULT_POLL_FRACTION = 0.2
+DEFAULT_MAX_CONCURRENCY = 8
+# Tracking at least this many jobs switches to listing finished jobs
+DEFAULT_LIST_THRESHOLD = 8
+
+TERMINAL_STATUSES: typing.List[typing.Any] = ["COMPLETED", "FAILED"]
+LIST_PAGE_SIZE = 100
+# Spreads out the polls of jobs submitted together
+_JITTER = 0.1
+
+
+def is_finished(job: UnionJob) -> bool:
+    return job.state.status in TERMINAL_STATUSES
+
+
+class JobTracker:
+    """Which of the jobs being waited on are still pending, and when each should be polled next."""
+
+    def __init__(
+        self,
+        ids: typing.Iterable[str],
+        *,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        poll_fraction: float = DEFAULT_POLL_FRACTION,
+        list_threshold: typing.Optional[int] = DEFAULT_LIST_THRESHOLD,
+        timeout: typing.Optional[float] = None,
+    ) -> None:
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("min_interval must be positive and no larger than max_interval")
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._poll_fraction = poll_fraction
+        self._list_threshold = list_threshold
+        self._deadline = time.monotonic() + timeout if timeout is not None else None
+        # Last known state of each pending job, `None` until it was first polled
+        self.pending: typing.Dict[str, typing.Optional[UnionJob]] = dict.fromkeys(ids)
+        self._next_poll = dict.fromkeys(self.pending, 0.0)
+        self._can_list = list_threshold is not None
+
+    def _delay(self, job: UnionJob) -> float:
+        state = job.state
+        since = getattr(state, "started_timestamp_ms", None) or state.created_timestamp_ms
+        elapsed = max(0.0, time.time() - since / 1000)
+        delay = min(max(elapsed * self._poll_fraction, self._min_interval), self._max_interval)
+        return delay * random.uniform(1 - _JITTER, 1 + _JITTER)
+
+    def observe(self, job: UnionJob) -> bool:
+        """Record a job's state. Returns whether it is one being waited on that just finished."""
+        if job.job_id not in self.pending:
+            return False
+        if is_finished(job):
+            del self.pending[job.job_id]
+            del self._next_poll[job.job_id]
+            return True
+        self.pending[job.job_id] = job
+        self._next_poll[job.job_id] = time.monotonic() + self._delay(job)
+        return False
+
+    def reschedule(self) -> None:
+        """Set the next polls from the last known states, after a round that didn't return them."""
+        for id, job in self.pending.items():
+            if job is not None:
+                self._next_poll[id] = time.monotonic() + self._delay(job)
+
+    def due(self) -> typing.List[str]:
+        now = time.monotonic()
+        return [id for id, at in self._next_poll.items() if at <= now]
+
+    def wait_time(self) -> float:
+        """Seconds until the next poll is due, or until the timeout. Raises `TimeoutError` once it has passed."""
+        now = time.monotonic()
+        wait = max(0.0, min(self._next_poll.values()) - now) if self._next_poll else 0.0
+        if self._deadline is None:
+            return wait
+        if now >= self._deadline:
+            raise TimeoutError(f"Timed out waiting for jobs: {', '.join(self.pending)}")
+        return min(wait, self._deadline - now)
+
+    def use_list(self) -> bool:
+        return (
+            self._can_list
+            and len(self.pending) >= typing.cast(int, self._list_threshold)
+            and all(job is not None for job in self.pending.values())
+        )
+
+    def created_after(self) -> int:
+        """`timestamp_ms` for listing jobs created no earlier than the oldest pending job."""
+        return min(job.state.created_timestamp_ms for job in self.pending.values() if job is not None) - 1
+
+    def next_page_after(self, page: typing.List[UnionJob], after: int) -> typing.Optional[int]:
+        """`timestamp_ms` for the next page of finished jobs, or `None` if no pending job can be on it."""
+        if len(page) < LIST_PAGE_SIZE:
+            return None
+        last = page[-1].state.created_timestamp_ms
+        if last > max(job.state.created_timestamp_ms for job in self.pending.values() if job is not None):
+            return None
+        # Jobs created in the page's last millisecond are listed again, in case the page cut them off
+        if last - 1 <= after:
+            # A whole page created in one millisecond can't be paged through; poll each job from now on
+            self._can_list = False
+            return None
+        return last - 1
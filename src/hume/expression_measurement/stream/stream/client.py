@@ -13,7 +13,8 @@ from ....core.remove_none_from_dict import remove_none_from_dict
 from ....core.request_options import RequestOptions
 from ....core.websocket_compat import InvalidWebSocketStatus, get_status_code
 from .raw_client import AsyncRawStreamClient, RawStreamClient
-from .socket_client import AsyncStreamSocketClient, StreamSocketClient
+from .socket_client import DEFAULT_PIPELINE_WINDOW, AsyncStreamSocketClient, StreamSocketClient
+from .socket_pool import PoolStrategy, StreamSocketPool
 
 try:
     from websockets.legacy.client import connect as websockets_client_connect  # type: ignore
@@ -75,7 +76,9 @@ class StreamClient:
             headers.update(request_options["additional_headers"])
         try:
             with websockets_sync_client.connect(ws_url, additional_headers=headers) as protocol:
-                yield StreamSocketClient(websocket=protocol)
+                yield StreamSocketClient(
+                    websocket=protocol, json_codec=self._raw_client._client_wrapper.get_json_codec()
+                )
         except InvalidWebSocketStatus as exc:
             status_code: int = get_status_code(exc)
             if status_code == 401:
@@ -145,7 +148,9 @@ class AsyncStreamClient:
             headers.update(request_options["additional_headers"])
         try:
             async with websockets_client_connect(ws_url, extra_headers=headers) as protocol:
-                yield AsyncStreamSocketClient(websocket=protocol)
+                yield AsyncStreamSocketClient(
+                    websocket=protocol, json_codec=self._raw_client._client_wrapper.get_json_codec()
+                )
         except InvalidWebSocketStatus as exc:
             status_code: int = get_status_code(exc)
             if status_code == 401:
@@ -159,3 +164,45 @@ class AsyncStreamClient:
                 headers=dict(headers),
                 body="Unexpected error when initializing websocket connection.",
             )
+
+    def pool(
+        self,
+        *,
+        size: int = 4,
+        strategy: PoolStrategy = "least_loaded",
+        window: int = DEFAULT_PIPELINE_WINDOW,
+        retries: int = 1,
+        hume_api_key: typing.Optional[str] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> StreamSocketPool:
+        """
+        Parameters
+        ----------
+        size : int
+            Maximum number of sockets. Sockets are opened as they are needed.
+
+        strategy : PoolStrategy
+            `"least_loaded"` or `"round_robin"`.
+
+        window : int
+            Payloads that can await predictions on one socket at the same time.
+
+        retries : int
+            Times a payload is retried on another socket when its socket's connection breaks.
+
+        hume_api_key : typing.Optional[str]
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration, used for every socket.
+
+        Returns
+        -------
+        StreamSocketPool
+        """
+        return StreamSocketPool(
+            lambda: self.connect(hume_api_key=hume_api_key, request_options=request_options),
+            size=size,
+            strategy=strategy,
+            window=window,
+            retries=retries,
+        )
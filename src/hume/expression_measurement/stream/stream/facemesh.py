@@ -0,0 +1,140 @@
+# THIS FILE IS MANUALLY MAINTAINED: see .fernignore
+"""
+Serialization of facemesh landmarks for the stream API.
+
+NumPy arrays of shape (meshes, 478, 3) are formatted to fixed precision with vectorized operations, which is
+much faster than formatting each float in Python. NumPy is optional; nested lists are serialized as before.
+"""
+
+import typing
+
+from ....core.api_error import ApiError
+from ....core.json_codec import JsonCodec
+from .types.stream_error_message import StreamErrorMessage
+from .types.stream_model_predictions_facemesh_predictions_item import StreamModelPredictionsFacemeshPredictionsItem
+
+if typing.TYPE_CHECKING:
+    import numpy as np  # type: ignore
+
+FacemeshLandmarks = typing.Union[typing.List[typing.List[typing.List[float]]], "np.ndarray"]
+
+FACEMESH_LANDMARKS = 478
+DEFAULT_FACEMESH_PRECISION = 4
+# The stream API accepts at most this many meshes in one facemesh payload
+MAX_FACEMESH_MESHES = 100
+
+
+def is_landmark_array(landmarks: typing.Any) -> bool:
+    return type(landmarks).__module__ == "numpy"
+
+
+def _format_landmarks(landmarks: "np.ndarray", precision: int) -> str:
+    import numpy as np  # type: ignore
+
+    if landmarks.ndim != 3 or landmarks.shape[1:] != (FACEMESH_LANDMARKS, 3):
+        raise ValueError(f"Expected landmarks of shape (meshes, {FACEMESH_LANDMARKS}, 3), got {landmarks.shape}")
+    if not np.isfinite(landmarks).all():
+        raise ValueError("Landmarks must be finite")
+    meshes = landmarks.shape[0]
+    if meshes == 0:
+        return "[]"
+
+    quantized = np.rint(landmarks * 10.0**precision).astype(np.int64).reshape(-1)
+    negative = quantized < 0
+    magnitude = np.abs(quantized)
+    integer, fraction = np.divmod(magnitude, 10**precision)
+    int_digits = max(1, len(str(int(integer.max()))))
+
+    # Every number gets the same width, right-aligned with spaces: "  -1.2345". JSON allows whitespace
+    # between tokens, so the columns can be filled in for all numbers at once.
+    width = 1 + int_digits + (1 + precision if precision > 0 else 0)
+    numbers = np.full((quantized.size, width), ord(" "), dtype=np.uint8)
+    length = np.ones(quantized.size, dtype=np.int64)
+    for j in range(1, int_digits):
+        length += integer >= 10**j
+    # Column int_digits - j holds the digit for 10**j, the minus sign just left of the leading digit
+    for j in range(int_digits + 1):
+        digits = (integer // 10**j % 10 + ord("0")).astype(np.uint8)
+        sign = np.where((j == length) & negative, ord("-"), ord(" ")).astype(np.uint8)
+        numbers[:, int_digits - j] = np.where(j < length, digits, sign)
+    if precision > 0:
+        numbers[:, int_digits + 1] = ord(".")
+        for j in range(precision):
+            numbers[:, width - 1 - j] = (fraction // 10**j % 10 + ord("0")).astype(np.uint8)
+
+    # One row per landmark: `[x,y,z]` between a leading slot for a mesh's `[` and two trailing separator slots
+    points = numbers.reshape(meshes * FACEMESH_LANDMARKS, 3, width)
+    rows = np.full((points.shape[0], 3 * width + 7), ord(" "), dtype=np.uint8)
+    rows[:, 1] = ord("[")
+    for axis in range(3):
+        start = 2 + axis * (width + 1)
+        rows[:, start : start + width] = points[:, axis]
+        rows[:, start + width] = ord(",") if axis < 2 else ord("]")
+    rows[:, -2] = ord(",")
+    first = np.arange(meshes) * FACEMESH_LANDMARKS
+    rows[first, 0] = ord("[")
+    rows[first + FACEMESH_LANDMARKS - 1, -2] = ord("]")
+    rows[first[:-1] + FACEMESH_LANDMARKS - 1, -1] = ord(",")
+    return "[" + rows.tobytes().decode("ascii") + "]"
+
+
+def encode_facemesh(
+    json_codec: JsonCodec, landmarks: FacemeshLandmarks, precision: int = DEFAULT_FACEMESH_PRECISION
+) -> str:
+    """
+    Serialize landmarks for the `data` field of a facemesh payload.
+
+    NumPy arrays are rounded to `precision` decimal places; nested lists are serialized as they are.
+    """
+    if is_landmark_array(landmarks):
+        import numpy as np  # type: ignore
+
+        return _format_landmarks(np.asarray(landmarks, dtype=np.float64), precision)
+    return json_codec.dumps(landmarks)
+
+
+def batch_landmarks(
+    landmarks: typing.Union[FacemeshLandmarks, typing.Iterable[typing.Any]], max_meshes: int = MAX_FACEMESH_MESHES
+) -> typing.Iterator[FacemeshLandmarks]:
+    """Split a stack of meshes into groups of up to `max_meshes`, each small enough for one payload."""
+    if max_meshes < 1:
+        raise ValueError("max_meshes must be at least 1")
+    if is_landmark_array(landmarks):
+        for start in range(0, len(landmarks), max_meshes):  # type: ignore[arg-type]
+            yield landmarks[start : start + max_meshes]  # type: ignore[index]
+        return
+    batch: typing.List[typing.Any] = []
+    for mesh in landmarks:
+        batch.append(mesh)
+        if len(batch) == max_meshes:
+            yield _stack(batch)
+            batch = []
+    if batch:
+        yield _stack(batch)
+
+
+def _stack(meshes: typing.List[typing.Any]) -> FacemeshLandmarks:
+    if is_landmark_array(meshes[0]):
+        import numpy as np  # type: ignore
+
+        return np.stack(meshes)
+    return meshes
+
+
+def split_facemesh_predictions(
+    results: typing.Iterable[typing.Tuple[int, typing.Any]],
+) -> typing.List[typing.Optional[StreamModelPredictionsFacemeshPredictionsItem]]:
+    """
+    Turn (meshes sent, response) pairs into one prediction per mesh, in the order the meshes were sent.
+
+    Meshes answered by a warning, or missing from a response, get `None`; an error response raises `ApiError`.
+    """
+    per_mesh: typing.List[typing.Optional[StreamModelPredictionsFacemeshPredictionsItem]] = []
+    for count, response in results:
+        if isinstance(response, StreamErrorMessage):
+            raise ApiError(body=f"Facemesh payload of {count} meshes failed: {response.dict()}")
+        facemesh = getattr(response, "facemesh", None)
+        predictions = list(facemesh.predictions or []) if facemesh is not None else []
+        per_mesh.extend(predictions[:count])
+        per_mesh.extend([None] * (count - len(predictions[:count])))
+    return per_mesh
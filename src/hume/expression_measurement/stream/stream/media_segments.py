@@ -0,0 +1,221 @@
+# THIS FILE IS MANUALLY MAINTAINED: see .fernignore
+"""
+Split long recordings into segments the stream API accepts, and merge the segments' predictions.
+
+* WAV files and headerless PCM are read with the `wave` module a segment at a time
+* Anything else is cut with `ffmpeg` (`ffmpeg` and `ffprobe` must be in $PATH), one process per segment
+"""
+
+import dataclasses
+import io
+import os
+import subprocess
+import typing
+import wave
+
+from ....core.api_error import ApiError
+from ....core.pydantic_utilities import parse_obj_as
+from .types.stream_error_message import StreamErrorMessage
+from .types.stream_model_predictions import StreamModelPredictions
+from .types.stream_warning_message import StreamWarningMessage
+
+MediaSource = typing.Union[str, "os.PathLike[str]", typing.BinaryIO]
+
+# The stream API rejects audio and video longer than 5 seconds
+DEFAULT_SEGMENT_SECONDS = 5.0
+DEFAULT_SEGMENT_CONCURRENCY = 4
+
+# Re-encoded so that segments start exactly at their offset, rather than at the previous keyframe
+_FFMPEG_OUTPUT_ARGS = ("-f", "mp4", "-movflags", "frag_keyframe+empty_moov")
+_TIMED_MODELS = ("burst", "face", "prosody")
+
+
+class PcmFormat(typing.NamedTuple):
+    """Layout of headerless PCM."""
+
+    sample_rate: int
+    channels: int = 1
+    sample_width: int = 2
+
+
+@dataclasses.dataclass
+class MediaSegment:
+    index: int
+    start: float
+    """Offset of the segment in the source, in seconds."""
+    duration: float
+    data: bytes
+    """The segment as a standalone file."""
+
+
+def _is_wav(head: bytes) -> bool:
+    return head[:4] == b"RIFF" and head[8:12] == b"WAVE"
+
+
+def _wav_file(pcm: bytes, pcm_format: PcmFormat) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as w:
+        w.setnchannels(pcm_format.channels)
+        w.setsampwidth(pcm_format.sample_width)
+        w.setframerate(pcm_format.sample_rate)
+        w.writeframes(pcm)
+    return buffer.getvalue()
+
+
+def _window_frames(pcm_format: PcmFormat, segment_seconds: float, overlap_seconds: float) -> typing.Tuple[int, int]:
+    segment = round(segment_seconds * pcm_format.sample_rate)
+    overlap = round(overlap_seconds * pcm_format.sample_rate)
+    if segment <= 0 or not 0 <= overlap < segment:
+        raise ValueError("segment_seconds must be positive and overlap_seconds must be shorter than a segment")
+    return segment, overlap
+
+
+def _pcm_segments(
+    read: typing.Callable[[int], bytes], pcm_format: PcmFormat, segment_seconds: float, overlap_seconds: float
+) -> typing.Iterator[MediaSegment]:
+    segment, overlap = _window_frames(pcm_format, segment_seconds, overlap_seconds)
+    frame_size = pcm_format.channels * pcm_format.sample_width
+    rate = pcm_format.sample_rate
+    tail = b""
+    start = 0
+    index = 0
+    while True:
+        wanted = segment - len(tail) // frame_size
+        chunk = read(wanted)
+        if not chunk:
+            # What is left is the overlap, which the previous segment already covered
+            return
+        pcm = tail + chunk
+        frames = len(pcm) // frame_size
+        yield MediaSegment(index=index, start=start / rate, duration=frames / rate, data=_wav_file(pcm, pcm_format))
+        if len(chunk) // frame_size < wanted:
+            return
+        tail = pcm[(segment - overlap) * frame_size :]
+        start += segment - overlap
+        index += 1
+
+
+def _ffmpeg_segments(
+    path: str, segment_seconds: float, overlap_seconds: float, ffmpeg: str, ffprobe: str
+) -> typing.Iterator[MediaSegment]:
+    if segment_seconds <= 0 or not 0 <= overlap_seconds < segment_seconds:
+        raise ValueError("segment_seconds must be positive and overlap_seconds must be shorter than a segment")
+    probe = subprocess.run(
+        [ffprobe, "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", path],
+        capture_output=True,
+        check=True,
+    )
+    duration = float(probe.stdout.decode().strip())
+    step = segment_seconds - overlap_seconds
+    index = 0
+    while index == 0 or index * step + overlap_seconds < duration:
+        start = index * step
+        cut = subprocess.run(
+            [ffmpeg, "-hide_banner", "-loglevel", "error", "-ss", f"{start:.6f}", "-i", path]
+            + ["-t", f"{segment_seconds:.6f}", *_FFMPEG_OUTPUT_ARGS, "pipe:1"],
+            capture_output=True,
+            check=True,
+        )
+        yield MediaSegment(
+            index=index, start=start, duration=min(segment_seconds, duration - start), data=cut.stdout
+        )
+        index += 1
+
+
+def iter_media_segments(
+    source: MediaSource,
+    *,
+    segment_seconds: float = DEFAULT_SEGMENT_SECONDS,
+    overlap_seconds: float = 0.0,
+    pcm_format: typing.Optional[PcmFormat] = None,
+    ffmpeg: str = "ffmpeg",
+    ffprobe: str = "ffprobe",
+) -> typing.Iterator[MediaSegment]:
+    """
+    Yield `source` as consecutive segments of `segment_seconds`, each starting `overlap_seconds` before the
+    previous one ends.
+
+    The source is read one segment at a time. WAV files are detected from their header; pass `pcm_format` for
+    headerless PCM. Other formats, including video, must be a path and are cut with ffmpeg.
+    """
+    if pcm_format is not None:
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                yield from iter_media_segments(
+                    f, segment_seconds=segment_seconds, overlap_seconds=overlap_seconds, pcm_format=pcm_format
+                )
+            return
+        frame_size = pcm_format.channels * pcm_format.sample_width
+        yield from _pcm_segments(
+            lambda frames: source.read(frames * frame_size), pcm_format, segment_seconds, overlap_seconds
+        )
+        return
+
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        with open(path, "rb") as f:
+            if not _is_wav(f.read(12)):
+                yield from _ffmpeg_segments(path, segment_seconds, overlap_seconds, ffmpeg, ffprobe)
+                return
+            f.seek(0)
+            yield from iter_media_segments(f, segment_seconds=segment_seconds, overlap_seconds=overlap_seconds)
+        return
+
+    with wave.open(source, "rb") as w:
+        wav_format = PcmFormat(w.getframerate(), w.getnchannels(), w.getsampwidth())
+        yield from _pcm_segments(w.readframes, wav_format, segment_seconds, overlap_seconds)
+
+
+def _segment_window(segment: MediaSegment, overlap_seconds: float, last: bool) -> typing.Tuple[float, float]:
+    # Each overlap is split down the middle between the two segments that cover it
+    half = overlap_seconds / 2
+    begin = segment.start + half if segment.index > 0 else float("-inf")
+    end = segment.start + segment.duration - half if not last else float("inf")
+    return begin, end
+
+
+def _rebase(item: typing.Dict[str, typing.Any], offset: float) -> typing.Optional[float]:
+    time = item.get("time")
+    if isinstance(time, dict):
+        time = dict(time)
+        for key in ("begin", "end"):
+            if time.get(key) is not None:
+                time[key] += offset
+        item["time"] = time
+        return time.get("begin")
+    if isinstance(time, (int, float)):
+        item["time"] = time + offset
+        return item["time"]
+    return None
+
+
+def merge_segment_predictions(
+    results: typing.Sequence[typing.Tuple[MediaSegment, typing.Any]], overlap_seconds: float = 0.0
+) -> StreamModelPredictions:
+    """
+    Merge the responses for consecutive segments into one set of predictions on the source's timeline.
+
+    `time` values are shifted by each segment's offset. Where segments overlap, a prediction is kept from the
+    segment whose half of the overlap it starts in. Face `frame` numbers stay relative to their segment. A
+    warning, such as no faces being detected, contributes no predictions; an error raises `ApiError`.
+    """
+    merged: typing.Dict[str, typing.List[typing.Any]] = {}
+    for position, (segment, response) in enumerate(results):
+        if isinstance(response, StreamErrorMessage):
+            raise ApiError(body=f"Segment {segment.index} at {segment.start:.3f}s failed: {response.dict()}")
+        if isinstance(response, StreamWarningMessage):
+            continue
+        begin, end = _segment_window(segment, overlap_seconds, last=position == len(results) - 1)
+        for model, output in response.dict().items():
+            if not isinstance(output, dict) or "predictions" not in output:
+                continue
+            items = merged.setdefault(model, [])
+            for item in output["predictions"] or []:
+                item = dict(item)
+                start = _rebase(item, segment.start)
+                if model in _TIMED_MODELS and start is not None and not begin <= start < end:
+                    continue
+                items.append(item)
+    return parse_obj_as(
+        StreamModelPredictions, {model: {"predictions": items} for model, items in merged.items()}
+    )
@@ -63,7 +63,7 @@ class RawStreamClient:
             headers.update(request_options["additional_headers"])
         try:
             with websockets_sync_client.connect(ws_url, additional_headers=headers) as protocol:
-                yield StreamSocketClient(websocket=protocol)
+                yield StreamSocketClient(websocket=protocol, json_codec=self._client_wrapper.get_json_codec())
         except InvalidWebSocketStatus as exc:
             status_code: int = get_status_code(exc)
             if status_code == 401:
@@ -122,7 +122,7 @@ class AsyncRawStreamClient:
             headers.update(request_options["additional_headers"])
         try:
             async with websockets_client_connect(ws_url, extra_headers=headers) as protocol:
-                yield AsyncStreamSocketClient(websocket=protocol)
+                yield AsyncStreamSocketClient(websocket=protocol, json_codec=self._client_wrapper.get_json_codec())
         except InvalidWebSocketStatus as exc:
             status_code: int = get_status_code(exc)
             if status_code == 401:
@@ -1,8 +1,13 @@
 # This file was auto-generated by Fern from our API Definition.
 
-import base64
-import json
+import asyncio
+import binascii
+import io
+import itertools
+import mmap
+import os
 import typing
+import uuid
 from json.decoder import JSONDecodeError
 from pathlib import Path
 
@@ -11,8 +16,28 @@ import websockets.sync.connection as websockets_sync_connection
 
 from ....core.api_error import ApiError
 from ....core.events import EventEmitterMixin, EventType
+from ....core.json_codec import JsonCodec, create_json_codec
 from ....core.pydantic_utilities import parse_obj_as
+from .facemesh import (
+    DEFAULT_FACEMESH_PRECISION,
+    MAX_FACEMESH_MESHES,
+    FacemeshLandmarks,
+    batch_landmarks,
+    encode_facemesh,
+    split_facemesh_predictions,
+)
+from .media_segments import (
+    DEFAULT_SEGMENT_CONCURRENCY,
+    DEFAULT_SEGMENT_SECONDS,
+    MediaSegment,
+    MediaSource,
+    PcmFormat,
+    iter_media_segments,
+    merge_segment_predictions,
+)
 from .types.config import Config
+from .types.stream_model_predictions import StreamModelPredictions
+from .types.stream_model_predictions_facemesh_predictions_item import StreamModelPredictionsFacemeshPredictionsItem
 from .types.stream_models_endpoint_payload import StreamModelsEndpointPayload
 from .types.subscribe_event import SubscribeEvent
 
@@ -23,15 +48,255 @@ except ImportError:
 
 StreamSocketClientResponse = typing.Union[SubscribeEvent]
 
+DEFAULT_PIPELINE_WINDOW = 8
+
+
+def _payload(
+    data: str, config: typing.Optional[Config], raw_text: bool, payload_id: typing.Optional[str]
+) -> typing.Dict[str, typing.Any]:
+    payload = {
+        "data": data,
+        "models": config.dict() if config else None,
+        "raw_text": raw_text,
+        "payload_id": payload_id,
+    }
+    return {k: v for k, v in payload.items() if v is not None}
+
+
+def _facemesh_payload(
+    json_codec: JsonCodec,
+    landmarks: FacemeshLandmarks,
+    config: typing.Optional[Config],
+    payload_id: typing.Optional[str],
+    precision: int = DEFAULT_FACEMESH_PRECISION,
+) -> typing.Dict[str, typing.Any]:
+    return _payload(encode_facemesh(json_codec, landmarks, precision), config, False, payload_id)
+
+
+def _text_payload(
+    text: str, config: typing.Optional[Config], payload_id: typing.Optional[str]
+) -> typing.Dict[str, typing.Any]:
+    return _payload(text, config, True, payload_id)
+
+
+FileSource = typing.Union[str, Path, bytes, bytearray, memoryview, typing.BinaryIO]
+
+# Multiple of 3 so that chunks encode to base64 without padding
+_ENCODE_CHUNK_SIZE = 3 * 256 * 1024
+
+
+class _FileData:
+    """
+    File contents that are base64-encoded straight into the JSON frame when the payload is sent.
+
+    The frame is built in one preallocated buffer, reading the file through `mmap` where possible, instead of
+    reading the file, encoding it to a new string and then copying that string into the serialized payload.
+    """
+
+    def __init__(self, source: FileSource) -> None:
+        self.source = source
+
+    def frame(self, head: str) -> str:
+        """Return `head`, a serialized payload without `data`, with the encoded data added as its last field."""
+        # `head` always has at least `raw_text`, so the data field follows a comma
+        prefix = (head[:-1] + ',"data":"').encode("utf-8")
+        source = self.source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return _encode_frame(prefix, memoryview(source).cast("B"))
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                return _encode_file_frame(prefix, f)
+        return _encode_file_frame(prefix, source)
+
+
+def _encode_frame(prefix: bytes, data: memoryview) -> str:
+    size = data.nbytes
+    buffer = bytearray(len(prefix) + 4 * ((size + 2) // 3) + 2)
+    buffer[: len(prefix)] = prefix
+    pos = len(prefix)
+    for start in range(0, size, _ENCODE_CHUNK_SIZE):
+        encoded = binascii.b2a_base64(data[start : start + _ENCODE_CHUNK_SIZE], newline=False)
+        buffer[pos : pos + len(encoded)] = encoded
+        pos += len(encoded)
+    buffer[pos:] = b'"}'
+    return buffer.decode("utf-8")
+
+
+def _encode_file_frame(prefix: bytes, f: typing.BinaryIO) -> str:
+    try:
+        fileno = f.fileno()
+        start = f.tell()
+        size = os.fstat(fileno).st_size - start
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        size = -1
+    if size > 0:
+        offset = start - start % mmap.ALLOCATIONGRANULARITY
+        with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ, offset=offset) as mapped:
+            view = memoryview(mapped)
+            try:
+                frame = _encode_frame(prefix, view[start - offset :])
+            finally:
+                view.release()
+        f.seek(start + size)
+        return frame
+    # Pipes and other unmappable streams: encode as the data arrives
+    parts = [prefix]
+    pending = b""
+    while True:
+        chunk = f.read(_ENCODE_CHUNK_SIZE)
+        if not chunk:
+            break
+        pending += chunk
+        whole = len(pending) - len(pending) % 3
+        parts.append(binascii.b2a_base64(pending[:whole], newline=False))
+        pending = pending[whole:]
+    parts.append(binascii.b2a_base64(pending, newline=False) if pending else b"")
+    parts.append(b'"}')
+    return b"".join(parts).decode("utf-8")
+
+
+def _file_payload(
+    file_: FileSource, config: typing.Optional[Config], payload_id: typing.Optional[str]
+) -> typing.Dict[str, typing.Any]:
+    data: typing.Union[str, _FileData]
+    if isinstance(file_, str) and not os.path.isfile(file_):
+        # A string that is not a path to a file is taken to be base64 data already
+        data = file_
+    elif isinstance(file_, Path) and not file_.is_file():
+        raise ApiError(body=f"Failed to open file: {file_}")
+    else:
+        data = _FileData(file_)
+    payload = _payload("", config, False, payload_id)
+    payload["data"] = data
+    return payload
+
+
+def _dumps_payload(json_codec: JsonCodec, payload: typing.Dict[str, typing.Any]) -> str:
+    data = payload.get("data")
+    if not isinstance(data, _FileData):
+        return json_codec.dumps(payload)
+    return data.frame(json_codec.dumps({k: v for k, v in payload.items() if k != "data"}))
+
 
 class AsyncStreamSocketClient(EventEmitterMixin):
-    def __init__(self, *, websocket: WebSocketClientProtocol):
+    def __init__(
+        self, *, websocket: WebSocketClientProtocol, json_codec: typing.Optional[JsonCodec] = None
+    ):
         super().__init__()
         self._websocket = websocket
+        self._json_codec = json_codec if json_codec is not None else create_json_codec()
+        # Pipelined mode; see start_pipeline
+        self._reader: typing.Optional[asyncio.Task] = None
+        self._window: typing.Optional[asyncio.Semaphore] = None
+        self._pending: typing.Dict[str, asyncio.Future] = {}
+        self._payload_ids = map("{}-{}".format, itertools.repeat(uuid.uuid4().hex[:8]), itertools.count())
+
+    @property
+    def pipelined(self) -> bool:
+        return self._reader is not None
+
+    def start_pipeline(self, window: int = DEFAULT_PIPELINE_WINDOW) -> None:
+        """
+        Switch to pipelined mode, where up to `window` payloads can await predictions at the same time.
+
+        Each payload is sent with a `payload_id` (generated unless given) and a background task reads responses
+        and resolves them by that id, so concurrent `send_*` calls no longer wait for each other's round trip.
+        Use `submit_*` to get a future for the response as soon as the payload is sent. While pipelined, read
+        responses through those calls rather than `recv()` or iteration.
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        if self._reader is not None:
+            raise RuntimeError("Pipelining has already been started")
+        self._window = asyncio.Semaphore(window)
+        self._reader = asyncio.create_task(self._read_responses())
+
+    async def stop_pipeline(self, error: typing.Optional[BaseException] = None) -> None:
+        """
+        Stop the background reader. Payloads still awaiting a response fail with `error`, or are cancelled when
+        no error is given.
+        """
+        if error is not None:
+            pending, self._pending = self._pending, {}
+            for future in pending.values():
+                self._resolve(future, error)
+        reader, self._reader = self._reader, None
+        if reader is not None:
+            reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)
+        self._window = None
+
+    async def _read_responses(self) -> None:
+        error: BaseException = ConnectionError("The websocket connection was closed")
+        try:
+            async for message in self._websocket:
+                response = parse_obj_as(StreamSocketClientResponse, self._json_codec.loads(message))  # type: ignore
+                payload_id = getattr(response, "payload_id", None)
+                if payload_id is not None:
+                    # An id that isn't pending belongs to a payload whose caller stopped waiting, or to no
+                    # payload at all; it must not answer some other payload, so the response is dropped
+                    future = self._pending.pop(payload_id, None)
+                elif self._pending:
+                    # Responses come back in order, so one without an id, such as a job_details reply, answers
+                    # the oldest payload
+                    future = self._pending.pop(next(iter(self._pending)))
+                else:
+                    future = None
+                if future is not None:
+                    self._resolve(future, response)
+        except asyncio.CancelledError:
+            error = asyncio.CancelledError()
+            raise
+        except (websockets.WebSocketException, JSONDecodeError) as exc:
+            error = exc
+        finally:
+            pending, self._pending = self._pending, {}
+            for future in pending.values():
+                self._resolve(future, error)
+
+    def _resolve(self, future: asyncio.Future, result: typing.Any) -> None:
+        if self._window is not None:
+            self._window.release()
+        if future.done():
+            return
+        if isinstance(result, asyncio.CancelledError):
+            future.cancel()
+        elif isinstance(result, BaseException):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+    async def _submit(self, payload: typing.Dict[str, typing.Any]) -> "asyncio.Future[StreamSocketClientResponse]":
+        if self._window is None:
+            raise RuntimeError("Call start_pipeline() before submitting payloads")
+        payload_id = payload.get("payload_id")
+        if payload_id is None:
+            payload_id = next(self._payload_ids)
+            if "data" in payload:
+                # Control messages such as job_details are answered in order without an id
+                payload["payload_id"] = payload_id
+        if payload_id in self._pending:
+            raise ValueError(f"A payload with payload_id {payload_id!r} is already awaiting a response")
+        await self._window.acquire()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending[payload_id] = future
+        try:
+            await self._websocket.send(_dumps_payload(self._json_codec, payload))
+        except BaseException:
+            if self._pending.pop(payload_id, None) is future:
+                self._window.release()
+            raise
+        return future
+
+    async def _request(self, payload: typing.Dict[str, typing.Any]) -> StreamSocketClientResponse:
+        if self._reader is not None:
+            return await (await self._submit(payload))
+        await self._websocket.send(_dumps_payload(self._json_codec, payload))
+        return await self.recv()
 
     async def __aiter__(self):
         async for message in self._websocket:
-            yield parse_obj_as(StreamSocketClientResponse, json.loads(message))  # type: ignore
+            yield parse_obj_as(StreamSocketClientResponse, self._json_codec.loads(message))  # type: ignore
 
     async def start_listening(self):
         """
@@ -46,7 +311,7 @@ class AsyncStreamSocketClient(EventEmitterMixin):
         await self._emit_async(EventType.OPEN, None)
         try:
             async for raw_message in self._websocket:
-                json_data = json.loads(raw_message)
+                json_data = self._json_codec.loads(raw_message)
                 parsed = parse_obj_as(StreamSocketClientResponse, json_data)  # type: ignore
                 await self._emit_async(EventType.MESSAGE, parsed)
         except (websockets.WebSocketException, JSONDecodeError) as exc:
@@ -66,7 +331,7 @@ class AsyncStreamSocketClient(EventEmitterMixin):
         Receive a message from the websocket connection.
         """
         data = await self._websocket.recv()
-        json_data = json.loads(data)
+        json_data = self._json_codec.loads(data)
         return parse_obj_as(StreamSocketClientResponse, json_data)  # type: ignore
 
     async def _send(self, data: typing.Any) -> None:
@@ -74,31 +339,29 @@ class AsyncStreamSocketClient(EventEmitterMixin):
         Send a message to the websocket connection.
         """
         if isinstance(data, dict):
-            data = json.dumps(data)
+            data = self._json_codec.dumps(data)
         await self._websocket.send(data)
 
     async def _send_model(self, data: typing.Any) -> None:
         """
         Send a Pydantic model to the websocket connection.
         """
-        await self._send(data.dict())
+        await self._websocket.send(self._json_codec.dumps_model(data))
+
+    async def send_payload(self, payload: typing.Dict[str, typing.Any]) -> StreamSocketClientResponse:
+        """
+        Send a payload given as a dict, e.g. a data payload or a `job_details` or `reset_stream` control message,
+        and return its response. When pipelined, the response is matched to the payload by its `payload_id`.
+        """
+        return await self._request(payload)
 
     async def send_facemesh(
         self,
-        landmarks: typing.List[typing.List[typing.List[float]]],
+        landmarks: FacemeshLandmarks,
         config: typing.Optional[Config] = None,
         payload_id: typing.Optional[str] = None,
     ) -> StreamSocketClientResponse:
-        landmarks_str = json.dumps(landmarks)
-        payload = {
-            "data": landmarks_str,
-            "models": config.dict() if config else None,
-            "raw_text": False,
-            "payload_id": payload_id,
-        }
-        payload = {k: v for k, v in payload.items() if v is not None}
-        await self._websocket.send(json.dumps(payload))
-        return await self.recv()
+        return await self._request(_facemesh_payload(self._json_codec, landmarks, config, payload_id))
 
     async def send_text(
         self,
@@ -106,60 +369,140 @@ class AsyncStreamSocketClient(EventEmitterMixin):
         config: typing.Optional[Config] = None,
         payload_id: typing.Optional[str] = None,
     ) -> StreamSocketClientResponse:
-        payload = {
-            "data": text,
-            "models": config.dict() if config else None,
-            "raw_text": True,
-            "payload_id": payload_id,
-        }
-        payload = {k: v for k, v in payload.items() if v is not None}
-        await self._websocket.send(json.dumps(payload))
-        return await self.recv()
+        return await self._request(_text_payload(text, config, payload_id))
 
     async def send_file(
         self,
-        file_: typing.Union[str, Path],
+        file_: FileSource,
         config: typing.Optional[Config] = None,
         payload_id: typing.Optional[str] = None,
     ) -> StreamSocketClientResponse:
+        """
+        Send a file for predictions. `file_` may be a path, the file's bytes, or a binary file object read from
+        its current position; a string that is not a path to a file is sent as already base64-encoded data.
+        """
+        return await self._request(_file_payload(file_, config, payload_id))
+
+    async def send_facemesh_batch(
+        self,
+        landmarks: typing.Union[FacemeshLandmarks, typing.Iterable[typing.Any]],
+        config: typing.Optional[Config] = None,
+        *,
+        max_meshes: int = MAX_FACEMESH_MESHES,
+        precision: int = DEFAULT_FACEMESH_PRECISION,
+    ) -> typing.List[typing.Optional[StreamModelPredictionsFacemeshPredictionsItem]]:
+        """
+        Send any number of facemeshes, e.g. one per video frame, packed `max_meshes` to a payload, and return
+        the facemesh prediction for each mesh in order (`None` where the API returned none).
+
+        `landmarks` may be a NumPy array of shape (meshes, 478, 3), which is formatted to `precision` decimal
+        places without a per-float Python loop, or any iterable of meshes. Payloads are sent back to back when
+        the socket is pipelined and one at a time otherwise.
+        """
+        payloads = (
+            (len(batch), _facemesh_payload(self._json_codec, batch, config, None, precision))
+            for batch in batch_landmarks(landmarks, max_meshes)
+        )
+        if self._reader is None:
+            return split_facemesh_predictions([(count, await self._request(payload)) for count, payload in payloads])
+        submitted = [(count, await self._submit(payload)) for count, payload in payloads]
+        return split_facemesh_predictions([(count, await future) for count, future in submitted])
+
+    async def send_file_segmented(
+        self,
+        file_: MediaSource,
+        config: typing.Optional[Config] = None,
+        *,
+        segment_seconds: float = DEFAULT_SEGMENT_SECONDS,
+        overlap_seconds: float = 0.0,
+        pcm_format: typing.Optional[PcmFormat] = None,
+        concurrency: int = DEFAULT_SEGMENT_CONCURRENCY,
+    ) -> StreamModelPredictions:
+        """
+        Send a recording longer than the stream API allows as consecutive segments and merge their predictions
+        onto the recording's timeline. See `iter_media_segments` for the supported sources and
+        `merge_segment_predictions` for how overlapping segments are merged.
+
+        Up to `concurrency` segments are read ahead and awaiting predictions at a time. The socket is switched
+        to pipelined mode for the duration of the call unless it already is.
+        """
+        started = not self.pipelined
+        if started:
+            self.start_pipeline(concurrency)
+        segments = iter_media_segments(
+            file_, segment_seconds=segment_seconds, overlap_seconds=overlap_seconds, pcm_format=pcm_format
+        )
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(concurrency)
+        submitted: typing.List[typing.Tuple[MediaSegment, asyncio.Future]] = []
         try:
-            with open(file_, "rb") as f:
-                bytes_data = base64.b64encode(f.read()).decode()
-        except:
-            if isinstance(file_, Path):
-                raise ApiError(body=f"Failed to open file: {file_}")
-            # If you cannot open the file, assume you were passed a b64 string, not a file path
-            bytes_data = str(file_)
-
-        payload = {
-            "data": bytes_data,
-            "models": config.dict() if config else None,
-            "raw_text": False,
-            "payload_id": payload_id,
-        }
-        payload = {k: v for k, v in payload.items() if v is not None}
-        await self._websocket.send(json.dumps(payload))
-        return await self.recv()
+            while True:
+                await slots.acquire()
+                segment = await loop.run_in_executor(None, next, segments, None)
+                if segment is None:
+                    break
+                future = await self.submit_file(segment.data, config)
+                future.add_done_callback(lambda _: slots.release())
+                submitted.append((segment, future))
+            results = [(segment, await future) for segment, future in submitted]
+        finally:
+            segments.close()
+            if started:
+                await self.stop_pipeline()
+        return merge_segment_predictions(results, overlap_seconds)
+
+    async def submit_facemesh(
+        self,
+        landmarks: FacemeshLandmarks,
+        config: typing.Optional[Config] = None,
+        payload_id: typing.Optional[str] = None,
+    ) -> "asyncio.Future[StreamSocketClientResponse]":
+        """
+        Send facemesh landmarks in pipelined mode and return a future for their predictions without waiting for
+        them. Waits only while `window` payloads are already in flight.
+        """
+        return await self._submit(_facemesh_payload(self._json_codec, landmarks, config, payload_id))
+
+    async def submit_text(
+        self,
+        text: str,
+        config: typing.Optional[Config] = None,
+        payload_id: typing.Optional[str] = None,
+    ) -> "asyncio.Future[StreamSocketClientResponse]":
+        """
+        Send text in pipelined mode and return a future for its predictions without waiting for them.
+        """
+        return await self._submit(_text_payload(text, config, payload_id))
+
+    async def submit_file(
+        self,
+        file_: FileSource,
+        config: typing.Optional[Config] = None,
+        payload_id: typing.Optional[str] = None,
+    ) -> "asyncio.Future[StreamSocketClientResponse]":
+        """
+        Send a file in pipelined mode and return a future for its predictions without waiting for them.
+        """
+        return await self._submit(_file_payload(file_, config, payload_id))
 
     async def get_job_details(self) -> StreamSocketClientResponse:
-        payload = {"job_details": True}
-        await self._websocket.send(json.dumps(payload))
-        return await self.recv()
+        return await self._request({"job_details": True})
 
     async def reset(self) -> StreamSocketClientResponse:
-        payload = {"reset_stream": True}
-        await self._websocket.send(json.dumps(payload))
-        return await self.recv()
+        return await self._request({"reset_stream": True})
 
 
 class StreamSocketClient(EventEmitterMixin):
-    def __init__(self, *, websocket: websockets_sync_connection.Connection):
+    def __init__(
+        self, *, websocket: websockets_sync_connection.Connection, json_codec: typing.Optional[JsonCodec] = None
+    ):
         super().__init__()
         self._websocket = websocket
+        self._json_codec = json_codec if json_codec is not None else create_json_codec()
 
     def __iter__(self):
         for message in self._websocket:
-            yield parse_obj_as(StreamSocketClientResponse, json.loads(message))  # type: ignore
+            yield parse_obj_as(StreamSocketClientResponse, self._json_codec.loads(message))  # type: ignore
 
     def start_listening(self):
         """
@@ -174,7 +517,7 @@ class StreamSocketClient(EventEmitterMixin):
         self._emit(EventType.OPEN, None)
         try:
             for raw_message in self._websocket:
-                json_data = json.loads(raw_message)
+                json_data = self._json_codec.loads(raw_message)
                 parsed = parse_obj_as(StreamSocketClientResponse, json_data)  # type: ignore
                 self._emit(EventType.MESSAGE, parsed)
         except (websockets.WebSocketException, JSONDecodeError) as exc:
@@ -194,7 +537,7 @@ class StreamSocketClient(EventEmitterMixin):
         Receive a message from the websocket connection.
         """
         data = self._websocket.recv()
-        json_data = json.loads(data)
+        json_data = self._json_codec.loads(data)
         return parse_obj_as(StreamSocketClientResponse, json_data)  # type: ignore
 
     def _send(self, data: typing.Any) -> None:
@@ -202,30 +545,23 @@ class StreamSocketClient(EventEmitterMixin):
         Send a message to the websocket connection.
         """
         if isinstance(data, dict):
-            data = json.dumps(data)
+            data = self._json_codec.dumps(data)
         self._websocket.send(data)
 
     def _send_model(self, data: typing.Any) -> None:
         """
         Send a Pydantic model to the websocket connection.
         """
-        self._send(data.dict())
+        self._websocket.send(self._json_codec.dumps_model(data))
 
     def send_facemesh(
         self,
-        landmarks: typing.List[typing.List[typing.List[float]]],
+        landmarks: FacemeshLandmarks,
         config: typing.Optional[Config] = None,
         payload_id: typing.Optional[str] = None,
     ) -> StreamSocketClientResponse:
-        landmarks_str = json.dumps(landmarks)
-        payload = {
-            "data": landmarks_str,
-            "models": config.dict() if config else None,
-            "raw_text": False,
-            "payload_id": payload_id,
-        }
-        payload = {k: v for k, v in payload.items() if v is not None}
-        self._websocket.send(json.dumps(payload))
+        payload = _facemesh_payload(self._json_codec, landmarks, config, payload_id)
+        self._websocket.send(self._json_codec.dumps(payload))
         return self.recv()
 
     def send_text(
@@ -234,47 +570,66 @@ class StreamSocketClient(EventEmitterMixin):
         config: typing.Optional[Config] = None,
         payload_id: typing.Optional[str] = None,
     ) -> StreamSocketClientResponse:
-        payload = {
-            "data": text,
-            "models": config.dict() if config else None,
-            "raw_text": True,
-            "payload_id": payload_id,
-        }
-        payload = {k: v for k, v in payload.items() if v is not None}
-        self._websocket.send(json.dumps(payload))
+        self._websocket.send(self._json_codec.dumps(_text_payload(text, config, payload_id)))
         return self.recv()
 
     def send_file(
         self,
-        file_: typing.Union[str, Path],
+        file_: FileSource,
         config: typing.Optional[Config] = None,
         payload_id: typing.Optional[str] = None,
     ) -> StreamSocketClientResponse:
-        try:
-            with open(file_, "rb") as f:
-                bytes_data = base64.b64encode(f.read()).decode()
-        except:
-            if isinstance(file_, Path):
-                raise ApiError(body=f"Failed to open file: {file_}")
-            # If you cannot open the file, assume you were passed a b64 string, not a file path
-            bytes_data = str(file_)
-
-        payload = {
-            "data": bytes_data,
-            "models": config.dict() if config else None,
-            "raw_text": False,
-            "payload_id": payload_id,
-        }
-        payload = {k: v for k, v in payload.items() if v is not None}
-        self._websocket.send(json.dumps(payload))
+        """
+        Send a file for predictions. `file_` may be a path, the file's bytes, or a binary file object read from
+        its current position; a string that is not a path to a file is sent as already base64-encoded data.
+        """
+        self._websocket.send(_dumps_payload(self._json_codec, _file_payload(file_, config, payload_id)))
         return self.recv()
 
+    def send_facemesh_batch(
+        self,
+        landmarks: typing.Union[FacemeshLandmarks, typing.Iterable[typing.Any]],
+        config: typing.Optional[Config] = None,
+        *,
+        max_meshes: int = MAX_FACEMESH_MESHES,
+        precision: int = DEFAULT_FACEMESH_PRECISION,
+    ) -> typing.List[typing.Optional[StreamModelPredictionsFacemeshPredictionsItem]]:
+        """
+        Send any number of facemeshes packed `max_meshes` to a payload, and return the facemesh prediction for
+        each mesh in order. See `AsyncStreamSocketClient.send_facemesh_batch`.
+        """
+        results = []
+        for batch in batch_landmarks(landmarks, max_meshes):
+            payload = _facemesh_payload(self._json_codec, batch, config, None, precision)
+            self._websocket.send(self._json_codec.dumps(payload))
+            results.append((len(batch), self.recv()))
+        return split_facemesh_predictions(results)
+
+    def send_file_segmented(
+        self,
+        file_: MediaSource,
+        config: typing.Optional[Config] = None,
+        *,
+        segment_seconds: float = DEFAULT_SEGMENT_SECONDS,
+        overlap_seconds: float = 0.0,
+        pcm_format: typing.Optional[PcmFormat] = None,
+    ) -> StreamModelPredictions:
+        """
+        Send a recording longer than the stream API allows as consecutive segments, one at a time, and merge
+        their predictions onto the recording's timeline.
+        """
+        segments = iter_media_segments(
+            file_, segment_seconds=segment_seconds, overlap_seconds=overlap_seconds, pcm_format=pcm_format
+        )
+        results = [(segment, self.send_file(segment.data, config)) for segment in segments]
+        return merge_segment_predictions(results, overlap_seconds)
+
     def get_job_details(self) -> StreamSocketClientResponse:
         payload = {"job_details": True}
-        self._websocket.send(json.dumps(payload))
+        self._websocket.send(self._json_codec.dumps(payload))
         return self.recv()
 
     def reset(self) -> StreamSocketClientResponse:
         payload = {"reset_stream": True}
-        self._websocket.send(json.dumps(payload))
+        self._websocket.send(self._json_codec.dumps(payload))
         return self.recv()
@@ -0,0 +1,264 @@
+# THIS FILE IS MANUALLY MAINTAINED: see .fernignore
+"""A pool of expression measurement stream sockets that share one scoring API."""
+
+import asyncio
+import contextlib
+import dataclasses
+import time
+import typing
+
+import websockets
+
+from ....core.jsonable_encoder import jsonable_encoder
+from .socket_client import DEFAULT_PIPELINE_WINDOW, AsyncStreamSocketClient, StreamSocketClientResponse
+from .types.stream_models_endpoint_payload import StreamModelsEndpointPayload
+
+PoolStrategy = typing.Literal["round_robin", "least_loaded"]
+StreamPayload = typing.Union[StreamModelsEndpointPayload, typing.Dict[str, typing.Any]]
+SocketConnector = typing.Callable[[], typing.AsyncContextManager[AsyncStreamSocketClient]]
+
+# Errors that mean the socket itself is unusable, as opposed to an error message about one payload
+_CONNECTION_ERRORS = (websockets.WebSocketException, ConnectionError, OSError)
+
+
+@dataclasses.dataclass
+class StreamSocketMetrics:
+    """Usage of one socket in a `StreamSocketPool`."""
+
+    index: int
+    open: bool
+    in_flight: int
+    sent: int
+    completed: int
+    failed: int
+    """Payloads that failed because the socket broke."""
+    recycled: int
+    """Times the socket was closed after a failure and reopened on its next use."""
+    busy_seconds: float
+    """Time spent with at least one payload awaiting a response."""
+    open_seconds: float
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the time the socket has been open that it was busy."""
+        return self.busy_seconds / self.open_seconds if self.open_seconds > 0 else 0.0
+
+
+class _PooledSocket:
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.client: typing.Optional[AsyncStreamSocketClient] = None
+        self.lock = asyncio.Lock()
+        self.stack: typing.Optional[contextlib.AsyncExitStack] = None
+        self.in_flight = 0
+        self.sent = 0
+        self.completed = 0
+        self.failed = 0
+        self.recycled = 0
+        self._busy = 0.0
+        self._busy_since: typing.Optional[float] = None
+        self._open = 0.0
+        self._open_since: typing.Optional[float] = None
+
+    def begin(self) -> None:
+        if self.in_flight == 0 and self.client is not None:
+            self._busy_since = time.perf_counter()
+        self.in_flight += 1
+        self.sent += 1
+
+    def end(self) -> None:
+        self.in_flight -= 1
+        if self.in_flight == 0 and self._busy_since is not None:
+            self._busy += time.perf_counter() - self._busy_since
+            self._busy_since = None
+
+    def opened(self, client: AsyncStreamSocketClient, stack: contextlib.AsyncExitStack) -> None:
+        self.client = client
+        self.stack = stack
+        self._open_since = time.perf_counter()
+        # Payloads that waited for the connection count as busy from now
+        if self.in_flight and self._busy_since is None:
+            self._busy_since = self._open_since
+
+    async def close(self, error: typing.Optional[BaseException] = None) -> None:
+        client, stack, self.client, self.stack = self.client, self.stack, None, None
+        now = time.perf_counter()
+        if self._open_since is not None:
+            self._open += now - self._open_since
+            self._open_since = None
+        if self._busy_since is not None:
+            self._busy += now - self._busy_since
+            self._busy_since = None
+        if client is not None:
+            await client.stop_pipeline(error)
+        if stack is not None:
+            with contextlib.suppress(*_CONNECTION_ERRORS):
+                await stack.aclose()
+
+    def metrics(self) -> StreamSocketMetrics:
+        now = time.perf_counter()
+        busy = self._busy + (now - self._busy_since if self._busy_since is not None else 0.0)
+        open_ = self._open + (now - self._open_since if self._open_since is not None else 0.0)
+        return StreamSocketMetrics(
+            index=self.index,
+            open=self.client is not None,
+            in_flight=self.in_flight,
+            sent=self.sent,
+            completed=self.completed,
+            failed=self.failed,
+            recycled=self.recycled,
+            busy_seconds=busy,
+            open_seconds=open_,
+        )
+
+
+class StreamSocketPool:
+    """
+    Spreads expression measurement payloads across up to `size` stream sockets.
+
+    Sockets are opened on first use and run pipelined (see `AsyncStreamSocketClient.start_pipeline`), so each
+    one carries up to `window` payloads at a time. With `"least_loaded"` a new socket is only opened once every
+    open socket is busy; `"round_robin"` cycles through all `size` sockets. A socket whose connection breaks is
+    closed and reopened the next time it is picked, and the payload is retried on another socket up to
+    `retries` times.
+
+    Note that each socket is its own streaming job: payloads that rely on context from earlier ones on the
+    same socket, such as `stream_window_ms` for audio, should not be spread across a pool.
+
+    Examples
+    --------
+    from hume import AsyncHumeClient
+
+    client = AsyncHumeClient(api_key="YOUR_API_KEY")
+    async with client.expression_measurement.stream.pool(size=4) as pool:
+        result = await pool.score({"data": "Hello", "raw_text": True, "models": {"language": {}}})
+    """
+
+    def __init__(
+        self,
+        connect: SocketConnector,
+        *,
+        size: int = 4,
+        strategy: PoolStrategy = "least_loaded",
+        window: int = DEFAULT_PIPELINE_WINDOW,
+        retries: int = 1,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if strategy not in ("round_robin", "least_loaded"):
+            raise ValueError(f"Unknown pool strategy: {strategy!r}")
+        self._connect = connect
+        self._strategy = strategy
+        self._window = window
+        self._retries = retries
+        self._sockets = [_PooledSocket(i) for i in range(size)]
+        self._next = 0
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        return len(self._sockets)
+
+    async def __aenter__(self) -> "StreamSocketPool":
+        return self
+
+    async def __aexit__(self, *exc_info: typing.Any) -> None:
+        await self.aclose()
+
+    def _pick(self, exclude: typing.Container[int] = ()) -> _PooledSocket:
+        candidates = [s for s in self._sockets if s.index not in exclude] or self._sockets
+        if self._strategy == "round_robin":
+            while True:
+                socket = self._sockets[self._next % len(self._sockets)]
+                self._next += 1
+                if socket in candidates:
+                    return socket
+        # Prefer sockets that are already open when loads tie, so the pool only grows under load
+        return min(candidates, key=lambda s: (s.in_flight, s.client is None, s.index))
+
+    async def _open(self, socket: _PooledSocket) -> AsyncStreamSocketClient:
+        async with socket.lock:
+            if socket.client is None:
+                if self._closed:
+                    raise RuntimeError("The socket pool is closed")
+                stack = contextlib.AsyncExitStack()
+                try:
+                    client = await stack.enter_async_context(self._connect())
+                    client.start_pipeline(self._window)
+                except BaseException:
+                    await stack.aclose()
+                    raise
+                socket.opened(client, stack)
+            return socket.client
+
+    async def _recycle(self, socket: _PooledSocket, client: AsyncStreamSocketClient) -> None:
+        async with socket.lock:
+            # Another payload on the same socket may have recycled it already
+            if socket.client is client:
+                socket.recycled += 1
+                # Other payloads waiting on this socket fail the same way, so they are retried too
+                await socket.close(ConnectionError("The stream socket was closed after a connection error"))
+
+    async def _send(self, socket: _PooledSocket, payload: typing.Dict[str, typing.Any]) -> StreamSocketClientResponse:
+        socket.begin()
+        try:
+            client = await self._open(socket)
+            try:
+                response = await client.send_payload(payload)
+            except _CONNECTION_ERRORS:
+                socket.failed += 1
+                await self._recycle(socket, client)
+                raise
+            socket.completed += 1
+            return response
+        finally:
+            socket.end()
+
+    async def score(self, payload: StreamPayload) -> StreamSocketClientResponse:
+        """
+        Send one payload on the least loaded (or next) socket and return its predictions.
+
+        Parameters
+        ----------
+        payload : typing.Union[StreamModelsEndpointPayload, typing.Dict[str, typing.Any]]
+            The payload, as for `AsyncStreamSocketClient.send_publish`. A `payload_id` is generated if it has none.
+
+        Returns
+        -------
+        StreamSocketClientResponse
+        """
+        body = {k: v for k, v in jsonable_encoder(payload).items() if v is not None}
+        tried: typing.List[int] = []
+        while True:
+            socket = self._pick(exclude=tried)
+            tried.append(socket.index)
+            try:
+                return await self._send(socket, dict(body))
+            except _CONNECTION_ERRORS:
+                if len(tried) > self._retries or self._closed:
+                    raise
+
+    async def _each(
+        self, payload: typing.Dict[str, typing.Any], index: typing.Optional[int]
+    ) -> typing.List[StreamSocketClientResponse]:
+        sockets = [self._sockets[index]] if index is not None else [s for s in self._sockets if s.client is not None]
+        return list(await asyncio.gather(*(self._send(socket, dict(payload)) for socket in sockets)))
+
+    async def get_job_details(self, index: typing.Optional[int] = None) -> typing.List[StreamSocketClientResponse]:
+        """Job details of the socket at `index`, or of every open socket, in socket order."""
+        return await self._each({"job_details": True}, index)
+
+    async def reset(self, index: typing.Optional[int] = None) -> typing.List[StreamSocketClientResponse]:
+        """Reset the streaming context of the socket at `index`, or of every open socket."""
+        return await self._each({"reset_stream": True}, index)
+
+    def metrics(self) -> typing.List[StreamSocketMetrics]:
+        """Per-socket usage, in socket order."""
+        return [socket.metrics() for socket in self._sockets]
+
+    async def aclose(self) -> None:
+        """Close every open socket. Payloads still awaiting a response are cancelled."""
+        self._closed = True
+        for socket in self._sockets:
+            async with socket.lock:
+                await socket.close()
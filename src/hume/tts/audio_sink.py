@@ -0,0 +1,174 @@
+# THIS FILE IS MANUALLY MAINTAINED: see .fernignore
+"""Write the audio of a streamed TTS generation to a file as each chunk arrives."""
+
+import binascii
+import dataclasses
+import inspect
+import os
+import struct
+import time
+import typing
+
+import aiofiles
+
+from ..core.wav import parse_wav_header
+from .types.tts_output import TtsOutput
+
+AudioDestination = typing.Union[str, "os.PathLike[str]", typing.BinaryIO]
+
+_ID3_HEADER_SIZE = 10
+_MAX_WAV_SIZE = 0xFFFFFFFF
+
+
+@dataclasses.dataclass
+class AudioSinkMetrics:
+    """Progress of writing a TTS stream to a file."""
+
+    total_bytes: int = 0
+    """Decoded audio bytes written, including the single header kept at the start of the file."""
+
+    chunks: int = 0
+    """Audio chunks written. Timestamp messages are not counted."""
+
+    time_to_first_byte: typing.Optional[float] = None
+    """Seconds from the start of the write until the first audio bytes were written."""
+
+    elapsed: float = 0.0
+    """Seconds from the start of the write until the stream ended."""
+
+
+def _id3_size(data: memoryview) -> int:
+    if data.nbytes < _ID3_HEADER_SIZE or data[:3] != b"ID3":
+        return 0
+    # Tag size is a 28-bit "syncsafe" integer and excludes the header
+    return _ID3_HEADER_SIZE + (data[6] << 21 | data[7] << 14 | data[8] << 7 | data[9])
+
+
+class _AudioAssembler:
+    """
+    Decodes each chunk and turns a sequence of per-chunk audio files into one file.
+
+    Without `strip_headers`, every chunk of a WAV or MP3 generation is a complete file with its own header. Only
+    the first chunk keeps its header; later chunks contribute just their audio data. A file holds a single
+    generation, so a chunk from a second one is rejected rather than interleaved with the first.
+    """
+
+    def __init__(self) -> None:
+        self.metrics = AudioSinkMetrics()
+        self._start = time.perf_counter()
+        self._wav_data_offset: typing.Optional[int] = None
+        self._generation_id: typing.Optional[str] = None
+
+    def decode(self, chunk: TtsOutput) -> typing.Optional[memoryview]:
+        if chunk.type != "audio":
+            return None
+        if self._generation_id is None:
+            self._generation_id = chunk.generation_id
+        elif chunk.generation_id != self._generation_id:
+            raise ValueError(
+                "The stream holds more than one generation, which can't be written to a single file. "
+                "Request one generation (num_generations=1) per file."
+            )
+        data = memoryview(binascii.a2b_base64(chunk.audio))
+        first = self.metrics.chunks == 0
+        if chunk.audio_format == "wav":
+            wav_format, offset, size = parse_wav_header(data)
+            if first:
+                self._wav_data_offset = offset if wav_format is not None else None
+            elif wav_format is not None:
+                data = data[offset : offset + size]
+        elif chunk.audio_format == "mp3" and not first:
+            data = data[_id3_size(data) :]
+        self.metrics.chunks += 1
+        return data
+
+    def wrote(self, size: int) -> None:
+        if size and self.metrics.time_to_first_byte is None:
+            self.metrics.time_to_first_byte = time.perf_counter() - self._start
+        self.metrics.total_bytes += size
+
+    def finish(self) -> AudioSinkMetrics:
+        self.metrics.elapsed = time.perf_counter() - self._start
+        return self.metrics
+
+    def wav_size_fields(self) -> typing.List[typing.Tuple[int, bytes]]:
+        """(offset, value) pairs that make the kept WAV header describe the whole file."""
+        offset = self._wav_data_offset
+        total = self.metrics.total_bytes
+        if offset is None or total < offset:
+            return []
+        return [
+            (4, struct.pack("<I", min(total - 8, _MAX_WAV_SIZE))),
+            (offset - 4, struct.pack("<I", min(total - offset, _MAX_WAV_SIZE))),
+        ]
+
+
+def _is_path(destination: typing.Any) -> bool:
+    return isinstance(destination, (str, os.PathLike))
+
+
+def write_audio_stream(stream: typing.Iterable[TtsOutput], destination: AudioDestination) -> AudioSinkMetrics:
+    """
+    Write the audio from a `synthesize_json_streaming` response to a path or binary file object.
+
+    Chunks are decoded and written one at a time, so the generation is never held in memory. When the
+    destination is seekable, the sizes in a WAV header are updated to cover the whole file at the end.
+    """
+    if _is_path(destination):
+        with open(destination, "wb") as f:  # type: ignore[arg-type]
+            return write_audio_stream(stream, f)
+
+    writer = typing.cast(typing.BinaryIO, destination)
+    assembler = _AudioAssembler()
+    for chunk in stream:
+        data = assembler.decode(chunk)
+        if data is not None:
+            writer.write(data)
+            assembler.wrote(data.nbytes)
+
+    fields = assembler.wav_size_fields()
+    if fields and getattr(writer, "seekable", lambda: False)():
+        end = writer.tell()
+        start = end - assembler.metrics.total_bytes
+        for offset, value in fields:
+            writer.seek(start + offset)
+            writer.write(value)
+        writer.seek(end)
+    return assembler.finish()
+
+
+async def _maybe_await(result: typing.Any) -> typing.Any:
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
+async def write_audio_stream_async(
+    stream: typing.AsyncIterable[TtsOutput], destination: typing.Any
+) -> AudioSinkMetrics:
+    """
+    Write the audio from an async `synthesize_json_streaming` response to a path or binary file object.
+
+    Paths are written with `aiofiles`. File objects may have either synchronous or async `write` methods,
+    e.g. an `aiofiles` handle.
+    """
+    if _is_path(destination):
+        async with aiofiles.open(destination, mode="wb") as f:
+            return await write_audio_stream_async(stream, f)
+
+    assembler = _AudioAssembler()
+    async for chunk in stream:
+        data = assembler.decode(chunk)
+        if data is not None:
+            await _maybe_await(destination.write(data))
+            assembler.wrote(data.nbytes)
+
+    fields = assembler.wav_size_fields()
+    if fields and await _maybe_await(getattr(destination, "seekable", lambda: False)()):
+        end = await _maybe_await(destination.tell())
+        start = end - assembler.metrics.total_bytes
+        for offset, value in fields:
+            await _maybe_await(destination.seek(start + offset))
+            await _maybe_await(destination.write(value))
+        await _maybe_await(destination.seek(end))
+    return assembler.finish()
@@ -7,6 +7,7 @@ import typing
 from .. import core
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
 from ..core.request_options import RequestOptions
+from .audio_sink import AudioDestination, AudioSinkMetrics, write_audio_stream, write_audio_stream_async
 from .raw_client import AsyncRawTtsClient, RawTtsClient
 from .types.format import Format
 from .types.octave_version import OctaveVersion
@@ -104,7 +105,7 @@ class TtsClient:
         instant_mode : typing.Optional[bool]
 
         request_options : typing.Optional[RequestOptions]
-            Request-specific configuration.
+            Request-specific configuration. Pass `hedge` to send a duplicate request when the first is slow to respond, e.g. `{"hedge": {"percentile": 95}}`.
 
         Returns
         -------
@@ -214,7 +215,7 @@ class TtsClient:
         instant_mode : typing.Optional[bool]
 
         request_options : typing.Optional[RequestOptions]
-            Request-specific configuration. You can pass in configuration such as `chunk_size`, and more to customize the request and response.
+            Request-specific configuration. You can pass in configuration such as `chunk_size`, and more to customize the request and response. Pass `hedge` to send a duplicate request when the first is slow to respond, e.g. `{"hedge": {"percentile": 95}}`.
 
         Returns
         -------
@@ -463,6 +464,71 @@ class TtsClient:
         ) as r:
             yield from r.data
 
+    def synthesize_json_streaming_to_file(
+        self,
+        *,
+        file: AudioDestination,
+        utterances: typing.Sequence[PostedUtterance],
+        context: typing.Optional[PostedContext] = OMIT,
+        format: typing.Optional[Format] = OMIT,
+        include_timestamp_types: typing.Optional[typing.Sequence[TimestampType]] = OMIT,
+        num_generations: typing.Optional[int] = OMIT,
+        split_utterances: typing.Optional[bool] = OMIT,
+        strip_headers: typing.Optional[bool] = OMIT,
+        version: typing.Optional[OctaveVersion] = OMIT,
+        instant_mode: typing.Optional[bool] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> AudioSinkMetrics:
+        """
+        Streams synthesized speech like `synthesize_json_streaming` and writes the decoded audio to `file` as each
+        chunk arrives.
+
+        Parameters
+        ----------
+        file : AudioDestination
+            Path to write to or a binary file object.
+
+        The remaining parameters are those of `synthesize_json_streaming`. When `strip_headers` is not enabled, only
+        the first chunk's WAV or MP3 header is written, so the result is a single playable file. A file holds one
+        generation, so `num_generations` may not be more than 1.
+
+        Returns
+        -------
+        AudioSinkMetrics
+            Bytes written and time to the first audio byte.
+
+        Examples
+        --------
+        from hume import HumeClient
+        from hume.tts import FormatWav, PostedUtterance
+
+        client = HumeClient(
+            api_key="YOUR_API_KEY",
+        )
+        metrics = client.tts.synthesize_json_streaming_to_file(
+            file="speech.wav",
+            utterances=[PostedUtterance(text="Beauty is no quality in things themselves.")],
+            format=FormatWav(),
+        )
+        """
+        if num_generations is not OMIT and num_generations is not None and num_generations > 1:
+            raise ValueError("synthesize_json_streaming_to_file writes a single generation; num_generations must be 1")
+        return write_audio_stream(
+            self.synthesize_json_streaming(
+                utterances=utterances,
+                context=context,
+                format=format,
+                include_timestamp_types=include_timestamp_types,
+                num_generations=num_generations,
+                split_utterances=split_utterances,
+                strip_headers=strip_headers,
+                version=version,
+                instant_mode=instant_mode,
+                request_options=request_options,
+            ),
+            file,
+        )
+
     def convert_voice_file(
         self,
         *,
@@ -671,7 +737,7 @@ class AsyncTtsClient:
         instant_mode : typing.Optional[bool]
 
         request_options : typing.Optional[RequestOptions]
-            Request-specific configuration.
+            Request-specific configuration. Pass `hedge` to send a duplicate request when the first is slow to respond, e.g. `{"hedge": {"percentile": 95}}`.
 
         Returns
         -------
@@ -789,7 +855,7 @@ class AsyncTtsClient:
         instant_mode : typing.Optional[bool]
 
         request_options : typing.Optional[RequestOptions]
-            Request-specific configuration. You can pass in configuration such as `chunk_size`, and more to customize the request and response.
+            Request-specific configuration. You can pass in configuration such as `chunk_size`, and more to customize the request and response. Pass `hedge` to send a duplicate request when the first is slow to respond, e.g. `{"hedge": {"percentile": 95}}`.
 
         Returns
         -------
@@ -1065,6 +1131,71 @@ class AsyncTtsClient:
             async for _chunk in r.data:
                 yield _chunk
 
+    async def synthesize_json_streaming_to_file(
+        self,
+        *,
+        file: typing.Any,
+        utterances: typing.Sequence[PostedUtterance],
+        context: typing.Optional[PostedContext] = OMIT,
+        format: typing.Optional[Format] = OMIT,
+        include_timestamp_types: typing.Optional[typing.Sequence[TimestampType]] = OMIT,
+        num_generations: typing.Optional[int] = OMIT,
+        split_utterances: typing.Optional[bool] = OMIT,
+        strip_headers: typing.Optional[bool] = OMIT,
+        version: typing.Optional[OctaveVersion] = OMIT,
+        instant_mode: typing.Optional[bool] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> AudioSinkMetrics:
+        """
+        Streams synthesized speech like `synthesize_json_streaming` and writes the decoded audio to `file` as each
+        chunk arrives.
+
+        Parameters
+        ----------
+        file : typing.Any
+            Path to write to, written with aiofiles, or a binary file object with a synchronous or async `write`.
+
+        The remaining parameters are those of `synthesize_json_streaming`. When `strip_headers` is not enabled, only
+        the first chunk's WAV or MP3 header is written, so the result is a single playable file. A file holds one
+        generation, so `num_generations` may not be more than 1.
+
+        Returns
+        -------
+        AudioSinkMetrics
+            Bytes written and time to the first audio byte.
+
+        Examples
+        --------
+        from hume import AsyncHumeClient
+        from hume.tts import FormatWav, PostedUtterance
+
+        client = AsyncHumeClient(
+            api_key="YOUR_API_KEY",
+        )
+        metrics = await client.tts.synthesize_json_streaming_to_file(
+            file="speech.wav",
+            utterances=[PostedUtterance(text="Beauty is no quality in things themselves.")],
+            format=FormatWav(),
+        )
+        """
+        if num_generations is not OMIT and num_generations is not None and num_generations > 1:
+            raise ValueError("synthesize_json_streaming_to_file writes a single generation; num_generations must be 1")
+        return await write_audio_stream_async(
+            self.synthesize_json_streaming(
+                utterances=utterances,
+                context=context,
+                format=format,
+                include_timestamp_types=include_timestamp_types,
+                num_generations=num_generations,
+                split_utterances=split_utterances,
+                strip_headers=strip_headers,
+                version=version,
+                instant_mode=instant_mode,
+                request_options=request_options,
+            ),
+            file,
+        )
+
     async def convert_voice_file(
         self,
         *,
@@ -117,7 +117,7 @@ class RawStreamInputClient:
             headers.update(request_options["additional_headers"])
         try:
             with websockets_sync_client.connect(ws_url, additional_headers=headers) as protocol:
-                yield StreamInputSocketClient(websocket=protocol)
+                yield StreamInputSocketClient(websocket=protocol, json_codec=self._client_wrapper.get_json_codec())
         except InvalidWebSocketStatus as exc:
             status_code: int = get_status_code(exc)
             if status_code == 401:
@@ -227,7 +227,7 @@ class AsyncRawStreamInputClient:
             headers.update(request_options["additional_headers"])
         try:
             async with websockets_client_connect(ws_url, extra_headers=headers) as protocol:
-                yield AsyncStreamInputSocketClient(websocket=protocol)
+                yield AsyncStreamInputSocketClient(websocket=protocol, json_codec=self._client_wrapper.get_json_codec())
         except InvalidWebSocketStatus as exc:
             status_code: int = get_status_code(exc)
             if status_code == 401:
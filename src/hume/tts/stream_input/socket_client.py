@@ -1,12 +1,12 @@
 # This file was auto-generated by Fern from our API Definition.
 
-import json
 import typing
 from json.decoder import JSONDecodeError
 
 import websockets
 import websockets.sync.connection as websockets_sync_connection
 from ...core.events import EventEmitterMixin, EventType
+from ...core.json_codec import JsonCodec, create_json_codec
 from ...core.pydantic_utilities import parse_obj_as
 from ..types.publish_tts import PublishTts
 from ..types.tts_output import TtsOutput
@@ -20,16 +20,19 @@ StreamInputSocketClientResponse = typing.Union[TtsOutput]
 
 
 class AsyncStreamInputSocketClient(EventEmitterMixin):
-    def __init__(self, *, websocket: WebSocketClientProtocol):
+    def __init__(
+        self, *, websocket: WebSocketClientProtocol, json_codec: typing.Optional[JsonCodec] = None
+    ):
         super().__init__()
         self._websocket = websocket
+        self._json_codec = json_codec if json_codec is not None else create_json_codec()
 
     async def __aiter__(self):
         async for message in self._websocket:
             if isinstance(message, bytes):
                 yield message
             else:
-                yield parse_obj_as(StreamInputSocketClientResponse, json.loads(message))  # type: ignore
+                yield parse_obj_as(StreamInputSocketClientResponse, self._json_codec.loads(message))  # type: ignore
 
     async def start_listening(self):
         """
@@ -47,7 +50,7 @@ class AsyncStreamInputSocketClient(EventEmitterMixin):
                 if isinstance(raw_message, bytes):
                     parsed = raw_message
                 else:
-                    json_data = json.loads(raw_message)
+                    json_data = self._json_codec.loads(raw_message)
                     parsed = parse_obj_as(StreamInputSocketClientResponse, json_data)  # type: ignore
                 await self._emit_async(EventType.MESSAGE, parsed)
         except (websockets.WebSocketException, JSONDecodeError) as exc:
@@ -69,7 +72,7 @@ class AsyncStreamInputSocketClient(EventEmitterMixin):
         data = await self._websocket.recv()
         if isinstance(data, bytes):
             return data  # type: ignore
-        json_data = json.loads(data)
+        json_data = self._json_codec.loads(data)
         return parse_obj_as(StreamInputSocketClientResponse, json_data)  # type: ignore
 
     async def _send(self, data: typing.Any) -> None:
@@ -77,27 +80,30 @@ class AsyncStreamInputSocketClient(EventEmitterMixin):
         Send a message to the websocket connection.
         """
         if isinstance(data, dict):
-            data = json.dumps(data)
+            data = self._json_codec.dumps(data)
         await self._websocket.send(data)
 
     async def _send_model(self, data: typing.Any) -> None:
         """
         Send a Pydantic model to the websocket connection.
         """
-        await self._send(data.dict())
+        await self._websocket.send(self._json_codec.dumps_model(data))
 
 
 class StreamInputSocketClient(EventEmitterMixin):
-    def __init__(self, *, websocket: websockets_sync_connection.Connection):
+    def __init__(
+        self, *, websocket: websockets_sync_connection.Connection, json_codec: typing.Optional[JsonCodec] = None
+    ):
         super().__init__()
         self._websocket = websocket
+        self._json_codec = json_codec if json_codec is not None else create_json_codec()
 
     def __iter__(self):
         for message in self._websocket:
             if isinstance(message, bytes):
                 yield message
             else:
-                yield parse_obj_as(StreamInputSocketClientResponse, json.loads(message))  # type: ignore
+                yield parse_obj_as(StreamInputSocketClientResponse, self._json_codec.loads(message))  # type: ignore
 
     def start_listening(self):
         """
@@ -115,7 +121,7 @@ class StreamInputSocketClient(EventEmitterMixin):
                 if isinstance(raw_message, bytes):
                     parsed = raw_message
                 else:
-                    json_data = json.loads(raw_message)
+                    json_data = self._json_codec.loads(raw_message)
                     parsed = parse_obj_as(StreamInputSocketClientResponse, json_data)  # type: ignore
                 self._emit(EventType.MESSAGE, parsed)
         except (websockets.WebSocketException, JSONDecodeError) as exc:
@@ -137,7 +143,7 @@ class StreamInputSocketClient(EventEmitterMixin):
         data = self._websocket.recv()
         if isinstance(data, bytes):
             return data  # type: ignore
-        json_data = json.loads(data)
+        json_data = self._json_codec.loads(data)
         return parse_obj_as(StreamInputSocketClientResponse, json_data)  # type: ignore
 
     def _send(self, data: typing.Any) -> None:
@@ -145,11 +151,11 @@ class StreamInputSocketClient(EventEmitterMixin):
         Send a message to the websocket connection.
         """
         if isinstance(data, dict):
-            data = json.dumps(data)
+            data = self._json_codec.dumps(data)
         self._websocket.send(data)
 
     def _send_model(self, data: typing.Any) -> None:
         """
         Send a Pydantic model to the websocket connection.
         """
-        self._send(data.dict())
+        self._websocket.send(self._json_codec.dumps_model(data))
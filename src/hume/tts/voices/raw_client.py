@@ -107,7 +107,17 @@ class RawVoicesClient:
                     filter_tag=filter_tag,
                     request_options=request_options,
                 )
-                return SyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                _get_page = lambda _page_number: self.list(
+                    provider=provider,
+                    page_number=_page_number,
+                    page_size=page_size,
+                    ascending_order=ascending_order,
+                    filter_tag=filter_tag,
+                    request_options=request_options,
+                )
+                return SyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
@@ -322,7 +332,19 @@ class AsyncRawVoicesClient:
                         request_options=request_options,
                     )
 
-                return AsyncPager(has_next=_has_next, items=_items, get_next=_get_next, response=_parsed_response)
+                async def _get_page(_page_number: int):
+                    return await self.list(
+                        provider=provider,
+                        page_number=_page_number,
+                        page_size=page_size,
+                        ascending_order=ascending_order,
+                        filter_tag=filter_tag,
+                        request_options=request_options,
+                    )
+
+                return AsyncPager(
+                    has_next=_has_next, items=_items, get_next=_get_next, get_page=_get_page, response=_parsed_response
+                )
             if _response.status_code == 400:
                 raise BadRequestError(
                     headers=dict(_response.headers),
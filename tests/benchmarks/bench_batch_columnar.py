@@ -0,0 +1,82 @@
+"""
+Cost of loading batch job predictions for analysis.
+
+Compares parsing the predictions JSON into models, as `get_job_predictions` does, with converting the JSON
+straight to columns as `get_job_predictions_columnar` does. Requires NumPy.
+
+    python tests/benchmarks/bench_batch_columnar.py
+"""
+
+import json
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+from hume.core.pydantic_utilities import parse_obj_as
+from hume.expression_measurement.batch.columnar import predictions_to_columns
+from hume.expression_measurement.batch.types import UnionPredictResult
+
+FILES = 50
+FRAMES = 200
+EMOTIONS = [f"Emotion {i}" for i in range(48)]
+
+
+def _face(frame: int) -> Dict[str, Any]:
+    return {
+        "frame": frame,
+        "time": frame / 30,
+        "prob": random.random(),
+        "box": {"x": 1.0, "y": 2.0, "w": 3.0, "h": 4.0},
+        "emotions": [{"name": name, "score": random.random()} for name in EMOTIONS],
+    }
+
+
+def _predictions() -> List[Dict[str, Any]]:
+    return [
+        {
+            "source": {"type": "url", "url": f"https://example.com/{i}.mp4"},
+            "results": {
+                "predictions": [
+                    {
+                        "file": f"{i}.mp4",
+                        "models": {
+                            "face": {
+                                "grouped_predictions": [
+                                    {"id": "face_0", "predictions": [_face(f) for f in range(FRAMES)]}
+                                ]
+                            }
+                        },
+                    }
+                ],
+                "errors": [],
+            },
+        }
+        for i in range(FILES)
+    ]
+
+
+def _time(fn: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    body = json.dumps(_predictions())
+    print(f"{FILES * FRAMES} face predictions x {len(EMOTIONS)} emotions, {len(body) / 2**20:.1f} MiB of JSON")
+    cases = {
+        "parse models": lambda: parse_obj_as(List[UnionPredictResult], json.loads(body)),
+        "parse models + columns": lambda: predictions_to_columns(
+            parse_obj_as(List[UnionPredictResult], json.loads(body))  # type: ignore[arg-type]
+        ),
+        "raw json -> columns": lambda: predictions_to_columns(json.loads(body)),
+    }
+    for name, fn in cases.items():
+        print(f"{name:>24}: {_time(fn) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Peak memory and time of reading batch job predictions.
+
+Compares parsing the whole predictions JSON at once, as `get_job_predictions` does, with streaming it one
+source at a time as `iter_job_predictions` does. Only counts allocations made by Python (`tracemalloc`).
+
+    python tests/benchmarks/bench_batch_predictions_stream.py
+"""
+
+import json
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from hume.core.json_stream import iter_json_array
+from hume.core.pydantic_utilities import parse_obj_as
+from hume.expression_measurement.batch.types import UnionPredictResult
+
+FILES = 50
+FRAMES = 100
+CHUNK_SIZE = 64 * 1024
+EMOTIONS = [f"Emotion {i}" for i in range(48)]
+
+
+def _source(i: int) -> Dict[str, Any]:
+    face = [
+        {
+            "frame": f,
+            "time": f / 30,
+            "prob": random.random(),
+            "box": {"x": 1.0, "y": 2.0, "w": 3.0, "h": 4.0},
+            "emotions": [{"name": name, "score": random.random()} for name in EMOTIONS],
+        }
+        for f in range(FRAMES)
+    ]
+    return {
+        "source": {"type": "url", "url": f"https://example.com/{i}.mp4"},
+        "results": {
+            "predictions": [
+                {
+                    "file": f"{i}.mp4",
+                    "models": {"face": {"grouped_predictions": [{"id": "face_0", "predictions": face}]}},
+                }
+            ],
+            "errors": [],
+        },
+    }
+
+
+def _chunks(body: bytes) -> Iterator[bytes]:
+    for start in range(0, len(body), CHUNK_SIZE):
+        yield body[start : start + CHUNK_SIZE]
+
+
+def _whole(body: bytes) -> None:
+    # The response is read into memory before it is parsed
+    content = b"".join(_chunks(body))
+    for result in parse_obj_as(List[UnionPredictResult], json.loads(content)):
+        pass
+
+
+def _streamed(body: bytes) -> None:
+    for item in iter_json_array(_chunks(body)):
+        parse_obj_as(UnionPredictResult, item)  # type: ignore[arg-type]
+
+
+def _measure(fn: Callable[[bytes], None], body: bytes) -> Tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(body)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    body = json.dumps([_source(i) for i in range(FILES)]).encode()
+    print(f"{FILES} sources x {FRAMES} face predictions, {len(body) / 2**20:.1f} MiB of JSON")
+    for name, fn in {"get_job_predictions": _whole, "iter_job_predictions": _streamed}.items():
+        elapsed, peak = _measure(fn, body)
+        print(f"{name:>22}: {elapsed * 1000:8.1f} ms, peak {peak / 2**20:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Cost of serializing facemesh landmarks for a `send_facemesh` payload.
+
+Compares the vectorized fixed-precision path for NumPy arrays with serializing nested lists through the JSON
+codec, which is what every payload went through before. Requires NumPy.
+
+    python tests/benchmarks/bench_facemesh_encoding.py
+"""
+
+import timeit
+
+import numpy as np
+
+from hume.core.json_codec import create_json_codec
+from hume.expression_measurement.stream.stream.facemesh import encode_facemesh
+
+codec = create_json_codec()
+
+
+def main() -> None:
+    print(f"json codec: {type(codec).__name__}")
+    print(f"{'meshes':>7} {'path':>14} {'us/mesh':>9} {'bytes/mesh':>11}")
+    for meshes in (1, 10, 100):
+        landmarks = np.random.default_rng(0).random((meshes, 478, 3))
+        nested = landmarks.tolist()
+        cases = {
+            "lists": lambda: codec.dumps(nested),
+            "array (prev)": lambda: codec.dumps(landmarks.tolist()),
+            "array": lambda: encode_facemesh(codec, landmarks),
+        }
+        for name, fn in cases.items():
+            number = max(1, 2000 // meshes)
+            best = min(timeit.repeat(fn, number=number, repeat=5)) / number
+            print(f"{meshes:>7} {name:>14} {best / meshes * 1e6:>9.1f} {len(fn()) // meshes:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Cost of encoding representative request bodies with `jsonable_encoder`.
+
+Compares the single-pass path used for request bodies with the general recursive path, which is what every
+body went through before. Passing a custom encoder for a type that never occurs forces the general path, at the
+cost of one extra lookup per value.
+
+    python tests/benchmarks/bench_jsonable_encoder.py
+"""
+
+import timeit
+from typing import Any, Callable, Dict
+
+from hume.core.jsonable_encoder import jsonable_encoder
+from hume.empathic_voice.types import (
+    PostedConfigPromptSpec,
+    PostedEventMessageSpec,
+    PostedEventMessageSpecs,
+    PostedLanguageModel,
+    PostedTimeoutSpecs,
+    PostedUserDefinedToolSpec,
+    VoiceName,
+)
+from hume.tts.types import FormatMp3, PostedUtterance, PostedUtteranceVoiceWithName
+
+N = 200
+
+
+class _Never:
+    pass
+
+
+def _general(body: Any) -> Any:
+    return jsonable_encoder(body, custom_encoder={_Never: repr})
+
+
+TTS_BODY: Dict[str, Any] = {
+    "utterances": [
+        PostedUtterance(
+            text=f"Sentence number {i} of a long narration that is being synthesized.",
+            description="Warm and unhurried",
+            speed=1.1,
+            voice=PostedUtteranceVoiceWithName(name="Ava Song", provider="HUME_AI"),
+        )
+        for i in range(50)
+    ],
+    "context": ...,
+    "format": FormatMp3(),
+    "num_generations": 1,
+    "split_utterances": ...,
+    "strip_headers": ...,
+}
+
+CONFIG_BODY: Dict[str, Any] = {
+    "evi_version": "3",
+    "name": "Support agent",
+    "prompt": PostedConfigPromptSpec(id="prompt-id", version=0),
+    "voice": VoiceName(name="Ava Song", provider="HUME_AI"),
+    "language_model": PostedLanguageModel(model_provider="ANTHROPIC", model_resource="claude-3-7-sonnet-latest"),
+    "event_messages": PostedEventMessageSpecs(
+        on_new_chat=PostedEventMessageSpec(enabled=True, text="Hello! How can I help?"),
+        on_inactivity_timeout=PostedEventMessageSpec(enabled=False),
+        on_max_duration_timeout=PostedEventMessageSpec(enabled=False),
+    ),
+    "timeouts": PostedTimeoutSpecs(inactivity={"enabled": True, "duration_secs": 600}),
+    "tools": [PostedUserDefinedToolSpec(id=f"tool-{i}", version=i) for i in range(20)],
+    "builtin_tools": ...,
+    "webhooks": ...,
+}
+
+
+def _time(encode: Callable[[Any], Any], body: Any) -> float:
+    return timeit.timeit(lambda: encode(body), number=N) / N
+
+
+if __name__ == "__main__":
+    for label, body in (("tts synthesize", TTS_BODY), ("create_config", CONFIG_BODY)):
+        assert jsonable_encoder(body) == _general(body)
+        before = _time(_general, body)
+        after = _time(jsonable_encoder, body)
+        print(f"{label:15} general {before * 1e6:8.1f} us   single-pass {after * 1e6:8.1f} us   {before / after:5.1f}x")
@@ -0,0 +1,85 @@
+"""
+Time from handing an MP3 stream to a decoder until its first PCM bytes come out.
+
+Compares spawning ffmpeg for every stream (previous behaviour) with the warm ffmpeg worker pool and the
+in-process PyAV decoder. Decoders whose dependency is missing are skipped. The MP3 input is synthesized with
+PyAV unless a file is given.
+
+    python tests/benchmarks/bench_mp3_decoders.py [file.mp3]
+"""
+
+import asyncio
+import io
+import math
+import shutil
+import struct
+import sys
+import time
+from typing import AsyncIterator, Dict, List
+
+from hume.empathic_voice.chat.audio.decoders import AudioDecoder, FfmpegDecoder, PyAVDecoder
+
+STREAMS = 50
+CHUNK = 4096
+
+
+def _synthesize() -> bytes:
+    import av  # type: ignore
+
+    out = io.BytesIO()
+    container = av.open(out, "w", format="mp3")
+    stream = container.add_stream("mp3", rate=24000)
+    stream.layout = "mono"
+    frame = av.AudioFrame(format="s16", layout="mono", samples=24000)
+    frame.planes[0].update(b"".join(struct.pack("<h", int(8000 * math.sin(i / 10))) for i in range(24000)))
+    frame.sample_rate = 24000
+    for packet in list(stream.encode(frame)) + list(stream.encode(None)):
+        container.mux(packet)
+    container.close()
+    return out.getvalue()
+
+
+async def _chunks(data: bytes) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), CHUNK):
+        yield data[start : start + CHUNK]
+
+
+async def _time_to_first_pcm(decoder: AudioDecoder, data: bytes) -> List[float]:
+    timings = []
+    for _ in range(STREAMS):
+        start = time.perf_counter()
+        pcm = decoder.decode(_chunks(data))
+        await pcm.__anext__()
+        timings.append(time.perf_counter() - start)
+        async for _ in pcm:
+            pass
+        # Let a pooled worker be replaced between streams, as it would be between utterances
+        await asyncio.sleep(0.05)
+    return timings
+
+
+async def main(data: bytes) -> None:
+    decoders: Dict[str, AudioDecoder] = {}
+    if shutil.which("ffmpeg"):
+        decoders["ffmpeg spawn"] = FfmpegDecoder(pool_size=0)
+        pooled = FfmpegDecoder(pool_size=1)
+        await pooled.warm()
+        decoders["ffmpeg pool"] = pooled
+    try:
+        decoders["pyav"] = PyAVDecoder()
+    except ImportError:
+        pass
+    if not decoders:
+        sys.exit("Neither ffmpeg nor PyAV is available")
+
+    for label, decoder in decoders.items():
+        timings = sorted(await _time_to_first_pcm(decoder, data))
+        median = timings[len(timings) // 2]
+        print(f"{label:13} median {median * 1e3:7.2f} ms   worst {timings[-1] * 1e3:7.2f} ms")
+        if isinstance(decoder, FfmpegDecoder):
+            await decoder.aclose()
+
+
+if __name__ == "__main__":
+    data = open(sys.argv[1], "rb").read() if len(sys.argv) > 1 else _synthesize()
+    asyncio.run(main(data))
@@ -0,0 +1,101 @@
+"""
+Peak memory and time of uploading local files as multipart/form-data to a local HTTP server.
+
+Compares reading the files into memory before the request, httpx's own multipart encoding of open files, and
+`MultipartEncoder` given paths, as `start_inference_job_from_local_file` now uses. Only counts allocations made by
+Python (`tracemalloc`).
+
+    python tests/benchmarks/bench_multipart_upload.py
+"""
+
+import http.server
+import os
+import pathlib
+import tempfile
+import threading
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+import httpx
+
+from hume.core.multipart import MultipartEncoder
+
+FILES = 4
+FILE_SIZE = 32 * 1024 * 1024
+
+
+class _Drain(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                self.rfile.read(size + 2)
+                if size == 0:
+                    break
+        else:
+            remaining = int(self.headers["Content-Length"])
+            while remaining:
+                remaining -= len(self.rfile.read(min(remaining, 1024 * 1024)))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+def _read_up_front(client: httpx.Client, url: str, paths: List[pathlib.Path]) -> None:
+    files = [("file", (path.name, path.read_bytes())) for path in paths]
+    client.post(url, files=files).raise_for_status()
+
+
+def _httpx_files(client: httpx.Client, url: str, paths: List[pathlib.Path]) -> None:
+    handles = [open(path, "rb") for path in paths]
+    try:
+        client.post(url, files=[("file", handle) for handle in handles]).raise_for_status()
+    finally:
+        for handle in handles:
+            handle.close()
+
+
+def _encoder(client: httpx.Client, url: str, paths: List[pathlib.Path]) -> None:
+    encoder = MultipartEncoder([("file", path) for path in paths])
+    client.post(url, content=encoder, headers=encoder.headers).raise_for_status()
+
+
+def _measure(fn: Callable[[], None]) -> Tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Drain)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/v0/batch/jobs"
+    with tempfile.TemporaryDirectory() as root, httpx.Client(timeout=None) as client:
+        paths = []
+        for i in range(FILES):
+            path = pathlib.Path(root) / f"{i}.mp4"
+            path.write_bytes(os.urandom(FILE_SIZE))
+            paths.append(path)
+        print(f"{FILES} files x {FILE_SIZE / 2**20:.0f} MiB")
+        for name, fn in {
+            "bytes read up front": _read_up_front,
+            "httpx open files": _httpx_files,
+            "MultipartEncoder paths": _encoder,
+        }.items():
+            elapsed, peak = _measure(lambda: fn(client, url, paths))
+            print(f"{name:>22}: {elapsed * 1000:8.1f} ms, peak {peak / 2**20:7.1f} MiB")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Microbenchmark for `parse_obj_as` on EVI socket traffic.
+
+Compares the per-message cost of the cached validator path against building a fresh
+`pydantic.TypeAdapter` (the previous behaviour) for every message.
+
+    python tests/benchmarks/bench_parse_obj_as.py
+"""
+
+import timeit
+import typing
+
+import pydantic
+
+from hume.core.pydantic_utilities import IS_PYDANTIC_V2, parse_obj_as
+from hume.core.serialization import convert_and_respect_annotation_metadata
+from hume.empathic_voice.types.audio_output import AudioOutput
+from hume.empathic_voice.types.subscribe_event import SubscribeEvent
+
+AUDIO_OUTPUT = {"type": "audio_output", "id": "msg-1", "index": 3, "data": "UklGRiQAAABXQVZFZm10IBAAAAABAAEA" * 64}
+N = 2_000
+
+
+def _uncached(type_: typing.Any, object_: typing.Any) -> typing.Any:
+    dealiased = convert_and_respect_annotation_metadata(object_=object_, annotation=type_, direction="read")
+    if IS_PYDANTIC_V2:
+        return pydantic.TypeAdapter(type_).validate_python(dealiased)  # type: ignore[attr-defined]
+    return pydantic.parse_obj_as(type_, dealiased)
+
+
+def _report(label: str, type_: typing.Any) -> None:
+    before = timeit.timeit(lambda: _uncached(type_, AUDIO_OUTPUT), number=N) / N
+    after = timeit.timeit(lambda: parse_obj_as(type_, AUDIO_OUTPUT), number=N) / N
+    print(f"{label:<16} before {before * 1e6:9.1f} us/msg   after {after * 1e6:9.1f} us/msg   {before / after:6.1f}x")
+
+
+if __name__ == "__main__":
+    _report("AudioOutput", AudioOutput)
+    _report("SubscribeEvent", SubscribeEvent)
@@ -0,0 +1,78 @@
+"""
+Worst-case latency of the PCM playback callback over an hour of synthetic 48 kHz mono audio.
+
+Compares the previous callback, which kept a `bytes` buffer and re-sliced it on every block, with the
+preallocated ring buffer. Audio arrives in one-second chunks, as EVI sends it.
+
+    python tests/benchmarks/bench_pcm_ring_buffer.py [seconds]
+"""
+
+import asyncio
+import gc
+import queue
+import sys
+import time
+from typing import Callable, List
+
+from hume.empathic_voice.chat.audio.audio_utilities import PcmRingBuffer, _make_pcm_callback
+
+SAMPLE_RATE = 48_000
+# 5 ms blocks, so every chunk is consumed exactly
+BLOCKSIZE = 240
+CHUNK = b"\x01\x00" * SAMPLE_RATE
+
+
+def _legacy_callback(q: "queue.Queue[bytes]") -> Callable[..., None]:
+    buf = b""
+
+    def cb(outdata, frames, *_):
+        nonlocal buf
+        need = frames * 2
+        while len(buf) < need:
+            buf += q.get_nowait()
+        outdata[:need] = buf[:need]
+        buf = buf[need:]
+
+    return cb
+
+
+def _drive(cb: Callable[..., None], feed: Callable[[], None], seconds: int) -> List[float]:
+    out = bytearray(BLOCKSIZE * 2)
+    blocks_per_chunk = SAMPLE_RATE // BLOCKSIZE
+    timings = [0.0] * (seconds * blocks_per_chunk)
+    i = 0
+    gc.disable()
+    try:
+        for _ in range(seconds):
+            feed()
+            for _ in range(blocks_per_chunk):
+                start = time.perf_counter()
+                cb(out, BLOCKSIZE)
+                timings[i] = time.perf_counter() - start
+                i += 1
+    finally:
+        gc.enable()
+    return timings
+
+
+def _report(label: str, timings: List[float]) -> None:
+    timings.sort()
+    p99 = timings[int(len(timings) * 0.999)]
+    mean = sum(timings) / len(timings)
+    print(f"{label:8} worst {timings[-1] * 1e6:8.1f} us   p99.9 {p99 * 1e6:6.1f} us   mean {mean * 1e6:6.2f} us")
+
+
+def main(seconds: int) -> None:
+    q: "queue.Queue[bytes]" = queue.Queue()
+    _report("bytes", _drive(_legacy_callback(q), lambda: q.put(CHUNK), seconds))
+
+    loop = asyncio.new_event_loop()
+    ring = PcmRingBuffer(4 * len(CHUNK))
+    timings = _drive(_make_pcm_callback(ring, 1, loop), lambda: ring.write(CHUNK), seconds)
+    loop.close()
+    _report("ring", timings)
+    print(f"underruns {ring.underruns}   peak fill {ring.peak_fill_level} / {ring.capacity} bytes")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3600)
@@ -0,0 +1,73 @@
+"""
+Rejected requests and throughput of many workers against a rate-limited API.
+
+A mock TTS endpoint allows `SERVER_RATE` requests a second with `x-ratelimit-*` headers, and answers 429 with a
+`retry-after` beyond that. Workers share one client, with and without a client-side `RateLimiter` set a little
+above the server's rate, so that it has to adapt to the headers.
+
+    python tests/benchmarks/bench_rate_limit.py
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+import httpx
+
+from hume.client import HumeClient
+from hume.core.rate_limit import RateLimiter
+
+SERVER_RATE = 50.0
+REQUESTS = 300
+WORKERS = 16
+
+
+class _Server:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._window = int(time.time())
+        self._used = 0
+        self.rejected = 0
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            now = time.time()
+            if int(now) != self._window:
+                self._window, self._used = int(now), 0
+            reset = str(self._window + 1)
+            if self._used >= SERVER_RATE:
+                self.rejected += 1
+                return httpx.Response(429, headers={"retry-after": "1", "x-ratelimit-reset": reset})
+            self._used += 1
+            remaining = str(int(SERVER_RATE) - self._used)
+        return httpx.Response(200, json=[], headers={"x-ratelimit-remaining": remaining, "x-ratelimit-reset": reset})
+
+
+def _run(rate_limit: Optional[RateLimiter]) -> Tuple[float, int]:
+    server = _Server()
+    client = HumeClient(
+        api_key="key",
+        rate_limit=rate_limit,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(server.handle)),
+    )
+    start = time.perf_counter()
+    with ThreadPoolExecutor(WORKERS) as pool:
+        list(
+            pool.map(
+                lambda _: client.expression_measurement.batch.list_jobs(request_options={"max_retries": 100}),
+                range(REQUESTS),
+            )
+        )
+    return time.perf_counter() - start, server.rejected
+
+
+def main() -> None:
+    print(f"{REQUESTS} requests from {WORKERS} threads, server allows {SERVER_RATE:.0f}/s")
+    for name, limiter in {"no rate limit": None, "RateLimiter": RateLimiter(SERVER_RATE * 1.2)}.items():
+        elapsed, rejected = _run(limiter)
+        print(f"{name:>14}: {elapsed:6.2f} s, {REQUESTS / elapsed:6.1f} req/s, {rejected:5d} rejected with 429")
+
+
+if __name__ == "__main__":
+    main()
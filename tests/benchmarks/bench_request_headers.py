@@ -0,0 +1,69 @@
+"""
+Per-request cost of building request headers.
+
+Compares rebuilding and JSON-encoding the SDK headers on every request, as the client did before, with the
+cached base headers merged by `_merge_headers`. A whole request through `HttpClient` to an `httpx.MockTransport`
+is timed too, for scale.
+
+    python tests/benchmarks/bench_request_headers.py
+"""
+
+import platform
+import time
+import typing
+
+import httpx
+
+from hume.core.client_wrapper import SyncClientWrapper
+from hume.core.http_client import _merge_headers
+from hume.core.jsonable_encoder import jsonable_encoder
+from hume.core.remove_none_from_dict import remove_none_from_dict
+from hume.environment import HumeClientEnvironment
+
+REQUESTS = 20_000
+
+
+def _uncached_headers(api_key: str) -> typing.Dict[str, str]:
+    headers = {
+        "User-Agent": "hume/0.13.11",
+        "X-Fern-Language": "Python",
+        "X-Fern-Runtime": f"python/{platform.python_version()}",
+        "X-Fern-Platform": f"{platform.system().lower()}/{platform.release()}",
+        "X-Fern-SDK-Name": "hume",
+        "X-Fern-SDK-Version": "0.13.11",
+    }
+    headers["X-Hume-Api-Key"] = api_key
+    return headers
+
+
+def _merge_before(base: typing.Dict[str, str], headers: typing.Dict[str, str]) -> typing.Dict[str, str]:
+    return jsonable_encoder(remove_none_from_dict({**base, **headers}))
+
+
+def _time(fn: typing.Callable[[], object]) -> float:
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        fn()
+    return (time.perf_counter() - start) / REQUESTS
+
+
+def main() -> None:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    wrapper = SyncClientWrapper(
+        api_key="key", environment=HumeClientEnvironment.PROD, httpx_client=httpx.Client(transport=transport)
+    )
+    client = wrapper.httpx_client
+    client.base_url = lambda: "https://api.hume.ai"
+    extra = {"Accept": "application/json"}
+
+    timings = {
+        "headers before": lambda: _merge_before(_uncached_headers("key"), extra),
+        "headers after": lambda: _merge_headers(wrapper.get_base_headers(), extra, None),
+        "whole request": lambda: client.request("v0/batch/jobs", method="GET", headers=extra),
+    }
+    for name, fn in timings.items():
+        print(f"{name:>16}: {_time(fn) * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
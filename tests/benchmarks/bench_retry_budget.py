@@ -0,0 +1,87 @@
+"""
+Load on a failing API from clients that retry.
+
+A mock endpoint succeeds until an outage, then answers 503 to everything. Worker threads keep sending requests
+with `max_retries=3`, through a plain client, one with a `RetryBudget`, and one with a `RetryBudget` and a
+`CircuitBreaker`. Counts the requests that reached the endpoint during the outage. Backoff delays are scaled down
+so the run takes seconds.
+
+    python tests/benchmarks/bench_retry_budget.py
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+import httpx
+
+import hume.core.http_client as http_client
+from hume.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from hume.core.http_client import HttpClient
+from hume.core.retry_budget import RetryBudget
+
+HEALTHY_REQUESTS = 500
+OUTAGE_REQUESTS = 500
+WORKERS = 16
+
+
+class _Server:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.down = False
+        self.outage_requests = 0
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            if not self.down:
+                return httpx.Response(200, json={})
+            self.outage_requests += 1
+        return httpx.Response(503)
+
+
+def _run(retry_budget: Optional[RetryBudget], circuit_breaker: Optional[CircuitBreaker]) -> Dict[str, int]:
+    server = _Server()
+    client = HttpClient(
+        httpx_client=httpx.Client(transport=httpx.MockTransport(server.handle)),
+        base_timeout=lambda: None,
+        base_headers=lambda: {},
+        base_url=lambda: "https://api.hume.ai",
+        retry_budget=retry_budget,
+        circuit_breaker=circuit_breaker,
+    )
+    rejected = 0
+
+    def call(_: int) -> None:
+        nonlocal rejected
+        try:
+            client.request("v0/tts", method="POST", request_options={"max_retries": 3})
+        except CircuitOpenError:
+            rejected += 1
+
+    with ThreadPoolExecutor(WORKERS) as pool:
+        list(pool.map(call, range(HEALTHY_REQUESTS)))
+        server.down = True
+        list(pool.map(call, range(OUTAGE_REQUESTS)))
+    return {"sent": server.outage_requests, "failed fast": rejected}
+
+
+def main() -> None:
+    http_client.INITIAL_RETRY_DELAY_SECONDS = 0.001
+    print(f"{OUTAGE_REQUESTS} requests from {WORKERS} threads during an outage, max_retries=3")
+    for name, budget, breaker in [
+        ("plain", None, None),
+        ("RetryBudget", RetryBudget(), None),
+        ("+ CircuitBreaker", RetryBudget(), CircuitBreaker()),
+    ]:
+        start = time.perf_counter()
+        counts = _run(budget, breaker)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:>16}: {counts['sent']:5d} requests reached the API, "
+            f"{counts['failed fast']:4d} failed fast, {elapsed:5.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Peak memory and time to build the websocket frame for `send_file` from large inputs.
+
+Compares building the frame straight from the file (memory-mapped where possible) with reading the whole file,
+base64-encoding it and serializing the payload dict, which is what `send_file` did before. Memory mapped pages
+belong to the page cache and are not counted by `tracemalloc`.
+
+    python tests/benchmarks/bench_send_file_frame.py
+"""
+
+import base64
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from hume.core.json_codec import create_json_codec
+from hume.expression_measurement.stream.stream.socket_client import _dumps_payload, _file_payload
+
+SIZES_MB = (1, 10, 50)
+
+codec = create_json_codec()
+
+
+def previous(path: str) -> str:
+    with open(path, "rb") as f:
+        bytes_data = base64.b64encode(f.read()).decode()
+    return codec.dumps({"data": bytes_data, "raw_text": False})
+
+
+def current(path: str) -> str:
+    return _dumps_payload(codec, _file_payload(path, None, None))
+
+
+def measure(fn: Callable[[str], Any], path: str) -> "tuple[float, float]":
+    fn(path)
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    print(f"json codec: {type(codec).__name__}")
+    print(f"{'size':>8} {'path':>10} {'time ms':>10} {'peak MiB':>10}")
+    for size in SIZES_MB:
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(os.urandom(size * 2**20))
+        try:
+            for name, fn in (("previous", previous), ("current", current)):
+                elapsed, peak = measure(fn, f.name)
+                print(f"{size:>6}MB {name:>10} {elapsed * 1000:>10.1f} {peak:>10.1f}")
+        finally:
+            os.unlink(f.name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Per-frame parse cost of EVI `SubscribeEvent` traffic dominated by `audio_output` frames.
+
+Compares validating against the whole union (previous behaviour) with dispatching on the `type` field.
+
+    python tests/benchmarks/bench_subscribe_event.py
+"""
+
+import json
+import timeit
+
+from hume.core.pydantic_utilities import parse_obj_as, parse_union_obj_as
+from hume.empathic_voice.types.subscribe_event import SubscribeEvent
+
+AUDIO_OUTPUT = json.dumps({"type": "audio_output", "id": "msg-1", "index": 3, "data": "UklGRiQAAABXQVZF" * 256})
+ASSISTANT_MESSAGE = json.dumps(
+    {
+        "type": "assistant_message",
+        "id": "msg-1",
+        "message": {"role": "assistant", "content": "Hello there."},
+        "from_text": False,
+        "is_quick_response": False,
+        "models": {},
+    }
+)
+# Roughly what a spoken assistant turn looks like on the wire.
+FRAMES = [AUDIO_OUTPUT] * 9 + [ASSISTANT_MESSAGE]
+N = 200
+
+
+def _union() -> None:
+    for frame in FRAMES:
+        parse_obj_as(SubscribeEvent, json.loads(frame))  # type: ignore[arg-type]
+
+
+def _dispatch() -> None:
+    for frame in FRAMES:
+        parse_union_obj_as(SubscribeEvent, json.loads(frame))  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    before = timeit.timeit(_union, number=N) / (N * len(FRAMES))
+    after = timeit.timeit(_dispatch, number=N) / (N * len(FRAMES))
+    print(f"union {before * 1e6:9.1f} us/frame   dispatch {after * 1e6:9.1f} us/frame   {before / after:6.1f}x")
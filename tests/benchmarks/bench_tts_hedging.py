@@ -0,0 +1,82 @@
+"""
+Latency percentiles of `synthesize_json` against a TTS stand-in with a slow tail, with and without hedging.
+
+The local server answers most requests after `FAST_SECONDS` and a `SLOW_FRACTION` of them after `SLOW_SECONDS`.
+Reports p50 and p99 of the call and how many requests the server received.
+
+    python tests/benchmarks/bench_tts_hedging.py
+"""
+
+import http.server
+import json
+import random
+import statistics
+import threading
+import time
+from typing import List, Optional
+
+from hume.client import HumeClient
+from hume.core.hedging import HedgePolicy
+from hume.tts import PostedUtterance
+
+CALLS = 300
+FAST_SECONDS = 0.02
+SLOW_SECONDS = 1.0
+SLOW_FRACTION = 0.05
+BODY = json.dumps({"generations": [], "request_id": "bench"}).encode()
+
+
+class _TailResponder(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    received = 0
+    lock = threading.Lock()
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        with self.lock:
+            type(self).received += 1
+        time.sleep(SLOW_SECONDS if random.random() < SLOW_FRACTION else FAST_SECONDS)
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+def _run(base_url: str, hedge: Optional[HedgePolicy]) -> List[float]:
+    client = HumeClient(api_key="key", base_url=base_url)
+    latencies = []
+    for _ in range(CALLS):
+        start = time.perf_counter()
+        client.tts.synthesize_json(
+            utterances=[PostedUtterance(text="Hello")],
+            request_options={"hedge": hedge} if hedge is not None else None,
+        )
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main() -> None:
+    random.seed(0)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _TailResponder)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    print(f"{CALLS} calls, {SLOW_FRACTION:.0%} of responses take {SLOW_SECONDS:.1f} s")
+    for name, hedge in {"no hedging": None, "hedge at p90": HedgePolicy(percentile=90)}.items():
+        _TailResponder.received = 0
+        latencies = sorted(_run(base_url, hedge))
+        p50 = statistics.median(latencies)
+        p99 = latencies[int(len(latencies) * 0.99) - 1]
+        print(f"{name:>13}: p50 {p50 * 1000:7.1f} ms, p99 {p99 * 1000:7.1f} ms, {_TailResponder.received} requests")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
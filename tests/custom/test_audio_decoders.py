@@ -0,0 +1,108 @@
+import asyncio
+import io
+import math
+import os
+import signal
+import stat
+import struct
+from pathlib import Path
+from typing import AsyncIterator, List
+
+import pytest
+
+from hume.empathic_voice.chat.audio.decoders import FfmpegDecoder, _skip_id3, create_audio_decoder
+
+
+async def _chunks(data: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def _collect(chunks: AsyncIterator[bytes]) -> List[bytes]:
+    return [chunk async for chunk in chunks]
+
+
+def _mp3(seconds: float = 0.5, sample_rate: int = 24000) -> bytes:
+    av = pytest.importorskip("av")
+    out = io.BytesIO()
+    container = av.open(out, "w", format="mp3")
+    stream = container.add_stream("mp3", rate=sample_rate)
+    stream.layout = "mono"
+    samples = int(sample_rate * seconds)
+    frame = av.AudioFrame(format="s16", layout="mono", samples=samples)
+    frame.planes[0].update(b"".join(struct.pack("<h", int(8000 * math.sin(i / 10))) for i in range(samples)))
+    frame.sample_rate = sample_rate
+    for packet in stream.encode(frame):
+        container.mux(packet)
+    for packet in stream.encode(None):
+        container.mux(packet)
+    container.close()
+    return out.getvalue()
+
+
+def test_skip_id3_drops_tag_split_across_chunks() -> None:
+    tag = b"ID3\x04\x00\x00\x00\x00\x00\x05" + b"TTTTT"
+    chunks = asyncio.run(_collect(_skip_id3(_chunks(tag + b"\xff\xfbAUDIO", 4))))
+    assert b"".join(chunks) == b"\xff\xfbAUDIO"
+
+
+def test_skip_id3_passes_untagged_audio_through() -> None:
+    chunks = asyncio.run(_collect(_skip_id3(_chunks(b"\xff\xfbAUDIO", 2))))
+    assert b"".join(chunks) == b"\xff\xfbAUDIO"
+
+
+def test_create_audio_decoder() -> None:
+    decoder = create_audio_decoder("ffmpeg", sample_rate=24000, channels=1)
+    assert isinstance(decoder, FfmpegDecoder)
+    assert (decoder.sample_rate, decoder.channels) == (24000, 1)
+    assert create_audio_decoder(decoder) is decoder
+    with pytest.raises(ValueError):
+        create_audio_decoder("wav")  # type: ignore[arg-type]
+
+
+def test_pyav_decoder_streams_pcm() -> None:
+    mp3 = _mp3()
+    decoder = create_audio_decoder("pyav", sample_rate=48000, channels=2)
+    pcm = b"".join(asyncio.run(_collect(decoder.decode(_chunks(mp3, 512)))))
+    assert len(pcm) % 4 == 0
+    # 0.5 s at 48 kHz stereo, plus encoder padding
+    assert 0.5 <= len(pcm) / (48000 * 4) < 0.6
+
+
+def test_ffmpeg_decoder_reuses_warm_workers(tmp_path: Path) -> None:
+    # Stand-in for ffmpeg that copies stdin to stdout and ignores its arguments
+    executable = tmp_path / "fake-ffmpeg"
+    executable.write_text("#!/bin/sh\nexec cat\n")
+    executable.chmod(executable.stat().st_mode | stat.S_IXUSR)
+
+    async def run() -> None:
+        decoder = FfmpegDecoder(executable=os.fspath(executable), pool_size=1)
+        await decoder.warm()
+        warm = decoder._idle[0]
+        assert b"".join(await _collect(decoder.decode(_chunks(b"abc" * 10000, 1000)))) == b"abc" * 10000
+        assert warm.returncode == 0
+        await asyncio.sleep(0.1)
+        assert len(decoder._idle) == 1
+        assert b"".join(await _collect(decoder.decode(_chunks(b"xyz", 1)))) == b"xyz"
+        await decoder.aclose()
+
+    asyncio.run(run())
+
+
+def test_ffmpeg_decoder_kills_the_worker_of_a_cancelled_stream(tmp_path: Path) -> None:
+    # Stand-in for an ffmpeg that hangs without producing output
+    executable = tmp_path / "fake-ffmpeg"
+    executable.write_text("#!/bin/sh\nexec sleep 30\n")
+    executable.chmod(executable.stat().st_mode | stat.S_IXUSR)
+
+    async def run() -> None:
+        decoder = FfmpegDecoder(executable=os.fspath(executable), pool_size=1)
+        await decoder.warm()
+        worker = decoder._idle[0]
+        stream = decoder.decode(_chunks(b"abc", 1))
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(stream.__anext__(), 0.2)
+        assert worker.returncode == -signal.SIGKILL
+        await decoder.aclose()
+
+    asyncio.run(run())
@@ -0,0 +1,144 @@
+import asyncio
+import io
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from hume.expression_measurement.batch.artifacts import aiter_zip_members, extract_zip, iter_zip_members
+
+FILES: Dict[str, bytes] = {
+    "predictions/a.json": b'{"face": []}' * 1000,
+    "predictions/empty.csv": b"",
+    "stored.txt": b"not compressed",
+    "../outside.txt": b"kept inside the target directory",
+}
+
+
+class _Unseekable(io.RawIOBase):
+    # `zipfile` writes data descriptors instead of sizes when it can't seek back, as streamed archives do
+    def __init__(self) -> None:
+        self.data = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: Any) -> int:
+        self.data += b
+        return len(b)
+
+
+def _archive(streamed: bool) -> bytes:
+    out: Any = _Unseekable() if streamed else io.BytesIO()
+    with zipfile.ZipFile(out, "w") as z:
+        z.writestr("predictions/", b"")
+        for name, data in FILES.items():
+            compression = zipfile.ZIP_STORED if name == "stored.txt" else zipfile.ZIP_DEFLATED
+            z.writestr(name, data, compress_type=compression)
+    return bytes(out.data) if streamed else out.getvalue()
+
+
+def _chunks(data: bytes, size: int) -> List[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("streamed", [False, True], ids=["sized", "data-descriptor"])
+@pytest.mark.parametrize("size", [1, 7, 1 << 20])
+def test_members_are_unpacked_as_they_stream(streamed: bool, size: int) -> None:
+    members = {m.name: (m.size, m.read()) for m in iter_zip_members(_chunks(_archive(streamed), size), spool_size=64)}
+    assert members == {name: (len(data), data) for name, data in FILES.items()}
+
+
+def test_extract_stays_inside_the_target(tmp_path: Path) -> None:
+    written = extract_zip(_chunks(_archive(streamed=True), 100), str(tmp_path))
+    assert sorted(os.path.relpath(p, tmp_path) for p in written) == sorted(
+        ["predictions/a.json", "predictions/empty.csv", "stored.txt", "outside.txt"]
+    )
+    assert (tmp_path / "outside.txt").read_bytes() == FILES["../outside.txt"]
+    assert (tmp_path / "predictions" / "a.json").read_bytes() == FILES["predictions/a.json"]
+
+
+def test_truncated_and_corrupt_archives_raise(tmp_path: Path) -> None:
+    data = _archive(streamed=False)
+    with pytest.raises(zipfile.BadZipFile):
+        extract_zip([data[: len(data) // 2]], str(tmp_path))
+
+    corrupt = bytearray(data)
+    stored = corrupt.index(FILES["stored.txt"])
+    corrupt[stored] ^= 0xFF
+    with pytest.raises(zipfile.BadZipFile, match="CRC"):
+        list(iter_zip_members([bytes(corrupt)]))
+
+
+def test_member_files_are_closed_when_iteration_stops(monkeypatch: pytest.MonkeyPatch) -> None:
+    opened: List[Any] = []
+    spool = tempfile.SpooledTemporaryFile
+
+    def track(*args: Any, **kwargs: Any) -> Any:
+        opened.append(spool(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(tempfile, "SpooledTemporaryFile", track)
+    data = _archive(streamed=True)
+
+    # A single chunk completes every member at once
+    for member in iter_zip_members([data]):
+        break
+    assert len(opened) == len(FILES) and all(f.closed for f in opened)
+
+    async def first_member() -> None:
+        async def chunks() -> Any:
+            yield data
+
+        members = aiter_zip_members(chunks())
+        async for member in members:
+            break
+        await members.aclose()  # type: ignore[attr-defined]
+
+    opened.clear()
+    asyncio.run(first_member())
+    assert len(opened) == len(FILES) and all(f.closed for f in opened)
+
+    # The CRC check fails inside the chunk that completed the members before it
+    corrupt = bytearray(_archive(streamed=False))
+    corrupt[corrupt.index(FILES["stored.txt"])] ^= 0xFF
+    opened.clear()
+    with pytest.raises(zipfile.BadZipFile):
+        list(iter_zip_members([bytes(corrupt)]))
+    assert opened and all(f.closed for f in opened)
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    assert request.url.path == "/v0/batch/jobs/job-1/artifacts"
+    return httpx.Response(200, content=_archive(streamed=True))
+
+
+def test_client_extracts_artifacts(tmp_path: Path) -> None:
+    from hume.client import HumeClient
+
+    client = HumeClient(api_key="0000", httpx_client=httpx.Client(transport=httpx.MockTransport(_handler)))
+    batch = client.expression_measurement.batch
+
+    assert [m.name for m in batch.iter_job_artifact_members(id="job-1")] == list(FILES)
+    assert len(batch.extract_job_artifacts(id="job-1", path=str(tmp_path))) == len(FILES)
+    assert (tmp_path / "stored.txt").read_bytes() == FILES["stored.txt"]
+
+
+def test_async_client_extracts_artifacts(tmp_path: Path) -> None:
+    from hume.client import AsyncHumeClient
+
+    async def run() -> List[str]:
+        client = AsyncHumeClient(
+            api_key="0000", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        )
+        batch = client.expression_measurement.batch
+        names = [m.name async for m in batch.iter_job_artifact_members(id="job-1")]
+        assert names == list(FILES)
+        return await batch.extract_job_artifacts(id="job-1", path=str(tmp_path))
+
+    assert len(asyncio.run(run())) == len(FILES)
+    assert (tmp_path / "predictions" / "a.json").read_bytes() == FILES["predictions/a.json"]
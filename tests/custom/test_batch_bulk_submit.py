@@ -0,0 +1,162 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+import pytest
+
+from hume.core.api_error import ApiError
+from hume.expression_measurement.batch.bulk_submit import plan_submission
+from hume.expression_measurement.batch.types import InferenceBaseRequest, Models
+
+
+class _FakeBatchApi:
+    def __init__(self, rate_limited: int = 0, rejected: Optional[str] = None) -> None:
+        self.rate_limited = rate_limited
+        self.rejected = rejected
+        self.jobs: List[Dict[str, Any]] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v0/batch/jobs"
+        if self.rate_limited:
+            self.rate_limited -= 1
+            return httpx.Response(429, headers={"retry-after": "0"}, json={"message": "Too many requests"})
+        if request.headers["content-type"].startswith("multipart/form-data"):
+            parts = request.read().split(b"\r\n--")
+            names = [p.split(b'filename="')[1].split(b'"')[0] for p in parts if b'name="file"; filename="' in p]
+            if self.rejected is not None and self.rejected.encode() in names:
+                return httpx.Response(400, json={"message": "Invalid file"})
+            self.jobs.append({"files": sorted(name.decode() for name in names)})
+        else:
+            self.jobs.append({"urls": json.loads(request.read())["urls"]})
+        return httpx.Response(200, json={"job_id": f"job-{len(self.jobs)}"})
+
+    async def slow_handler(self, request: httpx.Request) -> httpx.Response:
+        """As `handler`, but uploads that are accepted take a moment, so they finish after a rejection."""
+        await request.aread()
+        if self.rejected is None or self.rejected.encode() not in request.content:
+            await asyncio.sleep(0.05)
+        return self.handler(request)
+
+
+def _files(tmp_path: Path, **contents: bytes) -> Dict[str, str]:
+    paths = {}
+    for name, data in contents.items():
+        path = tmp_path / f"{name}.wav"
+        path.write_bytes(data)
+        paths[name] = str(path)
+    return paths
+
+
+def test_plan_groups_by_count_and_bytes(tmp_path: Path) -> None:
+    paths = _files(tmp_path, a=b"a" * 60, b=b"b" * 60, c=b"c" * 10, d=b"d" * 10, e=b"e" * 200)
+    urls = [f"https://example.com/{i}.mp4" for i in range(3)]
+    plan = plan_submission(list(paths.values()) + urls, None, None, max_files_per_job=2, max_bytes_per_job=100)
+    assert [[item.source for item in job.sources] for job in plan.jobs] == [
+        [paths["a"]],
+        [paths["b"], paths["c"]],
+        [paths["d"]],
+        urls[:2],
+        urls[2:],
+        [paths["e"]],
+    ]
+
+
+def test_duplicates_and_ledger_are_skipped(tmp_path: Path) -> None:
+    from hume.client import HumeClient
+
+    paths = _files(tmp_path, a=b"same", b=b"same", c=b"other")
+    api = _FakeBatchApi()
+    batch = HumeClient(
+        api_key="0000", httpx_client=httpx.Client(transport=httpx.MockTransport(api.handler))
+    ).expression_measurement.batch
+    ledger = tmp_path / "ledger.sqlite"
+    config = InferenceBaseRequest(models=Models(prosody={}))
+
+    first = batch.start_bulk_inference_jobs([paths["a"], paths["b"]], json=config, ledger=ledger)
+    assert first == {paths["a"]: "job-1", paths["b"]: "job-1"}
+    assert api.jobs == [{"files": ["a.wav"]}]
+
+    # Only the new file is uploaded; the known content maps to its earlier job
+    second = batch.start_bulk_inference_jobs(
+        [paths["c"], paths["b"], "https://example.com/x.mp4"], json=config, ledger=ledger
+    )
+    assert second == {paths["c"]: "job-3", paths["b"]: "job-1", "https://example.com/x.mp4": "job-2"}
+    assert api.jobs[1:] == [{"urls": ["https://example.com/x.mp4"]}, {"files": ["c.wav"]}]
+
+    # Another configuration is a new submission
+    batch.start_bulk_inference_jobs([paths["a"]], json=InferenceBaseRequest(models=Models(face={})), ledger=ledger)
+    assert len(api.jobs) == 4
+
+
+def test_rate_limits_are_waited_out(tmp_path: Path) -> None:
+    from hume.client import HumeClient
+
+    paths = _files(tmp_path, a=b"a", b=b"b")
+    api = _FakeBatchApi(rate_limited=4)
+    batch = HumeClient(
+        api_key="0000", httpx_client=httpx.Client(transport=httpx.MockTransport(api.handler))
+    ).expression_measurement.batch
+    result = batch.start_bulk_inference_jobs(
+        list(paths.values()), max_files_per_job=1, request_options={"max_retries": 0}
+    )
+    assert sorted(result.values()) == ["job-1", "job-2"]
+
+    api.rate_limited = 10
+    with pytest.raises(ApiError) as error:
+        batch.start_bulk_inference_jobs(
+            [paths["a"]], rate_limit_retries=1, request_options={"max_retries": 0}
+        )
+    assert error.value.status_code == 429
+
+
+def test_async_bulk_submission(tmp_path: Path) -> None:
+    from hume.client import AsyncHumeClient
+
+    paths = _files(tmp_path, a=b"a", b=b"b", c=b"c")
+    api = _FakeBatchApi(rate_limited=1)
+
+    async def run() -> Dict[str, str]:
+        client = AsyncHumeClient(
+            api_key="0000", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(api.handler))
+        )
+        return await client.expression_measurement.batch.start_bulk_inference_jobs(
+            list(paths.values()), max_files_per_job=2, max_concurrency=2, request_options={"max_retries": 0}
+        )
+
+    result = asyncio.run(run())
+    assert list(result) == list(paths.values())
+    assert sorted(job["files"] for job in api.jobs) == [["a.wav", "b.wav"], ["c.wav"]]
+
+
+def test_async_failure_still_records_the_other_jobs(tmp_path: Path) -> None:
+    from hume.client import AsyncHumeClient
+
+    paths = _files(tmp_path, a=b"a", b=b"b", c=b"c")
+    api = _FakeBatchApi(rejected="a.wav")
+    ledger = tmp_path / "ledger.sqlite"
+
+    async def run() -> Dict[str, str]:
+        client = AsyncHumeClient(
+            api_key="0000", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(api.slow_handler))
+        )
+        return await client.expression_measurement.batch.start_bulk_inference_jobs(
+            list(paths.values()),
+            ledger=ledger,
+            max_files_per_job=1,
+            max_concurrency=3,
+            request_options={"max_retries": 0},
+        )
+
+    with pytest.raises(ApiError) as error:
+        asyncio.run(run())
+    assert error.value.status_code == 400
+    assert sorted(job["files"] for job in api.jobs) == [["b.wav"], ["c.wav"]]
+
+    # Resuming uploads only the job that failed
+    api.rejected = None
+    result = asyncio.run(run())
+    assert api.jobs[2:] == [{"files": ["a.wav"]}]
+    assert result[paths["a"]] == "job-3"
+    assert sorted(result.values()) == ["job-1", "job-2", "job-3"]
@@ -0,0 +1,151 @@
+import json
+import math
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from hume.core.pydantic_utilities import parse_obj_as
+from hume.expression_measurement.batch.columnar import predictions_to_columns
+from hume.expression_measurement.batch.types import UnionPredictResult
+
+np = pytest.importorskip("numpy")
+
+
+def _scores(**scores: float) -> List[Dict[str, Any]]:
+    return [{"name": name, "score": score} for name, score in scores.items()]
+
+
+def _face(frame: int, joy: float) -> Dict[str, Any]:
+    return {
+        "frame": frame,
+        "time": frame / 30,
+        "prob": 0.99,
+        "box": {"x": 1.0, "y": 2.0, "w": 3.0, "h": 4.0},
+        "emotions": _scores(Joy=joy, Anger=1 - joy),
+    }
+
+
+def _prosody(begin: float, **scores: float) -> Dict[str, Any]:
+    return {"text": "hi", "time": {"begin": begin, "end": begin + 1}, "emotions": _scores(**scores)}
+
+
+PREDICTIONS: List[Dict[str, Any]] = [
+    {
+        "source": {"type": "url", "url": "https://example.com/a.mp4"},
+        "results": {
+            "predictions": [
+                {
+                    "file": "a.mp4",
+                    "models": {
+                        "face": {"grouped_predictions": [{"id": "face_0", "predictions": [_face(0, 0.25), _face(3, 0.5)]}]},
+                        "prosody": {
+                            "grouped_predictions": [
+                                {"id": "unknown", "predictions": [_prosody(0.0, Joy=0.1, Calmness=0.2)]},
+                                # Same emotions in another order, then one the model hasn't returned before
+                                {"id": "unknown", "predictions": [_prosody(1.0, Calmness=0.3, Joy=0.4, Awe=0.5)]},
+                            ]
+                        },
+                    },
+                }
+            ],
+            "errors": [],
+        },
+    },
+    {"source": {"type": "url", "url": "https://example.com/b.mp4"}, "error": "Failed to download"},
+]
+
+
+def _check(columns: Dict[str, Any]) -> None:
+    assert sorted(columns) == ["face", "prosody"]
+
+    face = columns["face"]
+    assert len(face) == 2
+    assert face.emotions == ["Joy", "Anger"]
+    assert face.scores.dtype == np.float32
+    assert face.emotion("Joy").tolist() == [0.25, 0.5]
+    assert face.frame.tolist() == [0, 3]
+    assert face.time_begin.tolist() == face.time_end.tolist() == [0.0, 0.1]
+    assert face.box.tolist() == [[1.0, 2.0, 3.0, 4.0]] * 2
+    assert face.file.tolist() == ["a.mp4", "a.mp4"]
+    assert face.group.tolist() == ["face_0", "face_0"]
+
+    prosody = columns["prosody"]
+    assert prosody.emotions == ["Joy", "Calmness", "Awe"]
+    assert np.allclose(prosody.scores, [[0.1, 0.2, math.nan], [0.4, 0.3, 0.5]], equal_nan=True)
+    assert prosody.time_end.tolist() == [1.0, 2.0]
+    assert prosody.frame.tolist() == [-1, -1]
+    assert np.isnan(prosody.box).all()
+    assert prosody.text.tolist() == ["hi", "hi"]
+
+
+def test_raw_json_and_parsed_models_give_the_same_columns() -> None:
+    _check(predictions_to_columns(PREDICTIONS))
+    _check(predictions_to_columns(parse_obj_as(List[UnionPredictResult], PREDICTIONS)))  # type: ignore[arg-type]
+
+
+def test_select_models() -> None:
+    assert list(predictions_to_columns(PREDICTIONS, models=["prosody", "language"])) == ["prosody"]
+
+
+def test_arrow_and_parquet_export(tmp_path: Path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    columns = predictions_to_columns(PREDICTIONS)["prosody"]
+
+    table = columns.to_arrow()
+    assert table.num_rows == 2
+    assert table.column("Awe").to_pylist()[1] == pytest.approx(0.5)
+
+    path = tmp_path / "prosody.parquet"
+    columns.to_parquet(path)
+    assert pq.read_table(path).column_names == table.column_names
+
+
+def test_client_fetches_raw_predictions() -> None:
+    from hume.client import HumeClient
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v0/batch/jobs/job-1/predictions"
+        return httpx.Response(200, content=json.dumps(PREDICTIONS).encode())
+
+    client = HumeClient(api_key="0000", httpx_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    _check(client.expression_measurement.batch.get_job_predictions_columnar(id="job-1"))
+
+
+def test_client_streams_predictions() -> None:
+    from hume.client import HumeClient
+    from hume.core.api_error import ApiError
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v0/batch/jobs/missing/predictions":
+            return httpx.Response(404, json={"message": "Job not found"})
+        return httpx.Response(200, content=json.dumps(PREDICTIONS).encode())
+
+    client = HumeClient(api_key="0000", httpx_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    batch = client.expression_measurement.batch
+
+    results = list(batch.iter_job_predictions(id="job-1"))
+    assert [result.source.url for result in results] == ["https://example.com/a.mp4", "https://example.com/b.mp4"]
+    _check(predictions_to_columns(batch.iter_job_predictions(id="job-1", raw=True)))
+
+    with pytest.raises(ApiError) as error:
+        list(batch.iter_job_predictions(id="missing"))
+    assert error.value.status_code == 404
+
+
+def test_async_client_streams_predictions() -> None:
+    import asyncio
+
+    from hume.client import AsyncHumeClient
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=json.dumps(PREDICTIONS).encode())
+
+    async def collect() -> List[Any]:
+        client = AsyncHumeClient(
+            api_key="0000", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        return [item async for item in client.expression_measurement.batch.iter_job_predictions(id="job-1", raw=True)]
+
+    assert asyncio.run(collect()) == PREDICTIONS
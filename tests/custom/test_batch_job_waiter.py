@@ -0,0 +1,105 @@
+import asyncio
+import json
+import time
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+
+class _FakeJobs:
+    """Jobs that finish after a number of polls, served like the batch API."""
+
+    def __init__(self, polls_until_done: Dict[str, int]) -> None:
+        self.created = int(time.time() * 1000) - 60_000
+        self.remaining = dict(polls_until_done)
+        self.details_calls: List[str] = []
+        self.list_calls: List[Dict[str, Any]] = []
+
+    def _job(self, id: str) -> Dict[str, Any]:
+        created = self.created + int(id.split("-")[1])
+        if self.remaining[id] > 0:
+            state = {"status": "IN_PROGRESS", "created_timestamp_ms": created, "started_timestamp_ms": created}
+        else:
+            state = {
+                "status": "FAILED" if id == "job-2" else "COMPLETED",
+                "created_timestamp_ms": created,
+                "started_timestamp_ms": created,
+                "ended_timestamp_ms": created + 1,
+                **({"message": "bad media"} if id == "job-2" else {"num_predictions": 1, "num_errors": 0}),
+            }
+        return {"job_id": id, "type": "INFERENCE", "request": {"files": []}, "state": state}
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v0/batch/jobs":
+            params = request.url.params
+            self.list_calls.append({"status": params.get_list("status"), "after": int(params["timestamp_ms"])})
+            for id in self.remaining:
+                self.remaining[id] -= 1
+            jobs = [self._job(id) for id in sorted(self.remaining) if self.remaining[id] <= 0]
+            return httpx.Response(200, content=json.dumps(jobs).encode())
+        id = request.url.path.rsplit("/", 1)[1]
+        self.details_calls.append(id)
+        self.remaining[id] -= 1
+        return httpx.Response(200, content=json.dumps(self._job(id)).encode())
+
+
+def _client(jobs: _FakeJobs) -> Any:
+    from hume.client import HumeClient
+
+    return HumeClient(api_key="0000", httpx_client=httpx.Client(transport=httpx.MockTransport(jobs.handler)))
+
+
+def test_wait_for_job_polls_until_it_finishes() -> None:
+    jobs = _FakeJobs({"job-1": 3})
+    job = _client(jobs).expression_measurement.batch.wait_for_job("job-1", min_interval=0.01, max_interval=0.01)
+    assert job.state.status == "COMPLETED"
+    assert jobs.details_calls == ["job-1"] * 3
+
+
+def test_wait_for_jobs_yields_in_completion_order_and_times_out() -> None:
+    jobs = _FakeJobs({"job-1": 4, "job-2": 2, "job-3": 1})
+    batch = _client(jobs).expression_measurement.batch
+    finished = [
+        (job.job_id, job.state.status)
+        for job in batch.wait_for_jobs(["job-1", "job-2", "job-3"], min_interval=0.01, max_interval=0.01)
+    ]
+    assert finished == [("job-3", "COMPLETED"), ("job-2", "FAILED"), ("job-1", "COMPLETED")]
+
+    with pytest.raises(TimeoutError, match="job-4"):
+        _client(_FakeJobs({"job-4": 10**6})).expression_measurement.batch.wait_for_job(
+            "job-4", timeout=0.05, min_interval=0.01
+        )
+
+
+def test_many_jobs_are_polled_with_list_jobs() -> None:
+    ids = [f"job-{i}" for i in range(10, 20)]
+    jobs = _FakeJobs({id: 3 for id in ids})
+    batch = _client(jobs).expression_measurement.batch
+    finished = list(batch.wait_for_jobs(ids, min_interval=0.01, max_interval=0.01, list_threshold=5))
+    assert sorted(job.job_id for job in finished) == ids
+    # One round of details to learn when the jobs were created, then only listing
+    assert sorted(jobs.details_calls) == ids
+    assert jobs.list_calls[0] == {"status": ["COMPLETED", "FAILED"], "after": jobs.created + 9}
+
+
+def test_async_wait_for_jobs() -> None:
+    from hume.client import AsyncHumeClient
+
+    jobs = _FakeJobs({"job-1": 3, "job-2": 1})
+
+    async def run() -> List[str]:
+        client = AsyncHumeClient(
+            api_key="0000", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(jobs.handler))
+        )
+        batch = client.expression_measurement.batch
+        job = await batch.wait_for_job("job-2", min_interval=0.01)
+        assert job.state.status == "FAILED"
+        return [
+            job.job_id
+            async for job in batch.wait_for_jobs(
+                ["job-1", "job-2"], min_interval=0.01, max_interval=0.01, max_concurrency=1
+            )
+        ]
+
+    assert asyncio.run(run()) == ["job-2", "job-1"]
@@ -0,0 +1,75 @@
+import base64
+import io
+import json
+import wave
+from typing import Any, AsyncIterator, List
+
+from hume.core.wav import parse_wav_header
+from hume.empathic_voice.chat.audio.decoded_audio import DecodedAudioOutput
+from hume.empathic_voice.chat.socket_client import AsyncChatSocketClient
+from hume.empathic_voice.types.assistant_end import AssistantEnd
+from hume.empathic_voice.types.audio_output import AudioOutput
+
+
+def _wav(pcm: bytes, *, sample_rate: int = 48000, channels: int = 1) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm)
+    return buffer.getvalue()
+
+
+class _FakeWebsocket:
+    def __init__(self, messages: List[str]) -> None:
+        self._messages = messages
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        for message in self._messages:
+            yield message
+
+    async def recv(self) -> str:
+        return self._messages.pop(0)
+
+
+def _audio_output_message(pcm: bytes) -> str:
+    return json.dumps(
+        {"type": "audio_output", "id": "msg-1", "index": 2, "data": base64.b64encode(_wav(pcm)).decode()}
+    )
+
+
+def test_parse_wav_header() -> None:
+    pcm = bytes(range(200))
+    wav = memoryview(_wav(pcm, sample_rate=24000, channels=2))
+    wav_format, offset, size = parse_wav_header(wav)
+    assert wav_format is not None
+    assert (wav_format.sample_rate, wav_format.channels, wav_format.sample_width) == (24000, 2, 2)
+    assert bytes(wav[offset : offset + size]) == pcm
+
+    raw = memoryview(b"\x01\x02\x03\x04")
+    assert parse_wav_header(raw) == (None, 0, 4)
+
+
+def test_decoded_audio_output_views_pcm_without_copy() -> None:
+    pcm = b"\x10\x00" * 480
+    event = DecodedAudioOutput.from_message(json.loads(_audio_output_message(pcm)))
+    assert (event.id, event.index) == ("msg-1", 2)
+    assert bytes(event.pcm) == pcm
+    assert event.pcm.obj is event.wav.obj
+    assert event.header_size == 44
+
+
+async def test_chat_socket_decode_audio() -> None:
+    pcm = b"\x01\x00" * 16
+    messages = [_audio_output_message(pcm), json.dumps({"type": "assistant_end"})]
+
+    socket = AsyncChatSocketClient(websocket=_FakeWebsocket(list(messages)), decode_audio=True)  # type: ignore[arg-type]
+    decoded: List[Any] = [message async for message in socket]
+    assert isinstance(decoded[0], DecodedAudioOutput)
+    assert bytes(decoded[0].pcm) == pcm
+    assert isinstance(decoded[1], AssistantEnd)
+
+    socket = AsyncChatSocketClient(websocket=_FakeWebsocket(list(messages)))  # type: ignore[arg-type]
+    default: List[Any] = [message async for message in socket]
+    assert isinstance(default[0], AudioOutput)
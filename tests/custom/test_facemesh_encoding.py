@@ -0,0 +1,121 @@
+import asyncio
+import json
+from typing import Any, List
+
+import pytest
+
+from hume.core.api_error import ApiError
+from hume.core.json_codec import JsonCodec
+from hume.expression_measurement.stream.stream.facemesh import (
+    batch_landmarks,
+    encode_facemesh,
+    split_facemesh_predictions,
+)
+from hume.expression_measurement.stream.stream.types import (
+    StreamErrorMessage,
+    StreamModelPredictions,
+    StreamWarningMessage,
+)
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("scale", [0.001, 1.0, 2500.0])
+@pytest.mark.parametrize("precision", [0, 3, 6])
+def test_array_encoding_matches_rounded_values(scale: float, precision: int) -> None:
+    landmarks = np.random.default_rng(0).standard_normal((3, 478, 3)) * scale
+    decoded = np.array(json.loads(encode_facemesh(JsonCodec(), landmarks, precision)))
+    assert decoded.shape == landmarks.shape
+    assert np.array_equal(decoded, np.round(landmarks, precision))
+
+
+def test_array_encoding_edge_values() -> None:
+    landmarks = np.zeros((1, 478, 3), dtype=np.float32)
+    landmarks[0, :4, 0] = [-0.00004, -9.99996, 10.0, -123.5]
+    decoded = json.loads(encode_facemesh(JsonCodec(), landmarks, 4))
+    assert [point[0] for point in decoded[0][:4]] == [0.0, -10.0, 10.0, -123.5]
+    assert encode_facemesh(JsonCodec(), np.zeros((0, 478, 3))) == "[]"
+
+
+def test_invalid_arrays() -> None:
+    with pytest.raises(ValueError):
+        encode_facemesh(JsonCodec(), np.zeros((2, 468, 3)))
+    with pytest.raises(ValueError):
+        encode_facemesh(JsonCodec(), np.full((1, 478, 3), np.nan))
+
+
+def test_lists_are_serialized_unchanged() -> None:
+    landmarks = [[[0.123456789, 1.0, -2.5]] * 478]
+    assert encode_facemesh(JsonCodec(), landmarks) == JsonCodec().dumps(landmarks)
+
+
+def test_batches() -> None:
+    landmarks = np.zeros((250, 478, 3))
+    assert [len(batch) for batch in batch_landmarks(landmarks, 100)] == [100, 100, 50]
+
+    batches = list(batch_landmarks(iter(landmarks[:3]), 2))
+    assert [batch.shape for batch in batches] == [(2, 478, 3), (1, 478, 3)]
+    assert list(batch_landmarks([[[0.0] * 3] * 478] * 3, 2))[1] == [[[0.0] * 3] * 478]
+
+
+def _facemesh_response(count: int) -> StreamModelPredictions:
+    return StreamModelPredictions(
+        facemesh={"predictions": [{"emotions": [{"name": "Joy", "score": i}]} for i in range(count)]}  # type: ignore[arg-type]
+    )
+
+
+def test_split_predictions_per_mesh() -> None:
+    predictions = split_facemesh_predictions(
+        [(2, _facemesh_response(2)), (2, StreamWarningMessage(warning="No faces", code="W0105")), (2, _facemesh_response(1))]
+    )
+    assert len(predictions) == 6
+    assert [p is None for p in predictions] == [False, False, True, True, False, True]
+
+    with pytest.raises(ApiError):
+        split_facemesh_predictions([(1, StreamErrorMessage(error="Bad mesh", code="E0200"))])
+
+
+class _FacemeshSocket:
+    def __init__(self) -> None:
+        self.payloads: List[Any] = []
+        self._responses: "asyncio.Queue[str]" = asyncio.Queue()
+
+    async def send(self, message: str) -> None:
+        payload = json.loads(message)
+        self.payloads.append(payload)
+        meshes = json.loads(payload["data"])
+        response = {
+            "payload_id": payload.get("payload_id"),
+            "facemesh": {"predictions": [{"emotions": [{"name": "Joy", "score": m[0][0]}]} for m in meshes]},
+        }
+        self._responses.put_nowait(json.dumps(response))
+
+    async def recv(self) -> str:
+        return await self._responses.get()
+
+    def __aiter__(self) -> "_FacemeshSocket":
+        return self
+
+    async def __anext__(self) -> str:
+        return await self._responses.get()
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_send_facemesh_batch(pipelined: bool) -> None:
+    from hume.expression_measurement.stream.stream.socket_client import AsyncStreamSocketClient
+
+    landmarks = np.zeros((7, 478, 3))
+    landmarks[:, 0, 0] = np.arange(7) / 10
+
+    async def run() -> List[Any]:
+        websocket = _FacemeshSocket()
+        client = AsyncStreamSocketClient(websocket=websocket)  # type: ignore[arg-type]
+        if pipelined:
+            client.start_pipeline()
+        predictions = await client.send_facemesh_batch(landmarks, max_meshes=3)
+        await client.stop_pipeline()
+        assert len(websocket.payloads) == 3
+        return predictions
+
+    predictions = asyncio.run(run())
+    assert [p.emotions[0].score for p in predictions if p and p.emotions] == pytest.approx(np.arange(7) / 10)
@@ -0,0 +1,150 @@
+import asyncio
+import io
+import json
+import stat
+import wave
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from hume.core.api_error import ApiError
+from hume.expression_measurement.stream.stream.media_segments import (
+    MediaSegment,
+    PcmFormat,
+    iter_media_segments,
+    merge_segment_predictions,
+)
+from hume.expression_measurement.stream.stream.types import StreamErrorMessage, StreamModelPredictions
+
+RATE = 100
+# 12.5 seconds of mono audio where every sample is its own index
+PCM = b"".join(i.to_bytes(2, "little") for i in range(1250))
+
+
+def _wav(pcm: bytes = PCM) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(RATE)
+        w.writeframes(pcm)
+    return buffer.getvalue()
+
+
+def _frames(segment: MediaSegment) -> bytes:
+    with wave.open(io.BytesIO(segment.data), "rb") as w:
+        assert w.getframerate() == RATE
+        return w.readframes(w.getnframes())
+
+
+def test_wav_segments_overlap(tmp_path: Path) -> None:
+    path = tmp_path / "long.wav"
+    path.write_bytes(_wav())
+    segments = list(iter_media_segments(path, segment_seconds=5, overlap_seconds=1))
+
+    assert [(s.index, s.start, s.duration) for s in segments] == [(0, 0.0, 5.0), (1, 4.0, 5.0), (2, 8.0, 4.5)]
+    assert [_frames(s) for s in segments] == [PCM[0:1000], PCM[800:1800], PCM[1600:]]
+
+
+def test_pcm_segments_without_overlap() -> None:
+    segments = list(iter_media_segments(io.BytesIO(PCM[:1000]), segment_seconds=2.5, pcm_format=PcmFormat(RATE)))
+
+    assert [s.start for s in segments] == [0.0, 2.5]
+    assert b"".join(_frames(s) for s in segments) == PCM[:1000]
+
+
+def test_invalid_overlap() -> None:
+    with pytest.raises(ValueError):
+        list(iter_media_segments(io.BytesIO(_wav()), segment_seconds=1, overlap_seconds=1))
+
+
+def test_other_formats_are_cut_with_ffmpeg(tmp_path: Path) -> None:
+    ffprobe = tmp_path / "ffprobe"
+    ffprobe.write_text("#!/bin/sh\necho 12.0\n")
+    # Stand-in for ffmpeg that outputs the start offset it was given
+    ffmpeg = tmp_path / "ffmpeg"
+    ffmpeg.write_text('#!/bin/sh\nprintf "%s" "$5"\n')
+    for executable in (ffprobe, ffmpeg):
+        executable.chmod(executable.stat().st_mode | stat.S_IXUSR)
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"\x00\x00\x00\x18ftypmp42")
+
+    segments = list(
+        iter_media_segments(video, segment_seconds=5, overlap_seconds=1, ffmpeg=str(ffmpeg), ffprobe=str(ffprobe))
+    )
+    assert [s.start for s in segments] == [0.0, 4.0, 8.0]
+    assert [float(s.data) for s in segments] == [0.0, 4.0, 8.0]
+    assert segments[-1].duration == 4.0
+
+
+def _prosody(*begins: float) -> StreamModelPredictions:
+    return StreamModelPredictions(
+        prosody={"predictions": [{"time": {"begin": b, "end": b + 0.5}, "emotions": []} for b in begins]}  # type: ignore[arg-type]
+    )
+
+
+def _segment(index: int, start: float, duration: float = 5.0) -> MediaSegment:
+    return MediaSegment(index=index, start=start, duration=duration, data=b"")
+
+
+def test_merge_rebases_and_splits_overlaps() -> None:
+    merged = merge_segment_predictions(
+        [
+            (_segment(0, 0.0), _prosody(0.0, 4.0, 4.6)),
+            (_segment(1, 4.0), _prosody(0.0, 0.6, 4.9)),
+            (_segment(2, 8.0, 2.0), _prosody(0.0, 0.6)),
+        ],
+        overlap_seconds=1.0,
+    )
+    assert merged.prosody is not None and merged.prosody.predictions is not None
+    times = [(p.time.begin, p.time.end) for p in merged.prosody.predictions if p.time]
+    assert times == [(0.0, 0.5), (4.0, 4.5), (4.6, 5.1), (8.6, 9.1)]
+
+
+def test_merge_raises_on_segment_error() -> None:
+    with pytest.raises(ApiError):
+        merge_segment_predictions([(_segment(0, 0.0), StreamErrorMessage(error="too long", code="E0101"))])
+
+
+class _ProsodySocket:
+    """Answers each file payload with one prosody prediction at the start of the segment, after a short delay."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.frames: List[bytes] = []
+        self._responses: "asyncio.Queue[str]" = asyncio.Queue()
+
+    async def send(self, message: str) -> None:
+        payload: Dict[str, Any] = json.loads(message)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        asyncio.get_running_loop().call_later(0.01, self._respond, payload["payload_id"])
+
+    def _respond(self, payload_id: str) -> None:
+        self.in_flight -= 1
+        prediction = {"time": {"begin": 0.25, "end": 0.75}, "emotions": []}
+        self._responses.put_nowait(json.dumps({"payload_id": payload_id, "prosody": {"predictions": [prediction]}}))
+
+    def __aiter__(self) -> "_ProsodySocket":
+        return self
+
+    async def __anext__(self) -> str:
+        return await self._responses.get()
+
+
+def test_send_file_segmented_sends_concurrently() -> None:
+    from hume.expression_measurement.stream.stream.socket_client import AsyncStreamSocketClient
+
+    async def run() -> StreamModelPredictions:
+        websocket = _ProsodySocket()
+        client = AsyncStreamSocketClient(websocket=websocket)  # type: ignore[arg-type]
+        result = await client.send_file_segmented(io.BytesIO(_wav()), segment_seconds=1, concurrency=3)
+        assert websocket.max_in_flight == 3
+        assert not client.pipelined
+        return result
+
+    result = asyncio.run(run())
+    assert result.prosody is not None and result.prosody.predictions is not None
+    assert [p.time.begin for p in result.prosody.predictions if p.time] == [i + 0.25 for i in range(13)]
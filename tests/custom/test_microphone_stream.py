@@ -0,0 +1,94 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from hume.empathic_voice.chat.audio.asyncio_utilities import BoundedByteQueue, Stream
+from hume.empathic_voice.chat.audio.microphone import Microphone
+
+
+def _drain(queue: BoundedByteQueue) -> List[bytes]:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+def test_drop_oldest_keeps_freshest_chunks() -> None:
+    queue = BoundedByteQueue(2, "drop_oldest")
+    for chunk in (b"aa", b"bb", b"cc"):
+        queue.put_nowait(chunk)
+
+    assert queue.queued_bytes == 4
+    assert queue.dropped_bytes == 2
+    assert _drain(queue) == [b"bb", b"cc"]
+    assert queue.queued_bytes == 0
+
+
+def test_drop_newest_discards_incoming_chunk() -> None:
+    queue = BoundedByteQueue(2, "drop_newest")
+    for chunk in (b"aa", b"bb", b"cc"):
+        queue.put_nowait(chunk)
+
+    assert queue.dropped_bytes == 2
+    assert queue.dropped_chunks == 1
+    assert _drain(queue) == [b"aa", b"bb"]
+
+
+def test_coalesce_merges_into_newest_chunk() -> None:
+    queue = BoundedByteQueue(2, "coalesce", max_bytes=6)
+    for chunk in (b"aa", b"bb", b"cc"):
+        queue.put_nowait(chunk)
+
+    assert queue.qsize() == 2
+    assert queue.queued_bytes == 6
+    assert queue.dropped_bytes == 0
+
+    # Over max_bytes: the oldest chunk goes
+    queue.put_nowait(b"dd")
+    assert queue.dropped_bytes == 2
+    assert _drain(queue) == [b"bbcc", b"dd"]
+
+
+def test_unknown_overflow_policy() -> None:
+    with pytest.raises(ValueError):
+        BoundedByteQueue(2, "block")  # type: ignore[arg-type]
+
+
+def test_coalesce_requires_a_byte_cap() -> None:
+    with pytest.raises(ValueError):
+        BoundedByteQueue(2, "coalesce")
+    with pytest.raises(ValueError):
+        Stream.bounded(2, "coalesce")
+
+
+class _RecordingSocket:
+    def __init__(self) -> None:
+        self.sent: List[bytes] = []
+
+    async def _send(self, data: bytes) -> None:
+        self.sent.append(data)
+
+
+def test_sender_batches_blocks_into_frames() -> None:
+    # Imported here: microphone_sender imports the EVI chat client, and test_hume_wss_client patches
+    # websockets' connect before that module is first imported.
+    from hume.empathic_voice.chat.audio.microphone_sender import MicrophoneSender
+
+    async def run() -> List[bytes]:
+        stream: Stream[bytes] = Stream.bounded(16)
+        # 1 kHz mono int16: 20 ms frames are 40 bytes
+        microphone = Microphone(stream=stream, num_channels=1, sample_rate=1000)
+        sender = MicrophoneSender.new(microphone=microphone, allow_interrupt=False)
+        socket = _RecordingSocket()
+        for _ in range(5):
+            await stream.put(b"\x01" * 16)
+        task = asyncio.create_task(sender.send(socket=socket))  # type: ignore[arg-type]
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert microphone.queued_bytes == 0
+        return socket.sent
+
+    assert asyncio.run(run()) == [b"\x01" * 48]
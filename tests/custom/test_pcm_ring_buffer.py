@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from hume.empathic_voice.chat.audio.audio_utilities import PcmRingBuffer, _make_pcm_callback
+
+
+def test_ring_buffer_wraps_around() -> None:
+    ring = PcmRingBuffer(8)
+    out = memoryview(bytearray(8))
+
+    assert ring.write(b"abcdef") == 6
+    assert ring.read_into(out, 4) == 4
+    assert bytes(out[:4]) == b"abcd"
+
+    # Only 6 bytes are free, and the write straddles the end of the buffer
+    assert ring.write(memoryview(b"ghijklmn")) == 6
+    assert ring.fill_level == 8
+    assert ring.write(b"x") == 0
+
+    assert ring.read_into(out, 8) == 8
+    assert bytes(out) == b"efghijkl"
+    assert ring.fill_level == 0
+    assert ring.bytes_written == 12
+    assert ring.bytes_read == 12
+    assert ring.peak_fill_level == 8
+
+
+def test_ring_buffer_reset_reopens_it_for_another_stream() -> None:
+    ring = PcmRingBuffer(8)
+    out = memoryview(bytearray(8))
+    ring.write(b"abcdef")
+    ring.close()
+
+    ring.reset()
+    assert not ring.closed
+    assert ring.fill_level == 0
+    assert ring.write(b"ghij") == 4
+    assert ring.read_into(out, 8) == 4
+    assert bytes(out[:4]) == b"ghij"
+    assert ring.peak_fill_level == 6
+
+
+def test_ring_buffer_rejects_empty_capacity() -> None:
+    with pytest.raises(ValueError):
+        PcmRingBuffer(0)
+
+
+def test_callback_pads_underruns_with_silence() -> None:
+    async def run() -> None:
+        ring = PcmRingBuffer(64)
+        events = []
+
+        async def on_active() -> None:
+            events.append("active")
+
+        async def on_idle() -> None:
+            events.append("idle")
+
+        cb = _make_pcm_callback(ring, 1, asyncio.get_running_loop(), on_active, on_idle)
+        out = bytearray(8)
+
+        ring.write(b"\x01\x02\x03\x04")
+        cb(out, 4)  # 4 frames of mono s16 = 8 bytes
+        assert bytes(out) == b"\x01\x02\x03\x04\x00\x00\x00\x00"
+        assert ring.underruns == 1
+
+        ring.write(b"\x05" * 8)
+        cb(out, 4)
+        assert bytes(out) == b"\x05" * 8
+        assert ring.underruns == 1
+
+        # Draining the tail of a finished stream is not an underrun
+        ring.write(b"\x06\x06")
+        ring.close()
+        cb(out, 4)
+        assert bytes(out) == b"\x06\x06" + b"\x00" * 6
+        assert ring.underruns == 1
+
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert events == ["idle", "active"]
+
+    asyncio.run(run())
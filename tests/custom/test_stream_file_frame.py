@@ -0,0 +1,74 @@
+import base64
+import io
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from hume.core.api_error import ApiError
+from hume.core.json_codec import JsonCodec
+from hume.expression_measurement.stream.stream import socket_client
+from hume.expression_measurement.stream.stream.socket_client import _dumps_payload, _file_payload
+from hume.expression_measurement.stream.stream.types.config import Config
+
+DATA = os.urandom(1000) + b"\x00\xff" * 7
+
+
+@pytest.fixture(autouse=True)
+def _small_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Exercise chunk boundaries without megabytes of test data
+    monkeypatch.setattr(socket_client, "_ENCODE_CHUNK_SIZE", 3 * 17)
+
+
+def _sent(file_: Any, **kwargs: Any) -> Dict[str, Any]:
+    frame = _dumps_payload(JsonCodec(), _file_payload(file_, kwargs.get("config"), kwargs.get("payload_id")))
+    return json.loads(frame)
+
+
+def _expected(payload_id: Any = None) -> Dict[str, Any]:
+    expected = {"data": base64.b64encode(DATA).decode(), "raw_text": False}
+    if payload_id is not None:
+        expected["payload_id"] = payload_id
+    return expected
+
+
+def test_bytes_and_memoryview() -> None:
+    assert _sent(DATA) == _expected()
+    assert _sent(bytearray(DATA)) == _expected()
+    assert _sent(memoryview(DATA)[1:]) == {**_expected(), "data": base64.b64encode(DATA[1:]).decode()}
+
+
+def test_path_and_open_file(tmp_path: Path) -> None:
+    path = tmp_path / "clip.bin"
+    path.write_bytes(b"skip" + DATA)
+
+    with open(path, "rb") as f:
+        f.seek(4)
+        assert _sent(f, payload_id="ü") == _expected("ü")
+        assert f.tell() == len(DATA) + 4
+
+    path.write_bytes(DATA)
+    assert _sent(path) == _expected()
+    assert _sent(str(path)) == _expected()
+
+
+def test_unmappable_file_object() -> None:
+    assert _sent(io.BytesIO(DATA)) == _expected()
+    assert _sent(io.BufferedReader(io.BytesIO(DATA), buffer_size=5)) == _expected()
+
+
+def test_config_and_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    sent = _sent(path, config=Config(language={}))
+    assert sent["data"] == ""
+    assert sent["models"] == {"language": {}}
+
+
+def test_base64_string_and_missing_path(tmp_path: Path) -> None:
+    encoded = base64.b64encode(DATA).decode()
+    assert _sent(encoded) == {"data": encoded, "raw_text": False}
+    with pytest.raises(ApiError):
+        _file_payload(tmp_path / "missing.bin", None, None)
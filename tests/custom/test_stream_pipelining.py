@@ -0,0 +1,137 @@
+import asyncio
+import json
+from typing import Any, List, Optional
+
+import pytest
+
+
+class _FakeStreamSocket:
+    """Answers text payloads in reverse order of arrival, once `batch` of them are waiting."""
+
+    def __init__(self, batch: int) -> None:
+        self.batch = batch
+        self.sent: List[Any] = []
+        self.max_in_flight = 0
+        self._waiting: List[Any] = []
+        self._responses: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+
+    async def send(self, message: str) -> None:
+        payload = json.loads(message)
+        self.sent.append(payload)
+        self._waiting.append(payload)
+        self.max_in_flight = max(self.max_in_flight, len(self._waiting))
+        if len(self._waiting) >= self.batch:
+            self.flush()
+
+    def flush(self) -> None:
+        waiting, self._waiting = self._waiting, []
+        for payload in reversed(waiting):
+            self._responses.put_nowait(json.dumps({"payload_id": payload.get("payload_id"), "language": {}}))
+
+    def close(self) -> None:
+        self._responses.put_nowait(None)
+
+    def __aiter__(self) -> "_FakeStreamSocket":
+        return self
+
+    async def __anext__(self) -> str:
+        message = await self._responses.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+def test_pipelined_responses_are_matched_by_payload_id() -> None:
+    from hume.expression_measurement.stream.stream.socket_client import AsyncStreamSocketClient
+
+    async def run() -> None:
+        websocket = _FakeStreamSocket(batch=4)
+        client = AsyncStreamSocketClient(websocket=websocket)  # type: ignore[arg-type]
+        client.start_pipeline(window=4)
+        texts = [f"text {i}" for i in range(8)]
+        responses = await asyncio.gather(*(client.send_text(text) for text in texts))
+        await client.stop_pipeline()
+
+        sent_ids = {payload["data"]: payload["payload_id"] for payload in websocket.sent}
+        assert [response.payload_id for response in responses] == [sent_ids[text] for text in texts]
+        assert len(set(sent_ids.values())) == len(texts)
+        assert websocket.max_in_flight == 4
+
+    asyncio.run(run())
+
+
+def test_submit_keeps_caller_payload_id() -> None:
+    from hume.expression_measurement.stream.stream.socket_client import AsyncStreamSocketClient
+
+    async def run() -> None:
+        websocket = _FakeStreamSocket(batch=2)
+        client = AsyncStreamSocketClient(websocket=websocket)  # type: ignore[arg-type]
+        client.start_pipeline(window=2)
+        first = await client.submit_text("a", payload_id="first")
+        with pytest.raises(ValueError):
+            await client.submit_text("b", payload_id="first")
+        second = await client.submit_text("b", payload_id="second")
+        assert (await first).payload_id == "first"
+        assert (await second).payload_id == "second"
+        await client.stop_pipeline()
+
+    asyncio.run(run())
+
+
+def test_responses_with_an_unknown_payload_id_are_dropped() -> None:
+    from hume.expression_measurement.stream.stream.socket_client import AsyncStreamSocketClient
+
+    async def run() -> None:
+        websocket = _FakeStreamSocket(batch=10)
+        client = AsyncStreamSocketClient(websocket=websocket)  # type: ignore[arg-type]
+        client.start_pipeline(window=2)
+        future = await client.submit_text("a", payload_id="mine")
+        # A late answer to a payload whose caller gave up, then a warning for no payload in particular
+        websocket._responses.put_nowait(json.dumps({"payload_id": "abandoned", "language": {}}))
+        websocket._responses.put_nowait(json.dumps({"payload_id": "other", "warning": "w", "code": "W0101"}))
+        websocket.flush()
+        assert (await future).payload_id == "mine"
+        await client.stop_pipeline()
+
+    asyncio.run(run())
+
+
+def test_pending_payloads_fail_when_connection_closes() -> None:
+    from hume.expression_measurement.stream.stream.socket_client import AsyncStreamSocketClient
+
+    async def run() -> None:
+        websocket = _FakeStreamSocket(batch=10)
+        client = AsyncStreamSocketClient(websocket=websocket)  # type: ignore[arg-type]
+        client.start_pipeline(window=2)
+        future = await client.submit_text("never answered")
+        websocket.close()
+        with pytest.raises(ConnectionError):
+            await future
+        await client.stop_pipeline()
+
+    asyncio.run(run())
+
+
+def test_stop_pipeline_fails_pending_payloads_with_the_given_error() -> None:
+    from hume.expression_measurement.stream.stream.socket_client import AsyncStreamSocketClient
+
+    async def run() -> None:
+        client = AsyncStreamSocketClient(websocket=_FakeStreamSocket(batch=10))  # type: ignore[arg-type]
+        client.start_pipeline(window=2)
+        future = await client.submit_text("never answered")
+        await client.stop_pipeline(ConnectionError("recycled"))
+        with pytest.raises(ConnectionError):
+            await future
+
+    asyncio.run(run())
+
+
+def test_submit_requires_pipeline() -> None:
+    from hume.expression_measurement.stream.stream.socket_client import AsyncStreamSocketClient
+
+    async def run() -> None:
+        client = AsyncStreamSocketClient(websocket=_FakeStreamSocket(batch=1))  # type: ignore[arg-type]
+        with pytest.raises(RuntimeError):
+            await client.submit_text("text")
+
+    asyncio.run(run())
@@ -0,0 +1,205 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List
+
+import pytest
+from websockets.asyncio.server import ServerConnection, serve
+
+
+class _StandInServer:
+    """Local stand-in for the stream API that echoes payload ids, optionally after a delay or a dropped connection."""
+
+    def __init__(self, delay: float = 0.0, drop_first: int = 0) -> None:
+        self.delay = delay
+        self.drop_first = drop_first
+        self.connections = 0
+        self.payloads: List[Dict[str, Any]] = []
+
+    async def handler(self, connection: ServerConnection) -> None:
+        self.connections += 1
+        async for message in connection:
+            payload = json.loads(message)
+            self.payloads.append(payload)
+            if self.drop_first:
+                self.drop_first -= 1
+                await connection.close()
+                return
+            asyncio.create_task(self._respond(connection, payload))
+
+    async def _respond(self, connection: ServerConnection, payload: Dict[str, Any]) -> None:
+        await asyncio.sleep(self.delay)
+        if payload.get("job_details"):
+            response: Dict[str, Any] = {"job_details": {"job_id": f"job-{id(connection)}"}}
+        else:
+            response = {"payload_id": payload.get("payload_id"), "language": {"predictions": []}}
+        await connection.send(json.dumps(response))
+
+
+@asynccontextmanager
+async def _pool(server: _StandInServer, **kwargs: Any) -> AsyncIterator[Any]:
+    from hume.client import AsyncHumeClient
+    from hume.environment import HumeClientEnvironment
+
+    async with serve(server.handler, "127.0.0.1", 0) as ws_server:
+        port = ws_server.sockets[0].getsockname()[1]
+        environment = HumeClientEnvironment(
+            base="http://127.0.0.1", evi="ws://127.0.0.1", tts="ws://127.0.0.1", stream=f"ws://127.0.0.1:{port}"
+        )
+        client = AsyncHumeClient(api_key="0000-0000-0000-0000", environment=environment)
+        async with client.expression_measurement.stream.pool(**kwargs) as pool:
+            yield pool
+
+
+@pytest.fixture(autouse=True)
+def _real_connect(monkeypatch: pytest.MonkeyPatch) -> None:
+    # test_hume_wss_client can leave a mock connect bound in the stream client module
+    import websockets.legacy.client
+
+    from hume.expression_measurement.stream.stream import client
+
+    monkeypatch.setattr(client, "websockets_client_connect", websockets.legacy.client.connect)
+
+
+def _text(text: str) -> Dict[str, Any]:
+    return {"data": text, "raw_text": True, "models": {"language": {}}}
+
+
+def test_least_loaded_opens_sockets_only_under_load() -> None:
+    async def run() -> None:
+        server = _StandInServer(delay=0.05)
+        async with _pool(server, size=4, window=2) as pool:
+            # One at a time: a single socket is enough
+            for i in range(3):
+                await pool.score(_text(f"sequential {i}"))
+            assert [m.open for m in pool.metrics()] == [True, False, False, False]
+
+            responses = await asyncio.gather(*(pool.score(_text(f"concurrent {i}")) for i in range(8)))
+            sent_ids = [p["payload_id"] for p in server.payloads[3:]]
+            assert sorted(r.payload_id for r in responses) == sorted(sent_ids)
+
+            metrics = pool.metrics()
+            assert all(m.open for m in metrics)
+            assert sum(m.completed for m in metrics) == 11
+            assert all(m.in_flight == 0 and m.failed == 0 for m in metrics)
+            assert all(0 < m.utilization <= 1 for m in metrics)
+        assert server.connections == 4
+
+    asyncio.run(run())
+
+
+def test_round_robin_spreads_payloads_evenly() -> None:
+    async def run() -> None:
+        server = _StandInServer()
+        async with _pool(server, size=3, strategy="round_robin") as pool:
+            for i in range(6):
+                await pool.score(_text(f"text {i}"))
+            assert [m.sent for m in pool.metrics()] == [2, 2, 2]
+
+    asyncio.run(run())
+
+
+def test_broken_socket_is_recycled_and_payload_retried() -> None:
+    async def run() -> None:
+        server = _StandInServer(drop_first=1)
+        async with _pool(server, size=2) as pool:
+            response = await pool.score(_text("retried"))
+            assert response.payload_id == server.payloads[-1]["payload_id"]
+
+            first, second = pool.metrics()
+            assert (first.failed, first.recycled, first.open) == (1, 1, False)
+            assert second.completed == 1
+
+            # The recycled socket reconnects when it is used again
+            await pool.get_job_details(index=0)
+            assert pool.metrics()[0].open
+            assert server.connections == 3
+
+    asyncio.run(run())
+
+
+class _FlakyConnection:
+    """Fake websocket: the first connection fails to send "break" and never answers; later ones answer at once."""
+
+    def __init__(self, first: bool) -> None:
+        self.first = first
+        self._responses: "asyncio.Queue[str]" = asyncio.Queue()
+
+    async def send(self, message: str) -> None:
+        payload = json.loads(message)
+        if not self.first:
+            self._responses.put_nowait(json.dumps({"payload_id": payload["payload_id"], "language": {}}))
+        elif payload["data"] == "break":
+            raise ConnectionError("send failed")
+
+    def __aiter__(self) -> "_FlakyConnection":
+        return self
+
+    async def __anext__(self) -> str:
+        return await self._responses.get()
+
+
+def test_payloads_waiting_on_a_recycled_socket_are_retried() -> None:
+    from hume.expression_measurement.stream.stream.socket_client import AsyncStreamSocketClient
+    from hume.expression_measurement.stream.stream.socket_pool import StreamSocketPool
+
+    connections: List[_FlakyConnection] = []
+
+    @asynccontextmanager
+    async def connect() -> AsyncIterator[AsyncStreamSocketClient]:
+        connections.append(_FlakyConnection(first=not connections))
+        yield AsyncStreamSocketClient(websocket=connections[-1])  # type: ignore[arg-type]
+
+    async def run() -> None:
+        async with StreamSocketPool(connect, size=1, retries=1) as pool:
+            waiting, broken = await asyncio.gather(pool.score(_text("waiting")), pool.score(_text("break")))
+            assert waiting.payload_id is not None and broken.payload_id is not None
+            (metrics,) = pool.metrics()
+            assert (metrics.failed, metrics.recycled, metrics.completed) == (2, 1, 2)
+        assert len(connections) == 2
+
+    asyncio.run(run())
+
+
+def test_closing_the_pool_cancels_payloads_in_flight() -> None:
+    from hume.expression_measurement.stream.stream.socket_client import AsyncStreamSocketClient
+    from hume.expression_measurement.stream.stream.socket_pool import StreamSocketPool
+
+    @asynccontextmanager
+    async def connect() -> AsyncIterator[AsyncStreamSocketClient]:
+        yield AsyncStreamSocketClient(websocket=_FlakyConnection(first=True))  # type: ignore[arg-type]
+
+    async def run() -> None:
+        pool = StreamSocketPool(connect, size=1, retries=1)
+        waiting = asyncio.create_task(pool.score(_text("waiting")))
+        while not pool.metrics()[0].open:
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+        await pool.aclose()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        (metrics,) = pool.metrics()
+        assert (metrics.failed, metrics.recycled) == (0, 0)
+
+    asyncio.run(run())
+
+
+def test_job_details_per_open_socket() -> None:
+    async def run() -> None:
+        server = _StandInServer(delay=0.01)
+        async with _pool(server, size=3) as pool:
+            await asyncio.gather(*(pool.score(_text(str(i))) for i in range(3)))
+            details = await pool.get_job_details()
+            assert len({d.job_details.job_id for d in details}) == 3
+            assert len(await pool.get_job_details(index=1)) == 1
+
+    asyncio.run(run())
+
+
+def test_invalid_pool_options() -> None:
+    from hume.expression_measurement.stream.stream.socket_pool import StreamSocketPool
+
+    with pytest.raises(ValueError):
+        StreamSocketPool(lambda: None, size=0)  # type: ignore[arg-type,return-value]
+    with pytest.raises(ValueError):
+        StreamSocketPool(lambda: None, strategy="random")  # type: ignore[arg-type,return-value]
@@ -0,0 +1,129 @@
+import asyncio
+import base64
+import io
+import json
+import wave
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List
+
+import httpx
+import pytest
+
+from hume.client import HumeClient
+from hume.core.pydantic_utilities import parse_obj_as
+from hume.tts.audio_sink import write_audio_stream, write_audio_stream_async
+from hume.tts.types.posted_utterance import PostedUtterance
+from hume.tts.types.tts_output import TtsOutput
+
+
+def _wav(pcm: bytes) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(24000)
+        wf.writeframes(pcm)
+    return buffer.getvalue()
+
+
+def _audio_chunk(audio: bytes, index: int, audio_format: str = "wav", generation_id: str = "gen-1") -> Dict[str, Any]:
+    return {
+        "type": "audio",
+        "audio": base64.b64encode(audio).decode(),
+        "audio_format": audio_format,
+        "chunk_index": index,
+        "generation_id": generation_id,
+        "is_last_chunk": False,
+        "request_id": "req-1",
+        "snippet_id": "snippet-1",
+        "text": "Hello.",
+    }
+
+
+TIMESTAMP = {
+    "type": "timestamp",
+    "generation_id": "gen-1",
+    "request_id": "req-1",
+    "snippet_id": "snippet-1",
+    "timestamp": {"type": "word", "text": "Hello", "time": {"begin": 0, "end": 100}},
+}
+
+PCM_CHUNKS = [b"\x01\x00" * 100, b"\x02\x00" * 50, b"\x03\x00" * 25]
+
+
+def _outputs(messages: List[Dict[str, Any]]) -> List[TtsOutput]:
+    return [parse_obj_as(TtsOutput, message) for message in messages]  # type: ignore[arg-type]
+
+
+def _wav_messages() -> List[Dict[str, Any]]:
+    messages = [_audio_chunk(_wav(pcm), i) for i, pcm in enumerate(PCM_CHUNKS)]
+    messages.insert(1, TIMESTAMP)
+    return messages
+
+
+def _read_frames(data: bytes) -> bytes:
+    with wave.open(io.BytesIO(data), "rb") as wf:
+        return wf.readframes(wf.getnframes())
+
+
+def test_repeated_wav_headers_are_stripped_and_sizes_fixed() -> None:
+    out = io.BytesIO()
+    metrics = write_audio_stream(_outputs(_wav_messages()), out)
+
+    assert _read_frames(out.getvalue()) == b"".join(PCM_CHUNKS)
+    assert metrics.chunks == 3
+    assert metrics.total_bytes == len(out.getvalue()) == 44 + len(b"".join(PCM_CHUNKS))
+    assert metrics.time_to_first_byte is not None
+
+
+def test_repeated_id3_tags_are_stripped() -> None:
+    tag = b"ID3\x04\x00\x00\x00\x00\x00\x02TT"
+    messages = [_audio_chunk(tag + b"\xff\xfbA", 0, "mp3"), _audio_chunk(tag + b"\xff\xfbB", 1, "mp3")]
+    out = io.BytesIO()
+    write_audio_stream(_outputs(messages), out)
+    assert out.getvalue() == tag + b"\xff\xfbA\xff\xfbB"
+
+
+def test_chunks_of_a_second_generation_are_rejected() -> None:
+    messages = [_audio_chunk(_wav(PCM_CHUNKS[0]), 0), _audio_chunk(_wav(PCM_CHUNKS[1]), 0, generation_id="gen-2")]
+    out = io.BytesIO()
+    with pytest.raises(ValueError, match="more than one generation"):
+        write_audio_stream(_outputs(messages), out)
+    assert _read_frames(out.getvalue()) == PCM_CHUNKS[0]
+
+
+def test_async_sink_writes_path_with_aiofiles(tmp_path: Path) -> None:
+    async def stream() -> AsyncIterator[TtsOutput]:
+        for output in _outputs(_wav_messages()):
+            yield output
+
+    path = tmp_path / "speech.wav"
+    metrics = asyncio.run(write_audio_stream_async(stream(), path))
+
+    assert _read_frames(path.read_bytes()) == b"".join(PCM_CHUNKS)
+    assert metrics.total_bytes == path.stat().st_size
+
+
+def test_client_streams_generation_to_file(tmp_path: Path) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v0/tts/stream/json"
+        body = "\n".join(json.dumps(message) for message in _wav_messages())
+        return httpx.Response(200, content=body.encode())
+
+    client = HumeClient(api_key="0000", httpx_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    path = tmp_path / "speech.wav"
+    metrics = client.tts.synthesize_json_streaming_to_file(file=path, utterances=[PostedUtterance(text="Hello.")])
+
+    assert _read_frames(path.read_bytes()) == b"".join(PCM_CHUNKS)
+    assert metrics.chunks == 3
+
+
+def test_client_rejects_multiple_generations_before_sending(tmp_path: Path) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("no request expected")
+
+    client = HumeClient(api_key="0000", httpx_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    with pytest.raises(ValueError):
+        client.tts.synthesize_json_streaming_to_file(
+            file=tmp_path / "speech.wav", utterances=[PostedUtterance(text="Hello.")], num_generations=2
+        )
@@ -0,0 +1,164 @@
+import asyncio
+import http.server
+import json
+import threading
+import time
+import typing
+
+import pytest
+
+from hume.core.hedging import LatencyHistogram, hedge_delay, is_hedgeable
+
+SLOW_SECONDS = 1.5
+RETURN_TTS = {"generations": [], "request_id": "abc"}
+
+
+class _SlowFirstResponder(http.server.BaseHTTPRequestHandler):
+    """Stand-in for the TTS API that stalls its first response before sending headers."""
+
+    protocol_version = "HTTP/1.1"
+    requests: typing.List[str] = []
+    lock = threading.Lock()
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        with self.lock:
+            self.requests.append(self.path)
+            first = len(self.requests) == 1
+        if first:
+            time.sleep(SLOW_SECONDS)
+        body = b"RIFF audio" if self.path.endswith("/file") else json.dumps(RETURN_TTS).encode()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The hedged client gave up on this attempt
+            pass
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> typing.Iterator[str]:
+    _SlowFirstResponder.requests = []
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _SlowFirstResponder)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+HEDGE = {"max_delay_in_seconds": 0.2}
+
+
+def test_histogram_percentiles() -> None:
+    histogram = LatencyHistogram()
+    for i in range(1, 101):
+        histogram.record(i / 100)
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=0.05)
+    assert histogram.percentile(95) == pytest.approx(0.95, rel=0.05)
+    assert histogram.count == 100
+
+
+def test_hedge_delay_follows_the_histogram_within_bounds() -> None:
+    histogram = LatencyHistogram()
+    assert hedge_delay(histogram, {"max_delay_in_seconds": 2}) == 2
+    for _ in range(30):
+        histogram.record(0.3)
+    assert hedge_delay(histogram, {}) == pytest.approx(0.3, rel=0.05)
+    assert hedge_delay(histogram, {"min_delay_in_seconds": 1}) == 1
+    assert hedge_delay(histogram, {"min_samples": 50, "max_delay_in_seconds": 4}) == 4
+
+
+def test_only_idempotent_tts_posts_are_hedged() -> None:
+    assert is_hedgeable("POST", "v0/tts")
+    assert is_hedgeable("POST", "/v0/tts/file")
+    assert not is_hedgeable("POST", "v0/tts/stream/json")
+    assert not is_hedgeable("POST", "v0/batch/jobs")
+    assert not is_hedgeable("GET", "v0/tts")
+
+
+def test_synthesize_json_uses_the_duplicate_when_the_first_attempt_stalls(server: str) -> None:
+    from hume.client import HumeClient
+    from hume.tts import PostedUtterance
+
+    client = HumeClient(api_key="key", base_url=server)
+    start = time.monotonic()
+    result = client.tts.synthesize_json(utterances=[PostedUtterance(text="Hello")], request_options={"hedge": HEDGE})
+    elapsed = time.monotonic() - start
+    assert result.request_id == "abc"
+    assert elapsed < SLOW_SECONDS / 2
+    assert _SlowFirstResponder.requests == ["/v0/tts", "/v0/tts"]
+    histogram = client._client_wrapper.httpx_client.latency_histograms["POST v0/tts"]
+    assert histogram.count == 1
+
+
+def test_synthesize_file_streams_the_winning_response(server: str) -> None:
+    from hume.client import HumeClient
+    from hume.tts import PostedUtterance
+
+    client = HumeClient(api_key="key", base_url=server)
+    start = time.monotonic()
+    audio = b"".join(
+        client.tts.synthesize_file(utterances=[PostedUtterance(text="Hello")], request_options={"hedge": HEDGE})
+    )
+    assert audio == b"RIFF audio"
+    assert time.monotonic() - start < SLOW_SECONDS / 2
+    assert len(_SlowFirstResponder.requests) == 2
+
+
+def test_fast_responses_are_not_duplicated(server: str) -> None:
+    from hume.client import HumeClient
+    from hume.tts import PostedUtterance
+
+    _SlowFirstResponder.requests = ["warm"]
+    client = HumeClient(api_key="key", base_url=server)
+    client.tts.synthesize_json(utterances=[PostedUtterance(text="Hello")], request_options={"hedge": HEDGE})
+    assert _SlowFirstResponder.requests == ["warm", "/v0/tts"]
+
+
+def test_requests_are_not_hedged_without_the_option(server: str) -> None:
+    from hume.client import HumeClient
+    from hume.tts import PostedUtterance
+
+    client = HumeClient(api_key="key", base_url=server)
+    start = time.monotonic()
+    client.tts.synthesize_json(utterances=[PostedUtterance(text="Hello")])
+    assert time.monotonic() - start >= SLOW_SECONDS
+    assert _SlowFirstResponder.requests == ["/v0/tts"]
+
+
+def test_no_duplicate_without_a_rate_limit_token(server: str) -> None:
+    from hume.client import HumeClient
+    from hume.tts import PostedUtterance
+
+    # The first attempt takes the only token, so the hedge would have to wait for one and is skipped
+    client = HumeClient(api_key="key", base_url=server, rate_limit=0.1)
+    start = time.monotonic()
+    client.tts.synthesize_json(utterances=[PostedUtterance(text="Hello")], request_options={"hedge": HEDGE})
+    assert time.monotonic() - start >= SLOW_SECONDS
+    assert _SlowFirstResponder.requests == ["/v0/tts"]
+
+
+def test_async_synthesize_json_cancels_the_stalled_attempt(server: str) -> None:
+    from hume.client import AsyncHumeClient
+    from hume.tts import PostedUtterance
+
+    client = AsyncHumeClient(api_key="key", base_url=server)
+
+    async def run() -> float:
+        start = time.monotonic()
+        result = await client.tts.synthesize_json(
+            utterances=[PostedUtterance(text="Hello")], request_options={"hedge": HEDGE}
+        )
+        assert result.request_id == "abc"
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) < SLOW_SECONDS / 2
+    assert _SlowFirstResponder.requests == ["/v0/tts", "/v0/tts"]
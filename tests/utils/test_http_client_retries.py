@@ -0,0 +1,166 @@
+import asyncio
+import time
+from typing import List
+
+import httpx
+import pytest
+
+from hume.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from hume.core.http_client import AsyncHttpClient, HttpClient
+from hume.core.retry_budget import RetryBudget
+
+
+@pytest.fixture(autouse=True)
+def _no_retry_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("hume.core.http_client._retry_timeout", lambda response, retries: 0)
+
+
+def _client(handler, **kwargs) -> HttpClient:
+    return HttpClient(
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        base_timeout=lambda: None,
+        base_headers=lambda: {"X-Hume-Api-Key": "key"},
+        base_url=lambda: "https://api.hume.ai",
+        **kwargs,
+    )
+
+
+def test_budget_allows_a_ratio_of_successes() -> None:
+    budget = RetryBudget(0.5, min_retries_per_second=0, ttl=10)
+    assert not budget.try_retry()
+    for _ in range(4):
+        budget.record_success()
+    assert [budget.try_retry() for _ in range(3)] == [True, True, False]
+    state = budget.state()
+    assert (state.successes, state.retries, state.available) == (4, 2, 0)
+
+
+def test_budget_has_a_floor_for_quiet_clients() -> None:
+    budget = RetryBudget(0, min_retries_per_second=0.3, ttl=10)
+    assert [budget.try_retry() for _ in range(4)] == [True, True, True, False]
+
+
+def test_retries_are_a_loop_that_resends_the_same_request() -> None:
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(503 if len(requests) < 3 else 200)
+
+    response = _client(handler).request(
+        "v0/evi/configs", method="POST", data={"name": "x"}, params={"page": 1}, headers={"X-Trace": "t"}
+    )
+    assert response.status_code == 200
+    assert len(requests) == 3
+    # Form data used to be dropped from retries
+    assert {r.content for r in requests} == {b"name=x"}
+    assert {str(r.url) for r in requests} == {"https://api.hume.ai/v0/evi/configs?page=1"}
+    assert all(r.headers["X-Trace"] == "t" for r in requests)
+
+
+def test_exhausted_budget_returns_the_failed_response() -> None:
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(500)
+
+    budget = RetryBudget(0, min_retries_per_second=0.1, ttl=10)
+    client = _client(handler, retry_budget=budget)
+    assert client.request("v0/tts", method="POST", request_options={"max_retries": 5}).status_code == 500
+    assert len(calls) == 2
+    assert client.request("v0/tts", method="POST", request_options={"max_retries": 5}).status_code == 500
+    assert len(calls) == 3
+    assert budget.state().retries == 1
+
+
+def test_circuit_opens_after_consecutive_failures_and_probes_again() -> None:
+    status = [500]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status[0])
+
+    breaker = CircuitBreaker(3, reset_timeout=0.05)
+    client = _client(handler, circuit_breaker=breaker)
+    client.request("v0/tts", method="POST", request_options={"max_retries": 5})
+    assert breaker.state("api.hume.ai").status == "open"
+    assert breaker.states()["api.hume.ai"].failures == 3
+    with pytest.raises(CircuitOpenError) as error:
+        client.request("v0/tts", method="POST")
+    assert error.value.host == "api.hume.ai"
+
+    # After the timeout one probe goes through, and its success closes the circuit
+    time.sleep(0.06)
+    assert breaker.allow("api.hume.ai")
+    assert not breaker.allow("api.hume.ai")
+    breaker.record("api.hume.ai", success=True)
+    status[0] = 200
+    assert client.request("v0/tts", method="POST").status_code == 200
+    assert breaker.state("api.hume.ai").status == "closed"
+
+
+def test_failed_probe_reopens_the_circuit() -> None:
+    breaker = CircuitBreaker(1, reset_timeout=0.01)
+    breaker.record("host", success=False)
+    time.sleep(0.02)
+    assert breaker.allow("host")
+    assert breaker.state("host").status == "half_open"
+    breaker.record("host", success=False)
+    assert breaker.state("host").status == "open"
+    assert not breaker.allow("host")
+
+
+def test_rate_limited_responses_do_not_trip_the_circuit() -> None:
+    breaker = CircuitBreaker(1)
+    client = _client(lambda request: httpx.Response(429), circuit_breaker=breaker)
+    client.request("v0/tts", method="POST", request_options={"max_retries": 0})
+    assert breaker.state("api.hume.ai").status == "closed"
+
+
+def test_connection_errors_count_as_failures() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    breaker = CircuitBreaker(2)
+    client = _client(handler, circuit_breaker=breaker)
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            client.request("v0/tts", method="POST")
+    with pytest.raises(CircuitOpenError):
+        client.request("v0/tts", method="POST")
+
+
+def test_async_client_shares_the_budget_and_breaker() -> None:
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(502)
+
+    budget = RetryBudget(0, min_retries_per_second=0.2, ttl=10)
+    breaker = CircuitBreaker(10)
+    client = AsyncHttpClient(
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        base_timeout=lambda: None,
+        base_headers=lambda: {},
+        base_url=lambda: "https://api.hume.ai",
+        retry_budget=budget,
+        circuit_breaker=breaker,
+    )
+
+    async def run() -> None:
+        await asyncio.gather(*(client.request("v0/batch/jobs", method="GET") for _ in range(3)))
+
+    asyncio.run(run())
+    # Three requests, and the two retries the budget had between them
+    assert len(calls) == 5
+    assert breaker.state("api.hume.ai").failures == 5
+
+
+def test_client_wrapper_passes_them_to_the_http_client() -> None:
+    from hume.client import HumeClient
+
+    budget, breaker = RetryBudget(), CircuitBreaker()
+    client = HumeClient(api_key="key", retry_budget=budget, circuit_breaker=breaker)
+    assert client._client_wrapper.get_retry_budget() is budget
+    assert client._client_wrapper.httpx_client.circuit_breaker is breaker
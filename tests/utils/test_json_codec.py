@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from hume.client import AsyncHumeClient, HumeClient
+from hume.core.json_codec import JsonCodec, _PydanticJsonCodec, create_json_codec
+from hume.core.pydantic_utilities import UniversalBaseModel
+from hume.empathic_voice.types.audio_input import AudioInput
+from hume.empathic_voice.types.context import Context
+from hume.empathic_voice.types.session_settings import SessionSettings
+from hume.empathic_voice.types.tool import Tool
+
+
+def _available_codecs() -> list:
+    codecs = [JsonCodec(), _PydanticJsonCodec()]
+    for name in ("orjson", "msgspec"):
+        try:
+            codecs.append(create_json_codec(name))  # type: ignore[arg-type]
+        except ImportError:
+            pass
+    return codecs
+
+
+@pytest.mark.parametrize("codec", _available_codecs(), ids=lambda codec: codec.name)
+def test_codec_round_trip(codec: JsonCodec) -> None:
+    payload = {"type": "audio_input", "data": "UklGRg==", "nested": {"values": [1, 2.5, None, True]}}
+    encoded = codec.dumps(payload)
+    assert isinstance(encoded, str)
+    assert codec.loads(encoded) == payload
+    assert codec.loads(encoded.encode("utf-8")) == payload
+
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads("{not json")
+
+
+@pytest.mark.parametrize("codec", _available_codecs(), ids=lambda codec: codec.name)
+def test_codec_dumps_model_matches_dict(codec: JsonCodec) -> None:
+    for model in (
+        AudioInput(data="UklGRg=="),
+        SessionSettings(system_prompt="Be brief.", variables={"name": "Ada"}),
+        SessionSettings(
+            system_prompt=None,
+            context=Context(text="Be brief.", type="temporary"),
+            tools=[Tool(type="function", name="lookup", parameters="{}")],
+        ),
+        SessionSettings.model_validate({"custom_session_id": "abc", "extra": {"value": None}}),
+    ):
+        assert json.loads(codec.dumps_model(model)) == model.dict()
+
+
+def test_pydantic_codec_dumps_model_skips_dict(monkeypatch: pytest.MonkeyPatch) -> None:
+    model = SessionSettings(system_prompt=None, tools=[Tool(type="function", name="lookup", parameters="{}")])
+    expected = model.dict()
+
+    def dict_(*args, **kwargs):
+        raise AssertionError("dumps_model built the intermediate dict")
+
+    monkeypatch.setattr(UniversalBaseModel, "dict", dict_)
+    assert json.loads(_PydanticJsonCodec().dumps_model(model)) == expected
+
+
+def test_client_json_codec_option() -> None:
+    assert HumeClient(api_key="key")._client_wrapper.get_json_codec().name == "json"
+    codec = JsonCodec()
+    assert AsyncHumeClient(api_key="key", json_codec=codec)._client_wrapper.get_json_codec() is codec
+    assert HumeClient(api_key="key", json_codec="auto")._client_wrapper.get_json_codec().name in (
+        "json",
+        "orjson",
+        "msgspec",
+    )
+    with pytest.raises(ValueError):
+        create_json_codec("yaml")  # type: ignore[arg-type]
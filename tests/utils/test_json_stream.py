@@ -0,0 +1,57 @@
+import asyncio
+import json
+from typing import AsyncIterator, List
+
+import pytest
+
+from hume.core.json_stream import JsonArrayParser, aiter_json_array, iter_json_array
+
+DOCUMENT = [
+    {"source": {"url": "https://example.com/é.mp4"}, "scores": [0.5, -1.25e-3, 12, None, True]},
+    [],
+    "a string with ] and , and \" inside",
+    1234567,
+    {},
+]
+
+
+def _chunks(data: bytes, size: int) -> List[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 4096])
+def test_elements_survive_any_chunking(size: int) -> None:
+    data = json.dumps(DOCUMENT, indent=2, ensure_ascii=False).encode("utf-8")
+    assert list(iter_json_array(_chunks(data, size))) == DOCUMENT
+
+
+def test_elements_are_yielded_before_the_array_ends() -> None:
+    parser = JsonArrayParser()
+    assert parser.feed('[{"a": 1}, {"b"') == [{"a": 1}]
+    assert parser.feed(': 2}, 3') == [{"b": 2}]
+    # The number may go on in the next chunk
+    assert parser.feed("4") == []
+    assert parser.feed("]", final=True) == [34]
+
+
+def test_empty_array() -> None:
+    assert list(iter_json_array([b" [ ", b"] "])) == []
+
+
+@pytest.mark.parametrize("data", [b"{}", b"[1, 2", b"[1 2]", b"[1,]", b"[1] 2", b"[tru]"])
+def test_malformed_arrays_raise(data: bytes) -> None:
+    with pytest.raises(ValueError):
+        list(iter_json_array(_chunks(data, 1)))
+
+
+def test_async_iteration() -> None:
+    data = json.dumps(DOCUMENT).encode("utf-8")
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for chunk in _chunks(data, 5):
+            yield chunk
+
+    async def collect() -> list:
+        return [item async for item in aiter_json_array(chunks())]
+
+    assert asyncio.run(collect()) == DOCUMENT
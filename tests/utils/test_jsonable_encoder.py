@@ -0,0 +1,81 @@
+import dataclasses
+import datetime as dt
+import enum
+import uuid
+from pathlib import PurePosixPath
+from typing import Any, Dict, List, Optional
+
+from hume.core.jsonable_encoder import jsonable_encoder
+from hume.core.pydantic_utilities import UniversalBaseModel
+
+
+class _Never:
+    pass
+
+
+# A custom encoder for a type that never occurs forces the general, recursive path
+_GENERAL_PATH: Dict[Any, Any] = {_Never: repr}
+
+
+class Color(str, enum.Enum):
+    RED = "red"
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: Optional[float] = None
+
+
+class Inner(UniversalBaseModel):
+    created_at: dt.datetime
+    tags: List[str] = []
+    note: Optional[str] = None
+
+
+class Outer(UniversalBaseModel):
+    name: str
+    inner: Inner
+    items: List[Inner]
+    color: Color = Color.RED
+    count: Optional[int] = None
+
+
+def _body() -> Dict[str, Any]:
+    when = dt.datetime(2024, 5, 6, 7, 8, 9, tzinfo=dt.timezone.utc)
+    inner = Inner(created_at=when, tags=["a", "b"])
+    return {
+        "model": Outer(name="outer", inner=inner, items=[inner, Inner(created_at=when, note=None)], count=None),
+        "omitted": ...,
+        "list": [1, ..., 2.5, True, None, "s"],
+        "tuple": (1, 2),
+        "set": {3},
+        "bytes": b"\xff\xfe",
+        "date": dt.date(2024, 1, 2),
+        "datetime": when,
+        "enum": Color.RED,
+        "path": PurePosixPath("/tmp/x"),
+        "dataclass": Point(x=1),
+        "uuid": uuid.UUID(int=1),
+        1: "int key",
+    }
+
+
+def test_fast_path_matches_general_path() -> None:
+    body = _body()
+    assert jsonable_encoder(body) == jsonable_encoder(body, custom_encoder=_GENERAL_PATH)
+
+
+def test_omit_semantics() -> None:
+    assert jsonable_encoder(...) is None
+    assert jsonable_encoder({"a": ..., "b": [..., 1]}) == {"b": [1]}
+
+
+def test_model_encoding() -> None:
+    encoded = jsonable_encoder(_body())
+    assert encoded["model"]["inner"] == {"created_at": "2024-05-06T07:08:09Z", "tags": ["a", "b"]}
+    assert encoded["model"]["items"][1] == {"created_at": "2024-05-06T07:08:09Z", "note": None, "tags": []}
+    assert encoded["model"]["count"] is None
+    assert encoded["bytes"] == "//4="
+    assert encoded["enum"] == "red"
+    assert encoded["dataclass"] == {"x": 1, "y": None}
@@ -0,0 +1,142 @@
+import asyncio
+import io
+import pathlib
+from typing import List, Optional, Tuple
+
+import httpx
+import pytest
+from httpx._multipart import MultipartStream
+
+from hume.core.client_wrapper import SyncClientWrapper
+from hume.core.http_client import _merge_headers
+from hume.core.multipart import MultipartEncoder
+from hume.environment import HumeClientEnvironment
+
+BOUNDARY = "0123456789abcdef"
+
+
+def _httpx_body(files: list) -> bytes:
+    return b"".join(MultipartStream(data={}, files=files, boundary=BOUNDARY.encode("ascii")))
+
+
+def test_body_matches_httpx(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(b"\x00\x01" * 5000)
+
+    def fields() -> list:
+        return [
+            ("file", b"raw bytes"),
+            ("file", ('na"me\n.wav', b"audio", "audio/wav")),
+            ("file", ("image.png", io.BytesIO(b"png" * 100))),
+            ("json", (None, '{"models": {}}', "application/json")),
+        ]
+
+    expected = _httpx_body(fields() + [("file", ("clip.mp4", path.read_bytes()))])
+    body = b"".join(MultipartEncoder(fields() + [("file", path)], boundary=BOUNDARY, chunk_size=1024))
+    assert body == expected
+
+
+def test_content_length_and_progress(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "a.bin"
+    path.write_bytes(b"x" * 10_000)
+    progress: List[Tuple[int, Optional[int]]] = []
+    encoder = MultipartEncoder(
+        [("file", path), ("file", io.BytesIO(b"y" * 3000))],
+        chunk_size=1024,
+        on_progress=lambda sent, total: progress.append((sent, total)),
+    )
+    body = b"".join(encoder)
+    assert encoder.headers["Content-Length"] == str(len(body))
+    assert encoder.headers["Content-Type"] == f"multipart/form-data; boundary={encoder.boundary}"
+    sent = [s for s, _ in progress]
+    assert sent == sorted(sent)
+    assert progress[-1] == (len(body), len(body))
+
+
+def test_body_can_be_sent_again_for_retries() -> None:
+    file = io.BytesIO(b"skip" + b"z" * 5000)
+    file.seek(4)
+    encoder = MultipartEncoder([("file", file)], chunk_size=512)
+    first = b"".join(encoder)
+    assert b"skip" not in first
+    assert b"".join(encoder) == first
+
+
+def test_unknown_size_is_sent_chunked() -> None:
+    class Unsized(io.RawIOBase):
+        def __init__(self) -> None:
+            self._data = iter([b"abc", b"def"])
+
+        def readable(self) -> bool:
+            return True
+
+        def read(self, size: int = -1) -> bytes:
+            return next(self._data, b"")
+
+    encoder = MultipartEncoder([("file", ("a.bin", Unsized()))])
+    assert encoder.content_length is None
+    assert "Content-Length" not in encoder.headers
+    assert b"abcdef" in b"".join(encoder)
+
+
+def test_text_mode_files_are_rejected() -> None:
+    with pytest.raises(TypeError):
+        MultipartEncoder([("file", io.StringIO("text"))])
+
+
+def test_async_stream_matches_sync(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "b.bin"
+    path.write_bytes(bytes(range(256)) * 100)
+    encoder = MultipartEncoder([("file", path), ("file", b"tail")], chunk_size=4096)
+
+    async def collect() -> bytes:
+        return b"".join([chunk async for chunk in encoder.stream_async()])
+
+    assert asyncio.run(collect()) == b"".join(encoder)
+
+
+def test_encoder_is_sent_with_content_length_through_httpx(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "c.bin"
+    path.write_bytes(b"c" * 2048)
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["headers"] = request.headers
+        seen["body"] = request.read()
+        return httpx.Response(200)
+
+    encoder = MultipartEncoder([("file", path)], boundary=BOUNDARY)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        client.post("https://example.com", content=encoder, headers=encoder.headers)
+    assert seen["body"] == _httpx_body([("file", ("c.bin", path.read_bytes()))])
+    assert seen["headers"]["content-length"] == str(len(seen["body"]))
+    assert "transfer-encoding" not in seen["headers"]
+
+
+def _wrapper(**kwargs) -> SyncClientWrapper:
+    return SyncClientWrapper(environment=HumeClientEnvironment.PROD, httpx_client=httpx.Client(), **kwargs)
+
+
+def test_base_headers_are_cached_until_replaced() -> None:
+    wrapper = _wrapper(api_key="one", headers={"X-Custom": "a"})
+    headers = wrapper.get_base_headers()
+    assert wrapper.get_base_headers() is headers
+    assert headers["X-Hume-Api-Key"] == "one"
+    assert headers["X-Custom"] == "a"
+    with pytest.raises(TypeError):
+        headers["X-Custom"] = "b"  # type: ignore[index]
+
+    wrapper.api_key = "two"
+    assert wrapper.get_base_headers()["X-Hume-Api-Key"] == "two"
+    wrapper.set_custom_headers({"X-Custom": "b"})
+    assert wrapper.get_base_headers()["X-Custom"] == "b"
+    # get_headers still returns a dict the caller may change
+    wrapper.get_headers()["X-Custom"] = "c"
+    assert wrapper.get_base_headers()["X-Custom"] == "b"
+
+
+def test_merge_headers_drops_none_and_encodes_non_strings() -> None:
+    base = {"A": "1", "B": "2"}
+    merged = _merge_headers(base, {"B": None, "C": 3}, None, {"D": "4"})
+    assert merged == {"A": "1", "C": 3, "D": "4"}
+    assert base == {"A": "1", "B": "2"}
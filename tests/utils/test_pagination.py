@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pytest
+
+from hume.core.pagination import AsyncPager, SyncPager
+
+PAGE_SIZE = 3
+TOTAL_PAGES = 6
+
+
+@dataclass
+class _Response:
+    page_number: int
+    total_pages: int
+
+
+class _Api:
+    """Stands in for a `page_number`-paginated list endpoint."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.requested: List[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _items(self, page_number: int) -> List[int]:
+        if page_number >= TOTAL_PAGES:
+            return []
+        return list(range(page_number * PAGE_SIZE, (page_number + 1) * PAGE_SIZE))
+
+    def _enter(self, page_number: int) -> None:
+        with self._lock:
+            self.requested.append(page_number)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _exit(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def list(self, page_number: int = 0) -> SyncPager[int, _Response]:
+        self._enter(page_number)
+        time.sleep(self.delay)
+        self._exit()
+        return SyncPager(
+            has_next=True,
+            items=self._items(page_number),
+            get_next=lambda: self.list(page_number + 1),
+            get_page=lambda n: self.list(n),
+            response=_Response(page_number=page_number, total_pages=TOTAL_PAGES),
+        )
+
+    async def alist(self, page_number: int = 0) -> AsyncPager[int, _Response]:
+        self._enter(page_number)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self._exit()
+
+        async def _get_next() -> Optional[AsyncPager[int, _Response]]:
+            return await self.alist(page_number + 1)
+
+        async def _get_page(n: int) -> Optional[AsyncPager[int, _Response]]:
+            return await self.alist(n)
+
+        return AsyncPager(
+            has_next=True,
+            items=self._items(page_number),
+            get_next=_get_next,
+            get_page=_get_page,
+            response=_Response(page_number=page_number, total_pages=TOTAL_PAGES),
+        )
+
+
+ALL_ITEMS = list(range(PAGE_SIZE * TOTAL_PAGES))
+
+
+def test_sync_prefetch_keeps_order() -> None:
+    api = _Api()
+    assert list(api.list()) == ALL_ITEMS
+    assert list(api.list().with_prefetch(2)) == ALL_ITEMS
+
+
+def test_sync_fan_out_requests_known_pages_concurrently() -> None:
+    api = _Api(delay=0.05)
+    assert list(api.list().with_prefetch(4, fan_out=True)) == ALL_ITEMS
+    assert api.max_in_flight == 4
+    # total_pages is known, so the empty page past the end is never requested
+    assert sorted(api.requested) == list(range(TOTAL_PAGES))
+
+
+def test_sync_fan_out_stops_requesting_on_early_exit() -> None:
+    api = _Api(delay=0.05)
+    for page in api.list().with_prefetch(2, fan_out=True).iter_pages():
+        if page.response.page_number == 1:
+            break
+    time.sleep(0.2)
+    # Page 3 may already have started when iteration stopped; nothing after it is requested
+    assert max(api.requested) <= 3
+
+
+def test_sync_prefetch_propagates_errors() -> None:
+    def fail() -> SyncPager[int, None]:
+        raise RuntimeError("boom")
+
+    pager: SyncPager[int, None] = SyncPager(has_next=True, items=[1], get_next=fail, response=None)
+    with pytest.raises(RuntimeError):
+        list(pager.with_prefetch(2))
+
+
+def test_async_prefetch_and_fan_out_keep_order() -> None:
+    async def run() -> None:
+        api = _Api(delay=0.01)
+        assert [item async for item in (await api.alist()).with_prefetch(2)] == ALL_ITEMS
+        fan_out = _Api(delay=0.01)
+        assert [item async for item in (await fan_out.alist()).with_prefetch(3, fan_out=True)] == ALL_ITEMS
+        assert fan_out.max_in_flight == 3
+
+    asyncio.run(run())
+
+
+def test_async_fan_out_cancels_tasks_on_early_exit() -> None:
+    async def run() -> None:
+        api = _Api(delay=0.05)
+        pages = (await api.alist()).with_prefetch(3, fan_out=True).iter_pages()
+        async for page in pages:
+            if page.response.page_number == 1:
+                break
+        await pages.aclose()
+        assert api.in_flight == 0
+        assert sorted(api.requested) == [0, 1, 2, 3]
+
+    asyncio.run(run())
@@ -0,0 +1,49 @@
+import typing
+
+import pydantic
+
+from hume.core.pydantic_utilities import IS_PYDANTIC_V2, UniversalBaseModel, parse_obj_as
+from hume.empathic_voice.types.audio_output import AudioOutput
+from hume.empathic_voice.types.subscribe_event import SubscribeEvent
+
+
+class _AliasedModel(UniversalBaseModel):
+    field_name: str = pydantic.Field(alias="fieldName")
+
+
+def test_parse_obj_as_reuses_cached_validator() -> None:
+    payload = {"type": "audio_output", "data": "UklGRg==", "id": "abc", "index": 0}
+    first = parse_obj_as(AudioOutput, payload)
+    second = parse_obj_as(AudioOutput, payload)
+    assert first == second
+    assert isinstance(parse_obj_as(SubscribeEvent, payload), AudioOutput)  # type: ignore[arg-type]
+
+    if IS_PYDANTIC_V2:
+        from hume.core.pydantic_utilities import _get_type_adapter
+
+        assert _get_type_adapter(AudioOutput) is _get_type_adapter(AudioOutput)
+
+
+def test_parse_obj_as_respects_pydantic_aliases() -> None:
+    assert parse_obj_as(_AliasedModel, {"fieldName": "a"}).field_name == "a"
+    assert parse_obj_as(_AliasedModel, {"field_name": "b"}).field_name == "b"
+    assert parse_obj_as(typing.List[_AliasedModel], [{"fieldName": "c"}])[0].field_name == "c"
+
+
+def test_parse_union_obj_as_dispatches_on_type() -> None:
+    from hume.core.pydantic_utilities import parse_union_obj_as
+    from hume.empathic_voice.types.assistant_end import AssistantEnd
+    from hume.empathic_voice.types.web_socket_error import WebSocketError
+
+    audio = parse_union_obj_as(SubscribeEvent, {"type": "audio_output", "data": "", "id": "a", "index": 1})  # type: ignore[arg-type]
+    assert isinstance(audio, AudioOutput)
+    assert isinstance(parse_union_obj_as(SubscribeEvent, {"type": "assistant_end"}), AssistantEnd)  # type: ignore[arg-type]
+    error = parse_union_obj_as(SubscribeEvent, {"type": "error", "code": "E0", "message": "m", "slug": "s"})  # type: ignore[arg-type]
+    assert isinstance(error, WebSocketError)
+
+
+def test_parse_union_obj_as_falls_back_to_union() -> None:
+    from hume.core.pydantic_utilities import parse_union_obj_as
+
+    untyped = {"data": "", "id": "a", "index": 1}
+    assert type(parse_union_obj_as(SubscribeEvent, untyped)) is type(parse_obj_as(SubscribeEvent, untyped))  # type: ignore[arg-type]
@@ -0,0 +1,144 @@
+import asyncio
+import threading
+import time
+from typing import List
+
+import httpx
+import pytest
+
+from hume.core.rate_limit import RateLimiter, TokenBucket, create_rate_limiter, rate_limit_group
+
+
+def _response(status_code: int = 200, **headers: str) -> httpx.Response:
+    return httpx.Response(status_code, headers={key.replace("_", "-"): value for key, value in headers.items()})
+
+
+def test_paths_are_grouped_by_api() -> None:
+    assert rate_limit_group("v0/tts/file") == "tts"
+    assert rate_limit_group("/v0/evi/configs") == "evi"
+    assert rate_limit_group("v0/batch/jobs/abc/predictions") == "batch"
+    assert rate_limit_group("v0/stream/models") == "default"
+    assert rate_limit_group(None) == "default"
+
+
+def test_bucket_allows_a_burst_then_spaces_requests() -> None:
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_unlimited_bucket_only_waits_when_held() -> None:
+    bucket = TokenBucket()
+    assert all(bucket.reserve() == 0 for _ in range(1000))
+    bucket.hold(5)
+    assert bucket.reserve() == pytest.approx(5, abs=0.01)
+
+
+def test_try_reserve_takes_only_a_token_available_now() -> None:
+    bucket = TokenBucket(rate=10, burst=1)
+    assert bucket.try_reserve()
+    assert not bucket.try_reserve()
+    # Declining doesn't take a token, so the next reservation waits no longer than it would have
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    unlimited = TokenBucket()
+    assert unlimited.try_reserve()
+    unlimited.hold(5)
+    assert not unlimited.try_reserve()
+
+
+def test_rate_limited_response_holds_only_its_group() -> None:
+    limiter = RateLimiter(100)
+    limiter.observe("v0/tts/file", _response(429, retry_after="3"))
+    assert limiter.reserve("v0/tts/stream/json") == pytest.approx(3, abs=0.05)
+    assert limiter.reserve("v0/batch/jobs") == 0
+
+
+def test_headers_spread_the_remaining_requests_until_the_reset() -> None:
+    limiter = RateLimiter({"batch": 100})
+    reset = str(int(time.time()) + 11)
+    limiter.observe("v0/batch/jobs", _response(x_ratelimit_remaining="20", x_ratelimit_reset=reset))
+    waits = [limiter.reserve("v0/batch/jobs") for _ in range(3)]
+    # About 20 requests over the 10-11 seconds left, rather than 100 a second
+    assert waits[0] == 0
+    assert 0.45 < waits[2] - waits[1] < 0.6
+    # A group without a rate adapts too
+    limiter.observe("v0/evi/chats", _response(x_ratelimit_remaining="0", x_ratelimit_reset=reset))
+    assert limiter.reserve("v0/evi/chats") > 9
+
+
+def test_higher_limits_from_headers_do_not_raise_the_configured_rate() -> None:
+    limiter = RateLimiter(10, burst=1)
+    reset = str(int(time.time()) + 10)
+    limiter.observe("v0/tts/file", _response(x_ratelimit_remaining="1000", x_ratelimit_reset=reset))
+    limiter.reserve("v0/tts/file")
+    assert limiter.reserve("v0/tts/file") == pytest.approx(0.1, abs=0.01)
+
+
+def test_reservations_are_shared_between_threads() -> None:
+    limiter = RateLimiter(100, burst=1)
+    waits: List[float] = []
+    lock = threading.Lock()
+
+    def worker() -> None:
+        for _ in range(10):
+            wait = limiter.reserve("v0/tts/file")
+            with lock:
+                waits.append(wait)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Each of the 40 requests got its own slot, 10 ms apart
+    assert sorted(waits)[-1] == pytest.approx(0.39, abs=0.02)
+
+
+def test_create_rate_limiter() -> None:
+    limiter = RateLimiter(5)
+    assert create_rate_limiter(None) is None
+    assert create_rate_limiter(limiter) is limiter
+    assert isinstance(create_rate_limiter({"tts": 2}), RateLimiter)
+    with pytest.raises(ValueError):
+        RateLimiter({"voices": 1})
+
+
+def test_clients_share_a_rate_limiter() -> None:
+    from hume.client import HumeClient
+
+    reset = str(int(time.time()) + 30)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[], headers={"x-ratelimit-remaining": "0", "x-ratelimit-reset": reset})
+
+    limiter = RateLimiter({"batch": 50})
+    first = HumeClient(
+        api_key="key", rate_limit=limiter, httpx_client=httpx.Client(transport=httpx.MockTransport(handler))
+    )
+    second = HumeClient(api_key="key", rate_limit=limiter)
+    assert first.expression_measurement.batch.list_jobs() == []
+    # The other client now holds off batch requests until the reset, instead of sending them to be rejected
+    assert second._client_wrapper.httpx_client.rate_limiter is limiter
+    assert limiter.reserve("v0/batch/jobs") > 25
+
+
+def test_async_requests_are_spaced() -> None:
+    from hume.client import AsyncHumeClient
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[])
+
+    client = AsyncHumeClient(
+        api_key="key",
+        rate_limit=RateLimiter({"batch": 50}, burst=1),
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    async def run() -> float:
+        start = time.monotonic()
+        await asyncio.gather(*(client.expression_measurement.batch.list_jobs() for _ in range(6)))
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.09
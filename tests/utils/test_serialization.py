@@ -1,10 +1,20 @@
 # This file was auto-generated by Fern from our API Definition.
 
-from typing import Any, List
+from typing import Any, Dict, List
+
+import typing_extensions
 
 from .assets.models import ObjectWithOptionalFieldParams, ShapeParams
 
-from hume.core.serialization import convert_and_respect_annotation_metadata
+from hume.core.serialization import FieldMetadata, convert_and_respect_annotation_metadata
+
+
+class RecursiveNodeParams(typing_extensions.TypedDict):
+    value: int
+    child_node: typing_extensions.NotRequired[
+        typing_extensions.Annotated["RecursiveNodeParams", FieldMetadata(alias="childNode")]
+    ]
+
 
 UNION_TEST: ShapeParams = {"radius_measurement": 1.0, "shape_type": "circle", "id": "1"}
 UNION_TEST_CONVERTED = {"shapeType": "circle", "radiusMeasurement": 1.0, "id": "1"}
@@ -70,3 +80,20 @@ def test_convert_and_respect_annotation_metadata_with_empty_object() -> None:
     data: Any = {}
     converted = convert_and_respect_annotation_metadata(object_=data, annotation=ShapeParams, direction="write")
     assert converted == data
+
+
+def test_convert_and_respect_annotation_metadata_skips_alias_free_subtrees() -> None:
+    data: Any = [{"string": "string", "literal": "lit_one"}]
+    converted = convert_and_respect_annotation_metadata(object_=data, annotation=List[Dict[str, str]], direction="write")
+    assert converted is data
+
+
+def test_convert_and_respect_annotation_metadata_with_recursive_type() -> None:
+    data: Any = {"value": 1, "child_node": {"value": 2, "child_node": {"value": 3}}}
+    converted = convert_and_respect_annotation_metadata(object_=data, annotation=RecursiveNodeParams, direction="write")
+    assert converted == {"value": 1, "childNode": {"value": 2, "childNode": {"value": 3}}}
+
+    read_back = convert_and_respect_annotation_metadata(
+        object_=converted, annotation=RecursiveNodeParams, direction="read"
+    )
+    assert read_back == data